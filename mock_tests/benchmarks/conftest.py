@@ -0,0 +1,40 @@
+import grpc
+import pytest
+from pytest_httpserver import HTTPServer
+
+import weaviate
+from mock_tests.benchmarks import payloads
+from mock_tests.mock_data import mock_class
+from weaviate.proto.v1 import batch_pb2, search_get_pb2, weaviate_pb2_grpc
+
+
+class MockBenchmarkService(weaviate_pb2_grpc.WeaviateServicer):
+    """Answers every request with a canned reply, so that only the work of the client is measured."""
+
+    def Search(
+        self, request: search_get_pb2.SearchRequest, context: grpc.ServicerContext
+    ) -> search_get_pb2.SearchReply:
+        if request.HasField("near_vector"):
+            return payloads.SEARCH_REPLY
+        return payloads.iterator_page(request.after, request.limit)
+
+    def BatchObjects(
+        self, request: batch_pb2.BatchObjectsRequest, context: grpc.ServicerContext
+    ) -> batch_pb2.BatchObjectsReply:
+        return batch_pb2.BatchObjectsReply()
+
+
+@pytest.fixture(scope="function")
+def benchmark_collection(
+    weaviate_client: weaviate.WeaviateClient,
+    weaviate_mock: HTTPServer,
+    start_grpc_server: grpc.Server,
+) -> weaviate.collections.Collection:
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(MockBenchmarkService(), start_grpc_server)
+    weaviate_mock.expect_request(f"/v1/schema/{payloads.COLLECTION}").respond_with_json(
+        {**mock_class, "class": payloads.COLLECTION}
+    )
+    weaviate_mock.expect_request("/v1/graphql", method="POST").respond_with_json(
+        payloads.AGGREGATE_RESPONSE
+    )
+    return weaviate_client.collections.use(payloads.COLLECTION)
@@ -0,0 +1,108 @@
+"""Canned replies of realistic sizes that the benchmark server answers every request with."""
+
+import struct
+import uuid
+from typing import Any, Dict, List
+
+from weaviate.proto.v1 import properties_pb2, search_get_pb2
+
+DIMENSIONS = 384
+SEARCH_RESULTS = 100
+ITERATOR_OBJECTS = 1000
+BATCH_OBJECTS = 1000
+
+COLLECTION = "BenchmarkCollection"
+
+VECTOR = [i / DIMENSIONS for i in range(DIMENSIONS)]
+UUIDS = [uuid.UUID(int=i + 1) for i in range(max(SEARCH_RESULTS, ITERATOR_OBJECTS))]
+
+
+def search_result(i: int) -> search_get_pb2.SearchResult:
+    return search_get_pb2.SearchResult(
+        properties=search_get_pb2.PropertiesResult(
+            non_ref_props=properties_pb2.Properties(
+                fields={
+                    "title": properties_pb2.Value(text_value=f"A product title {i}"),
+                    "description": properties_pb2.Value(
+                        text_value=" ".join(f"word{j}" for j in range(50))
+                    ),
+                    "price": properties_pb2.Value(number_value=i / 7),
+                    "stock": properties_pb2.Value(int_value=i),
+                    "available": properties_pb2.Value(bool_value=i % 2 == 0),
+                    "released": properties_pb2.Value(
+                        date_value=f"2024-01-{i % 28 + 1:02}T10:00:00.{i % 1000:06}Z"
+                    ),
+                    "tags": properties_pb2.Value(
+                        list_value=properties_pb2.ListValue(
+                            text_values=properties_pb2.TextValues(values=["a", "b", "c"])
+                        )
+                    ),
+                }
+            )
+        ),
+        metadata=search_get_pb2.MetadataResult(
+            id_as_bytes=UUIDS[i].bytes,
+            distance=i / SEARCH_RESULTS,
+            distance_present=True,
+            vector_bytes=struct.pack(f"<{DIMENSIONS}f", *VECTOR),
+        ),
+    )
+
+
+SEARCH_REPLY = search_get_pb2.SearchReply(results=[search_result(i) for i in range(SEARCH_RESULTS)])
+
+_ITERATOR_RESULTS = [search_result(i % SEARCH_RESULTS) for i in range(ITERATOR_OBJECTS)]
+for _i, _result in enumerate(_ITERATOR_RESULTS):
+    _result.metadata.id_as_bytes = UUIDS[_i].bytes
+
+
+def iterator_page(after: str, limit: int) -> search_get_pb2.SearchReply:
+    """The page of ITERATOR_OBJECTS objects after the cursor `after`."""
+    start = UUIDS.index(uuid.UUID(after)) + 1 if after else 0
+    return search_get_pb2.SearchReply(results=_ITERATOR_RESULTS[start : start + limit])
+
+
+def batch_objects() -> List[Dict[str, Any]]:
+    return [
+        {
+            "properties": {
+                "title": f"A product title {i}",
+                "description": " ".join(f"word{j}" for j in range(50)),
+                "price": i / 7,
+                "stock": i,
+                "available": i % 2 == 0,
+                "tags": ["a", "b", "c"],
+            },
+            "uuid": uuid.UUID(int=i + 1),
+            "vector": VECTOR,
+        }
+        for i in range(BATCH_OBJECTS)
+    ]
+
+
+AGGREGATE_RESPONSE = {
+    "data": {
+        "Aggregate": {
+            COLLECTION: [
+                {
+                    "meta": {"count": ITERATOR_OBJECTS},
+                    "price": {
+                        "count": ITERATOR_OBJECTS,
+                        "maximum": 142.7,
+                        "mean": 71.3,
+                        "median": 71.0,
+                        "minimum": 0.0,
+                        "mode": 0.0,
+                        "sum": 71300.0,
+                    },
+                    "title": {
+                        "count": ITERATOR_OBJECTS,
+                        "topOccurrences": [
+                            {"occurs": 10, "value": f"A product title {i}"} for i in range(5)
+                        ],
+                    },
+                }
+            ]
+        }
+    }
+}
@@ -0,0 +1,104 @@
+"""Benchmarks of the client against the in-process mock server, they do not need a running Weaviate.
+
+The timings depend on the machine, so they are only compared between commits measured on the same machine. CI runs
+the benchmarks of the base commit and fails if a median is more than 50% slower with the changes. To do the same
+locally, save a run of the base commit:
+    pytest mock_tests/benchmarks --benchmark-only --benchmark-storage=/tmp/benchmarks --benchmark-save=base
+then compare a run with the changes against it:
+    pytest mock_tests/benchmarks --benchmark-only --benchmark-storage=/tmp/benchmarks \
+        --benchmark-compare --benchmark-compare-fail=median:50%
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import weaviate
+from mock_tests.benchmarks import payloads
+from weaviate.classes.data import DataObject
+from weaviate.classes.query import Metrics, MetadataQuery
+
+OBJECTS = payloads.batch_objects()
+DATA_OBJECTS = [DataObject(**obj) for obj in OBJECTS]
+PRODUCERS = 8
+
+
+def test_benchmark_near_vector(
+    benchmark: Any, benchmark_collection: weaviate.collections.Collection
+) -> None:
+    def query() -> None:
+        res = benchmark_collection.query.near_vector(
+            payloads.VECTOR,
+            limit=payloads.SEARCH_RESULTS,
+            include_vector=True,
+            return_metadata=MetadataQuery(distance=True),
+        )
+        assert len(res.objects) == payloads.SEARCH_RESULTS
+
+    benchmark(query)
+
+
+def test_benchmark_iterator(
+    benchmark: Any, benchmark_collection: weaviate.collections.Collection
+) -> None:
+    def iterate() -> None:
+        count = sum(1 for _ in benchmark_collection.iterator(include_vector=True))
+        assert count == payloads.ITERATOR_OBJECTS
+
+    benchmark(iterate)
+
+
+def test_benchmark_aggregate(
+    benchmark: Any, benchmark_collection: weaviate.collections.Collection
+) -> None:
+    def aggregate() -> None:
+        res = benchmark_collection.aggregate.over_all(
+            total_count=True,
+            return_metrics=[
+                Metrics("price").number(count=True, maximum=True, mean=True, minimum=True),
+                Metrics("title").text(count=True, top_occurrences_count=True),
+            ],
+        )
+        assert res.total_count == payloads.ITERATOR_OBJECTS
+
+    benchmark(aggregate)
+
+
+def test_benchmark_insert_many(
+    benchmark: Any, benchmark_collection: weaviate.collections.Collection
+) -> None:
+    def insert_many() -> None:
+        res = benchmark_collection.data.insert_many(DATA_OBJECTS)
+        assert not res.has_errors
+
+    benchmark(insert_many)
+
+
+def test_benchmark_batch(
+    benchmark: Any, benchmark_collection: weaviate.collections.Collection
+) -> None:
+    def batch() -> None:
+        with benchmark_collection.batch.fixed_size(batch_size=100, concurrent_requests=2) as b:
+            for obj in OBJECTS:
+                b.add_object(properties=obj["properties"], uuid=obj["uuid"], vector=obj["vector"])
+        assert len(benchmark_collection.batch.failed_objects) == 0
+
+    benchmark(batch)
+
+
+def test_benchmark_batch_multi_producer(
+    benchmark: Any, benchmark_collection: weaviate.collections.Collection
+) -> None:
+    def batch() -> None:
+        with benchmark_collection.batch.fixed_size(batch_size=100, concurrent_requests=2) as b:
+
+            def produce(worker: int) -> None:
+                for obj in OBJECTS[worker::PRODUCERS]:
+                    b.add_object(
+                        properties=obj["properties"], uuid=obj["uuid"], vector=obj["vector"]
+                    )
+
+            with ThreadPoolExecutor(max_workers=PRODUCERS) as pool:
+                list(pool.map(produce, range(PRODUCERS)))
+        assert len(benchmark_collection.batch.failed_objects) == 0
+
+    benchmark(batch)
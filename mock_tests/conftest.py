@@ -1,5 +1,6 @@
 import json
 import time
+import uuid
 from concurrent import futures
 from typing import Generator, Mapping
 
@@ -22,6 +23,7 @@ from weaviate.proto.v1 import (
     weaviate_pb2_grpc,
 )
 
+from mock_tests.fake_weaviate import FakeWeaviate
 from mock_tests.mock_data import mock_class
 
 MOCK_IP = "127.0.0.1"
@@ -350,3 +352,86 @@ def forbidden(
     service = MockForbiddenWeaviateService()
     weaviate_pb2_grpc.add_WeaviateServicer_to_server(service, start_grpc_server)
     return weaviate_client.collections.use("ForbiddenCollection")
+
+
+class MockMultiTenantSearchService(weaviate_pb2_grpc.WeaviateServicer):
+    """Returns three results per tenant whose distances depend on the number in the tenant name."""
+
+    def __init__(self) -> None:
+        self.searched_tenants: list[str] = []
+
+    def Search(
+        self, request: search_get_pb2.SearchRequest, context: grpc.ServicerContext
+    ) -> search_get_pb2.SearchReply:
+        self.searched_tenants.append(request.tenant)
+        offset = int(request.tenant.removeprefix("tenant"))
+        return search_get_pb2.SearchReply(
+            results=[
+                search_get_pb2.SearchResult(
+                    properties=search_get_pb2.PropertiesResult(
+                        non_ref_props=properties_pb2.Properties(
+                            fields={"name": properties_pb2.Value(text_value=request.tenant)}
+                        )
+                    ),
+                    metadata=search_get_pb2.MetadataResult(
+                        id_as_bytes=uuid.UUID(int=offset * 10 + i).bytes,
+                        distance=offset * 0.1 + i * 0.25,
+                        distance_present=True,
+                    ),
+                )
+                for i in range(min(request.limit or 3, 3))
+            ]
+        )
+
+
+@pytest.fixture(scope="function")
+def multi_tenant_search(
+    weaviate_client: weaviate.WeaviateClient, start_grpc_server: grpc.Server
+) -> tuple[weaviate.collections.Collection, MockMultiTenantSearchService]:
+    service = MockMultiTenantSearchService()
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(service, start_grpc_server)
+    return weaviate_client.collections.use("MultiTenantSearchCollection"), service
+
+
+class MockSearchManyService(weaviate_pb2_grpc.WeaviateServicer):
+    """Returns two results per collection, with distances or hybrid scores depending on the search type."""
+
+    distances = {"First": [0.3, 0.5], "Second": [0.1, 0.6], "Third": [0.2, 0.4]}
+    scores = {"First": [0.9, 0.8], "Second": [0.02, 0.01], "Third": [0.5, 0.4]}
+
+    def Search(
+        self, request: search_get_pb2.SearchRequest, context: grpc.ServicerContext
+    ) -> search_get_pb2.SearchReply:
+        is_hybrid = request.HasField("hybrid_search")
+        values = (self.scores if is_hybrid else self.distances)[request.collection]
+        return search_get_pb2.SearchReply(
+            results=[
+                search_get_pb2.SearchResult(
+                    properties=search_get_pb2.PropertiesResult(
+                        non_ref_props=properties_pb2.Properties(
+                            fields={"rank": properties_pb2.Value(int_value=i)}
+                        )
+                    ),
+                    metadata=(
+                        search_get_pb2.MetadataResult(score=value, score_present=True)
+                        if is_hybrid
+                        else search_get_pb2.MetadataResult(distance=value, distance_present=True)
+                    ),
+                )
+                for i, value in enumerate(values)
+            ]
+        )
+
+
+@pytest.fixture(scope="function")
+def search_many_client(
+    weaviate_client: weaviate.WeaviateClient, start_grpc_server: grpc.Server
+) -> weaviate.WeaviateClient:
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(MockSearchManyService(), start_grpc_server)
+    return weaviate_client
+
+
+@pytest.fixture(scope="function")
+def fake_weaviate() -> Generator[FakeWeaviate, None, None]:
+    with FakeWeaviate(seed=0) as fake:
+        yield fake
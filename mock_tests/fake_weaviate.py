@@ -0,0 +1,1037 @@
+"""An in-memory fake of a Weaviate server to load-test code that uses the client without a running cluster.
+
+The fake implements the `Search`, `BatchObjects`, `BatchDelete`, `TenantsGet` and `Aggregate` methods of the gRPC
+service and the REST endpoints for the schema, tenants, single objects and the node status. Objects are kept in memory
+and vector searches are brute-force cosine distances computed with NumPy. Latency, errors, rate limits of a vectorizer
+and the `batchStats` that the dynamic batching reads can be injected with `Faults`, also while the fake is running:
+
+    with FakeWeaviate(faults=Faults(latency=0.01, rate_limit=1000)) as fake:
+        with fake.connect() as client:
+            ...
+
+It only supports what the client needs for ingestion and simple searches: there are no modules, no keyword or hybrid
+search, no references and only the common filter operators.
+"""
+
+import datetime
+import json
+import random
+import re
+import struct
+import threading
+import time
+import uuid as uuid_lib
+from concurrent import futures
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import grpc
+import numpy as np
+from google.protobuf import json_format
+from grpc_health.v1.health_pb2 import HealthCheckRequest, HealthCheckResponse
+from grpc_health.v1.health_pb2_grpc import HealthServicer, add_HealthServicer_to_server
+from werkzeug.serving import BaseWSGIServer, WSGIRequestHandler, make_server
+from werkzeug.wrappers import Request, Response
+
+import weaviate
+from mock_tests.mock_data import mock_class
+from weaviate.proto.v1 import (
+    aggregate_pb2,
+    base_pb2,
+    base_search_pb2,
+    batch_delete_pb2,
+    batch_pb2,
+    properties_pb2,
+    search_get_pb2,
+    tenants_pb2,
+    weaviate_pb2_grpc,
+)
+
+DEFAULT_LIMIT = 10
+
+RATE_LIMIT_ERROR = "update vector: connection to: OpenAI API failed with status: 429 error: Rate limit reached for requests"
+OBJECT_ERROR = "fake weaviate: injected error for this object"
+
+# the configuration of a new collection that the posted configuration is merged into
+_DEFAULT_CONFIG: Dict[str, Any] = {
+    **mock_class,
+    "description": None,
+    "moduleConfig": {},
+    "properties": [],
+    "vectorIndexConfig": {**mock_class["vectorIndexConfig"], "skip": False},
+    "vectorizer": "none",
+}
+
+
+@dataclass
+class Faults:
+    """The faults that the fake injects, the attributes can be changed while the fake is running."""
+
+    latency: float = 0.0
+    """Seconds that every request except the health checks is delayed by."""
+    error_rate: float = 0.0
+    """Fraction of requests that fail with `UNAVAILABLE` (gRPC) or 503 (REST), which the client retries."""
+    object_error_rate: float = 0.0
+    """Fraction of objects in a batch that fail with a permanent error."""
+    rate_limit: Optional[float] = None
+    """Objects per second that the simulated vectorizer accepts, objects above it fail with a rate limit error of the
+    vectorizer which the batching of the client retries."""
+    queue_length: int = 0
+    """The `queueLength` of the `batchStats` in the node status."""
+    rate_per_second: int = 0
+    """The `ratePerSecond` of the `batchStats` in the node status."""
+
+
+@dataclass
+class StoredObject:
+    uuid: str
+    properties: Dict[str, Any]
+    vectors: Dict[str, np.ndarray]
+    creation_time: int = field(default_factory=lambda: int(time.time() * 1000))
+    last_update_time: int = 0
+
+    def __post_init__(self) -> None:
+        self.last_update_time = self.last_update_time or self.creation_time
+
+
+@dataclass
+class _Collection:
+    config: Dict[str, Any]
+    tenants: Dict[str, str] = field(default_factory=dict)
+    shards: Dict[str, Dict[str, StoredObject]] = field(default_factory=dict)
+
+    @property
+    def multi_tenant(self) -> bool:
+        return bool(self.config.get("multiTenancyConfig", {}).get("enabled", False))
+
+    def data_types(self) -> Dict[str, str]:
+        return {prop["name"]: prop["dataType"][0] for prop in self.config["properties"]}
+
+
+class _InjectedError(Exception):
+    def __init__(self, code: grpc.StatusCode, status: int, message: str) -> None:
+        super().__init__(message)
+        self.code = code
+        self.status = status
+
+
+class _TokenBucket:
+    def __init__(self) -> None:
+        self.__tokens = 0.0
+        self.__last = time.monotonic()
+
+    def take(self, rate: float) -> bool:
+        now = time.monotonic()
+        self.__tokens = min(rate, self.__tokens + (now - self.__last) * rate)
+        self.__last = now
+        if self.__tokens >= 1:
+            self.__tokens -= 1
+            return True
+        return False
+
+
+class FakeWeaviate:
+    """A fake Weaviate server that listens on local ports, which are chosen freely if they are not given."""
+
+    def __init__(
+        self,
+        *,
+        version: str = "1.29.0",
+        host: str = "127.0.0.1",
+        http_port: int = 0,
+        grpc_port: int = 0,
+        faults: Optional[Faults] = None,
+        seed: Optional[int] = None,
+        grpc_max_message_size: Optional[int] = None,
+        query_maximum_results: int = 10_000,
+    ) -> None:
+        self.version = version
+        self.grpc_max_message_size = grpc_max_message_size
+        self.query_maximum_results = query_maximum_results
+        self.host = host
+        self.faults = faults if faults is not None else Faults()
+        self.requests: Dict[str, int] = {}
+        self.__http_port = http_port
+        self.__grpc_port = grpc_port
+        self.__collections: Dict[str, _Collection] = {}
+        self.__lock = threading.RLock()
+        self.__random = random.Random(seed)
+        self.__bucket = _TokenBucket()
+        self.__grpc_server: Optional[grpc.Server] = None
+        self.__http_server: Optional[BaseWSGIServer] = None
+
+    @property
+    def http_port(self) -> int:
+        return self.__http_port
+
+    @property
+    def grpc_port(self) -> int:
+        return self.__grpc_port
+
+    def start(self) -> "FakeWeaviate":
+        options = (
+            [("grpc.max_receive_message_length", self.grpc_max_message_size)]
+            if self.grpc_max_message_size is not None
+            else []
+        )
+        self.__grpc_server = grpc.server(
+            futures.ThreadPoolExecutor(max_workers=16), options=options
+        )
+        add_HealthServicer_to_server(_HealthService(), self.__grpc_server)
+        weaviate_pb2_grpc.add_WeaviateServicer_to_server(_FakeService(self), self.__grpc_server)
+        self.__grpc_port = self.__grpc_server.add_insecure_port(f"{self.host}:{self.__grpc_port}")
+        self.__grpc_server.start()
+
+        self.__http_server = make_server(
+            self.host,
+            self.__http_port,
+            _RestApp(self),
+            threaded=True,
+            request_handler=_QuietHandler,
+        )
+        self.__http_port = self.__http_server.server_port
+        threading.Thread(target=self.__http_server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        if self.__http_server is not None:
+            self.__http_server.shutdown()
+            self.__http_server.server_close()
+            self.__http_server = None
+        if self.__grpc_server is not None:
+            self.__grpc_server.stop(0)
+            self.__grpc_server = None
+
+    def __enter__(self) -> "FakeWeaviate":
+        return self.start()
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+    def connect(self, **kwargs: Any) -> weaviate.WeaviateClient:
+        """A client that is connected to this fake, the keyword arguments are passed to `connect_to_local`."""
+        return weaviate.connect_to_local(
+            host=self.host, port=self.http_port, grpc_port=self.grpc_port, **kwargs
+        )
+
+    def objects(self, collection: str, tenant: Optional[str] = None) -> List[StoredObject]:
+        """The objects that are stored in a collection, for assertions in tests."""
+        with self.__lock:
+            col = self.__collections.get(_capitalize(collection))
+            if col is None:
+                return []
+            return list(col.shards.get(tenant or "", {}).values())
+
+    # faults
+
+    def _inject(self, method: str) -> None:
+        with self.__lock:
+            self.requests[method] = self.requests.get(method, 0) + 1
+            fail = self.__random.random() < self.faults.error_rate
+        if self.faults.latency > 0:
+            time.sleep(self.faults.latency)
+        if fail:
+            raise _InjectedError(
+                grpc.StatusCode.UNAVAILABLE, 503, f"fake weaviate: injected error in {method}"
+            )
+
+    def __object_error(self) -> Optional[str]:
+        if (
+            self.faults.object_error_rate > 0
+            and self.__random.random() < self.faults.object_error_rate
+        ):
+            return OBJECT_ERROR
+        if self.faults.rate_limit is not None and not self.__bucket.take(self.faults.rate_limit):
+            return RATE_LIMIT_ERROR
+        return None
+
+    # schema and tenants
+
+    def _create_collection(self, config: Dict[str, Any]) -> Dict[str, Any]:
+        name = _capitalize(config["class"])
+        with self.__lock:
+            if name in self.__collections:
+                raise _InjectedError(
+                    grpc.StatusCode.ALREADY_EXISTS, 422, f"class name {name} already exists"
+                )
+            merged = {**_DEFAULT_CONFIG, **config, "class": name}
+            merged["properties"] = [_property_config(prop) for prop in config.get("properties", [])]
+            self.__collections[name] = _Collection(merged)
+            return merged
+
+    def _collection(self, name: str) -> _Collection:
+        col = self.__collections.get(_capitalize(name))
+        if col is None:
+            raise _InjectedError(grpc.StatusCode.NOT_FOUND, 404, f"could not find class {name}")
+        return col
+
+    def _collection_config(self, name: str) -> Dict[str, Any]:
+        with self.__lock:
+            return self._collection(name).config
+
+    def _collection_configs(self) -> List[Dict[str, Any]]:
+        with self.__lock:
+            return [col.config for col in self.__collections.values()]
+
+    def _delete_collection(self, name: str) -> None:
+        with self.__lock:
+            self.__collections.pop(_capitalize(name), None)
+
+    def _add_tenants(self, name: str, tenants: List[Dict[str, Any]]) -> None:
+        with self.__lock:
+            col = self._collection(name)
+            for tenant in tenants:
+                col.tenants[tenant["name"]] = tenant.get("activityStatus") or "ACTIVE"
+
+    def _remove_tenants(self, name: str, tenants: List[str]) -> None:
+        with self.__lock:
+            col = self._collection(name)
+            for tenant in tenants:
+                col.tenants.pop(tenant, None)
+                col.shards.pop(tenant, None)
+
+    def _tenants(self, name: str) -> Dict[str, str]:
+        with self.__lock:
+            return dict(self._collection(name).tenants)
+
+    def _shard(self, col: _Collection, tenant: str, create: bool) -> Dict[str, StoredObject]:
+        if col.multi_tenant:
+            if tenant == "":
+                raise _InjectedError(
+                    grpc.StatusCode.INVALID_ARGUMENT,
+                    422,
+                    f"class {col.config['class']} has multi-tenancy enabled, but request was without tenant",
+                )
+            if tenant not in col.tenants:
+                if not (create and col.config["multiTenancyConfig"].get("autoTenantCreation")):
+                    raise _InjectedError(
+                        grpc.StatusCode.INVALID_ARGUMENT, 422, f'tenant not found: "{tenant}"'
+                    )
+                col.tenants[tenant] = "ACTIVE"
+        elif tenant != "":
+            raise _InjectedError(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                422,
+                f"class {col.config['class']} has multi-tenancy disabled, but request was with tenant",
+            )
+        return col.shards.setdefault(tenant, {})
+
+    # objects
+
+    def _put_objects(
+        self, collection: str, tenant: str, objects: Iterable[StoredObject]
+    ) -> List[Optional[str]]:
+        """Store objects like a batch does and return an error per object, or `None` for the stored ones."""
+        errors: List[Optional[str]] = []
+        with self.__lock:
+            name = _capitalize(collection)
+            col = self.__collections.get(name)
+            if col is None:
+                col = self.__collections[name] = _Collection(
+                    {**_DEFAULT_CONFIG, "class": name, "properties": []}
+                )
+            try:
+                shard = self._shard(col, tenant, create=True)
+            except _InjectedError as e:
+                return [str(e) for _ in objects]
+            for obj in objects:
+                error = self.__object_error()
+                if error is None:
+                    _update_schema(col, obj.properties)
+                    if obj.uuid in shard:
+                        # replacing an object updates it
+                        obj.creation_time = shard[obj.uuid].creation_time
+                    shard[obj.uuid] = obj
+                errors.append(error)
+        return errors
+
+    def _get_object(self, collection: str, tenant: str, uuid: str) -> Optional[StoredObject]:
+        with self.__lock:
+            col = self._collection(collection)
+            return self._shard(col, tenant, create=False).get(uuid)
+
+    def _delete_object(self, collection: str, tenant: str, uuid: str) -> bool:
+        with self.__lock:
+            col = self._collection(collection)
+            return self._shard(col, tenant, create=False).pop(uuid, None) is not None
+
+    def _matching(
+        self, collection: str, tenant: str, filters: Optional[base_pb2.Filters]
+    ) -> Tuple[_Collection, List[StoredObject]]:
+        with self.__lock:
+            col = self._collection(collection)
+            objects = list(self._shard(col, tenant, create=False).values())
+        if filters is not None:
+            objects = [obj for obj in objects if _matches(filters, obj)]
+        return col, objects
+
+    def _delete_matching(
+        self, collection: str, tenant: str, filters: base_pb2.Filters, dry_run: bool
+    ) -> List[StoredObject]:
+        with self.__lock:
+            _, objects = self._matching(collection, tenant, filters)
+            # like Weaviate, a batch delete handles at most QUERY_MAXIMUM_RESULTS objects
+            objects = objects[: self.query_maximum_results]
+            if not dry_run:
+                shard = self._shard(self._collection(collection), tenant, create=False)
+                for obj in objects:
+                    shard.pop(obj.uuid, None)
+            return objects
+
+    def _node_status(self) -> Dict[str, Any]:
+        with self.__lock:
+            count = sum(
+                len(shard) for col in self.__collections.values() for shard in col.shards.values()
+            )
+            shards = sum(len(col.shards) for col in self.__collections.values())
+        return {
+            "name": "fake-node-1",
+            "status": "HEALTHY",
+            "version": self.version,
+            "gitHash": "fake",
+            "stats": {"objectCount": count, "shardCount": shards},
+            "batchStats": {
+                "queueLength": self.faults.queue_length,
+                "ratePerSecond": self.faults.rate_per_second,
+            },
+            "shards": None,
+        }
+
+
+def _capitalize(name: str) -> str:
+    return name[0].upper() + name[1:] if len(name) > 0 else name
+
+
+# data types of properties for the auto-schema
+
+
+def _infer_data_type(value: Any) -> Optional[str]:
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, (int, float)):
+        return "number"
+    if isinstance(value, str):
+        return "text"
+    if isinstance(value, dict):
+        return "geoCoordinates" if set(value) == {"latitude", "longitude"} else "object"
+    if isinstance(value, list) and len(value) > 0:
+        inner = _infer_data_type(value[0])
+        return f"{inner}[]" if inner is not None else None
+    return None
+
+
+def _update_schema(col: _Collection, properties: Dict[str, Any]) -> None:
+    known = col.data_types()
+    for name, value in properties.items():
+        if name not in known and (data_type := _infer_data_type(value)) is not None:
+            col.config["properties"].append(
+                _property_config({"name": name, "dataType": [data_type]})
+            )
+
+
+def _property_config(prop: Dict[str, Any]) -> Dict[str, Any]:
+    text = prop["dataType"][0] in ("text", "text[]")
+    return {
+        "indexFilterable": True,
+        "indexSearchable": text,
+        "indexRangeFilters": False,
+        "tokenization": "word" if text else None,
+        **prop,
+    }
+
+
+# conversion of the protobuf messages
+
+
+def _decode_properties(props: Any) -> Dict[str, Any]:
+    """The properties of a `BatchObject.Properties` or `ObjectPropertiesValue` as Python values."""
+    values: Dict[str, Any] = json_format.MessageToDict(props.non_ref_properties)
+    for prop in props.text_array_properties:
+        values[prop.prop_name] = list(prop.values)
+    for prop in props.int_array_properties:
+        values[prop.prop_name] = [int(v) for v in prop.values]
+    for prop in props.number_array_properties:
+        values[prop.prop_name] = (
+            list(struct.unpack(f"{len(prop.values_bytes) // 8}d", prop.values_bytes))
+            if len(prop.values_bytes) > 0
+            else list(prop.values)
+        )
+    for prop in props.boolean_array_properties:
+        values[prop.prop_name] = list(prop.values)
+    for prop in props.object_properties:
+        values[prop.prop_name] = _decode_properties(prop.value)
+    for prop in props.object_array_properties:
+        values[prop.prop_name] = [_decode_properties(value) for value in prop.values]
+    for name in props.empty_list_props:
+        values[name] = []
+    return values
+
+
+def _decode_vector(vector_bytes: bytes) -> np.ndarray:
+    return np.frombuffer(vector_bytes, dtype="<f4")
+
+
+def _to_value(value: Any, data_type: Optional[str]) -> properties_pb2.Value:
+    if value is None:
+        return properties_pb2.Value(null_value=0)
+    if data_type is None:
+        data_type = _infer_data_type(value)
+    if data_type == "int":
+        return properties_pb2.Value(int_value=int(value))
+    if data_type == "number":
+        return properties_pb2.Value(number_value=float(value))
+    if data_type == "boolean":
+        return properties_pb2.Value(bool_value=value)
+    if data_type == "date":
+        return properties_pb2.Value(date_value=value)
+    if data_type == "uuid":
+        return properties_pb2.Value(uuid_value=value)
+    if data_type == "geoCoordinates":
+        return properties_pb2.Value(geo_value=properties_pb2.GeoCoordinate(**value))
+    if data_type == "object":
+        return properties_pb2.Value(object_value=_to_properties(value, None))
+    if data_type is not None and data_type.endswith("[]"):
+        return properties_pb2.Value(list_value=_to_list_value(value, data_type[:-2]))
+    return properties_pb2.Value(text_value=str(value))
+
+
+def _to_list_value(values: List[Any], data_type: str) -> properties_pb2.ListValue:
+    if data_type == "int":
+        return properties_pb2.ListValue(
+            int_values=properties_pb2.IntValues(values=struct.pack(f"<{len(values)}q", *values))
+        )
+    if data_type == "number":
+        return properties_pb2.ListValue(
+            number_values=properties_pb2.NumberValues(
+                values=struct.pack(f"<{len(values)}d", *values)
+            )
+        )
+    if data_type == "boolean":
+        return properties_pb2.ListValue(bool_values=properties_pb2.BoolValues(values=values))
+    if data_type == "date":
+        return properties_pb2.ListValue(date_values=properties_pb2.DateValues(values=values))
+    if data_type == "uuid":
+        return properties_pb2.ListValue(uuid_values=properties_pb2.UuidValues(values=values))
+    if data_type == "object":
+        return properties_pb2.ListValue(
+            object_values=properties_pb2.ObjectValues(
+                values=[_to_properties(value, None) for value in values]
+            )
+        )
+    return properties_pb2.ListValue(text_values=properties_pb2.TextValues(values=values))
+
+
+def _to_properties(
+    values: Dict[str, Any], data_types: Optional[Dict[str, str]]
+) -> properties_pb2.Properties:
+    return properties_pb2.Properties(
+        fields={
+            name: _to_value(value, data_types.get(name) if data_types is not None else None)
+            for name, value in values.items()
+        }
+    )
+
+
+# filters
+
+_COMPARISONS: Dict[int, Callable[[Any, Any], bool]] = {
+    base_pb2.Filters.OPERATOR_EQUAL: lambda a, b: a == b,
+    base_pb2.Filters.OPERATOR_NOT_EQUAL: lambda a, b: a != b,
+    base_pb2.Filters.OPERATOR_GREATER_THAN: lambda a, b: a is not None and a > b,
+    base_pb2.Filters.OPERATOR_GREATER_THAN_EQUAL: lambda a, b: a is not None and a >= b,
+    base_pb2.Filters.OPERATOR_LESS_THAN: lambda a, b: a is not None and a < b,
+    base_pb2.Filters.OPERATOR_LESS_THAN_EQUAL: lambda a, b: a is not None and a <= b,
+    base_pb2.Filters.OPERATOR_IS_NULL: lambda a, b: (a is None) == b,
+    base_pb2.Filters.OPERATOR_LIKE: lambda a, b: isinstance(a, str)
+    and re.fullmatch(re.escape(b).replace(r"\*", ".*").replace(r"\?", "."), a) is not None,
+    base_pb2.Filters.OPERATOR_CONTAINS_ANY: lambda a, b: a is not None
+    and any(v in (a if isinstance(a, list) else [a]) for v in b),
+    base_pb2.Filters.OPERATOR_CONTAINS_ALL: lambda a, b: a is not None
+    and all(v in (a if isinstance(a, list) else [a]) for v in b),
+}
+
+
+def _filter_value(filters: base_pb2.Filters) -> Any:
+    kind = filters.WhichOneof("test_value")
+    if kind is None:
+        return None
+    value = getattr(filters, kind)
+    if kind.endswith("_array"):
+        return list(value.values)
+    return value
+
+
+def _matches(filters: base_pb2.Filters, obj: StoredObject) -> bool:
+    if filters.operator == base_pb2.Filters.OPERATOR_AND:
+        return all(_matches(f, obj) for f in filters.filters)
+    if filters.operator == base_pb2.Filters.OPERATOR_OR:
+        return any(_matches(f, obj) for f in filters.filters)
+    comparison = _COMPARISONS.get(filters.operator)
+    if comparison is None:
+        raise _InjectedError(
+            grpc.StatusCode.UNIMPLEMENTED,
+            501,
+            f"fake weaviate: filter operator {base_pb2.Filters.Operator.Name(filters.operator)} is not supported",
+        )
+    if filters.HasField("target"):
+        if filters.target.WhichOneof("target") != "property":
+            raise _InjectedError(
+                grpc.StatusCode.UNIMPLEMENTED,
+                501,
+                "fake weaviate: only property filters are supported",
+            )
+        prop = filters.target.property
+    else:
+        prop = filters.on[0]
+    if prop in _TIME_PROPERTIES:
+        value = _filter_value(filters)
+        return comparison(
+            _sort_key(obj, prop),
+            [_timestamp(v) for v in value] if isinstance(value, list) else _timestamp(value),
+        )
+    return comparison(_sort_key(obj, prop), _filter_value(filters))
+
+
+_TIME_PROPERTIES = {"_creationTimeUnix": "creation_time", "_lastUpdateTimeUnix": "last_update_time"}
+
+
+def _timestamp(date: str) -> int:
+    return round(datetime.datetime.fromisoformat(date).timestamp() * 1000)
+
+
+def _sort_key(obj: StoredObject, prop: str) -> Any:
+    if prop == "_id":
+        return obj.uuid
+    if prop in _TIME_PROPERTIES:
+        return getattr(obj, _TIME_PROPERTIES[prop])
+    return obj.properties.get(prop)
+
+
+# searches
+
+
+def _near_vector_query(near_vector: base_search_pb2.NearVector) -> Tuple[np.ndarray, str]:
+    target = (
+        near_vector.targets.target_vectors[0] if len(near_vector.targets.target_vectors) else ""
+    )
+    if len(near_vector.vector_bytes) > 0:
+        return _decode_vector(near_vector.vector_bytes), target
+    if len(near_vector.vectors) > 0:
+        return _decode_vector(near_vector.vectors[0].vector_bytes), target
+    return np.array(near_vector.vector, dtype=np.float32), target
+
+
+def _rank(
+    objects: List[StoredObject], query: np.ndarray, target: str
+) -> List[Tuple[StoredObject, float]]:
+    """The objects with a vector for the target ordered by their cosine distance to the query."""
+    with_vector = [obj for obj in objects if target in obj.vectors]
+    if len(with_vector) == 0:
+        return []
+    matrix = np.stack([obj.vectors[target] for obj in with_vector])
+    norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query)
+    distances = 1 - (matrix @ query) / np.where(norms == 0, 1, norms)
+    order = np.argsort(distances, kind="stable")
+    return [(with_vector[i], float(distances[i])) for i in order]
+
+
+def _search_result(
+    obj: StoredObject,
+    distance: Optional[float],
+    request: search_get_pb2.SearchRequest,
+    data_types: Dict[str, str],
+) -> search_get_pb2.SearchResult:
+    if not request.HasField("properties") or request.properties.return_all_nonref_properties:
+        values = obj.properties
+    else:
+        values = {
+            name: obj.properties[name]
+            for name in request.properties.non_ref_properties
+            if name in obj.properties
+        }
+    meta = request.metadata
+    uid = uuid_lib.UUID(obj.uuid)
+    return search_get_pb2.SearchResult(
+        properties=search_get_pb2.PropertiesResult(
+            non_ref_props=_to_properties(values, data_types)
+        ),
+        metadata=search_get_pb2.MetadataResult(
+            id=obj.uuid if meta.uuid else "",
+            id_as_bytes=uid.bytes if meta.uuid else b"",
+            vector_bytes=(
+                obj.vectors[""].astype("<f4").tobytes()
+                if meta.vector and "" in obj.vectors
+                else b""
+            ),
+            vectors=[
+                base_pb2.Vectors(name=name, vector_bytes=obj.vectors[name].astype("<f4").tobytes())
+                for name in meta.vectors
+                if name in obj.vectors
+            ],
+            distance=distance if distance is not None and meta.distance else 0,
+            distance_present=distance is not None and meta.distance,
+            certainty=1 - distance / 2 if distance is not None and meta.certainty else 0,
+            certainty_present=distance is not None and meta.certainty,
+            creation_time_unix=obj.creation_time if meta.creation_time_unix else 0,
+            creation_time_unix_present=meta.creation_time_unix,
+            last_update_time_unix=obj.last_update_time if meta.last_update_time_unix else 0,
+            last_update_time_unix_present=meta.last_update_time_unix,
+        ),
+    )
+
+
+def _aggregate_property(
+    aggregation: aggregate_pb2.AggregateRequest.Aggregation, objects: List[StoredObject]
+) -> aggregate_pb2.AggregateReply.Aggregations.Aggregation:
+    values = [
+        obj.properties[aggregation.property]
+        for obj in objects
+        if obj.properties.get(aggregation.property) is not None
+    ]
+    reply = aggregate_pb2.AggregateReply.Aggregations.Aggregation
+    kind = aggregation.WhichOneof("aggregation")
+    if kind in ("int", "number"):
+        stats: Dict[str, Any] = {"count": len(values)}
+        if len(values) > 0:
+            stats.update(
+                sum=sum(values),
+                mean=sum(values) / len(values),
+                minimum=min(values),
+                maximum=max(values),
+                median=float(np.median(values)),
+                mode=max(set(values), key=values.count),
+            )
+            if kind == "int":
+                stats.update({k: int(stats[k]) for k in ("sum", "minimum", "maximum", "mode")})
+        if kind == "int":
+            return reply(property=aggregation.property, int=reply.Integer(**stats))
+        return reply(property=aggregation.property, number=reply.Number(**stats))
+    if kind == "text":
+        counts: Dict[str, int] = {}
+        for value in values:
+            counts[value] = counts.get(value, 0) + 1
+        top = sorted(counts.items(), key=lambda item: -item[1])
+        limit = aggregation.text.top_occurences_limit or 5
+        return reply(
+            property=aggregation.property,
+            text=reply.Text(
+                count=len(values),
+                top_occurences=reply.Text.TopOccurrences(
+                    items=[
+                        reply.Text.TopOccurrences.TopOccurrence(value=value, occurs=occurs)
+                        for value, occurs in top[:limit]
+                    ]
+                ),
+            ),
+        )
+    if kind == "boolean":
+        true = sum(1 for value in values if value)
+        return reply(
+            property=aggregation.property,
+            boolean=reply.Boolean(
+                count=len(values),
+                total_true=true,
+                total_false=len(values) - true,
+                percentage_true=true / len(values) if len(values) > 0 else 0,
+                percentage_false=(len(values) - true) / len(values) if len(values) > 0 else 0,
+            ),
+        )
+    raise _InjectedError(
+        grpc.StatusCode.UNIMPLEMENTED, 501, f"fake weaviate: {kind} aggregations are not supported"
+    )
+
+
+class _QuietHandler(WSGIRequestHandler):
+    def log_request(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+
+class _HealthService(HealthServicer):
+    def Check(
+        self, request: HealthCheckRequest, context: grpc.ServicerContext
+    ) -> HealthCheckResponse:
+        return HealthCheckResponse(status=HealthCheckResponse.SERVING)
+
+
+def _grpc_method(method: Callable[..., Any]) -> Callable[..., Any]:
+    """Inject the faults before a gRPC method and turn errors into status codes."""
+
+    def wrapper(self: "_FakeService", request: Any, context: grpc.ServicerContext) -> Any:
+        try:
+            self._fake._inject(method.__name__)
+            return method(self, request, context)
+        except _InjectedError as e:
+            context.abort(e.code, str(e))
+
+    wrapper.__name__ = method.__name__
+    return wrapper
+
+
+class _FakeService(weaviate_pb2_grpc.WeaviateServicer):
+    def __init__(self, fake: FakeWeaviate) -> None:
+        self._fake = fake
+
+    @_grpc_method
+    def BatchObjects(
+        self, request: batch_pb2.BatchObjectsRequest, context: grpc.ServicerContext
+    ) -> batch_pb2.BatchObjectsReply:
+        start = time.time()
+        groups: Dict[Tuple[str, str], List[Tuple[int, StoredObject]]] = {}
+        for index, obj in enumerate(request.objects):
+            vectors = {vec.name: _decode_vector(vec.vector_bytes) for vec in obj.vectors}
+            if len(obj.vector_bytes) > 0:
+                vectors[""] = _decode_vector(obj.vector_bytes)
+            elif len(obj.vector) > 0:
+                vectors[""] = np.array(obj.vector, dtype=np.float32)
+            stored = StoredObject(obj.uuid, _decode_properties(obj.properties), vectors)
+            groups.setdefault((obj.collection, obj.tenant), []).append((index, stored))
+
+        errors: List[batch_pb2.BatchObjectsReply.BatchError] = []
+        for (collection, tenant), objects in groups.items():
+            results = self._fake._put_objects(collection, tenant, (obj for _, obj in objects))
+            errors.extend(
+                batch_pb2.BatchObjectsReply.BatchError(index=index, error=error)
+                for (index, _), error in zip(objects, results)
+                if error is not None
+            )
+        return batch_pb2.BatchObjectsReply(took=time.time() - start, errors=errors)
+
+    @_grpc_method
+    def BatchDelete(
+        self, request: batch_delete_pb2.BatchDeleteRequest, context: grpc.ServicerContext
+    ) -> batch_delete_pb2.BatchDeleteReply:
+        start = time.time()
+        deleted = self._fake._delete_matching(
+            request.collection, request.tenant, request.filters, request.dry_run
+        )
+        return batch_delete_pb2.BatchDeleteReply(
+            took=time.time() - start,
+            matches=len(deleted),
+            successful=len(deleted),
+            failed=0,
+            objects=(
+                [
+                    batch_delete_pb2.BatchDeleteObject(
+                        uuid=uuid_lib.UUID(obj.uuid).bytes, successful=True
+                    )
+                    for obj in deleted
+                ]
+                if request.verbose
+                else []
+            ),
+        )
+
+    @_grpc_method
+    def Search(
+        self, request: search_get_pb2.SearchRequest, context: grpc.ServicerContext
+    ) -> search_get_pb2.SearchReply:
+        start = time.time()
+        search = next(
+            (
+                descriptor.name
+                for descriptor, _ in request.ListFields()
+                if descriptor.name.startswith("near_")
+                or descriptor.name in ("hybrid_search", "bm25_search")
+            ),
+            None,
+        )
+        if search not in (None, "near_vector"):
+            raise _InjectedError(
+                grpc.StatusCode.UNIMPLEMENTED, 501, f"fake weaviate: {search} is not supported"
+            )
+        col, objects = self._fake._matching(
+            request.collection,
+            request.tenant,
+            request.filters if request.HasField("filters") else None,
+        )
+        limit = request.limit if request.limit > 0 else DEFAULT_LIMIT
+
+        ranked: List[Tuple[StoredObject, Optional[float]]]
+        if search == "near_vector":
+            query, target = _near_vector_query(request.near_vector)
+            ranked = list(_rank(objects, query, target))
+            if request.near_vector.HasField("distance"):
+                ranked = [
+                    (o, d) for o, d in ranked if d is not None and d <= request.near_vector.distance
+                ]
+        else:
+            objects.sort(key=lambda obj: obj.uuid)
+            if request.after != "":
+                objects = [obj for obj in objects if obj.uuid > request.after]
+            for sort in reversed(request.sort_by):
+                objects.sort(
+                    key=lambda obj: _sort_key(obj, sort.path[0]), reverse=not sort.ascending
+                )
+            ranked = [(obj, None) for obj in objects]
+
+        data_types = col.data_types()
+        return search_get_pb2.SearchReply(
+            took=time.time() - start,
+            results=[
+                _search_result(obj, distance, request, data_types)
+                for obj, distance in ranked[request.offset : request.offset + limit]
+            ],
+        )
+
+    @_grpc_method
+    def TenantsGet(
+        self, request: tenants_pb2.TenantsGetRequest, context: grpc.ServicerContext
+    ) -> tenants_pb2.TenantsGetReply:
+        tenants = self._fake._tenants(request.collection)
+        names = request.names.values if request.HasField("names") else tenants.keys()
+        return tenants_pb2.TenantsGetReply(
+            tenants=[
+                tenants_pb2.Tenant(
+                    name=name,
+                    activity_status=tenants_pb2.TenantActivityStatus.Value(
+                        f"TENANT_ACTIVITY_STATUS_{tenants[name]}"
+                    ),
+                )
+                for name in names
+                if name in tenants
+            ]
+        )
+
+    @_grpc_method
+    def Aggregate(
+        self, request: aggregate_pb2.AggregateRequest, context: grpc.ServicerContext
+    ) -> aggregate_pb2.AggregateReply:
+        start = time.time()
+        if request.HasField("group_by") or request.HasField("near_vector"):
+            raise _InjectedError(
+                grpc.StatusCode.UNIMPLEMENTED,
+                501,
+                "fake weaviate: only aggregations over all objects are supported",
+            )
+        _, objects = self._fake._matching(
+            request.collection,
+            request.tenant,
+            request.filters if request.HasField("filters") else None,
+        )
+        return aggregate_pb2.AggregateReply(
+            took=time.time() - start,
+            single_result=aggregate_pb2.AggregateReply.Single(
+                objects_count=len(objects),
+                aggregations=aggregate_pb2.AggregateReply.Aggregations(
+                    aggregations=[_aggregate_property(a, objects) for a in request.aggregations]
+                ),
+            ),
+        )
+
+
+class _RestApp:
+    """The WSGI app of the REST endpoints."""
+
+    def __init__(self, fake: FakeWeaviate) -> None:
+        self.__fake = fake
+        self.__routes: List[Tuple[str, "re.Pattern[str]", Callable[..., Response]]] = [
+            ("GET", re.compile(r"/v1/meta"), self.meta),
+            ("GET", re.compile(r"/v1/nodes"), self.nodes),
+            ("GET", re.compile(r"/v1/schema"), self.schema),
+            ("POST", re.compile(r"/v1/schema"), self.create_collection),
+            ("GET", re.compile(r"/v1/schema/(\w+)"), self.collection),
+            ("DELETE", re.compile(r"/v1/schema/(\w+)"), self.delete_collection),
+            ("GET", re.compile(r"/v1/schema/(\w+)/tenants"), self.tenants),
+            ("POST", re.compile(r"/v1/schema/(\w+)/tenants"), self.add_tenants),
+            ("DELETE", re.compile(r"/v1/schema/(\w+)/tenants"), self.remove_tenants),
+            ("POST", re.compile(r"/v1/objects"), self.insert),
+            ("GET", re.compile(r"/v1/objects/(\w+)/([\w-]+)"), self.get_object),
+            ("HEAD", re.compile(r"/v1/objects/(\w+)/([\w-]+)"), self.object_exists),
+            ("DELETE", re.compile(r"/v1/objects/(\w+)/([\w-]+)"), self.delete_object),
+        ]
+
+    def __call__(self, environ: Dict[str, Any], start_response: Callable[..., Any]) -> Any:
+        request = Request(environ)
+        return self.__dispatch(request)(environ, start_response)
+
+    def __dispatch(self, request: Request) -> Response:
+        if request.path in ("/v1/.well-known/ready", "/v1/.well-known/live"):
+            return Response(status=200)
+        if request.path == "/v1/.well-known/openid-configuration":
+            return Response(status=404)
+        for method, pattern, handler in self.__routes:
+            match = pattern.fullmatch(request.path)
+            if match is not None and method == request.method:
+                try:
+                    self.__fake._inject(handler.__name__)
+                    return handler(request, *match.groups())
+                except _InjectedError as e:
+                    return _json({"error": [{"message": str(e)}]}, e.status)
+        return _json({"error": [{"message": f"fake weaviate: {request.path} not found"}]}, 404)
+
+    def meta(self, request: Request) -> Response:
+        meta: Dict[str, Any] = {"version": self.__fake.version, "modules": {}, "hostname": "fake"}
+        if self.__fake.grpc_max_message_size is not None:
+            meta["grpcMaxMessageSize"] = self.__fake.grpc_max_message_size
+        return _json(meta)
+
+    def nodes(self, request: Request) -> Response:
+        return _json({"nodes": [self.__fake._node_status()]})
+
+    def schema(self, request: Request) -> Response:
+        return _json({"classes": self.__fake._collection_configs()})
+
+    def create_collection(self, request: Request) -> Response:
+        return _json(self.__fake._create_collection(request.get_json()))
+
+    def collection(self, request: Request, name: str) -> Response:
+        return _json(self.__fake._collection_config(name))
+
+    def delete_collection(self, request: Request, name: str) -> Response:
+        self.__fake._delete_collection(name)
+        return Response(status=200)
+
+    def tenants(self, request: Request, name: str) -> Response:
+        tenants = self.__fake._tenants(name)
+        return _json([{"name": t, "activityStatus": status} for t, status in tenants.items()])
+
+    def add_tenants(self, request: Request, name: str) -> Response:
+        self.__fake._add_tenants(name, request.get_json())
+        return _json(request.get_json())
+
+    def remove_tenants(self, request: Request, name: str) -> Response:
+        self.__fake._remove_tenants(name, request.get_json())
+        return Response(status=200)
+
+    def insert(self, request: Request) -> Response:
+        body = request.get_json()
+        vectors = {
+            name: np.array(vector, dtype=np.float32)
+            for name, vector in (body.get("vectors") or {}).items()
+        }
+        if body.get("vector") is not None:
+            vectors[""] = np.array(body["vector"], dtype=np.float32)
+        obj = StoredObject(
+            body.get("id") or str(uuid_lib.uuid4()), body.get("properties", {}), vectors
+        )
+        errors = self.__fake._put_objects(body["class"], body.get("tenant") or "", [obj])
+        if errors[0] is not None:
+            return _json({"error": [{"message": errors[0]}]}, 422)
+        return _json({**body, "id": obj.uuid, "creationTimeUnix": obj.creation_time})
+
+    def get_object(self, request: Request, name: str, uuid: str) -> Response:
+        obj = self.__fake._get_object(name, request.args.get("tenant", ""), uuid)
+        if obj is None:
+            return Response(status=404)
+        return _json(
+            {
+                "class": _capitalize(name),
+                "id": obj.uuid,
+                "properties": obj.properties,
+                "creationTimeUnix": obj.creation_time,
+                "lastUpdateTimeUnix": obj.last_update_time,
+                **({"vector": obj.vectors[""].tolist()} if "" in obj.vectors else {}),
+            }
+        )
+
+    def object_exists(self, request: Request, name: str, uuid: str) -> Response:
+        exists = self.__fake._get_object(name, request.args.get("tenant", ""), uuid) is not None
+        return Response(status=204 if exists else 404)
+
+    def delete_object(self, request: Request, name: str, uuid: str) -> Response:
+        deleted = self.__fake._delete_object(name, request.args.get("tenant", ""), uuid)
+        return Response(status=204 if deleted else 404)
+
+
+def _json(body: Any, status: int = 200) -> Response:
+    return Response(json.dumps(body), status=status, content_type="application/json")
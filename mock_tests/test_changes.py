@@ -0,0 +1,101 @@
+import asyncio
+import datetime
+import time
+import uuid
+from typing import Any, Dict, List
+
+import pytest
+
+import weaviate
+import weaviate.classes as wvc
+from mock_tests.fake_weaviate import FakeWeaviate
+from weaviate.exceptions import WeaviateInvalidInputError
+
+UUIDS = [uuid.UUID(int=i + 1) for i in range(10)]
+
+
+def _objects(
+    uuids: List[uuid.UUID], version: int
+) -> List[wvc.data.DataObject[Dict[str, Any], None]]:
+    return [wvc.data.DataObject(properties={"version": version}, uuid=uid) for uid in uuids]
+
+
+def test_changes(fake_weaviate: FakeWeaviate) -> None:
+    with fake_weaviate.connect() as client:
+        collection = client.collections.create("Changes")
+        # several objects get the same update time, which is the precision of the watermark
+        collection.data.insert_many(_objects(UUIDS[:7], 1))
+        time.sleep(0.01)
+        collection.data.insert_many(_objects(UUIDS[7:], 1))
+
+        changes = collection.changes(page_size=3)
+        returned = [obj.uuid for obj in changes]
+        assert sorted(returned) == UUIDS
+        assert set(returned[7:]) == set(UUIDS[7:])
+        assert all(obj.metadata.last_update_time is not None for obj in collection.changes())
+
+        # nothing changed since the watermark
+        watermark = changes.watermark
+        assert list(collection.changes(since=watermark)) == []
+
+        time.sleep(0.01)
+        collection.data.insert_many(_objects(UUIDS[2:4], 2))
+        updated = list(collection.changes(since=watermark, page_size=1))
+        assert [obj.uuid for obj in updated] == UUIDS[2:4]
+        assert all(obj.properties["version"] == 2 for obj in updated)
+
+        # resuming in the middle of objects with the same update time returns the others
+        partial = collection.changes(page_size=2)
+        first = [next(partial).uuid for _ in range(4)]
+        rest = [obj.uuid for obj in collection.changes(since=partial.watermark)]
+        assert sorted(first + rest) == UUIDS
+
+        future = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(hours=1)
+        assert list(collection.changes(since=future)) == []
+        with pytest.raises(WeaviateInvalidInputError):
+            collection.changes(since="not a watermark")
+
+
+def test_changes_same_update_time(fake_weaviate: FakeWeaviate) -> None:
+    uuids = [uuid.UUID(int=i + 1) for i in range(25)]
+    with fake_weaviate.connect() as client:
+        collection = client.collections.create("SameTime")
+        # all objects of one request get the same update time, more of them than fit into a page
+        collection.data.insert_many(_objects(uuids, 1))
+
+        changes = collection.changes(page_size=3)
+        returned = [obj.uuid for obj in changes]
+        assert returned == uuids
+        # the watermark does not grow with the number of objects sharing an update time
+        assert len(changes.watermark) < 120
+
+        # resume in the middle of the objects and update some that were returned already before continuing
+        partial = collection.changes(page_size=3)
+        first = [next(partial).uuid for _ in range(7)]
+        watermark = partial.watermark
+        time.sleep(0.01)
+        collection.data.insert_many(_objects(uuids[1:3], 2))
+        rest = [obj.uuid for obj in collection.changes(since=watermark, page_size=3)]
+        assert first == uuids[:7]
+        assert rest == uuids[7:] + uuids[1:3]
+
+
+@pytest.mark.asyncio
+async def test_changes_follow(fake_weaviate: FakeWeaviate) -> None:
+    async with weaviate.use_async_with_local(
+        host=fake_weaviate.host, port=fake_weaviate.http_port, grpc_port=fake_weaviate.grpc_port
+    ) as client:
+        collection = await client.collections.create("Followed")
+        await collection.data.insert_many(_objects(UUIDS[:5], 1))
+
+        changes = collection.changes(page_size=2, follow=True, poll_interval=0.01)
+        returned = [(await changes.__anext__()).uuid for _ in range(5)]
+        assert sorted(returned) == UUIDS[:5]
+
+        # the iterator waits for the next change instead of stopping
+        waiting = asyncio.ensure_future(changes.__anext__())
+        await asyncio.sleep(0.05)
+        assert not waiting.done()
+        await collection.data.insert_many(_objects(UUIDS[5:6], 1))
+        obj = await asyncio.wait_for(waiting, timeout=5)
+        assert obj.uuid == UUIDS[5]
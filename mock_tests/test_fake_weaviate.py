@@ -0,0 +1,376 @@
+import asyncio
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List
+
+import pytest
+
+import weaviate
+import weaviate.classes as wvc
+from mock_tests.fake_weaviate import OBJECT_ERROR, FakeWeaviate
+from weaviate.classes.query import Filter, MetadataQuery, Metrics
+from weaviate.exceptions import (
+    UnexpectedStatusCodeError,
+    WeaviateInsertManyAllFailedError,
+    WeaviateInvalidInputError,
+)
+from weaviate.outputs.batch import BatchStats
+from weaviate.outputs.data import DeleteManyReturn
+
+UUIDS = [uuid.UUID(int=i + 1) for i in range(20)]
+
+
+def test_insert_and_search(fake_weaviate: FakeWeaviate) -> None:
+    with fake_weaviate.connect() as client:
+        collection = client.collections.create(
+            "Products",
+            properties=[
+                wvc.config.Property(name="name", data_type=wvc.config.DataType.TEXT),
+                wvc.config.Property(name="count", data_type=wvc.config.DataType.INT),
+            ],
+        )
+        res = collection.data.insert_many(
+            [
+                wvc.data.DataObject(
+                    properties={"name": f"name {i}", "count": i}, vector=[1.0, i / 10], uuid=uid
+                )
+                for i, uid in enumerate(UUIDS)
+            ]
+        )
+        assert not res.has_errors
+        assert len(fake_weaviate.objects("Products")) == len(UUIDS)
+
+        found = collection.query.near_vector(
+            [1.0, 0.0], limit=3, return_metadata=MetadataQuery(distance=True)
+        )
+        assert [obj.uuid for obj in found.objects] == UUIDS[:3]
+        assert found.objects[0].metadata.distance == pytest.approx(0.0, abs=1e-6)
+        assert found.objects[1].properties == {"name": "name 1", "count": 1}
+
+        filtered = collection.query.fetch_objects(
+            filters=Filter.by_property("count").greater_than(15)
+            & Filter.by_id().not_equal(UUIDS[19])
+        )
+        assert sorted(obj.properties["count"] for obj in filtered.objects) == [16, 17, 18]
+
+        assert [obj.uuid for obj in collection.iterator()] == UUIDS
+
+
+def test_delete_and_aggregate(fake_weaviate: FakeWeaviate) -> None:
+    with fake_weaviate.connect() as client:
+        collection = client.collections.create("Products")
+        collection.data.insert_many([{"count": i} for i in range(10)])
+
+        res = collection.data.delete_many(where=Filter.by_property("count").less_than(4))
+        assert res.successful == 4
+        assert len(collection) == 6
+
+        agg = collection.aggregate.over_all(return_metrics=Metrics("count").number(sum_=True))
+        assert agg.properties["count"].sum_ == sum(range(4, 10))
+
+        uid = collection.data.insert({"count": 100})
+        assert collection.data.exists(uid)
+        collection.data.delete_by_id(uid)
+        assert not collection.data.exists(uid)
+
+
+def test_tenants(fake_weaviate: FakeWeaviate) -> None:
+    with fake_weaviate.connect() as client:
+        collection = client.collections.create(
+            "Tenanted", multi_tenancy_config=wvc.config.Configure.multi_tenancy(enabled=True)
+        )
+        collection.tenants.create(["tenant1", "tenant2"])
+        assert set(collection.tenants.get()) == {"tenant1", "tenant2"}
+
+        assert not collection.with_tenant("tenant1").data.insert_many([{"name": "a"}]).has_errors
+        assert len(fake_weaviate.objects("Tenanted", "tenant1")) == 1
+        with pytest.raises(WeaviateInsertManyAllFailedError, match="tenant not found"):
+            collection.with_tenant("unknown").data.insert_many([{"name": "a"}])
+
+
+def test_batch_retries_rate_limited_objects(fake_weaviate: FakeWeaviate) -> None:
+    fake_weaviate.faults.rate_limit = 100
+    with fake_weaviate.connect() as client:
+        collection = client.collections.create("Batched")
+        with collection.batch.fixed_size(batch_size=50) as batch:
+            for i in range(120):
+                batch.add_object({"count": i})
+        assert len(collection.batch.failed_objects) == 0
+    assert len(fake_weaviate.objects("Batched")) == 120
+    assert fake_weaviate.requests["BatchObjects"] > 3
+
+
+def test_injected_errors(fake_weaviate: FakeWeaviate) -> None:
+    with fake_weaviate.connect() as client:
+        collection = client.collections.create("Failing")
+        fake_weaviate.faults.object_error_rate = 1.0
+        with pytest.raises(WeaviateInsertManyAllFailedError, match=OBJECT_ERROR):
+            collection.data.insert_many([{"count": i} for i in range(3)])
+
+        fake_weaviate.faults.object_error_rate = 0.0
+        fake_weaviate.faults.error_rate = 1.0
+        with pytest.raises(UnexpectedStatusCodeError):
+            collection.data.insert({"count": 1})
+
+
+def test_dynamic_batch_reads_batch_stats(fake_weaviate: FakeWeaviate) -> None:
+    fake_weaviate.faults.queue_length = 500
+    fake_weaviate.faults.rate_per_second = 100
+    with fake_weaviate.connect() as client:
+        collection = client.collections.create("Dynamic")
+        with collection.batch.dynamic() as batch:
+            for i in range(10):
+                batch.add_object({"count": i})
+    assert len(fake_weaviate.objects("Dynamic")) == 10
+    assert fake_weaviate.requests["nodes"] > 0
+
+
+def test_batch_stats(fake_weaviate: FakeWeaviate) -> None:
+    fake_weaviate.faults.rate_limit = 100
+    fake_weaviate.faults.queue_length = 500
+    fake_weaviate.faults.rate_per_second = 100
+    reported: List[BatchStats] = []
+    with fake_weaviate.connect() as client:
+        collection = client.collections.create("Stats")
+        with collection.batch.dynamic(stats_callback=reported.append, stats_interval=0.1) as batch:
+            for i in range(120):
+                batch.add_object({"count": i})
+            batch.flush()
+            stats = batch.stats()
+
+        with pytest.raises(WeaviateInvalidInputError):
+            collection.batch.fixed_size(stats_interval=0)
+        with pytest.raises(WeaviateInvalidInputError):
+            client.batch.rate_limit(100, stats_interval=-1)
+
+    assert stats.objects_sent == 120
+    assert stats.objects_failed == 0
+    assert stats.retries > 0
+    assert stats.in_flight_requests == 0
+    assert stats.queued_objects == 0
+    assert stats.objects_per_second > 0
+    assert stats.server_queue_length == 500
+    assert stats.server_rate_per_second == 100
+    assert sum(stats.request_latency.values()) == fake_weaviate.requests["BatchObjects"]
+
+    # the final callback reports the totals of the finished batch
+    assert len(reported) > 1
+    assert reported[-1].objects_sent == 120
+
+
+def test_batch_splits_by_bytes() -> None:
+    # the fake rejects messages above the limit, a batch of 100 objects of 1kB would be too large
+    with FakeWeaviate(grpc_max_message_size=32 * 1024) as fake:
+        with fake.connect() as client:
+            collection = client.collections.create("Large")
+            with collection.batch.fixed_size(batch_size=100) as batch:
+                for _ in range(300):
+                    batch.add_object({"text": "a" * 1000})
+            assert len(collection.batch.failed_objects) == 0
+        assert len(fake.objects("Large")) == 300
+        assert fake.requests["BatchObjects"] >= 300 * 1000 // (16 * 1024)
+
+
+def test_batch_multiple_producers(fake_weaviate: FakeWeaviate) -> None:
+    with fake_weaviate.connect() as client:
+        collection = client.collections.create("Threads")
+        with collection.batch.dynamic() as batch:
+
+            def produce(worker: int) -> None:
+                for i in range(250):
+                    batch.add_object({"count": i}, uuid=uuid.UUID(int=worker * 1000 + i + 1))
+
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                list(pool.map(produce, range(8)))
+        assert len(collection.batch.failed_objects) == 0
+        results = collection.batch.results.objs
+    assert len(fake_weaviate.objects("Threads")) == 8 * 250
+    # every object got its own index, no matter which thread added it
+    assert sorted(results.uuids) == list(range(8 * 250))
+
+
+def test_batch_multiprocess(fake_weaviate: FakeWeaviate) -> None:
+    with fake_weaviate.connect() as client:
+        collection = client.collections.create("Processes")
+        with collection.batch.multiprocess(workers=2, batch_size=100) as batch:
+            for i in range(450):
+                # `id` is a reserved property name, the worker reports the object as failed
+                batch.add_object({"id": i} if i == 7 else {"count": i}, vector=[1.0, i])
+        assert [err.object_.index for err in collection.batch.failed_objects] == [7]
+        results = collection.batch.results.objs
+        assert sorted(results.uuids) == [i for i in range(450) if i != 7]
+
+        with client.batch.multiprocess(workers=2) as client_batch:
+            uid = client_batch.add_object("Processes", {"count": 1000})
+        assert len(client.batch.failed_objects) == 0
+
+        with pytest.raises(WeaviateInvalidInputError):
+            collection.batch.multiprocess(workers=0)
+        with pytest.raises(WeaviateInvalidInputError):
+            collection.batch.multiprocess(batch_size=0)
+        with pytest.raises(WeaviateInvalidInputError):
+            client.batch.multiprocess(workers=-1)
+    assert len(fake_weaviate.objects("Processes")) == 450
+    assert uid in {obj.uuid for obj in fake_weaviate.objects("Processes")}
+
+
+def test_batch_rate_limiter_is_shared(fake_weaviate: FakeWeaviate) -> None:
+    limiter = wvc.batch.RateLimiter(requests_per_minute=1200)
+    # another user of the limiter took the budget of the whole minute
+    limiter.acquire(1200)
+    with fake_weaviate.connect() as client:
+        collection = client.collections.create("Limited")
+        start = time.time()
+        with collection.batch.rate_limit(limiter=limiter) as batch:
+            for i in range(20):
+                batch.add_object({"count": i})
+        assert time.time() - start > 0.9
+        assert len(collection.batch.failed_objects) == 0
+
+        with pytest.raises(WeaviateInvalidInputError):
+            collection.batch.rate_limit(100, limiter=limiter)
+    assert len(fake_weaviate.objects("Limited")) == 20
+
+
+def test_batch_rate_limiter_cuts_batches_by_tokens(
+    fake_weaviate: FakeWeaviate, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    limiter = wvc.batch.RateLimiter(tokens_per_minute=60_000)
+    acquired: List[int] = []
+    acquire = limiter.acquire
+
+    def recording(requests: int, tokens: int = 0) -> None:
+        acquired.append(tokens)
+        acquire(requests, tokens)
+
+    monkeypatch.setattr(limiter, "acquire", recording)
+    with fake_weaviate.connect() as client:
+        collection = client.collections.create("TokenLimited")
+        with collection.batch.rate_limit(limiter=limiter) as batch:
+            # about 1000 tokens each, far fewer than the default batch size of a limiter without an object budget
+            for i in range(40):
+                batch.add_object({"text": "a" * 4000, "count": i})
+        assert len(collection.batch.failed_objects) == 0
+    # two concurrent batches at most use the budget of a minute
+    assert sum(acquired) == 40 * 1000
+    assert len(acquired) > 1
+    assert max(acquired) <= 30_000
+    assert len(fake_weaviate.objects("TokenLimited")) == 40
+
+
+class _CountingExecutor(ThreadPoolExecutor):
+    def __init__(self) -> None:
+        super().__init__(max_workers=1)
+        self.calls: List[str] = []
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Any:
+        # the event loop also resolves host names in its default executor
+        if fn.__module__.startswith("weaviate."):
+            self.calls.append(fn.__name__)
+        return super().submit(fn, *args, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_async_offloads_large_payloads(fake_weaviate: FakeWeaviate) -> None:
+    pool = _CountingExecutor()
+    asyncio.get_running_loop().set_default_executor(pool)
+    async with weaviate.use_async_with_local(
+        host=fake_weaviate.host,
+        port=fake_weaviate.http_port,
+        grpc_port=fake_weaviate.grpc_port,
+        additional_config=wvc.init.AdditionalConfig(offload_threshold=10_000),
+    ) as client:
+        collection = await client.collections.create("Offloaded")
+        await collection.data.insert_many([{"text": "a"} for _ in range(3)])
+        assert pool.calls == []
+
+        # about 20kB in both directions
+        res = await collection.data.insert_many([{"text": "a" * 100} for _ in range(200)])
+        assert len(res.uuids) == 200
+        assert pool.calls == ["__encode"]
+
+        found = await collection.query.fetch_objects(limit=1)
+        assert len(found.objects) == 1
+        assert pool.calls == ["__encode"]
+
+        found = await collection.query.fetch_objects(limit=1000)
+        assert len(found.objects) == 203
+        assert pool.calls == ["__encode", "resp"]
+
+
+def test_delete_many_until_empty() -> None:
+    with FakeWeaviate(query_maximum_results=100) as fake:
+        with fake.connect() as client:
+            collection = client.collections.create("Cleanup")
+            collection.data.insert_many([{"count": i} for i in range(250)])
+
+            res = collection.data.delete_many(where=Filter.by_property("count").less_than(200))
+            assert (res.matches, res.successful) == (100, 100)
+
+            reported: List[DeleteManyReturn] = []
+            rest = collection.data.delete_many(
+                where=Filter.by_property("count").greater_or_equal(0),
+                until_empty=True,
+                progress_callback=reported.append,
+            )
+            assert (rest.matches, rest.successful, rest.failed) == (150, 150, 0)
+            assert [progress.successful for progress in reported] == [100, 150, 150]
+            assert len(collection) == 0
+
+
+def test_delete_many_splits_uuid_lists(fake_weaviate: FakeWeaviate) -> None:
+    uuids = [uuid.UUID(int=i + 1) for i in range(250)]
+    with fake_weaviate.connect() as client:
+        collection = client.collections.create("Cleanup")
+        collection.data.insert_many(
+            [wvc.data.DataObject(properties={"count": i}, uuid=uid) for i, uid in enumerate(uuids)]
+        )
+
+        res = collection.data.delete_many(
+            where=Filter.by_id().contains_any(uuids[:200]),
+            verbose=True,
+            chunk_size=40,
+            concurrent_requests=3,
+        )
+        assert (res.matches, res.successful) == (200, 200)
+        assert res.objects is not None
+        assert sorted(obj.uuid for obj in res.objects) == uuids[:200]
+        assert fake_weaviate.requests["BatchDelete"] == 5
+
+        with pytest.raises(WeaviateInvalidInputError):
+            collection.data.delete_many(where=Filter.by_id().contains_any(uuids), chunk_size=0)
+        with pytest.raises(WeaviateInvalidInputError):
+            collection.data.delete_many(
+                where=Filter.by_id().contains_any(uuids), concurrent_requests=0
+            )
+        assert fake_weaviate.requests["BatchDelete"] == 5
+    assert sorted(obj.uuid for obj in fake_weaviate.objects("Cleanup")) == [
+        str(uid) for uid in uuids[200:]
+    ]
+
+
+@pytest.mark.asyncio
+async def test_delete_many_async() -> None:
+    uuids = [uuid.UUID(int=i + 1) for i in range(100)]
+    with FakeWeaviate(query_maximum_results=30) as fake:
+        async with weaviate.use_async_with_local(
+            host=fake.host, port=fake.http_port, grpc_port=fake.grpc_port
+        ) as client:
+            collection = await client.collections.create("Cleanup")
+            await collection.data.insert_many(
+                [
+                    wvc.data.DataObject(properties={"count": i}, uuid=uid)
+                    for i, uid in enumerate(uuids)
+                ]
+            )
+
+            res = await collection.data.delete_many(
+                where=Filter.by_id().contains_any(uuids[:50]), chunk_size=20
+            )
+            assert res.successful == 50
+            res = await collection.data.delete_many(
+                where=Filter.by_property("count").greater_or_equal(0), until_empty=True
+            )
+            assert res.successful == 50
+        assert fake.objects("Cleanup") == []
@@ -0,0 +1,144 @@
+import csv
+import json
+import uuid
+from pathlib import Path
+from typing import List
+
+import pytest
+
+import weaviate
+import weaviate.classes as wvc
+from mock_tests.fake_weaviate import FakeWeaviate
+from weaviate.exceptions import WeaviateInvalidInputError
+from weaviate.outputs.data import ImportFileProgress
+
+UUIDS = [uuid.UUID(int=i + 1) for i in range(25)]
+
+
+def test_import_jsonl(fake_weaviate: FakeWeaviate, tmp_path: Path) -> None:
+    path = tmp_path / "products.jsonl"
+    with open(path, "w") as f:
+        for i, uid in enumerate(UUIDS):
+            f.write(json.dumps({"id": str(uid), "title": f"product {i}", "emb": [1.0, i]}) + "\n")
+            if i == 3:
+                f.write("\n")
+
+    reported: List[ImportFileProgress] = []
+    with fake_weaviate.connect() as client:
+        collection = client.collections.create("Products")
+        res = collection.data.import_file(
+            str(path),
+            mapping=wvc.data.FileMapping(properties={"title": "name"}, uuid="id", vector="emb"),
+            chunk_size=10,
+            progress_callback=reported.append,
+        )
+        assert res.rows == 25
+        assert res.objects_imported == 25
+        assert not res.has_errors
+
+        with pytest.raises(WeaviateInvalidInputError):
+            collection.data.import_file(str(tmp_path / "products.txt"))
+        with pytest.raises(WeaviateInvalidInputError):
+            collection.data.import_file(str(path), chunk_size=0)
+
+    assert [progress.rows for progress in reported] == [10, 20, 25]
+    assert reported[-1].objects_imported == 25
+    stored = {obj.uuid: obj for obj in fake_weaviate.objects("Products")}
+    assert sorted(stored) == [str(uid) for uid in UUIDS]
+    assert stored[str(UUIDS[4])].properties == {"name": "product 4"}
+    assert stored[str(UUIDS[4])].vectors[""].tolist() == [1.0, 4.0]
+
+
+class _Interrupted(Exception):
+    pass
+
+
+def test_import_csv_resumes_from_checkpoint(fake_weaviate: FakeWeaviate, tmp_path: Path) -> None:
+    path = tmp_path / "rows.csv"
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["name", "count"])
+        writer.writerows([f"row {i}", i] for i in range(25))
+    checkpoint = str(tmp_path / "rows.checkpoint")
+
+    def interrupt(progress: ImportFileProgress) -> None:
+        raise _Interrupted()
+
+    with fake_weaviate.connect() as client:
+        collection = client.collections.create("Rows")
+        with pytest.raises(_Interrupted):
+            collection.data.import_file(
+                str(path), chunk_size=10, checkpoint=checkpoint, progress_callback=interrupt
+            )
+        assert len(fake_weaviate.objects("Rows")) == 10
+
+        # the objects have random UUIDs, the rows before the checkpoint are not imported again
+        res = collection.data.import_file(str(path), chunk_size=10, checkpoint=checkpoint)
+        assert (res.rows, res.skipped_rows, res.objects_imported) == (25, 10, 15)
+        assert len(fake_weaviate.objects("Rows")) == 25
+        assert sorted(obj.properties["count"] for obj in fake_weaviate.objects("Rows")) == list(
+            range(25)
+        )
+
+        res = collection.data.import_file(str(path), checkpoint=checkpoint)
+        assert (res.rows, res.skipped_rows, res.objects_imported) == (25, 25, 0)
+
+        with open(path, "a") as f:
+            f.write("row 25,25\n")
+        with pytest.raises(WeaviateInvalidInputError):
+            collection.data.import_file(str(path), checkpoint=checkpoint)
+
+
+@pytest.mark.asyncio
+async def test_import_parquet_async(fake_weaviate: FakeWeaviate, tmp_path: Path) -> None:
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "rows.parquet"
+    table = pa.table({"name": [f"row {i}" for i in range(25)], "count": list(range(25))})
+    pq.write_table(table, path, row_group_size=8)
+    checkpoint = tmp_path / "rows.checkpoint"
+    # resumes in the middle of the second row group
+    checkpoint.write_text(json.dumps({"file": str(path), "size": path.stat().st_size, "rows": 12}))
+
+    async with weaviate.use_async_with_local(
+        host=fake_weaviate.host, port=fake_weaviate.http_port, grpc_port=fake_weaviate.grpc_port
+    ) as client:
+        collection = await client.collections.create("Parquet")
+        res = await collection.data.import_file(str(path), chunk_size=5, checkpoint=str(checkpoint))
+        assert (res.rows, res.objects_imported) == (25, 13)
+    counts = sorted(obj.properties["count"] for obj in fake_weaviate.objects("Parquet"))
+    assert counts == list(range(12, 25))
+    assert json.loads(checkpoint.read_text())["rows"] == 25
+
+
+def test_import_parquet_columns(fake_weaviate: FakeWeaviate, tmp_path: Path) -> None:
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "vectors.parquet"
+    vectors = pa.FixedSizeListArray.from_arrays(
+        pa.array([float(v) for i in range(25) for v in (i, -i, 0.5)], type=pa.float32()), 3
+    )
+    table = pa.table(
+        {
+            "id": pa.array([uid.bytes for uid in UUIDS], type=pa.binary(16)),
+            "title": [f"row {i}" if i % 5 != 0 else None for i in range(25)],
+            "emb": vectors,
+        }
+    )
+    pq.write_table(table, path, row_group_size=7)
+
+    with fake_weaviate.connect() as client:
+        collection = client.collections.create("Vectors")
+        res = collection.data.import_file(
+            str(path),
+            mapping=wvc.data.FileMapping(uuid="id", vector="emb"),
+            chunk_size=10,
+        )
+        assert (res.rows, res.objects_imported) == (25, 25)
+
+    stored = {obj.uuid: obj for obj in fake_weaviate.objects("Vectors")}
+    assert sorted(stored) == [str(uid) for uid in UUIDS]
+    assert stored[str(UUIDS[3])].properties == {"title": "row 3"}
+    # null values are not imported as properties
+    assert stored[str(UUIDS[5])].properties == {}
+    assert stored[str(UUIDS[3])].vectors[""].tolist() == [3.0, -3.0, 0.5]
@@ -0,0 +1,74 @@
+import uuid
+
+import pytest
+
+import weaviate
+import weaviate.classes as wvc
+from mock_tests.fake_weaviate import OBJECT_ERROR, FakeWeaviate
+from weaviate.exceptions import WeaviateInvalidInputError
+
+UUIDS = [uuid.UUID(int=i + 1) for i in range(2500)]
+
+
+def test_insert_many_is_split_by_count(fake_weaviate: FakeWeaviate) -> None:
+    fake_weaviate.faults.object_error_rate = 0.2
+    with fake_weaviate.connect() as client:
+        collection = client.collections.create("Chunked")
+        res = collection.data.insert_many(
+            [wvc.data.DataObject(properties={"count": i}, uuid=uid) for i, uid in enumerate(UUIDS)],
+            batch_size=1000,
+            concurrent_requests=3,
+        )
+    assert fake_weaviate.requests["BatchObjects"] == 3
+
+    # the indexes refer to the position in the input, no matter which request an object was sent with
+    stored = {uuid.UUID(obj.uuid) for obj in fake_weaviate.objects("Chunked")}
+    assert res.has_errors
+    assert set(res.uuids) | set(res.errors) == set(range(len(UUIDS)))
+    assert all(UUIDS[idx] == uid for idx, uid in res.uuids.items())
+    assert {UUIDS[idx] for idx in res.uuids} == stored
+    assert all(err.message == OBJECT_ERROR for err in res.errors.values())
+    assert all(err.original_uuid == str(UUIDS[idx]) for idx, err in res.errors.items())
+
+
+@pytest.mark.parametrize("kwargs", [{"batch_size": 0}, {"concurrent_requests": 0}])
+def test_insert_many_rejects_non_positive_sizes(fake_weaviate: FakeWeaviate, kwargs: dict) -> None:
+    with fake_weaviate.connect() as client:
+        collection = client.collections.create("Invalid")
+        with pytest.raises(WeaviateInvalidInputError):
+            collection.data.insert_many([{"count": 1}], **kwargs)
+    assert "BatchObjects" not in fake_weaviate.requests
+
+
+def test_insert_many_is_split_by_size() -> None:
+    with FakeWeaviate(grpc_max_message_size=16 * 1024) as fake:
+        with fake.connect() as client:
+            collection = client.collections.create("Sized")
+            objects = [
+                wvc.data.DataObject(properties={"text": "a" * 1000}, uuid=uid) for uid in UUIDS[:50]
+            ]
+            # does not fit into any request, it fails on its own without failing the other objects
+            objects[20] = wvc.data.DataObject(properties={"text": "a" * 32 * 1024}, uuid=UUIDS[20])
+            res = collection.data.insert_many(objects)
+
+        assert fake.requests["BatchObjects"] > 3
+        assert list(res.errors) == [20]
+        assert len(res.uuids) == 49
+        assert len(fake.objects("Sized")) == 49
+
+
+@pytest.mark.asyncio
+async def test_insert_many_async(fake_weaviate: FakeWeaviate) -> None:
+    async with weaviate.use_async_with_local(
+        host=fake_weaviate.host, port=fake_weaviate.http_port, grpc_port=fake_weaviate.grpc_port
+    ) as client:
+        collection = await client.collections.create("Async")
+        res = await collection.data.insert_many(
+            [wvc.data.DataObject(properties={"count": i}, uuid=uid) for i, uid in enumerate(UUIDS)],
+            batch_size=300,
+            concurrent_requests=4,
+        )
+    assert not res.has_errors
+    assert res.uuids == dict(enumerate(UUIDS))
+    assert fake_weaviate.requests["BatchObjects"] == 9
+    assert len(fake_weaviate.objects("Async")) == len(UUIDS)
@@ -0,0 +1,55 @@
+import grpc
+import pytest
+from pytest_httpserver import HTTPServer
+
+import weaviate
+from mock_tests.conftest import MOCK_IP, MOCK_PORT, MOCK_PORT_GRPC, MockMultiTenantSearchService
+from weaviate.classes.query import MetadataQuery
+from weaviate.exceptions import WeaviateInvalidInputError
+from weaviate.proto.v1 import weaviate_pb2_grpc
+
+
+def test_multi_tenant_near_vector_merges_top_k(
+    multi_tenant_search: tuple[weaviate.collections.Collection, MockMultiTenantSearchService],
+) -> None:
+    collection, service = multi_tenant_search
+    res = collection.query.multi_tenant(
+        [f"tenant{i}" for i in range(1, 6)], max_concurrency=2
+    ).near_vector([1.0, 2.0], limit=4, return_metadata=MetadataQuery(distance=True))
+
+    assert sorted(service.searched_tenants) == [f"tenant{i}" for i in range(1, 6)]
+    assert [obj.tenant for obj in res.objects] == ["tenant1", "tenant2", "tenant3", "tenant1"]
+    assert [obj.metadata.distance for obj in res.objects] == pytest.approx([0.1, 0.2, 0.3, 0.35])
+    assert res.objects[0].properties["name"] == "tenant1"
+
+
+def test_multi_tenant_near_vector_early_stop(
+    multi_tenant_search: tuple[weaviate.collections.Collection, MockMultiTenantSearchService],
+) -> None:
+    collection, service = multi_tenant_search
+    res = collection.query.multi_tenant(
+        ["tenant1", "tenant2", "tenant3"], max_concurrency=1
+    ).near_vector([1.0, 2.0], limit=2, early_stop_distance=0.4)
+
+    assert service.searched_tenants == ["tenant1"]
+    assert [obj.tenant for obj in res.objects] == ["tenant1", "tenant1"]
+
+    with pytest.raises(WeaviateInvalidInputError):
+        collection.query.multi_tenant(["tenant1"]).near_vector([1.0], early_stop_distance=0.4)
+
+
+@pytest.mark.asyncio
+async def test_multi_tenant_near_vector_async(
+    weaviate_mock: HTTPServer, start_grpc_server: grpc.Server
+) -> None:
+    service = MockMultiTenantSearchService()
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(service, start_grpc_server)
+    async with weaviate.use_async_with_local(
+        host=MOCK_IP, port=MOCK_PORT, grpc_port=MOCK_PORT_GRPC
+    ) as client:
+        collection = client.collections.use("MultiTenantSearchCollection")
+        res = await collection.query.multi_tenant(
+            ["tenant3", "tenant2", "tenant1"], max_concurrency=2
+        ).near_vector([1.0, 2.0], limit=3)
+
+    assert [obj.tenant for obj in res.objects] == ["tenant1", "tenant2", "tenant3"]
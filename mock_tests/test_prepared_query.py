@@ -0,0 +1,102 @@
+import struct
+import uuid
+from typing import List
+
+import grpc
+import pytest
+from pytest_httpserver import HTTPServer
+
+import weaviate
+from mock_tests.conftest import MOCK_IP, MOCK_PORT, MOCK_PORT_GRPC
+from weaviate.classes.query import Filter, MetadataQuery
+from weaviate.exceptions import WeaviateInvalidInputError
+from weaviate.proto.v1 import properties_pb2, search_get_pb2, weaviate_pb2_grpc
+
+
+class MockRecordingSearchService(weaviate_pb2_grpc.WeaviateServicer):
+    def __init__(self) -> None:
+        self.requests: List[search_get_pb2.SearchRequest] = []
+
+    def Search(
+        self, request: search_get_pb2.SearchRequest, context: grpc.ServicerContext
+    ) -> search_get_pb2.SearchReply:
+        self.requests.append(request)
+        return search_get_pb2.SearchReply(
+            results=[
+                search_get_pb2.SearchResult(
+                    properties=search_get_pb2.PropertiesResult(
+                        non_ref_props=properties_pb2.Properties(
+                            fields={"name": properties_pb2.Value(text_value=f"name {i}")}
+                        )
+                    ),
+                    metadata=search_get_pb2.MetadataResult(
+                        id_as_bytes=uuid.UUID(int=i).bytes, distance=i / 10, distance_present=True
+                    ),
+                )
+                for i in range(request.limit)
+            ]
+        )
+
+
+def test_prepared_query(
+    weaviate_client: weaviate.WeaviateClient, start_grpc_server: grpc.Server
+) -> None:
+    service = MockRecordingSearchService()
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(service, start_grpc_server)
+    collection = weaviate_client.collections.use("PreparedCollection").with_tenant("tenant")
+
+    prepared = collection.query.prepare(
+        limit=2,
+        filters=Filter.by_property("name").equal("name"),
+        distance=0.5,
+        query_properties=["name"],
+        return_metadata=MetadataQuery(distance=True),
+        return_properties=["name"],
+    )
+
+    res = prepared.near_vector([1.0, 2.0])
+    assert [obj.properties for obj in res.objects] == [{"name": "name 0"}, {"name": "name 1"}]
+    assert res.objects[1].metadata.distance == pytest.approx(0.1)
+
+    assert len(prepared.near_vector([3.0, 4.0], limit=3).objects) == 3
+    assert len(prepared.bm25("name").objects) == 2
+    assert len(prepared.near_text("name").objects) == 2
+
+    first, second, bm25, near_text = service.requests
+    assert first.near_vector.distance == pytest.approx(0.5)
+    assert first.near_vector.vector_bytes == struct.pack("2f", 1.0, 2.0)
+    assert second.near_vector.vector_bytes == struct.pack("2f", 3.0, 4.0)
+    assert [first.limit, second.limit, bm25.limit] == [2, 3, 2]
+    assert bm25.bm25_search.query == "name" and list(bm25.bm25_search.properties) == ["name"]
+    assert not bm25.HasField("near_vector")
+    assert list(near_text.near_text.query) == ["name"]
+    for request in service.requests:
+        assert request.tenant == "tenant"
+        assert request.filters.target.property == "name"
+        assert list(request.properties.non_ref_properties) == ["name"]
+        assert request.metadata.distance
+
+
+def test_prepared_query_validates_arguments_once(weaviate_client: weaviate.WeaviateClient) -> None:
+    collection = weaviate_client.collections.use("PreparedCollection")
+    with pytest.raises(WeaviateInvalidInputError):
+        collection.query.prepare(limit="2")  # type: ignore[arg-type]
+
+    prepared = collection.query.prepare()
+    with pytest.raises(WeaviateInvalidInputError):
+        prepared.near_vector([1.0], limit="2")  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_prepared_query_async(
+    weaviate_mock: HTTPServer, start_grpc_server: grpc.Server
+) -> None:
+    service = MockRecordingSearchService()
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(service, start_grpc_server)
+    async with weaviate.use_async_with_local(
+        host=MOCK_IP, port=MOCK_PORT, grpc_port=MOCK_PORT_GRPC
+    ) as client:
+        prepared = client.collections.use("PreparedCollection").query.prepare(limit=1)
+        results = [await prepared.near_vector([float(i), 0.0]) for i in range(3)]
+    assert [len(res.objects) for res in results] == [1, 1, 1]
+    assert len(service.requests) == 3
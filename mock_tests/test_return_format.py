@@ -0,0 +1,125 @@
+import struct
+import uuid
+from typing import List
+
+import grpc
+import pytest
+from pytest_httpserver import HTTPServer
+
+import weaviate
+from mock_tests.conftest import MOCK_IP, MOCK_PORT, MOCK_PORT_GRPC
+from weaviate.classes.query import GroupBy, MetadataQuery
+from weaviate.exceptions import WeaviateInvalidInputError
+from weaviate.proto.v1 import properties_pb2, search_get_pb2, weaviate_pb2_grpc
+
+UUIDS = [uuid.UUID(int=i + 1) for i in range(5)]
+
+
+class MockPagedSearchService(weaviate_pb2_grpc.WeaviateServicer):
+    """Returns the objects after the `after` cursor of the request, up to its limit."""
+
+    def __init__(self) -> None:
+        self.requests: List[search_get_pb2.SearchRequest] = []
+
+    def Search(
+        self, request: search_get_pb2.SearchRequest, context: grpc.ServicerContext
+    ) -> search_get_pb2.SearchReply:
+        self.requests.append(request)
+        start = UUIDS.index(uuid.UUID(request.after)) + 1 if request.after else 0
+        return search_get_pb2.SearchReply(
+            results=[
+                search_get_pb2.SearchResult(
+                    properties=search_get_pb2.PropertiesResult(
+                        non_ref_props=properties_pb2.Properties(
+                            fields={"position": properties_pb2.Value(int_value=i)}
+                        )
+                    ),
+                    metadata=search_get_pb2.MetadataResult(
+                        id_as_bytes=UUIDS[i].bytes,
+                        distance=i / 10,
+                        distance_present=True,
+                        vector_bytes=struct.pack("<2f", i, i),
+                    ),
+                )
+                for i in range(start, min(start + (request.limit or len(UUIDS)), len(UUIDS)))
+            ]
+        )
+
+
+@pytest.fixture(scope="function")
+def paged_collection(
+    weaviate_client: weaviate.WeaviateClient, start_grpc_server: grpc.Server
+) -> weaviate.collections.Collection:
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(MockPagedSearchService(), start_grpc_server)
+    return weaviate_client.collections.use("PagedCollection")
+
+
+def test_near_vector_polars(paged_collection: weaviate.collections.Collection) -> None:
+    pl = pytest.importorskip("polars")
+    df = paged_collection.query.near_vector(
+        [1.0, 2.0],
+        include_vector=True,
+        return_metadata=MetadataQuery(distance=True),
+        return_format="polars",
+    )
+    assert df["uuid"].to_list() == [u.bytes for u in UUIDS]
+    assert df["position"].to_list() == [0, 1, 2, 3, 4]
+    assert df["distance"].to_list() == pytest.approx([0.0, 0.1, 0.2, 0.3, 0.4])
+    assert df.schema["vector"] == pl.Array(pl.Float32, 2)
+
+
+def test_near_vector_ids(
+    weaviate_client: weaviate.WeaviateClient, start_grpc_server: grpc.Server
+) -> None:
+    np = pytest.importorskip("numpy")
+    service = MockPagedSearchService()
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(service, start_grpc_server)
+    collection = weaviate_client.collections.use("PagedCollection")
+
+    uuids, distances = collection.query.near_vector_ids([1.0, 2.0], limit=3)
+    assert [uuid.UUID(bytes=u.tobytes()) for u in uuids] == UUIDS[:3]
+    assert distances.dtype == np.float32
+    assert distances.tolist() == pytest.approx([0.0, 0.1, 0.2])
+
+    request = service.requests[0]
+    assert request.metadata.uuid and request.metadata.distance
+    assert not request.metadata.vector and not request.metadata.certainty
+    assert not request.properties.return_all_nonref_properties
+    assert len(request.properties.non_ref_properties) == 0
+
+
+def test_return_format_rejects_group_by(paged_collection: weaviate.collections.Collection) -> None:
+    with pytest.raises(WeaviateInvalidInputError):
+        paged_collection.query.near_vector(
+            [1.0, 2.0],
+            group_by=GroupBy(prop="position", number_of_groups=1, objects_per_group=1),
+            return_format="pandas",
+        )
+
+
+def test_iterator_pandas(paged_collection: weaviate.collections.Collection) -> None:
+    pytest.importorskip("pandas")
+    pages = list(paged_collection.iterator(return_format="pandas", cache_size=2))
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert [pos for page in pages for pos in page["position"]] == [0, 1, 2, 3, 4]
+
+    pages = list(paged_collection.iterator(return_format="pandas", after=UUIDS[2], cache_size=2))
+    assert [pos for page in pages for pos in page["position"]] == [3, 4]
+
+
+@pytest.mark.asyncio
+async def test_iterator_arrow_async(
+    weaviate_mock: HTTPServer, start_grpc_server: grpc.Server
+) -> None:
+    pytest.importorskip("pyarrow")
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(MockPagedSearchService(), start_grpc_server)
+    async with weaviate.use_async_with_local(
+        host=MOCK_IP, port=MOCK_PORT, grpc_port=MOCK_PORT_GRPC
+    ) as client:
+        collection = client.collections.use("PagedCollection")
+        positions = [
+            pos
+            async for table in collection.iterator(return_format="arrow", cache_size=3)
+            for pos in table.column("position").to_pylist()
+        ]
+    assert positions == [0, 1, 2, 3, 4]
@@ -0,0 +1,114 @@
+import copy
+import json
+from typing import Generator, List
+
+import grpc
+import pytest
+from pytest_httpserver import HTTPServer
+from werkzeug.wrappers import Request, Response
+
+import weaviate
+from weaviate.collections.classes.config import _CollectionConfig
+from weaviate.collections.classes.config_methods import _collection_config_from_json
+
+from mock_tests.conftest import MOCK_IP, MOCK_PORT, MOCK_PORT_GRPC
+from mock_tests.mock_data import mock_class
+
+
+@pytest.fixture(scope="function")
+def caching_client(
+    weaviate_mock: HTTPServer, start_grpc_server: grpc.Server
+) -> Generator[weaviate.WeaviateClient, None, None]:
+    client = weaviate.connect_to_local(
+        host=MOCK_IP,
+        port=MOCK_PORT,
+        grpc_port=MOCK_PORT_GRPC,
+        additional_config=weaviate.classes.init.AdditionalConfig(schema_cache_ttl=60),
+    )
+    yield client
+    client.close()
+
+
+def count_schema_gets(weaviate_mock: HTTPServer) -> List[str]:
+    gets: List[str] = []
+
+    def get_collection(request: Request) -> Response:
+        gets.append(request.path)
+        return Response(json.dumps(mock_class), content_type="application/json")
+
+    def get_all(request: Request) -> Response:
+        gets.append(request.path)
+        return Response(json.dumps({"classes": [mock_class]}), content_type="application/json")
+
+    weaviate_mock.expect_request(
+        f"/v1/schema/{mock_class['class']}", method="GET"
+    ).respond_with_handler(get_collection)
+    weaviate_mock.expect_request("/v1/schema", method="GET").respond_with_handler(get_all)
+    return gets
+
+
+def test_config_get_is_cached_and_invalidated(
+    caching_client: weaviate.WeaviateClient, weaviate_mock: HTTPServer
+) -> None:
+    gets = count_schema_gets(weaviate_mock)
+    weaviate_mock.expect_request(
+        f"/v1/schema/{mock_class['class']}/properties", method="POST"
+    ).respond_with_json({})
+    collection = caching_client.collections.use(mock_class["class"])
+
+    config = collection.config.get()
+    assert config == collection.config.get()
+    assert len(gets) == 1
+
+    collection.config.add_property(
+        weaviate.classes.config.Property(
+            name="new", data_type=weaviate.classes.config.DataType.TEXT
+        )
+    )
+    # adding a property always reads the schema from the server and invalidates the cached one
+    assert len(gets) == 3
+    collection.config.get()
+    assert len(gets) == 4
+
+
+def test_list_all_fills_cache(
+    caching_client: weaviate.WeaviateClient, weaviate_mock: HTTPServer
+) -> None:
+    gets = count_schema_gets(weaviate_mock)
+    weaviate_mock.expect_request(
+        f"/v1/schema/{mock_class['class']}", method="DELETE"
+    ).respond_with_json({})
+
+    caching_client.collections.list_all(simple=False)
+    caching_client.collections.list_all()
+    caching_client.collections.export_config(mock_class["class"])
+    assert gets == ["/v1/schema"]
+
+    caching_client.collections.delete(mock_class["class"])
+    caching_client.collections.list_all()
+    assert gets == ["/v1/schema", "/v1/schema"]
+
+
+def test_no_cache_by_default(
+    weaviate_client: weaviate.WeaviateClient, weaviate_mock: HTTPServer
+) -> None:
+    gets = count_schema_gets(weaviate_mock)
+    collection = weaviate_client.collections.use(mock_class["class"])
+    collection.config.get()
+    collection.config.get()
+    assert len(gets) == 2
+
+
+def test_lazy_collection_config() -> None:
+    schema = copy.deepcopy(mock_class)
+    config = weaviate.collections.classes.config_methods._collection_config_lazy_from_json(schema)
+    assert isinstance(config, _CollectionConfig)
+    assert "properties" not in config.__dict__
+    assert config.properties[0].name == "names"
+    assert "properties" in config.__dict__
+    assert "vector_index_config" not in config.__dict__
+
+    eager = _collection_config_from_json(schema)
+    assert config == eager
+    assert repr(config) == repr(eager)
+    assert config.to_dict() == eager.to_dict()
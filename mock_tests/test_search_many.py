@@ -0,0 +1,44 @@
+import grpc
+import pytest
+from pytest_httpserver import HTTPServer
+
+import weaviate
+from mock_tests.conftest import MOCK_IP, MOCK_PORT, MOCK_PORT_GRPC, MockSearchManyService
+from weaviate.classes.query import MetadataQuery
+from weaviate.exceptions import WeaviateInvalidInputError
+from weaviate.proto.v1 import weaviate_pb2_grpc
+
+
+def test_search_many_near_vector_merges_by_distance(
+    search_many_client: weaviate.WeaviateClient,
+) -> None:
+    res = search_many_client.query.search_many(
+        ["First", "second", "Third"],
+        near_vector=[1.0, 2.0],
+        limit=4,
+        return_metadata=MetadataQuery(distance=True),
+    )
+    assert [obj.collection for obj in res.objects] == ["Second", "Third", "First", "Third"]
+    assert [obj.metadata.distance for obj in res.objects] == pytest.approx([0.1, 0.2, 0.3, 0.4])
+
+
+def test_search_many_hybrid_merges_by_rrf(search_many_client: weaviate.WeaviateClient) -> None:
+    res = search_many_client.query.search_many(["First", "Second", "Third"], query="hello", limit=4)
+    # scores are not comparable across collections, so objects are interleaved by rank
+    assert [obj.collection for obj in res.objects] == ["First", "Second", "Third", "First"]
+    assert [obj.properties["rank"] for obj in res.objects] == [0, 0, 0, 1]
+
+    with pytest.raises(WeaviateInvalidInputError):
+        search_many_client.query.search_many(["First"])
+
+
+@pytest.mark.asyncio
+async def test_search_many_async(weaviate_mock: HTTPServer, start_grpc_server: grpc.Server) -> None:
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(MockSearchManyService(), start_grpc_server)
+    async with weaviate.use_async_with_local(
+        host=MOCK_IP, port=MOCK_PORT, grpc_port=MOCK_PORT_GRPC
+    ) as client:
+        res = await client.query.search_many(
+            ["First", "Second"], near_vector=[1.0, 2.0], limit=2, max_concurrency=1
+        )
+    assert [obj.collection for obj in res.objects] == ["Second", "First"]
@@ -0,0 +1,136 @@
+import uuid
+from pathlib import Path
+from typing import List, Sequence
+
+import pytest
+
+import weaviate
+import weaviate.classes as wvc
+from mock_tests.fake_weaviate import FakeWeaviate
+from weaviate.collections.batch.base import STAGING_BUFFER_SIZE
+from weaviate.collections.batch.sync_index import _Key
+from weaviate.exceptions import WeaviateInvalidInputError
+
+UUIDS = [uuid.UUID(int=i + 1) for i in range(250)]
+
+
+def _snapshot(changed: int = -1, count: int = 100) -> List[wvc.data.DataObject]:
+    return [
+        wvc.data.DataObject(
+            properties={"count": i, "text": "changed" if i == changed else "text"},
+            uuid=UUIDS[i],
+            vector=[1.0, i],
+        )
+        for i in range(count)
+    ]
+
+
+def test_insert_many_skips_unchanged_objects(fake_weaviate: FakeWeaviate, tmp_path: Path) -> None:
+    path = str(tmp_path / "index")
+    with fake_weaviate.connect() as client:
+        collection = client.collections.create("Synced")
+        with wvc.batch.SyncIndex(path) as index:
+            res = collection.data.insert_many(_snapshot(), sync_index=index)
+            assert len(res.uuids) == 100
+            assert len(index) == 100
+        assert fake_weaviate.requests["BatchObjects"] == 1
+
+        # the next snapshot changed one object and lost the last ten
+        with wvc.batch.SyncIndex(path) as index:
+            res = collection.data.insert_many(_snapshot(changed=5, count=90), sync_index=index)
+            assert res.uuids == dict(enumerate(UUIDS[:90]))
+            assert fake_weaviate.requests["BatchObjects"] == 2
+
+            with pytest.raises(WeaviateInvalidInputError):
+                collection.data.delete_vanished(index, chunk_size=0)
+            deleted = collection.data.delete_vanished(index, chunk_size=3)
+            assert deleted.successful == 10
+            assert len(index) == 90
+
+        stored = {uuid.UUID(obj.uuid): obj for obj in fake_weaviate.objects("Synced")}
+        assert set(stored) == set(UUIDS[:90])
+        assert stored[UUIDS[5]].properties["text"] == "changed"
+
+        # nothing changed and nothing vanished, no request is sent
+        with wvc.batch.SyncIndex(path) as index:
+            res = collection.data.insert_many(_snapshot(changed=5, count=90), sync_index=index)
+            assert len(res.uuids) == 90
+            assert collection.data.delete_vanished(index).matches == 0
+        assert fake_weaviate.requests["BatchObjects"] == 2
+
+
+def test_batch_skips_unchanged_objects(fake_weaviate: FakeWeaviate, tmp_path: Path) -> None:
+    path = str(tmp_path / "index")
+    with fake_weaviate.connect() as client:
+        collection = client.collections.create("SyncedBatch")
+        fake_weaviate.faults.object_error_rate = 0.5
+        with wvc.batch.SyncIndex(path) as index:
+            with collection.batch.fixed_size(batch_size=10, sync_index=index) as batch:
+                for obj in _snapshot():
+                    batch.add_object(obj.properties, uuid=obj.uuid, vector=obj.vector)
+            failed = {err.object_.uuid for err in collection.batch.failed_objects}
+            # only the imported objects are recorded, the failed ones are sent again
+            assert len(index) == 100 - len(failed)
+
+        fake_weaviate.faults.object_error_rate = 0
+        with wvc.batch.SyncIndex(path) as index:
+            with collection.batch.fixed_size(batch_size=10, sync_index=index) as batch:
+                for obj in _snapshot():
+                    batch.add_object(obj.properties, uuid=obj.uuid, vector=obj.vector)
+            assert set(collection.batch.results.objs.uuids.values()) == {
+                uuid.UUID(uid) for uid in failed
+            }
+            assert len(index) == 100
+    assert len(fake_weaviate.objects("SyncedBatch")) == 100
+
+
+@pytest.mark.asyncio
+async def test_sync_index_async(fake_weaviate: FakeWeaviate, tmp_path: Path) -> None:
+    path = str(tmp_path / "index")
+    async with weaviate.use_async_with_local(
+        host=fake_weaviate.host, port=fake_weaviate.http_port, grpc_port=fake_weaviate.grpc_port
+    ) as client:
+        collection = await client.collections.create("SyncedAsync")
+        with wvc.batch.SyncIndex(path) as index:
+            await collection.data.insert_many(_snapshot(), sync_index=index)
+        with wvc.batch.SyncIndex(path) as index:
+            res = await collection.data.insert_many(_snapshot(count=50), sync_index=index)
+            assert len(res.uuids) == 50
+            assert (await collection.data.delete_vanished(index)).successful == 50
+    assert fake_weaviate.requests["BatchObjects"] == 1
+    assert len(fake_weaviate.objects("SyncedAsync")) == 50
+
+
+def test_sync_index_lookups_per_chunk(
+    fake_weaviate: FakeWeaviate, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    lookups: List[int] = []
+    unchanged = wvc.batch.SyncIndex._unchanged
+
+    def counting(
+        index: wvc.batch.SyncIndex, keys: Sequence[_Key], digests: Sequence[bytes]
+    ) -> List[bool]:
+        lookups.append(len(keys))
+        return unchanged(index, keys, digests)
+
+    monkeypatch.setattr(wvc.batch.SyncIndex, "_unchanged", counting)
+    path = str(tmp_path / "index")
+    with fake_weaviate.connect() as client:
+        collection = client.collections.create("SyncedChunks")
+        for _ in range(2):
+            with wvc.batch.SyncIndex(path) as index:
+                with collection.batch.fixed_size(batch_size=10, sync_index=index) as batch:
+                    for obj in _snapshot(count=250):
+                        batch.add_object(obj.properties, uuid=obj.uuid, vector=obj.vector)
+                assert len(index) == 250
+        # the staged objects of the producer are looked up together, not one by one
+        assert sum(lookups) == 500
+        assert len(lookups) <= 2 * (250 // STAGING_BUFFER_SIZE + 1)
+    assert fake_weaviate.requests["BatchObjects"] == 25
+
+    # more UUIDs than fit into the parameters of one query
+    with wvc.batch.SyncIndex(path) as index:
+        keys = [("SyncedChunks", None, str(uuid.UUID(int=i + 1))) for i in range(2000)]
+        assert sum(index._unchanged(keys, [b""] * len(keys))) == 0
+        # the stored objects among them were found and marked as seen
+        assert index._vanished("SyncedChunks", None) == []
@@ -0,0 +1,93 @@
+import grpc
+import pytest
+from grpc import ServicerContext
+from pytest_httpserver import HTTPServer
+
+import weaviate
+from weaviate.classes.tenants import Tenant, TenantActivityStatus
+from weaviate.exceptions import WeaviateInvalidInputError
+from weaviate.proto.v1 import tenants_pb2, weaviate_pb2_grpc
+
+COLLECTION = "TenantRegistryCollection"
+
+
+class MockTenantsGetService(weaviate_pb2_grpc.WeaviateServicer):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def TenantsGet(
+        self, request: tenants_pb2.TenantsGetRequest, context: ServicerContext
+    ) -> tenants_pb2.TenantsGetReply:
+        self.calls += 1
+        return tenants_pb2.TenantsGetReply(
+            tenants=[
+                tenants_pb2.Tenant(
+                    name="tenant1", activity_status=tenants_pb2.TENANT_ACTIVITY_STATUS_ACTIVE
+                ),
+                tenants_pb2.Tenant(
+                    name="tenant2", activity_status=tenants_pb2.TENANT_ACTIVITY_STATUS_OFFLOADED
+                ),
+            ]
+        )
+
+
+def test_tenant_registry(
+    weaviate_client: weaviate.WeaviateClient,
+    weaviate_mock: HTTPServer,
+    start_grpc_server: grpc.Server,
+) -> None:
+    service = MockTenantsGetService()
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(service, start_grpc_server)
+    path = f"/v1/schema/{COLLECTION}/tenants"
+    weaviate_mock.expect_request(path, method="POST").respond_with_json([])
+    weaviate_mock.expect_request(path, method="PUT").respond_with_json([])
+    weaviate_mock.expect_request(path, method="DELETE").respond_with_json({})
+
+    tenants = weaviate_client.collections.use(COLLECTION).tenants
+    with pytest.raises(WeaviateInvalidInputError):
+        tenants.refresh_registry()
+
+    tenants.enable_registry()
+    assert tenants.exists("tenant1")
+    assert not tenants.exists("tenant3")
+    tenant = tenants.get_by_name("tenant2")
+    assert tenant is not None and tenant.activity_status == TenantActivityStatus.OFFLOADED
+    assert list(tenants.get_by_names(["tenant1", "tenant3"]).keys()) == ["tenant1"]
+    assert service.calls == 1
+
+    tenants.create(["tenant3"])
+    tenants.update(
+        [
+            Tenant(name="tenant1", activity_status=TenantActivityStatus.OFFLOADED),
+            Tenant(name="tenant2", activity_status=TenantActivityStatus.ACTIVE),
+        ]
+    )
+    tenants.remove("tenant3")
+    assert not tenants.exists("tenant3")
+    statuses = {
+        name: tenant.activity_status
+        for name, tenant in tenants.get_by_names(["tenant1", "tenant2"]).items()
+    }
+    assert statuses == {
+        "tenant1": TenantActivityStatus.OFFLOADING,
+        "tenant2": TenantActivityStatus.ONLOADING,
+    }
+    assert service.calls == 1
+
+    tenants.refresh_registry()
+    tenant = tenants.get_by_name("tenant1")
+    assert tenant is not None and tenant.activity_status == TenantActivityStatus.ACTIVE
+    assert service.calls == 2
+
+
+def test_tenant_registry_ttl(
+    weaviate_client: weaviate.WeaviateClient, start_grpc_server: grpc.Server
+) -> None:
+    service = MockTenantsGetService()
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(service, start_grpc_server)
+
+    tenants = weaviate_client.collections.use(COLLECTION).tenants
+    tenants.enable_registry(ttl=0)
+    assert tenants.exists("tenant1")
+    assert tenants.exists("tenant1")
+    assert service.calls == 2
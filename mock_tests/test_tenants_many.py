@@ -0,0 +1,98 @@
+import json
+from typing import List
+
+import grpc
+import pytest
+from pytest_httpserver import HTTPServer
+from werkzeug.wrappers import Request, Response
+
+import weaviate
+from weaviate.collections.tenants import executor as tenants_executor
+from weaviate.exceptions import UnexpectedStatusCodeError
+from weaviate.outputs.tenants import TenantsChunkProgress
+
+from mock_tests.conftest import MOCK_IP, MOCK_PORT, MOCK_PORT_GRPC
+
+COLLECTION = "TenantsManyCollection"
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(tenants_executor, "TENANTS_MANY_RETRY_BACKOFF", 0)
+
+
+def flaky_tenants_handler(weaviate_mock: HTTPServer) -> List[List[str]]:
+    requests: List[List[str]] = []
+
+    def handler(request: Request) -> Response:
+        body = json.loads(request.data)
+        names = [tenant if isinstance(tenant, str) else tenant["name"] for tenant in body]
+        requests.append(names)
+        if "broken" in names:
+            return Response(json.dumps({"error": [{"message": "invalid"}]}), status=422)
+        if "flaky" in names and sum("flaky" in chunk for chunk in requests) == 1:
+            return Response(json.dumps({"error": [{"message": "unavailable"}]}), status=503)
+        return Response(json.dumps(body), status=200, content_type="application/json")
+
+    path = f"/v1/schema/{COLLECTION}/tenants"
+    for method in ("POST", "PUT", "DELETE"):
+        weaviate_mock.expect_request(path, method=method).respond_with_handler(handler)
+    return requests
+
+
+def test_create_many(weaviate_client: weaviate.WeaviateClient, weaviate_mock: HTTPServer) -> None:
+    requests = flaky_tenants_handler(weaviate_mock)
+    progress: List[TenantsChunkProgress] = []
+
+    ret = weaviate_client.collections.use(COLLECTION).tenants.create_many(
+        ["a", "b", "flaky", "c", "broken", "d", "e"],
+        chunk_size=2,
+        concurrency=2,
+        on_progress=progress.append,
+    )
+
+    assert sorted(ret.succeeded) == ["a", "b", "c", "e", "flaky"]
+    assert ret.has_errors
+    assert sorted(ret.failed) == ["broken", "d"]
+    assert isinstance(ret.failed["broken"], UnexpectedStatusCodeError)
+    # four chunks, the flaky one being sent twice and the broken one not being retried
+    assert len(requests) == 5
+    assert len(progress) == 4
+    # the chunks complete in any order, the last one has processed all tenants
+    assert [p.processed for p in progress] == sorted(p.processed for p in progress)
+    assert progress[-1].processed == 7
+    assert all(p.total == 7 for p in progress)
+    assert sum(len(p.failed) for p in progress) == 2
+
+
+def test_remove_many_without_retries(
+    weaviate_client: weaviate.WeaviateClient, weaviate_mock: HTTPServer
+) -> None:
+    requests = flaky_tenants_handler(weaviate_mock)
+
+    ret = weaviate_client.collections.use(COLLECTION).tenants.remove_many(
+        ["a", "flaky", "b"], chunk_size=1, retries=0
+    )
+
+    assert sorted(ret.succeeded) == ["a", "b"]
+    assert list(ret.failed) == ["flaky"]
+    assert len(requests) == 3
+
+
+@pytest.mark.asyncio
+async def test_update_many_async(weaviate_mock: HTTPServer, start_grpc_server: grpc.Server) -> None:
+    requests = flaky_tenants_handler(weaviate_mock)
+    async with weaviate.use_async_with_local(
+        host=MOCK_IP, port=MOCK_PORT, grpc_port=MOCK_PORT_GRPC
+    ) as client:
+        ret = await client.collections.use(COLLECTION).tenants.update_many(
+            [
+                weaviate.classes.tenants.Tenant(name=name)
+                for name in ["a", "flaky", "b", "broken", "c"]
+            ],
+            chunk_size=2,
+        )
+
+    assert sorted(ret.succeeded) == ["a", "c", "flaky"]
+    assert sorted(ret.failed) == ["b", "broken"]
+    assert len(requests) == 4
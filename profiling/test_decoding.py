@@ -0,0 +1,138 @@
+# run: pytest profiling/test_decoding.py --benchmark-only --benchmark-disable-gc
+import struct
+import uuid
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from weaviate.collections.classes.internal import _QueryOptions
+from weaviate.collections.queries.decoders import _PropertyDecoder
+from weaviate.collections.queries.executor import _BaseExecutor
+from weaviate.proto.v1 import properties_pb2, search_get_pb2
+from weaviate.util import _ServerVersion
+
+NUM_RESULTS = 1000
+
+
+def record_search_reply() -> bytes:
+    """A serialized reply of NUM_RESULTS objects which contain every property type the server can return."""
+
+    def value(i: int) -> properties_pb2.Properties:
+        return properties_pb2.Properties(
+            fields={
+                "text": properties_pb2.Value(text_value=f"text {i}"),
+                "int": properties_pb2.Value(int_value=i),
+                "number": properties_pb2.Value(number_value=i / 7),
+                "bool": properties_pb2.Value(bool_value=i % 2 == 0),
+                "date": properties_pb2.Value(
+                    date_value=f"2024-01-{i % 28 + 1:02}T10:00:00.{i:06}Z"
+                ),
+                "uuid": properties_pb2.Value(uuid_value=str(uuid.UUID(int=i))),
+                "geo": properties_pb2.Value(
+                    geo_value=properties_pb2.GeoCoordinate(latitude=i / 100, longitude=i / 50)
+                ),
+                "blob": properties_pb2.Value(blob_value="d2VhdmlhdGU="),
+                "phone": properties_pb2.Value(
+                    phone_value=properties_pb2.PhoneNumber(country_code=49, input=f"0171{i}")
+                ),
+                "null": properties_pb2.Value(null_value=0),
+                "texts": properties_pb2.Value(
+                    list_value=properties_pb2.ListValue(
+                        text_values=properties_pb2.TextValues(values=["a", "b", "c"])
+                    )
+                ),
+                "ints": properties_pb2.Value(
+                    list_value=properties_pb2.ListValue(
+                        int_values=properties_pb2.IntValues(values=struct.pack("<3q", i, 2, 3))
+                    )
+                ),
+                "numbers": properties_pb2.Value(
+                    list_value=properties_pb2.ListValue(
+                        number_values=properties_pb2.NumberValues(
+                            values=struct.pack("<3d", i, 0.5, 1.5)
+                        )
+                    )
+                ),
+                "bools": properties_pb2.Value(
+                    list_value=properties_pb2.ListValue(
+                        bool_values=properties_pb2.BoolValues(values=[True, False])
+                    )
+                ),
+                "dates": properties_pb2.Value(
+                    list_value=properties_pb2.ListValue(
+                        date_values=properties_pb2.DateValues(
+                            values=["2024-01-01T10:00:00Z", "2024-01-02T10:00:00.5+02:00"]
+                        )
+                    )
+                ),
+                "uuids": properties_pb2.Value(
+                    list_value=properties_pb2.ListValue(
+                        uuid_values=properties_pb2.UuidValues(
+                            values=[str(uuid.UUID(int=i)), str(uuid.UUID(int=i + 1))]
+                        )
+                    )
+                ),
+                "object": properties_pb2.Value(
+                    object_value=properties_pb2.Properties(
+                        fields={
+                            "name": properties_pb2.Value(text_value="nested"),
+                            "count": properties_pb2.Value(int_value=i),
+                        }
+                    )
+                ),
+                "objects": properties_pb2.Value(
+                    list_value=properties_pb2.ListValue(
+                        object_values=properties_pb2.ObjectValues(
+                            values=[
+                                properties_pb2.Properties(
+                                    fields={"name": properties_pb2.Value(text_value="nested")}
+                                )
+                            ]
+                            * 2
+                        )
+                    )
+                ),
+            }
+        )
+
+    return search_get_pb2.SearchReply(
+        results=[
+            search_get_pb2.SearchResult(
+                properties=search_get_pb2.PropertiesResult(non_ref_props=value(i)),
+                metadata=search_get_pb2.MetadataResult(id_as_bytes=uuid.UUID(int=i).bytes),
+            )
+            for i in range(NUM_RESULTS)
+        ]
+    ).SerializeToString()
+
+
+@pytest.fixture(scope="module")
+def search_reply() -> search_get_pb2.SearchReply:
+    reply = search_get_pb2.SearchReply()
+    reply.ParseFromString(record_search_reply())
+    return reply
+
+
+def test_benchmark_decode_properties(
+    benchmark: Any, search_reply: search_get_pb2.SearchReply
+) -> None:
+    decoder = _PropertyDecoder.for_version(True)
+
+    def decode() -> None:
+        for result in search_reply.results:
+            decoder.decode_properties(result.properties.non_ref_props)
+
+    benchmark(decode)
+
+
+def test_benchmark_decode_search_reply(
+    benchmark: Any, search_reply: search_get_pb2.SearchReply
+) -> None:
+    connection = SimpleNamespace(_weaviate_version=_ServerVersion(1, 28, 0))
+    executor: _BaseExecutor = _BaseExecutor(connection, "Test", None, None, None, None, True)  # type: ignore[arg-type]
+    options = _QueryOptions.from_input(None, None, False, None, None)
+
+    res = benchmark(executor._result_to_query_return, search_reply, options)
+    assert len(res.objects) == NUM_RESULTS
+    assert len(res.objects[0].properties) == 18
@@ -0,0 +1,31 @@
+# run: pytest profiling/test_filters.py --benchmark-only
+import uuid
+from typing import Any
+
+from weaviate.classes.query import Filter
+from weaviate.collections.filters import _FilterToGRPC
+
+IDS = [str(uuid.UUID(int=i)) for i in range(100_000)]
+
+
+def acl_filter() -> Any:
+    return Filter.all_of(
+        [
+            Filter.by_property("tenant_id").equal("tenant-42"),
+            Filter.by_property("visibility").contains_any(["public", "internal"]),
+            Filter.by_ref("owner").by_property("groups").contains_any(["admins", "editors"]),
+        ]
+    )
+
+
+def test_benchmark_convert_reused_filter(benchmark: Any) -> None:
+    filters = acl_filter()
+    benchmark(_FilterToGRPC.convert, filters)
+
+
+def test_benchmark_convert_rebuilt_filter(benchmark: Any) -> None:
+    benchmark(lambda: _FilterToGRPC.convert(acl_filter()))
+
+
+def test_benchmark_build_and_convert_id_list(benchmark: Any) -> None:
+    benchmark(lambda: _FilterToGRPC.convert(Filter.by_id().contains_any(IDS)))
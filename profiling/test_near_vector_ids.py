@@ -0,0 +1,54 @@
+# run: pytest profiling/test_near_vector_ids.py --benchmark-only --benchmark-group-by=param:limit
+import uuid
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from weaviate.collections.classes.grpc import MetadataQuery
+from weaviate.collections.classes.internal import _QueryOptions
+from weaviate.collections.queries.executor import _BaseExecutor
+from weaviate.collections.queries.tables import _decode_ids_and_distances
+from weaviate.proto.v1 import search_get_pb2
+from weaviate.util import _ServerVersion
+
+
+def record_search_reply(limit: int) -> bytes:
+    """A serialized reply of a near_vector search that only returned the id and distance of each object."""
+    return search_get_pb2.SearchReply(
+        results=[
+            search_get_pb2.SearchResult(
+                properties=search_get_pb2.PropertiesResult(),
+                metadata=search_get_pb2.MetadataResult(
+                    id_as_bytes=uuid.UUID(int=i).bytes,
+                    distance=i / limit,
+                    distance_present=True,
+                ),
+            )
+            for i in range(limit)
+        ]
+    ).SerializeToString()
+
+
+@pytest.mark.parametrize("limit", [10, 100, 1000])
+def test_benchmark_near_vector_full(benchmark: Any, limit: int) -> None:
+    connection = SimpleNamespace(_weaviate_version=_ServerVersion(1, 28, 0))
+    executor: _BaseExecutor = _BaseExecutor(connection, "Test", None, None, None, None, True)  # type: ignore[arg-type]
+    options = _QueryOptions.from_input(MetadataQuery(distance=True), [], False, None, None)
+    reply = record_search_reply(limit)
+
+    def decode() -> None:
+        executor._result_to_query_return(search_get_pb2.SearchReply.FromString(reply), options)
+
+    benchmark(decode)
+
+
+@pytest.mark.parametrize("limit", [10, 100, 1000])
+def test_benchmark_near_vector_ids(benchmark: Any, limit: int) -> None:
+    pytest.importorskip("numpy")
+    reply = record_search_reply(limit)
+
+    def decode() -> None:
+        _decode_ids_and_distances(search_get_pb2.SearchReply.FromString(reply))
+
+    benchmark(decode)
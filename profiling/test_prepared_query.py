@@ -0,0 +1,63 @@
+# run: pytest profiling/test_prepared_query.py --benchmark-only --benchmark-group-by=func
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from weaviate.classes.query import Filter, MetadataQuery
+from weaviate.collections.queries.near_vector import _NearVectorQuery
+from weaviate.collections.queries.prepared import _PreparedQuery
+from weaviate.proto.v1 import search_get_pb2
+from weaviate.util import _ServerVersion
+
+VECTOR = [i / 384 for i in range(384)]
+FILTERS = Filter.all_of(
+    [
+        Filter.by_property("category").contains_any(["books", "music", "film"]),
+        Filter.by_property("price").less_than(100),
+        Filter.by_property("in_stock").equal(True),
+    ]
+)
+QUERY: Any = {
+    "limit": 10,
+    "filters": FILTERS,
+    "return_metadata": MetadataQuery(distance=True, creation_time=True),
+    "return_properties": ["title", "category", "price"],
+}
+
+# the search itself is not sent anywhere, so that only the per-call overhead of the client is measured
+connection = SimpleNamespace(
+    _weaviate_version=_ServerVersion(1, 29, 0),
+    grpc_search=lambda request: search_get_pb2.SearchReply(),
+)
+
+
+@pytest.mark.parametrize("validate_arguments", [True, False])
+def test_benchmark_near_vector(benchmark: Any, validate_arguments: bool) -> None:
+    query: _NearVectorQuery = _NearVectorQuery(
+        connection, "Products", None, None, None, None, validate_arguments  # type: ignore[arg-type]
+    )
+    benchmark(lambda: query.near_vector(VECTOR, **QUERY))
+
+
+@pytest.mark.parametrize("validate_arguments", [True, False])
+def test_benchmark_prepared_near_vector(benchmark: Any, validate_arguments: bool) -> None:
+    prepared: _PreparedQuery = _PreparedQuery(
+        connection,  # type: ignore[arg-type]
+        "Products",
+        None,
+        None,
+        None,
+        None,
+        validate_arguments,
+        offset=None,
+        auto_limit=None,
+        certainty=None,
+        distance=None,
+        target_vector=None,
+        query_properties=None,
+        include_vector=False,
+        return_references=None,
+        **QUERY,
+    )
+    benchmark(lambda: prepared.near_vector(VECTOR))
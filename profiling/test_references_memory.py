@@ -0,0 +1,85 @@
+# run: pytest profiling/test_references_memory.py --benchmark-only -s
+import tracemalloc
+import uuid
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from weaviate.collections.classes.grpc import MetadataQuery, QueryReference
+from weaviate.collections.classes.internal import _QueryOptions
+from weaviate.collections.queries.executor import _BaseExecutor
+from weaviate.proto.v1 import properties_pb2, search_get_pb2
+from weaviate.util import _ServerVersion
+
+NUM_RESULTS = 10_000
+NUM_TARGETS = 20
+
+
+def record_search_reply() -> bytes:
+    """A serialized reply of NUM_RESULTS objects which all reference one of NUM_TARGETS objects."""
+
+    def target(i: int) -> search_get_pb2.PropertiesResult:
+        return search_get_pb2.PropertiesResult(
+            target_collection="Author",
+            metadata=search_get_pb2.MetadataResult(id_as_bytes=uuid.UUID(int=i).bytes),
+            non_ref_props=properties_pb2.Properties(
+                fields={
+                    "name": properties_pb2.Value(text_value=f"author {i}"),
+                    "bio": properties_pb2.Value(text_value="lorem ipsum " * 20),
+                    "age": properties_pb2.Value(int_value=i),
+                }
+            ),
+        )
+
+    return search_get_pb2.SearchReply(
+        results=[
+            search_get_pb2.SearchResult(
+                properties=search_get_pb2.PropertiesResult(
+                    non_ref_props=properties_pb2.Properties(
+                        fields={"title": properties_pb2.Value(text_value=f"article {i}")}
+                    ),
+                    ref_props=[
+                        search_get_pb2.RefPropertiesResult(
+                            prop_name="writtenBy", properties=[target(i % NUM_TARGETS)]
+                        )
+                    ],
+                ),
+                metadata=search_get_pb2.MetadataResult(id_as_bytes=uuid.UUID(int=i).bytes),
+            )
+            for i in range(NUM_RESULTS)
+        ]
+    ).SerializeToString()
+
+
+@pytest.fixture(scope="module")
+def search_reply() -> search_get_pb2.SearchReply:
+    reply = search_get_pb2.SearchReply()
+    reply.ParseFromString(record_search_reply())
+    return reply
+
+
+@pytest.fixture(scope="module")
+def executor() -> _BaseExecutor:
+    connection = SimpleNamespace(_weaviate_version=_ServerVersion(1, 28, 0))
+    return _BaseExecutor(connection, "Article", None, None, None, None, True)  # type: ignore[arg-type]
+
+
+OPTIONS = _QueryOptions.from_input(
+    MetadataQuery(), None, False, None, [QueryReference(link_on="writtenBy")]
+)
+
+
+def test_benchmark_decode_references(
+    benchmark: Any, executor: _BaseExecutor, search_reply: search_get_pb2.SearchReply
+) -> None:
+    tracemalloc.start()
+    res = executor._result_to_query_return(search_reply, OPTIONS)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(res.objects) == NUM_RESULTS
+    benchmark.extra_info["peak_memory_mib"] = round(peak / 2**20, 1)
+    print(f"\npeak memory decoding {NUM_RESULTS} objects with references: {peak / 2**20:.1f} MiB")
+
+    res = benchmark(executor._result_to_query_return, search_reply, OPTIONS)
+    assert len(res.objects) == NUM_RESULTS
@@ -1,5 +1,19 @@
+import math
+import time
 import uuid
-from weaviate.collections.classes.batch import BatchObjectReturn, MAX_STORED_RESULTS
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pytest
+
+from weaviate.collections.batch.base import ObjectsBatchRequest, _BatchStatsTracker
+from weaviate.collections.batch.grpc_batch_objects import _BatchGRPC, _estimated_size
+from weaviate.collections.batch.rate_limiter import RateLimiter, _estimated_tokens
+from weaviate.collections.classes.batch import BatchObjectReturn, MAX_STORED_RESULTS, _BatchObject
+from weaviate.exceptions import WeaviateInvalidInputError
+from weaviate.types import VECTORS
+from weaviate.util import _ServerVersion
 
 
 def test_batch_object_return_add() -> None:
@@ -29,3 +43,133 @@ def test_batch_object_return_add() -> None:
         idx + len(rhs_uuids): v
         for idx, v in enumerate(lhs_uuids[len(rhs_uuids) : MAX_STORED_RESULTS] + rhs_uuids)
     }
+
+
+def test_batch_stats_tracker() -> None:
+    tracker = _BatchStatsTracker(window=10)
+    tracker.add_objects(sent=10, failed=2, retried=1, took=0.05)
+    tracker.add_objects(sent=5, failed=0, retried=0, took=3)
+    tracker.add_objects(sent=5, failed=0, retried=0, took=1000)
+    tracker.add_references(sent=4, failed=1)
+
+    assert (tracker.objects_sent, tracker.objects_failed, tracker.retries) == (20, 2, 1)
+    assert (tracker.references_sent, tracker.references_failed) == (4, 1)
+    histogram = tracker.latency_histogram()
+    assert histogram[0.1] == 1
+    assert histogram[5] == 1
+    assert histogram[math.inf] == 1
+    assert sum(histogram.values()) == 3
+
+    # 18 objects were imported, the batch is younger than the window
+    tracker.start = time.time() - 2
+    assert tracker.objects_per_second() == pytest.approx(9, rel=0.05)
+
+
+def _batch_object(index: int, text: str = "", vector: Optional[VECTORS] = None) -> _BatchObject:
+    return _BatchObject(
+        collection="Test",
+        vector=vector,
+        uuid=str(uuid.UUID(int=index)),
+        properties={"text": text, "count": index, "tags": ["a", "b"]},
+        tenant=None,
+        references=None,
+        index=index,
+    )
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        _batch_object(1),
+        _batch_object(2, text="a" * 10000),
+        _batch_object(3, vector=[0.5] * 1536),
+        _batch_object(4, vector={"first": [0.5] * 128, "multi": [[0.5] * 128] * 32}),
+        _batch_object(5, vector={"multi": np.full((100, 128), 0.5, dtype=np.float32)}),
+    ],
+)
+def test_estimated_size(obj: _BatchObject) -> None:
+    grpc = _BatchGRPC(_ServerVersion(1, 29, 0), None)
+    encoded = grpc._BatchGRPC__grpc_objects([obj])[0].ByteSize()  # type: ignore
+    assert encoded / 2 < _estimated_size(obj) < encoded * 2
+
+
+def test_objects_batch_request_pops_by_bytes() -> None:
+    queue = ObjectsBatchRequest()
+    for i in range(10):
+        queue.add(_batch_object(i, text="a" * 1000))
+    size = _estimated_size(_batch_object(0, text="a" * 1000))
+    assert queue.num_bytes == 10 * size
+
+    assert [obj.index for obj in queue.pop_items(5, max_bytes=int(3.5 * size))] == [0, 1, 2]
+    assert [obj.index for obj in queue.pop_items(2, max_bytes=10 * size)] == [3, 4]
+    # an object that is larger than the limit is still sent on its own
+    assert [obj.index for obj in queue.pop_items(5, max_bytes=1)] == [5]
+    assert queue.num_bytes == 4 * size
+
+    queue.prepend([_batch_object(0, text="a" * 1000)])
+    assert queue.num_bytes == 5 * size
+    assert [obj.index for obj in queue.pop_items(100)] == [0, 6, 7, 8, 9]
+    assert queue.num_bytes == 0
+
+
+def test_objects_batch_request_pops_by_tokens() -> None:
+    queue = ObjectsBatchRequest()
+    for i in range(5):
+        queue.add(_batch_object(i, text="a" * 1000))
+    tokens = _estimated_tokens(_batch_object(0, text="a" * 1000))
+
+    assert [obj.index for obj in queue.pop_items(5, max_tokens=2 * tokens)] == [0, 1]
+    # an object with more tokens than the limit is still sent on its own
+    assert [obj.index for obj in queue.pop_items(5, max_tokens=1)] == [2]
+    assert [obj.index for obj in queue.pop_items(5, max_tokens=10 * tokens)] == [3, 4]
+
+
+def _waited(limiter: RateLimiter, requests: int, tokens: int = 0) -> float:
+    start = time.time()
+    limiter.acquire(requests, tokens)
+    return time.time() - start
+
+
+def test_rate_limiter() -> None:
+    limiter = RateLimiter(requests_per_minute=600, tokens_per_minute=6000)
+    # a full minute of the budgets is available at once
+    assert _waited(limiter, 600, 1000) < 0.1
+    assert 0.4 < _waited(limiter, 5) < 1
+    # 5050 tokens are left, they refill with 100 per second and the requests are not the limit anymore
+    assert 0.4 < _waited(limiter, 1, 5100) < 1
+
+    limiter._exhaust()
+    assert 0.4 < _waited(limiter, 5) < 1
+
+    # more than a whole budget waits for a full bucket and leaves it in debt
+    limiter = RateLimiter(requests_per_minute=60000)
+    assert _waited(limiter, 61000) < 0.1
+    assert 0.9 < _waited(limiter, 1) < 1.5
+
+    with pytest.raises(WeaviateInvalidInputError):
+        RateLimiter()
+    with pytest.raises(WeaviateInvalidInputError):
+        RateLimiter(requests_per_minute=0)
+
+
+def test_rate_limiter_shared_through_file(tmp_path: Path) -> None:
+    path = str(tmp_path / "limiter")
+    first = RateLimiter(requests_per_minute=600, path=path)
+    second = RateLimiter(requests_per_minute=600, path=path)
+    assert _waited(first, 600) < 0.1
+    assert 0.4 < _waited(second, 5) < 1
+
+
+def test_estimated_tokens() -> None:
+    assert _estimated_tokens(_batch_object(0)) == 1
+    assert _estimated_tokens(_batch_object(0, text="a" * 1000)) == 251
+    obj = _BatchObject(
+        collection="Test",
+        vector=None,
+        uuid=None,
+        properties={"tags": ["a" * 4, "b" * 4], "nested": {"text": "c" * 8}, "count": 12345},
+        tenant=None,
+        references=None,
+        index=0,
+    )
+    assert _estimated_tokens(obj) == 4
@@ -0,0 +1,127 @@
+import datetime
+import struct
+import uuid
+
+import pytest
+
+from weaviate.collections.classes.types import GeoCoordinate, _PhoneNumber
+from weaviate.collections.queries.decoders import _PropertyDecoder
+from weaviate.proto.v1 import properties_pb2
+
+UUID = uuid.UUID("f2b6b5b8-0b44-4c35-8a6f-bcd0b8e5e0a1")
+DATE = "2024-02-29T12:30:45.123456Z"
+PARSED_DATE = datetime.datetime(2024, 2, 29, 12, 30, 45, 123456, tzinfo=datetime.timezone.utc)
+
+
+def test_decode_every_value_kind() -> None:
+    phone = properties_pb2.PhoneNumber(
+        country_code=49, default_country="DE", input="0171", national=171, valid=True
+    )
+    properties = properties_pb2.Properties(
+        fields={
+            "text": properties_pb2.Value(text_value="text"),
+            "string": properties_pb2.Value(string_value="string"),
+            "int": properties_pb2.Value(int_value=-3),
+            "number": properties_pb2.Value(number_value=0.5),
+            "bool": properties_pb2.Value(bool_value=True),
+            "date": properties_pb2.Value(date_value=DATE),
+            "uuid": properties_pb2.Value(uuid_value=str(UUID)),
+            "geo": properties_pb2.Value(
+                geo_value=properties_pb2.GeoCoordinate(latitude=1.5, longitude=2.5)
+            ),
+            "blob": properties_pb2.Value(blob_value="YmxvYg=="),
+            "phone": properties_pb2.Value(phone_value=phone),
+            "null": properties_pb2.Value(null_value=0),
+            "object": properties_pb2.Value(
+                object_value=properties_pb2.Properties(
+                    fields={"nested": properties_pb2.Value(int_value=1)}
+                )
+            ),
+        }
+    )
+
+    decoded = _PropertyDecoder.for_version(True).decode_properties(properties)
+
+    assert decoded == {
+        "text": "text",
+        "string": "string",
+        "int": -3,
+        "number": 0.5,
+        "bool": True,
+        "date": PARSED_DATE,
+        "uuid": UUID,
+        "geo": GeoCoordinate(latitude=1.5, longitude=2.5),
+        "blob": "YmxvYg==",
+        "phone": _PhoneNumber(
+            country_code=49,
+            default_country="DE",
+            international_formatted="",
+            national=171,
+            national_formatted="",
+            number="0171",
+            valid=True,
+        ),
+        "null": None,
+        "object": {"nested": 1},
+    }
+
+
+def test_decode_every_list_kind() -> None:
+    lists = {
+        "bools": properties_pb2.ListValue(bool_values=properties_pb2.BoolValues(values=[True])),
+        "dates": properties_pb2.ListValue(date_values=properties_pb2.DateValues(values=[DATE])),
+        "ints": properties_pb2.ListValue(
+            int_values=properties_pb2.IntValues(values=struct.pack("<2q", 1, -2))
+        ),
+        "numbers": properties_pb2.ListValue(
+            number_values=properties_pb2.NumberValues(values=struct.pack("<2d", 0.5, 1.5))
+        ),
+        "texts": properties_pb2.ListValue(text_values=properties_pb2.TextValues(values=["a"])),
+        "uuids": properties_pb2.ListValue(
+            uuid_values=properties_pb2.UuidValues(values=[str(UUID)])
+        ),
+        "objects": properties_pb2.ListValue(
+            object_values=properties_pb2.ObjectValues(
+                values=[
+                    properties_pb2.Properties(
+                        fields={"nested": properties_pb2.Value(text_value="b")}
+                    )
+                ]
+            )
+        ),
+    }
+    properties = properties_pb2.Properties(
+        fields={name: properties_pb2.Value(list_value=value) for name, value in lists.items()}
+    )
+
+    decoded = _PropertyDecoder.for_version(True).decode_properties(properties)
+
+    assert decoded == {
+        "bools": [True],
+        "dates": [PARSED_DATE],
+        "ints": [1, -2],
+        "numbers": [0.5, 1.5],
+        "texts": ["a"],
+        "uuids": [UUID],
+        "objects": [{"nested": "b"}],
+    }
+
+
+def test_decode_list_before_125() -> None:
+    value = properties_pb2.Value(
+        list_value=properties_pb2.ListValue(
+            values=[properties_pb2.Value(int_value=1), properties_pb2.Value(date_value=DATE)]
+        )
+    )
+    assert _PropertyDecoder.for_version(False).decode_value(value) == [1, PARSED_DATE]
+
+
+def test_decode_unset_and_invalid_values() -> None:
+    decoder = _PropertyDecoder.for_version(True)
+    with pytest.warns(UserWarning, match="Grpc002"):
+        assert decoder.decode_value(properties_pb2.Value()) is None
+    with pytest.warns(UserWarning, match="Con004"):
+        assert (
+            decoder.decode_value(properties_pb2.Value(date_value="0000-01-30T00:00:00Z"))
+            == datetime.datetime.min
+        )
@@ -1,10 +1,13 @@
 import datetime
+import uuid
 
 import pytest
 
 import weaviate
 import weaviate.classes as wvc
-from weaviate.collections.classes.filters import _FilterAnd, _FilterOr
+from weaviate.collections.classes.filters import _FilterAnd, _FilterOr, _Filters
+from weaviate.collections.filters import _FilterToGRPC
+from weaviate.proto.v1 import base_pb2
 
 
 def test_empty_input_contains_any() -> None:
@@ -86,3 +89,71 @@ def test_filter_bitwise_or_assignment() -> None:
     assert isinstance(or_direct.filters[0], _FilterOr)
     assert f4.filters[0].filters == or_direct.filters[0].filters
     assert f4.filters[1] == f3
+
+
+def test_filter_structural_key() -> None:
+    def build() -> _Filters:
+        return wvc.query.Filter.by_property("tenant").equal("a") & (
+            wvc.query.Filter.by_ref("owner").by_property("name").contains_any(["x", "y"])
+            | wvc.query.Filter.by_creation_time().less_than(
+                datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+            )
+        )
+
+    assert build()._key() == build()._key()
+    assert hash(build()._key()) == hash(build()._key())
+
+    by_value = [
+        wvc.query.Filter.by_property("a").equal(1),
+        wvc.query.Filter.by_property("a").equal(1.0),
+        wvc.query.Filter.by_property("a").equal(True),
+        wvc.query.Filter.by_property("a").equal("1"),
+        wvc.query.Filter.by_property("a").not_equal(1),
+        wvc.query.Filter.by_property("b").equal(1),
+        wvc.query.Filter.by_ref("a").by_property("b").equal(1),
+        wvc.query.Filter.by_ref_count("a").equal(1),
+        wvc.query.Filter.by_property("a").contains_any([1, 2]),
+        wvc.query.Filter.by_property("a").contains_any([1.0, 2.0]),
+        wvc.query.Filter.by_property("a").equal(
+            datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+        ),
+        wvc.query.Filter.by_property("a").equal(
+            datetime.datetime(2024, 1, 1, 2, tzinfo=datetime.timezone(datetime.timedelta(hours=2)))
+        ),
+    ]
+    assert len({filter_._key() for filter_ in by_value}) == len(by_value)
+    assert (by_value[0] & by_value[1])._key() != (by_value[0] | by_value[1])._key()
+
+
+def test_filter_without_structural_key() -> None:
+    class _Unkeyed(_Filters):
+        pass
+
+    # the filter cache relies on the key, a subclass that does not define it cannot be created
+    with pytest.raises(TypeError):
+        _Unkeyed()  # type: ignore
+
+
+def test_convert_caches_equal_filters() -> None:
+    ids = [uuid.UUID(int=i) for i in range(1000)]
+    first = _FilterToGRPC.convert(wvc.query.Filter.by_id().contains_any(ids))
+    second = _FilterToGRPC.convert(wvc.query.Filter.by_id().contains_any([str(id_) for id_ in ids]))
+    assert first is second
+    assert list(first.value_text_array.values) == [str(id_) for id_ in ids]
+    assert first.target.property == "_id"
+
+    other = _FilterToGRPC.convert(wvc.query.Filter.by_id().contains_any(ids[:-1]))
+    assert other is not first
+    assert len(other.value_text_array.values) == 999
+
+
+def test_convert_nested_filters() -> None:
+    filters = wvc.query.Filter.by_property("a").equal(1) & (
+        wvc.query.Filter.by_property("b").equal(1.0) | wvc.query.Filter.by_property("c").equal(True)
+    )
+    converted = _FilterToGRPC.convert(filters)
+    assert converted.operator == base_pb2.Filters.OPERATOR_AND
+    assert converted.filters[0].value_int == 1
+    assert converted.filters[1].operator == base_pb2.Filters.OPERATOR_OR
+    assert converted.filters[1].filters[0].value_number == 1.0
+    assert converted.filters[1].filters[1].value_boolean
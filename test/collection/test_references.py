@@ -0,0 +1,87 @@
+import sys
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+from weaviate.collections.classes.grpc import MetadataQuery, QueryReference
+from weaviate.collections.classes.internal import _QueryOptions
+from weaviate.collections.queries.executor import _BaseExecutor
+from weaviate.proto.v1 import properties_pb2, search_get_pb2
+from weaviate.util import _ServerVersion
+
+TARGETS = [uuid.UUID(int=100 + i) for i in range(2)]
+
+
+def _target(i: int, nested: bool) -> search_get_pb2.PropertiesResult:
+    return search_get_pb2.PropertiesResult(
+        target_collection="Target",
+        metadata=search_get_pb2.MetadataResult(id_as_bytes=TARGETS[i].bytes),
+        non_ref_props=properties_pb2.Properties(
+            fields={"name": properties_pb2.Value(text_value=f"target {i}")}
+        ),
+        ref_props=(
+            [search_get_pb2.RefPropertiesResult(prop_name="next", properties=[_target(1, False)])]
+            if nested
+            else []
+        ),
+    )
+
+
+def _reply(num_results: int) -> search_get_pb2.SearchReply:
+    return search_get_pb2.SearchReply(
+        results=[
+            search_get_pb2.SearchResult(
+                properties=search_get_pb2.PropertiesResult(
+                    ref_props=[
+                        search_get_pb2.RefPropertiesResult(
+                            prop_name="ref", properties=[_target(i % 2, nested=i % 2 == 0)]
+                        ),
+                        search_get_pb2.RefPropertiesResult(
+                            prop_name="other", properties=[_target(i % 2, nested=False)]
+                        ),
+                    ]
+                ),
+                metadata=search_get_pb2.MetadataResult(id_as_bytes=uuid.UUID(int=i).bytes),
+            )
+            for i in range(num_results)
+        ]
+    )
+
+
+@pytest.fixture
+def executor() -> _BaseExecutor:
+    connection = SimpleNamespace(_weaviate_version=_ServerVersion(1, 28, 0))
+    return _BaseExecutor(connection, "Test", None, None, None, None, True)  # type: ignore[arg-type]
+
+
+def test_references_are_shared_within_a_response(executor: _BaseExecutor) -> None:
+    options = _QueryOptions.from_input(
+        MetadataQuery(), None, False, None, [QueryReference(link_on="ref")]
+    )
+    res = executor._result_to_query_return(_reply(4), options)
+
+    refs = [obj.references["ref"].objects[0] for obj in res.objects]
+    assert [ref.uuid for ref in refs] == [TARGETS[0], TARGETS[1]] * 2
+    assert refs[0] is refs[2] and refs[1] is refs[3]
+    assert refs[0].properties == {"name": "target 0"}
+
+    # the same target object under a different reference path is decoded separately
+    others = [obj.references["other"].objects[0] for obj in res.objects]
+    assert others[1] is not refs[1] and others[1] is others[3]
+    assert refs[0].references["next"].objects[0] is not refs[1]
+
+    # objects are not shared between responses
+    again = executor._result_to_query_return(_reply(1), options)
+    assert again.objects[0].references["ref"].objects[0] is not refs[0]
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="slotted dataclasses require Python 3.10")
+def test_result_objects_have_no_instance_dict(executor: _BaseExecutor) -> None:
+    options = _QueryOptions.from_input(
+        MetadataQuery(), None, False, None, [QueryReference(link_on="ref")]
+    )
+    obj = executor._result_to_query_return(_reply(1), options).objects[0]
+    assert not hasattr(obj, "__dict__")
+    assert not hasattr(obj.metadata, "__dict__")
+    assert not hasattr(obj.references["ref"], "__dict__")
@@ -0,0 +1,198 @@
+import struct
+import sys
+import uuid
+from typing import List, Optional
+
+import pytest
+
+from weaviate.collections.classes.grpc import MetadataQuery
+from weaviate.collections.classes.internal import _QueryOptions
+from weaviate.collections.queries.tables import (
+    _build_columns,
+    _ColumnPropertyDecoder,
+    _decode_ids_and_distances,
+    _decode_table,
+    _validate_return_format,
+)
+from weaviate.exceptions import (
+    WeaviateInvalidInputError,
+    WeaviateOptionalDependencyNotInstalledError,
+)
+from weaviate.proto.v1 import base_pb2, properties_pb2, search_get_pb2
+
+UUIDS = [uuid.UUID(int=i + 1) for i in range(3)]
+OPTIONS = _QueryOptions.from_input(MetadataQuery(distance=True), None, True, None, None)
+
+
+def _result(i: int, vector: Optional[List[float]]) -> search_get_pb2.SearchResult:
+    return search_get_pb2.SearchResult(
+        properties=search_get_pb2.PropertiesResult(
+            non_ref_props=properties_pb2.Properties(
+                fields={
+                    "name": properties_pb2.Value(text_value=f"name {i}"),
+                    "geo": properties_pb2.Value(
+                        geo_value=properties_pb2.GeoCoordinate(latitude=1.0, longitude=2.0)
+                    ),
+                    "ref": properties_pb2.Value(uuid_value=str(UUIDS[i])),
+                    **({"count": properties_pb2.Value(int_value=i)} if i > 0 else {}),
+                }
+            )
+        ),
+        metadata=search_get_pb2.MetadataResult(
+            id_as_bytes=UUIDS[i].bytes,
+            distance=i / 10,
+            distance_present=True,
+            vector_bytes=struct.pack(f"<{len(vector)}f", *vector) if vector is not None else b"",
+        ),
+    )
+
+
+def _reply(vectors: List[Optional[List[float]]]) -> search_get_pb2.SearchReply:
+    return search_get_pb2.SearchReply(
+        results=[_result(i, vector) for i, vector in enumerate(vectors)]
+    )
+
+
+def test_build_columns() -> None:
+    columns = _build_columns(
+        _reply([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]).results,
+        OPTIONS,
+        _ColumnPropertyDecoder.for_version(True),
+    )
+    assert list(columns)[:2] == ["uuid", "distance"]
+    assert set(columns) == {"uuid", "distance", "name", "geo", "ref", "count", "vector"}
+    assert columns["uuid"] == [u.bytes for u in UUIDS]
+    assert columns["distance"] == pytest.approx([0.0, 0.1, 0.2])
+    assert columns["geo"][0] == {"latitude": 1.0, "longitude": 2.0}
+    assert columns["ref"] == [str(u) for u in UUIDS]
+    assert columns["count"] == [None, 1, 2]
+
+
+def test_decode_arrow() -> None:
+    pa = pytest.importorskip("pyarrow")
+    table = _decode_table(_reply([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]), OPTIONS, "arrow", True)
+    assert table.schema.field("uuid").type == pa.binary(16)
+    assert table.schema.field("distance").type == pa.float64()
+    assert table.schema.field("vector").type == pa.list_(pa.float32(), 2)
+    assert table.column("uuid").to_pylist() == [u.bytes for u in UUIDS]
+    assert table.column("vector").to_pylist() == [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]
+    assert table.column("count").to_pylist() == [None, 1, 2]
+
+
+def test_decode_arrow_missing_vector() -> None:
+    pa = pytest.importorskip("pyarrow")
+    table = _decode_table(_reply([[1.0, 2.0], None, [5.0, 6.0]]), OPTIONS, "arrow", True)
+    assert table.schema.field("vector").type == pa.list_(pa.float32())
+    assert table.column("vector").to_pylist() == [[1.0, 2.0], None, [5.0, 6.0]]
+
+
+def test_decode_pandas() -> None:
+    pytest.importorskip("pandas")
+    df = _decode_table(_reply([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]), OPTIONS, "pandas", True)
+    assert set(df.columns) == {"uuid", "distance", "name", "geo", "ref", "count", "vector"}
+    assert df["uuid"].tolist() == [u.bytes for u in UUIDS]
+    assert df["vector"][1].dtype == "float32"
+    assert df["vector"][1].tolist() == [3.0, 4.0]
+
+
+def test_decode_polars() -> None:
+    pl = pytest.importorskip("polars")
+    df = _decode_table(_reply([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]), OPTIONS, "polars", True)
+    assert df.schema["uuid"] == pl.Binary
+    assert df.schema["vector"] == pl.Array(pl.Float32, 2)
+    assert df["vector"].to_list() == [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]
+    assert df["geo"].to_list()[0] == {"latitude": 1.0, "longitude": 2.0}
+
+
+def test_decode_named_and_multi_vectors() -> None:
+    pl = pytest.importorskip("polars")
+    reply = search_get_pb2.SearchReply(
+        results=[
+            search_get_pb2.SearchResult(
+                metadata=search_get_pb2.MetadataResult(
+                    id_as_bytes=UUIDS[0].bytes,
+                    vectors=[
+                        base_pb2.Vectors(name="title", vector_bytes=struct.pack("<2f", 1, 2)),
+                        base_pb2.Vectors(
+                            name="colbert",
+                            vector_bytes=struct.pack("<H4f", 2, 1, 2, 3, 4),
+                            type=base_pb2.Vectors.VECTOR_TYPE_MULTI_FP32,
+                        ),
+                    ],
+                )
+            )
+        ]
+    )
+    df = _decode_table(reply, OPTIONS, "polars", True)
+    assert df.schema["vector.title"] == pl.Array(pl.Float32, 2)
+    assert df["vector.colbert"].to_list() == [[[1.0, 2.0], [3.0, 4.0]]]
+
+
+def test_property_clashing_with_metadata_column() -> None:
+    reply = search_get_pb2.SearchReply(
+        results=[
+            search_get_pb2.SearchResult(
+                properties=search_get_pb2.PropertiesResult(
+                    non_ref_props=properties_pb2.Properties(
+                        fields={"distance": properties_pb2.Value(number_value=1.0)}
+                    )
+                ),
+                metadata=search_get_pb2.MetadataResult(
+                    id_as_bytes=UUIDS[0].bytes, distance=0.5, distance_present=True
+                ),
+            )
+        ]
+    )
+    with pytest.raises(WeaviateInvalidInputError):
+        _build_columns(reply.results, OPTIONS, _ColumnPropertyDecoder.for_version(True))
+
+
+@pytest.mark.parametrize("name", ["vector", "vector.title"])
+def test_property_clashing_with_vector_column(name: str) -> None:
+    reply = search_get_pb2.SearchReply(
+        results=[
+            search_get_pb2.SearchResult(
+                properties=search_get_pb2.PropertiesResult(
+                    non_ref_props=properties_pb2.Properties(
+                        fields={name: properties_pb2.Value(text_value="text")}
+                    )
+                ),
+                metadata=search_get_pb2.MetadataResult(
+                    id_as_bytes=UUIDS[0].bytes,
+                    vector_bytes=struct.pack("<2f", 1, 2),
+                    vectors=[base_pb2.Vectors(name="title", vector_bytes=struct.pack("<2f", 1, 2))],
+                ),
+            )
+        ]
+    )
+    with pytest.raises(WeaviateInvalidInputError):
+        _build_columns(reply.results, OPTIONS, _ColumnPropertyDecoder.for_version(True))
+
+
+def test_validate_return_format() -> None:
+    _validate_return_format(None, group_by=object(), references=object())
+    _validate_return_format("arrow")
+    with pytest.raises(WeaviateInvalidInputError):
+        _validate_return_format("numpy")  # type: ignore[arg-type]
+    with pytest.raises(WeaviateInvalidInputError):
+        _validate_return_format("pandas", group_by=object())
+    with pytest.raises(WeaviateInvalidInputError):
+        _validate_return_format("polars", references=object())
+
+
+def test_library_not_installed(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    with pytest.raises(WeaviateOptionalDependencyNotInstalledError):
+        _decode_table(_reply([None]), OPTIONS, "arrow", True)
+
+
+def test_decode_ids_and_distances() -> None:
+    np = pytest.importorskip("numpy")
+    uuids, distances = _decode_ids_and_distances(_reply([None, None, None]))
+    assert uuids.dtype == np.dtype("V16")
+    assert [uuid.UUID(bytes=u.tobytes()) for u in uuids] == UUIDS
+    assert distances.dtype == np.float32
+    assert distances.tolist() == pytest.approx([0.0, 0.1, 0.2])
+
+    uuids, distances = _decode_ids_and_distances(search_get_pb2.SearchReply())
+    assert len(uuids) == 0 and len(distances) == 0
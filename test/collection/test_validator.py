@@ -1,4 +1,4 @@
-from typing import Any, List
+from typing import Any, Dict, List, Sequence, Union
 
 import numpy as np
 import pandas as pd
@@ -6,7 +6,12 @@ import polars as pl
 import pytest
 
 from weaviate.exceptions import WeaviateInvalidInputError
-from weaviate.validator import _validate_input, _ValidateArgument, _ExtraTypes
+from weaviate.validator import (
+    _ArgumentValidator,
+    _ExtraTypes,
+    _validate_input,
+    _ValidateArgument,
+)
 
 
 @pytest.mark.parametrize(
@@ -36,3 +41,34 @@ def test_validator(inputs: Any, expected: List[Any], error: bool) -> None:
             _validate_input(_ValidateArgument(expected=expected, name="test", value=inputs))
     else:
         _validate_input(_ValidateArgument(expected=expected, name="test", value=inputs))
+
+
+@pytest.mark.parametrize(
+    "inputs,expected,error",
+    [
+        ([1.0] * 5000, [List[float]], False),
+        ([1.0] * 4999 + ["a"], [List[float]], True),
+        (["a"] + [1.0] * 4999, [List[float]], True),
+        ([1.0] * 10, [Sequence[Union[str, float]]], False),
+        ((1, 2), [Sequence], False),
+        ({"a": 1}, [Dict, None], False),
+        ("a", [List, None], True),
+    ],
+)
+def test_validator_generics(inputs: Any, expected: List[Any], error: bool) -> None:
+    if error:
+        with pytest.raises(WeaviateInvalidInputError):
+            _validate_input(_ValidateArgument(expected=expected, name="test", value=inputs))
+    else:
+        _validate_input(_ValidateArgument(expected=expected, name="test", value=inputs))
+
+
+def test_argument_validator() -> None:
+    validate = _ArgumentValidator([([int, None], "limit"), ([List, _ExtraTypes.NUMPY], "vector")])
+    validate(None, [1.0])
+    validate(1, np.array([1.0]))
+    with pytest.raises(WeaviateInvalidInputError) as e:
+        validate(1, (1.0,))
+    assert "Argument 'vector' must be one of" in str(e.value)
+    with pytest.raises(WeaviateInvalidInputError):
+        validate("1", [1.0])
@@ -15,6 +15,7 @@ from weaviate.util import (
     is_weaviate_object_url,
     get_vector,
     get_valid_uuid,
+    _get_valid_uuids,
     get_domain_from_weaviate_url,
     _is_sub_schema,
     parse_version_string,
@@ -243,6 +244,26 @@ class TestUtil(unittest.TestCase):
             get_valid_uuid(12)
         check_error_message(self, error, type_error_message + str(int))
 
+    def test_get_valid_uuids(self):
+        """
+        Test the `_get_valid_uuids` function.
+        """
+
+        self.assertEqual(
+            _get_valid_uuids(
+                [
+                    "1c9cd584-88fe-5010-83d0-017cb3fcb446",
+                    "1C9CD584-88FE-5010-83D0-017CB3FCB446",
+                    "1c9cd58488fe501083d0017cb3fcb446",
+                    uuid_lib.UUID("1c9cd58488fe501083d0017cb3fcb446"),
+                    "weaviate://localhost/1c9cd584-88fe-5010-83d0-017cb3fcb446",
+                ]
+            ),
+            ["1c9cd584-88fe-5010-83d0-017cb3fcb446"] * 5,
+        )
+        with self.assertRaises(ValueError):
+            _get_valid_uuids(["1c9cd584-88fe-5010-83d0-017cb3fcb446", "some-UUID"])
+
     def test_get_vector(self):
         """
         Test the `get_vector` function.
@@ -1,5 +1,9 @@
+from weaviate.collections.batch.rate_limiter import RateLimiter
+from weaviate.collections.batch.sync_index import SyncIndex
 from weaviate.collections.classes.batch import Shard
 
 __all__ = [
+    "RateLimiter",
     "Shard",
+    "SyncIndex",
 ]
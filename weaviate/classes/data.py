@@ -1,9 +1,10 @@
-from weaviate.collections.classes.data import DataObject, DataReference
+from weaviate.collections.classes.data import DataObject, DataReference, FileMapping
 from weaviate.collections.classes.types import GeoCoordinate, PhoneNumber
 
 __all__ = [
     "DataObject",
     "DataReference",
+    "FileMapping",
     "GeoCoordinate",
     "PhoneNumber",
 ]
@@ -21,6 +21,7 @@ from .connect.base import (
 from .connect.v4 import ConnectionAsync, ConnectionSync
 from .debug import _Debug, _DebugAsync
 from .embedded import EmbeddedOptions
+from .query import _QueryAsync, _Query
 from .rbac import _RolesAsync, _Roles
 from .types import NUMBER
 from .users import _UsersAsync, _Users
@@ -48,6 +49,8 @@ class WeaviateAsyncClient(_WeaviateClientExecutor[ConnectionAsync]):
             A `_CollectionsAsync` object instance connected to the same Weaviate instance as the Client.
         `debug`
             A `_DebugAsync` object instance connected to the same Weaviate instance as the Client.
+        `query`
+            A `_QueryAsync` object instance connected to the same Weaviate instance as the Client.
         `roles`
             A `_RolesAsync` object instance connected to the same Weaviate instance as the Client.
         `users`
@@ -86,6 +89,8 @@ class WeaviateAsyncClient(_WeaviateClientExecutor[ConnectionAsync]):
         """This namespace contains functionality used to debug Weaviate clusters. As such, it is deemed experimental and is subject to change.
 
         We can make no guarantees about the stability of this namespace nor the potential for future breaking changes. Use at your own risk."""
+        self.query = _QueryAsync(self._connection)
+        """This namespace contains all functionality to query several collections at once."""
         self.roles = _RolesAsync(self._connection)
         """This namespace contains all functionality to manage Weaviate's RBAC functionality."""
 
@@ -124,6 +129,8 @@ class WeaviateClient(_WeaviateClientExecutor[ConnectionSync]):
             A `_Collections` object instance connected to the same Weaviate instance as the Client.
         `debug`
             A `_Debug` object instance connected to the same Weaviate instance as the Client.
+        `query`
+            A `_Query` object instance connected to the same Weaviate instance as the Client.
         `roles`
             A `_Roles` object instance connected to the same Weaviate instance as the Client.
         `users`
@@ -166,6 +173,8 @@ class WeaviateClient(_WeaviateClientExecutor[ConnectionSync]):
         """This namespace contains functionality used to debug Weaviate clusters. As such, it is deemed experimental and is subject to change.
 
         We can make no guarantees about the stability of this namespace nor the potential for future breaking changes. Use at your own risk."""
+        self.query = _Query(self._connection)
+        """This namespace contains all functionality to query several collections at once."""
         self.roles = _Roles(self._connection)
         """This namespace contains all functionality to manage Weaviate's RBAC functionality."""
 
@@ -16,6 +16,7 @@ from .collections.batch.client import _BatchClientWrapper
 from .collections.cluster import _Cluster, _ClusterAsync
 from .connect.v4 import ConnectionV4
 from .debug import _Debug, _DebugAsync
+from .query import _Query, _QueryAsync
 from .rbac import _Roles, _RolesAsync
 from .types import NUMBER
 
@@ -30,6 +31,7 @@ class WeaviateAsyncClient(_WeaviateClientExecutor[ConnectionAsync]):
     collections: _CollectionsAsync
     cluster: _ClusterAsync
     debug: _DebugAsync
+    query: _QueryAsync
     roles: _RolesAsync
     users: _UsersAsync
 
@@ -51,6 +53,7 @@ class WeaviateClient(_WeaviateClientExecutor[ConnectionSync]):
     collections: _Collections
     cluster: _Cluster
     debug: _Debug
+    query: _Query
     roles: _Roles
     users: _Users
 
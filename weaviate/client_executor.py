@@ -90,6 +90,8 @@ class _WeaviateClientExecutor(Generic[ConnectionType]):
                 proxies=config.proxies,
                 trust_env=config.trust_env,
                 skip_init_checks=skip_init_checks,
+                schema_cache_ttl=config.schema_cache_ttl,
+                offload_threshold=config.offload_threshold,
             )
         )
 
@@ -1,3 +1,4 @@
+import itertools
 import math
 import os
 import threading
@@ -8,7 +9,20 @@ from collections import deque
 from concurrent.futures import ThreadPoolExecutor
 from copy import copy
 from dataclasses import dataclass, field
-from typing import Any, Dict, Generic, List, Optional, Set, TypeVar, Union, cast
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
 
 from pydantic import ValidationError
 from typing_extensions import TypeAlias
@@ -16,13 +30,21 @@ from typing_extensions import TypeAlias
 from httpx import ConnectError
 
 from weaviate.cluster.types import Node
-from weaviate.collections.batch.grpc_batch_objects import _BatchGRPC
+from weaviate.collections.batch.grpc_batch_objects import _BatchGRPC, _estimated_size
+from weaviate.collections.batch.rate_limiter import RateLimiter, _estimated_tokens
 from weaviate.collections.batch.rest import _BatchREST
+from weaviate.collections.batch.sync_index import (
+    SyncIndex,
+    _Key as _SyncKey,
+    _object_digest,
+    _object_key,
+)
 from weaviate.collections.classes.batch import (
     _BatchReference,
     BatchObject,
     BatchReference,
     BatchResult,
+    BatchStats,
     ErrorObject,
     ErrorReference,
     _BatchObject,
@@ -38,6 +60,7 @@ from weaviate.collections.classes.internal import (
 )
 from weaviate.collections.classes.types import WeaviateProperties
 from weaviate.connect import executor
+from weaviate.connect.base import MAX_GRPC_MESSAGE_LENGTH
 from weaviate.connect.v4 import ConnectionSync
 from weaviate.exceptions import WeaviateBatchValidationError, EmptyResponseException
 from weaviate.logger import logger
@@ -58,6 +81,16 @@ VECTORIZER_BATCHING_STEP_SIZE = 48  # cohere max batch size is 96
 MAX_RETRIES = float(
     os.getenv("WEAVIATE_BATCH_MAX_RETRIES", "9.299")
 )  # approximately 10m30s of waiting in worst case, e.g. server scale up event
+MAX_QUEUE_BYTES = int(
+    os.getenv("WEAVIATE_BATCH_MAX_QUEUE_BYTES", str(256 * 1024 * 1024))
+)  # producers block while more than this many (estimated) bytes of objects are waiting to be sent
+STAGING_BUFFER_SIZE = (
+    100  # objects that a producer thread collects before handing them to the queue at once
+)
+STATS_WINDOW_SECONDS = 10
+STATS_LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, math.inf)
+
+BatchStatsCallback: TypeAlias = Callable[[BatchStats], None]
 
 
 class BatchRequest(ABC, Generic[TBatchInput, TBatchReturn]):
@@ -110,26 +143,98 @@ class ReferencesBatchRequest(BatchRequest[_BatchReference, BatchReferenceReturn]
 
 
 class ObjectsBatchRequest(BatchRequest[_BatchObject, BatchObjectReturn]):
-    """Collect objects for one batch request to weaviate."""
+    """Collect objects for one batch request to weaviate.
 
-    def pop_items(self, pop_amount: int) -> List[_BatchObject]:
+    Keeps track of the estimated encoded size of the queued objects, so that batches can be limited in bytes as well.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._sizes: List[int] = []
+        self._num_bytes = 0
+
+    @property
+    def num_bytes(self) -> int:
+        """The estimated encoded size of all queued objects."""
+        return self._num_bytes
+
+    def add(self, item: _BatchObject) -> None:
+        """Add an item to the BatchRequest."""
+        size = _estimated_size(item)
+        with self._lock:
+            self._items.append(item)
+            self._sizes.append(size)
+            self._num_bytes += size
+
+    def prepend(self, item: List[_BatchObject]) -> None:
+        """Add items to the front of the BatchRequest.
+
+        This is intended to be used when objects should be retries, eg. after a temporary error.
+        """
+        sizes = [_estimated_size(obj) for obj in item]
+        with self._lock:
+            self._items = item + self._items
+            self._sizes = sizes + self._sizes
+            self._num_bytes += sum(sizes)
+
+    def extend(self, items: List[_BatchObject]) -> None:
+        """Add several items to the end of the BatchRequest at once."""
+        sizes = [_estimated_size(obj) for obj in items]
+        with self._lock:
+            self._items.extend(items)
+            self._sizes.extend(sizes)
+            self._num_bytes += sum(sizes)
+
+    def pop_items(
+        self, pop_amount: int, max_bytes: Optional[int] = None, max_tokens: Optional[int] = None
+    ) -> List[_BatchObject]:
         """Pop the given number of items from the BatchRequest queue.
 
+        If `max_bytes` or `max_tokens` is given, fewer items are popped if their estimated size or number of tokens
+        would exceed it, but always at least one.
+
         Returns
             `List[_BatchObject]` items from the BatchRequest.
         """
         self._lock.acquire()
-        if pop_amount >= len(self._items):
+        pop_amount = min(pop_amount, len(self._items))
+        if max_bytes is not None:
+            num_bytes = 0
+            for i in range(pop_amount):
+                num_bytes += self._sizes[i]
+                if num_bytes > max_bytes and i > 0:
+                    pop_amount = i
+                    break
+        if max_tokens is not None:
+            num_tokens = 0
+            for i in range(pop_amount):
+                num_tokens += _estimated_tokens(self._items[i])
+                if num_tokens > max_tokens and i > 0:
+                    pop_amount = i
+                    break
+        if pop_amount == len(self._items):
             ret = copy(self._items)
             self._items.clear()
+            self._sizes.clear()
+            self._num_bytes = 0
         else:
             ret = copy(self._items[:pop_amount])
             self._items = self._items[pop_amount:]
+            self._num_bytes -= sum(self._sizes[:pop_amount])
+            self._sizes = self._sizes[pop_amount:]
 
         self._lock.release()
         return ret
 
 
+class _StagingBuffer:
+    """The objects that one producer thread added and that were not handed to the shared queue yet."""
+
+    def __init__(self) -> None:
+        self.items: List[_BatchObject] = []
+        self.lock = threading.Lock()
+
+
 @dataclass
 class _BatchDataWrapper:
     results: BatchResult = field(default_factory=BatchResult)
@@ -138,6 +243,62 @@ class _BatchDataWrapper:
     imported_shards: Set[Shard] = field(default_factory=set)
 
 
+class _BatchStatsTracker:
+    """Collect the counters of a batch that are updated from the request threads."""
+
+    def __init__(self, window: float = STATS_WINDOW_SECONDS) -> None:
+        self.window = window
+        self.start = time.time()
+        self.objects_sent = 0
+        self.objects_failed = 0
+        self.references_sent = 0
+        self.references_failed = 0
+        self.retries = 0
+        self.server_queue_length: Optional[int] = None
+        self.server_rate_per_second: Optional[float] = None
+        self.__latency = [0] * len(STATS_LATENCY_BUCKETS)
+        self.__completed: Deque[Tuple[float, int]] = deque()
+        self.__lock = threading.Lock()
+
+    def add_objects(self, sent: int, failed: int, retried: int, took: float) -> None:
+        now = time.time()
+        with self.__lock:
+            self.objects_sent += sent
+            self.objects_failed += failed
+            self.retries += retried
+            self.__latency[self.__bucket(took)] += 1
+            self.__completed.append((now, sent - failed))
+            self.__evict(now)
+
+    def add_references(self, sent: int, failed: int) -> None:
+        with self.__lock:
+            self.references_sent += sent
+            self.references_failed += failed
+
+    def objects_per_second(self) -> float:
+        now = time.time()
+        with self.__lock:
+            self.__evict(now)
+            imported = sum(n for _, n in self.__completed)
+        # do not under-report the rate during the first seconds of a batch
+        return imported / max(min(self.window, now - self.start), 1e-3)
+
+    def latency_histogram(self) -> Dict[float, int]:
+        with self.__lock:
+            return dict(zip(STATS_LATENCY_BUCKETS, self.__latency))
+
+    def __evict(self, now: float) -> None:
+        while len(self.__completed) > 0 and self.__completed[0][0] < now - self.window:
+            self.__completed.popleft()
+
+    @staticmethod
+    def __bucket(took: float) -> int:
+        for i, bound in enumerate(STATS_LATENCY_BUCKETS):
+            if took <= bound:
+                return i
+        return len(STATS_LATENCY_BUCKETS) - 1
+
+
 @dataclass
 class _DynamicBatching:
     pass
@@ -151,7 +312,7 @@ class _FixedSizeBatching:
 
 @dataclass
 class _RateLimitedBatching:
-    requests_per_minute: int
+    limiter: RateLimiter
 
 
 _BatchMode: TypeAlias = Union[_DynamicBatching, _FixedSizeBatching, _RateLimitedBatching]
@@ -168,6 +329,9 @@ class _BatchBase:
         vectorizer_batching: bool,
         objects: Optional[ObjectsBatchRequest] = None,
         references: Optional[ReferencesBatchRequest] = None,
+        stats_callback: Optional[BatchStatsCallback] = None,
+        stats_interval: float = 5,
+        sync_index: Optional[SyncIndex] = None,
     ) -> None:
         self.__batch_objects = objects or ObjectsBatchRequest()
         self.__batch_references = references or ReferencesBatchRequest()
@@ -190,9 +354,17 @@ class _BatchBase:
 
         self.__batching_mode: _BatchMode = batch_mode
         self.__max_batch_size: int = 1000
+        # leave room for the inaccuracy of the size estimate of the objects
+        self.__max_batch_bytes: int = (
+            connection._grpc_max_msg_size or MAX_GRPC_MESSAGE_LENGTH
+        ) // 2
+        self.__max_queue_bytes: int = MAX_QUEUE_BYTES
+        # only limited for rate limited batching with a token budget
+        self.__max_batch_tokens: Optional[int] = None
 
         self.__executor = executor
-        self.__objs_count = 0
+        # next() on a count is atomic, so that producer threads never share an index
+        self.__objs_count = itertools.count()
         self.__objs_logs_count = 0
         self.__refs_logs_count = 0
 
@@ -200,17 +372,21 @@ class _BatchBase:
             self.__recommended_num_objects = self.__batching_mode.batch_size
             self.__concurrent_requests = self.__batching_mode.concurrent_requests
         elif isinstance(self.__batching_mode, _RateLimitedBatching):
-            # Batch with rate limiting should never send more than the given amount of objects per minute.
-            # We could send all objects in a single batch every 60 seconds but that could cause problems with too large requests. Therefore, we
-            # limit the size of a batch to self.__max_batch_size and send multiple batches of equal size and send them in equally space in time.
+            # The limiter decides when a batch can be sent, the batches are sized so that a few of them use up the
+            # budget of a minute without exceeding self.__max_batch_size, in objects as well as in estimated tokens.
             # Example:
-            #  3000 objects, 1000/min -> 3 batches of 1000 objects, send every 20 seconds
+            #  1000/min -> 2 batches of 500 objects
+            #  10000 tokens/min -> 2 batches of up to 5000 tokens
+            limiter = self.__batching_mode.limiter
+            requests_per_minute = limiter.requests_per_minute or self.__max_batch_size
             self.__concurrent_requests = (
-                self.__batching_mode.requests_per_minute + self.__max_batch_size
+                requests_per_minute + self.__max_batch_size
             ) // self.__max_batch_size
-            self.__recommended_num_objects = (
-                self.__batching_mode.requests_per_minute // self.__concurrent_requests
-            )
+            self.__recommended_num_objects = requests_per_minute // self.__concurrent_requests
+            if limiter.tokens_per_minute is not None:
+                self.__max_batch_tokens = max(
+                    1, limiter.tokens_per_minute // self.__concurrent_requests
+                )
         elif isinstance(self.__batching_mode, _DynamicBatching) and not self.__vectorizer_batching:
             self.__recommended_num_objects = 10
             self.__concurrent_requests = 2
@@ -230,7 +406,6 @@ class _BatchBase:
         self.__rate_queue: deque = deque(maxlen=50)  # 5s with 0.1s refresh rate
         self.__took_queue: deque = deque(maxlen=CONCURRENT_REQUESTS_DYNAMIC_VECTORIZER)
 
-        # fixed rate batching
         self.__time_stamp_last_request: float = 0
         # do 62 secs to give us some buffer to the "per-minute" calculation
         self.__fix_rate_batching_base_time = 62
@@ -239,6 +414,22 @@ class _BatchBase:
         self.__uuid_lookup_lock = threading.Lock()
         self.__results_lock = threading.Lock()
 
+        # every producer thread collects its objects in its own buffer, so that producers do not contend on the
+        # lock of the queue for every object
+        self.__staging_local = threading.local()
+        self.__staging_buffers: List[_StagingBuffer] = []
+        self.__staging_lock = threading.Lock()
+        self.__imported_shards: Set[Tuple[str, Optional[str]]] = set()
+
+        self.__stats = _BatchStatsTracker()
+        self.__stats_callback = stats_callback
+        self.__stats_interval = stats_interval
+
+        # the digests of the objects that were sent because they changed, they are stored once they are imported
+        self.__sync_index = sync_index
+        self.__sync_digests: Dict[_SyncKey, bytes] = {}
+        self.__sync_lock = threading.Lock()
+
         self.__bg_thread = self.__start_bg_threads()
         self.__bg_thread_exception: Optional[Exception] = None
 
@@ -249,6 +440,31 @@ class _BatchBase:
             self.__results_for_wrapper.failed_references
         )
 
+    def stats(self) -> BatchStats:
+        """Return a snapshot of the throughput, sizing and queue state of the batch.
+
+        The values are read without stopping the batch, so they are only consistent with each other approximately.
+        """
+        return BatchStats(
+            objects_per_second=self.__stats.objects_per_second(),
+            window_seconds=self.__stats.window,
+            objects_sent=self.__stats.objects_sent,
+            objects_failed=self.__stats.objects_failed,
+            references_sent=self.__stats.references_sent,
+            references_failed=self.__stats.references_failed,
+            retries=self.__stats.retries,
+            recommended_batch_size=self.__recommended_num_objects,
+            concurrent_requests=self.__concurrent_requests,
+            in_flight_requests=self.__active_requests,
+            queued_objects=len(self.__batch_objects),
+            queued_references=len(self.__batch_references),
+            queued_bytes=self.__batch_objects.num_bytes,
+            server_queue_length=self.__stats.server_queue_length,
+            server_rate_per_second=self.__stats.server_rate_per_second,
+            request_latency=self.__stats.latency_histogram(),
+            elapsed_seconds=time.time() - self.__stats.start,
+        )
+
     def _shutdown(self) -> None:
         """Shutdown the current batch and wait for all requests to be finished."""
         self.flush()
@@ -257,6 +473,8 @@ class _BatchBase:
         self.__shut_background_thread_down.set()
         while self.__bg_thread.is_alive():
             time.sleep(0.01)
+        if self.__stats_thread is not None:
+            self.__stats_thread.join()
 
         # copy the results to the public results
         self.__results_for_wrapper_backup.results = self.__results_for_wrapper.results
@@ -274,15 +492,7 @@ class _BatchBase:
             self.__shut_background_thread_down is not None
             and not self.__shut_background_thread_down.is_set()
         ):
-            if isinstance(self.__batching_mode, _RateLimitedBatching):
-                if (
-                    time.time() - self.__time_stamp_last_request
-                    < self.__fix_rate_batching_base_time // self.__concurrent_requests
-                ):
-                    time.sleep(1)
-                    continue
-                refresh_time = 0
-            elif isinstance(self.__batching_mode, _DynamicBatching) and self.__vectorizer_batching:
+            if isinstance(self.__batching_mode, _DynamicBatching) and self.__vectorizer_batching:
                 if self.__dynamic_batching_sleep_time > 0:
                     if (
                         time.time() - self.__time_stamp_last_request
@@ -291,6 +501,7 @@ class _BatchBase:
                         time.sleep(1)
                         continue
 
+            self.__drain_staging_buffers()
             if (
                 self.__active_requests < self.__concurrent_requests
                 and len(self.__batch_objects) + len(self.__batch_references) > 0
@@ -302,11 +513,14 @@ class _BatchBase:
                     self.__active_requests += 1
 
                 start = time.time()
-                while (len_o := len(self.__batch_objects)) < self.__recommended_num_objects and (
-                    len_r := len(self.__batch_references)
-                ) < self.__recommended_num_refs:
+                while (
+                    (len_o := len(self.__batch_objects)) < self.__recommended_num_objects
+                    and (len_r := len(self.__batch_references)) < self.__recommended_num_refs
+                    and self.__batch_objects.num_bytes < self.__max_batch_bytes
+                ):
                     # wait for more objects to be added up to the recommended number
                     time.sleep(0.01)
+                    self.__drain_staging_buffers()
                     if (
                         self.__shut_background_thread_down is not None
                         and self.__shut_background_thread_down.is_set()
@@ -319,18 +533,23 @@ class _BatchBase:
                         # no new objects were added in the last second, exit the loop
                         break
 
-                objs = self.__batch_objects.pop_items(self.__recommended_num_objects)
-                refs = self.__batch_references.pop_items(
-                    self.__recommended_num_refs,
-                    uuid_lookup=self.__uuid_lookup,
+                objs = self.__batch_objects.pop_items(
+                    self.__recommended_num_objects,
+                    max_bytes=self.__max_batch_bytes,
+                    max_tokens=self.__max_batch_tokens,
                 )
+                with self.__uuid_lookup_lock:
+                    refs = self.__batch_references.pop_items(
+                        self.__recommended_num_refs,
+                        uuid_lookup=self.__uuid_lookup,
+                    )
+                if isinstance(self.__batching_mode, _RateLimitedBatching) and len(objs) > 0:
+                    # blocks until the budgets of the vectorizer, which might be shared with other batches, allow it
+                    self.__batching_mode.limiter.acquire(
+                        len(objs), sum(_estimated_tokens(obj) for obj in objs)
+                    )
                 # do not block the thread - the results are written to a central (locked) list and we want to have multiple concurrent batch-requests
-                self.__executor.submit(
-                    self.__send_batch,
-                    objs,
-                    refs,
-                    readd_rate_limit=isinstance(self.__batching_mode, _RateLimitedBatching),
-                )
+                self.__executor.submit(self.__send_batch, objs, refs)
 
             time.sleep(refresh_time)
 
@@ -350,6 +569,18 @@ class _BatchBase:
 
             time.sleep(refresh_time)
 
+    def __stats_loop(self) -> None:
+        assert self.__stats_callback is not None
+        # the final call after the shutdown reports the totals of the whole batch
+        while True:
+            stopped = self.__shut_background_thread_down.wait(self.__stats_interval)
+            try:
+                self.__stats_callback(self.stats())
+            except Exception as e:
+                logger.warning(f"Batch stats callback failed: {e!r}")
+            if stopped:
+                return
+
     def __start_bg_threads(self) -> threading.Thread:
         """Create a background thread that periodically checks how congested the batch queue is."""
         self.__shut_background_thread_down = threading.Event()
@@ -381,6 +612,15 @@ class _BatchBase:
         )
         demonBatchSend.start()
 
+        self.__stats_thread: Optional[threading.Thread] = None
+        if self.__stats_callback is not None:
+            self.__stats_thread = threading.Thread(
+                target=self.__stats_loop,
+                daemon=True,
+                name="BgBatchStats",
+            )
+            self.__stats_thread.start()
+
         return demonBatchSend
 
     def __dynamic_batching(self) -> None:
@@ -398,6 +638,8 @@ class _BatchBase:
         batch_length = status[0]["batchStats"]["queueLength"]
 
         self.__rate_queue.append(rate)
+        self.__stats.server_queue_length = batch_length
+        self.__stats.server_rate_per_second = rate
 
         if self.__vectorizer_batching:
             # slow vectorizer, we want to send larger batches that can take a bit longer, but fewer of them. We might need to sleep
@@ -474,9 +716,7 @@ class _BatchBase:
                     self.__recommended_num_objects = 0
                     self.__concurrent_requests = 2
 
-    def __send_batch(
-        self, objs: List[_BatchObject], refs: List[_BatchReference], readd_rate_limit: bool
-    ) -> None:
+    def __send_batch(self, objs: List[_BatchObject], refs: List[_BatchReference]) -> None:
         if (n_objs := len(objs)) > 0:
             start = time.time()
             try:
@@ -512,6 +752,7 @@ class _BatchBase:
                     errors=errors_obj,
                     has_errors=True,
                 )
+            took = time.time() - start
 
             readded_uuids = set()
             readded_objects = []
@@ -548,7 +789,11 @@ class _BatchBase:
             if len(readded_objects) > 0:
                 _Warnings.batch_rate_limit_reached(
                     response_obj.errors[readded_objects[0]].message,
-                    self.__fix_rate_batching_base_time * (highest_retry_count + 1),
+                    (
+                        60  # the limiter refills empty budgets within a minute
+                        if isinstance(self.__batching_mode, _RateLimitedBatching)
+                        else self.__fix_rate_batching_base_time * (highest_retry_count + 1)
+                    ),
                 )
 
                 readd_objects = [
@@ -576,14 +821,10 @@ class _BatchBase:
                     ],
                     elapsed_seconds=response_obj.elapsed_seconds,
                 )
-                if readd_rate_limit:
-                    # for rate limited batching the timing is handled by the outer loop => no sleep here
-                    self.__time_stamp_last_request = (
-                        time.time() + self.__fix_rate_batching_base_time * (highest_retry_count + 1)
-                    )  # skip a full minute to recover from the rate limit
-                    self.__fix_rate_batching_base_time += (
-                        1  # increase the base time as the current one is too low
-                    )
+                if isinstance(self.__batching_mode, _RateLimitedBatching):
+                    # for rate limited batching the timing is handled by the limiter => no sleep here, the budgets
+                    # were used up by someone else, so the next batches have to wait for them to be refilled
+                    self.__batching_mode.limiter._exhaust()
                 else:
                     # sleep a bit to recover from the rate limit in other cases
                     time.sleep(2**highest_retry_count)
@@ -591,6 +832,8 @@ class _BatchBase:
                 self.__uuid_lookup.difference_update(
                     obj.uuid for obj in objs if obj.uuid not in readded_uuids
                 )
+            if self.__sync_index is not None:
+                self.__record_synced(objs, response_obj, readded_uuids)
 
             if (n_obj_errs := len(response_obj.errors)) > 0 and self.__objs_logs_count < 30:
                 logger.error(
@@ -609,6 +852,12 @@ class _BatchBase:
                 self.__results_for_wrapper.results.objs += response_obj
                 self.__results_for_wrapper.failed_objects.extend(response_obj.errors.values())
             self.__took_queue.append(time.time() - start)
+            self.__stats.add_objects(
+                sent=n_objs - len(readded_uuids),
+                failed=len(response_obj.errors),
+                retried=len(readded_uuids),
+                took=took,
+            )
 
         if (n_refs := len(refs)) > 0:
             start = time.time()
@@ -645,6 +894,7 @@ class _BatchBase:
             with self.__results_lock:
                 self.__results_for_wrapper.results.refs += response_ref
                 self.__results_for_wrapper.failed_references.extend(response_ref.errors.values())
+            self.__stats.add_references(sent=n_refs, failed=len(response_ref.errors))
 
         with self.__active_requests_lock:
             self.__active_requests -= 1
@@ -652,6 +902,7 @@ class _BatchBase:
     def flush(self) -> None:
         """Flush the batch queue and wait for all requests to be finished."""
         # bg thread is sending objs+refs automatically, so simply wait for everything to be done
+        self.__drain_staging_buffers()
         while (
             self.__active_requests > 0
             or len(self.__batch_objects) > 0
@@ -659,6 +910,23 @@ class _BatchBase:
         ):
             time.sleep(0.01)
             self.__check_bg_thread_alive()
+            self.__drain_staging_buffers()
+
+    def __record_synced(
+        self, objs: List[_BatchObject], response_obj: BatchObjectReturn, readded_uuids: Set[str]
+    ) -> None:
+        """Store the digests of the imported objects, failed objects are sent again by the next import."""
+        assert self.__sync_index is not None
+        imported: List[Tuple[_SyncKey, bytes]] = []
+        with self.__sync_lock:
+            for obj in objs:
+                if obj.uuid in readded_uuids:
+                    continue
+                key = _object_key(obj)
+                digest = self.__sync_digests.pop(key, None)
+                if digest is not None and obj.index in response_obj.uuids:
+                    imported.append((key, digest))
+        self.__sync_index._record(imported)
 
     def _add_object(
         self,
@@ -678,29 +946,83 @@ class _BatchBase:
                 uuid=uuid,
                 vector=vector,
                 tenant=tenant,
-                index=self.__objs_count,
-            )
-            self.__objs_count += 1
-            self.__results_for_wrapper.imported_shards.add(
-                Shard(collection=collection, tenant=tenant)
+                index=next(self.__objs_count),
             )
         except ValidationError as e:
             raise WeaviateBatchValidationError(repr(e))
-        self.__uuid_lookup.add(str(batch_object.uuid))
-        self.__batch_objects.add(batch_object._to_internal())
+        assert batch_object.uuid is not None
+        internal = batch_object._to_internal()
+        if (collection, tenant) not in self.__imported_shards:
+            with self.__results_lock:
+                self.__imported_shards.add((collection, tenant))
+                self.__results_for_wrapper.imported_shards.add(
+                    Shard(collection=collection, tenant=tenant)
+                )
+        # the lookup has to contain the object before any reference to it can be scheduled
+        with self.__uuid_lookup_lock:
+            self.__uuid_lookup.add(str(batch_object.uuid))
+
+        buffer = self.__staging_buffer()
+        with buffer.lock:
+            buffer.items.append(internal)
+            if len(buffer.items) >= STAGING_BUFFER_SIZE:
+                self.__hand_off(buffer.items)
+                buffer.items = []
 
         # block if queue gets too long or weaviate is overloaded - reading files is faster them sending them so we do
         # not need a long queue
         while (
             self.__recommended_num_objects == 0
             or len(self.__batch_objects) >= self.__recommended_num_objects * 2
+            or self.__batch_objects.num_bytes >= self.__max_queue_bytes
         ):
             self.__check_bg_thread_alive()
             time.sleep(0.01)
 
-        assert batch_object.uuid is not None
         return batch_object.uuid
 
+    def __staging_buffer(self) -> _StagingBuffer:
+        buffer: Optional[_StagingBuffer] = getattr(self.__staging_local, "buffer", None)
+        if buffer is None:
+            buffer = _StagingBuffer()
+            self.__staging_local.buffer = buffer
+            with self.__staging_lock:
+                self.__staging_buffers.append(buffer)
+        return buffer
+
+    def __drain_staging_buffers(self) -> None:
+        """Hand the objects of all producer threads to the queue, also the ones of buffers that are not full yet."""
+        with self.__staging_lock:
+            buffers = list(self.__staging_buffers)
+        for buffer in buffers:
+            if len(buffer.items) == 0:
+                continue
+            # extend while holding the lock of the buffer to keep the order of the objects of one producer
+            with buffer.lock:
+                self.__hand_off(buffer.items)
+                buffer.items = []
+
+    def __hand_off(self, items: List[_BatchObject]) -> None:
+        """Move the objects of a staging buffer to the queue, without the ones that the sync index has already."""
+        if self.__sync_index is not None and len(items) > 0:
+            # one lookup per buffer instead of per object, which would serialize the producers on the index
+            keys = [_object_key(obj) for obj in items]
+            digests = [_object_digest(obj) for obj in items]
+            unchanged = self.__sync_index._unchanged(keys, digests)
+            with self.__sync_lock:
+                for key, digest, skip in zip(keys, digests, unchanged):
+                    if not skip:
+                        self.__sync_digests[key] = digest
+            sent = [obj for obj, skip in zip(items, unchanged) if not skip]
+            if len(sent) < len(items):
+                # references to the skipped objects do not have to wait for them
+                with self.__uuid_lookup_lock:
+                    self.__uuid_lookup.difference_update(
+                        {obj.uuid for obj in items} - {obj.uuid for obj in sent}
+                    )
+            items = sent
+        self.__batch_objects.extend(items)
+
     def _add_reference(
         self,
         from_object_uuid: UUID,
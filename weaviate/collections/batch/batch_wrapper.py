@@ -1,16 +1,20 @@
 import time
-from typing import Generic, List, Optional, Any, TypeVar, cast
+from typing import Generic, List, Optional, Any, TypeVar, Union, cast
 
 from weaviate.collections.batch.base import (
     _BatchBase,
     _BatchDataWrapper,
+    BatchStatsCallback,
     _DynamicBatching,
     _BatchMode,
 )
+from weaviate.collections.batch.multiprocess import _MultiprocessBatchBase
+from weaviate.collections.batch.sync_index import SyncIndex
 from weaviate.collections.classes.batch import BatchResult, ErrorObject, ErrorReference, Shard
 from weaviate.collections.classes.config import ConsistencyLevel
 from weaviate.connect import executor
 from weaviate.connect.v4 import ConnectionSync
+from weaviate.exceptions import WeaviateInvalidInputError
 from weaviate.logger import logger
 from weaviate.util import _capitalize_first_letter, _decode_json_response_list
 
@@ -26,9 +30,20 @@ class _BatchWrapper:
         self._current_batch: Optional[_BatchBase] = None
         # config options
         self._batch_mode: _BatchMode = _DynamicBatching()
+        self._stats_callback: Optional[BatchStatsCallback] = None
+        self._stats_interval: float = 5
+        self._sync_index: Optional[SyncIndex] = None
 
         self._batch_data = _BatchDataWrapper()
 
+    @staticmethod
+    def _validate_stats_interval(stats_interval: float) -> None:
+        # the stats thread waits for the interval between two snapshots, it would spin without one
+        if stats_interval <= 0:
+            raise WeaviateInvalidInputError(
+                f"stats_interval has to be positive, got {stats_interval}."
+            )
+
     def __is_ready(
         self, max_count: int, shards: Optional[List[Shard]], backoff_count: int = 0
     ) -> bool:
@@ -122,7 +137,7 @@ class _BatchWrapper:
         return self._batch_data.results
 
 
-T = TypeVar("T", bound=_BatchBase)
+T = TypeVar("T", bound=Union[_BatchBase, _MultiprocessBatchBase])
 
 
 class _ContextManagerWrapper(Generic[T]):
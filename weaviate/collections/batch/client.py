@@ -1,8 +1,10 @@
+import os
 from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Union
 
 from weaviate.collections.batch.base import (
     _BatchBase,
+    BatchStatsCallback,
     _BatchDataWrapper,
     _DynamicBatching,
     _FixedSizeBatching,
@@ -13,11 +15,14 @@ from weaviate.collections.batch.batch_wrapper import (
     _BatchMode,
     _ContextManagerWrapper,
 )
+from weaviate.collections.batch.rate_limiter import RateLimiter
+from weaviate.collections.batch.sync_index import SyncIndex
+from weaviate.collections.batch.multiprocess import _MultiprocessBatchClient
 from weaviate.collections.classes.config import ConsistencyLevel, Vectorizers
 from weaviate.collections.classes.internal import ReferenceInput, ReferenceInputs
 from weaviate.collections.classes.tenants import Tenant
 from weaviate.collections.classes.types import WeaviateProperties
-from weaviate.exceptions import UnexpectedStatusCodeError
+from weaviate.exceptions import UnexpectedStatusCodeError, WeaviateInvalidInputError
 from weaviate.types import UUID, VECTORS
 
 from weaviate.connect.v4 import ConnectionSync
@@ -170,11 +175,18 @@ class _BatchClientWrapper(_BatchWrapper):
                 batch_mode=self._batch_mode,
                 executor=self.__executor,
                 vectorizer_batching=self._vectorizer_batching,
+                stats_callback=self._stats_callback,
+                stats_interval=self._stats_interval,
+                sync_index=self._sync_index,
             )
         )
 
     def dynamic(
-        self, consistency_level: Optional[ConsistencyLevel] = None
+        self,
+        consistency_level: Optional[ConsistencyLevel] = None,
+        stats_callback: Optional[BatchStatsCallback] = None,
+        stats_interval: float = 5,
+        sync_index: Optional[SyncIndex] = None,
     ) -> ClientBatchingContextManager:
         """Configure dynamic batching.
 
@@ -183,9 +195,25 @@ class _BatchClientWrapper(_BatchWrapper):
         Arguments:
             `consistency_level`
                 The consistency level to be used to send batches. If not provided, the default value is `None`.
+            `stats_callback`
+                A function that is called with a `BatchStats` snapshot of the batch every `stats_interval` seconds and
+                once more when the batch is finished. If not provided, the default value is `None`.
+            `stats_interval`
+                The number of seconds between two calls of `stats_callback`. If not provided, the default value is 5.
+            `sync_index`
+                A `SyncIndex` of the objects that were imported before. Objects that did not change since then are not
+                sent and not included in the results. If not provided, the default value is `None`.
+
+        Raises:
+            `WeaviateInvalidInputError`
+                If `stats_interval` is not positive.
         """
+        self._validate_stats_interval(stats_interval)
         self._batch_mode: _BatchMode = _DynamicBatching()
         self._consistency_level = consistency_level
+        self._stats_callback = stats_callback
+        self._stats_interval = stats_interval
+        self._sync_index = sync_index
         return self.__create_batch_and_reset()
 
     def fixed_size(
@@ -193,6 +221,9 @@ class _BatchClientWrapper(_BatchWrapper):
         batch_size: int = 100,
         concurrent_requests: int = 2,
         consistency_level: Optional[ConsistencyLevel] = None,
+        stats_callback: Optional[BatchStatsCallback] = None,
+        stats_interval: float = 5,
+        sync_index: Optional[SyncIndex] = None,
     ) -> _ContextManagerWrapper[_BatchClient]:
         """Configure fixed size batches. Note that the default is dynamic batching.
 
@@ -206,17 +237,44 @@ class _BatchClientWrapper(_BatchWrapper):
                 made to Weaviate and not the speed of batch creation within Python.
             `consistency_level`
                 The consistency level to be used to send batches. If not provided, the default value is `None`.
+            `stats_callback`
+                A function that is called with a `BatchStats` snapshot of the batch every `stats_interval` seconds and
+                once more when the batch is finished. If not provided, the default value is `None`.
+            `stats_interval`
+                The number of seconds between two calls of `stats_callback`. If not provided, the default value is 5.
+            `sync_index`
+                A `SyncIndex` of the objects that were imported before. Objects that did not change since then are not
+                sent and not included in the results. If not provided, the default value is `None`.
 
+        Raises:
+            `WeaviateInvalidInputError`
+                If `stats_interval` is not positive.
         """
+        self._validate_stats_interval(stats_interval)
         self._batch_mode = _FixedSizeBatching(batch_size, concurrent_requests)
         self._consistency_level = consistency_level
+        self._stats_callback = stats_callback
+        self._stats_interval = stats_interval
+        self._sync_index = sync_index
         return self.__create_batch_and_reset()
 
     def rate_limit(
-        self, requests_per_minute: int, consistency_level: Optional[ConsistencyLevel] = None
+        self,
+        requests_per_minute: Optional[int] = None,
+        consistency_level: Optional[ConsistencyLevel] = None,
+        stats_callback: Optional[BatchStatsCallback] = None,
+        stats_interval: float = 5,
+        *,
+        tokens_per_minute: Optional[int] = None,
+        limiter: Optional[RateLimiter] = None,
+        sync_index: Optional[SyncIndex] = None,
     ) -> ClientBatchingContextManager:
         """Configure batches with a rate limited vectorizer.
 
+        The objects are sent as fast as the budgets of the vectorizer allow, see `RateLimiter` for how they are enforced.
+        Pass the same `limiter` to several batches, or limiters with the same `path` in several processes, to share the
+        budgets of one vectorizer between them.
+
         When you exit the context manager, the final batch will be sent automatically.
 
         Arguments:
@@ -224,7 +282,79 @@ class _BatchClientWrapper(_BatchWrapper):
                 The number of requests that the vectorizer can process per minute.
             `consistency_level`
                 The consistency level to be used to send batches. If not provided, the default value is `None`.
+            `stats_callback`
+                A function that is called with a `BatchStats` snapshot of the batch every `stats_interval` seconds and
+                once more when the batch is finished. If not provided, the default value is `None`.
+            `stats_interval`
+                The number of seconds between two calls of `stats_callback`. If not provided, the default value is 5.
+            `tokens_per_minute`
+                The number of tokens that the vectorizer can process per minute, estimated from the length of the text
+                properties of the objects.
+            `limiter`
+                A `RateLimiter` that the budgets are taken from instead of `requests_per_minute` and `tokens_per_minute`.
+            `sync_index`
+                A `SyncIndex` of the objects that were imported before. Objects that did not change since then are not
+                sent and not included in the results. If not provided, the default value is `None`.
+
+        Raises:
+            `WeaviateInvalidInputError`
+                If neither or both of a limiter and budgets are given or `stats_interval` is not positive.
         """
-        self._batch_mode = _RateLimitedBatching(requests_per_minute)
+        self._validate_stats_interval(stats_interval)
+        if limiter is None:
+            limiter = RateLimiter(requests_per_minute, tokens_per_minute)
+        elif requests_per_minute is not None or tokens_per_minute is not None:
+            raise WeaviateInvalidInputError(
+                "Either a limiter or requests_per_minute and tokens_per_minute can be given, not both."
+            )
+        self._batch_mode = _RateLimitedBatching(limiter)
         self._consistency_level = consistency_level
+        self._stats_callback = stats_callback
+        self._stats_interval = stats_interval
+        self._sync_index = sync_index
         return self.__create_batch_and_reset()
+
+    def multiprocess(
+        self,
+        workers: Optional[int] = None,
+        batch_size: int = 1000,
+        consistency_level: Optional[ConsistencyLevel] = None,
+    ) -> _ContextManagerWrapper[_MultiprocessBatchClient]:
+        """Configure batching that validates and encodes the objects in worker processes.
+
+        Use this mode if the import is limited by the CPU of the client, i.e. if one core is fully used by the batching.
+        The objects are only validated in the workers, invalid objects are reported in `failed_objects`. References and
+        the retrying of objects that hit the rate limit of a vectorizer are not supported in this mode. The workers are
+        started with the `spawn` method, so the entry point of a script that uses this mode has to be guarded by
+        `if __name__ == "__main__":`.
+
+        When you exit the context manager, the final batch will be sent automatically.
+
+        Arguments:
+            `workers`
+                The number of worker processes, which is also the number of concurrent requests. If not provided, the
+                number of CPUs is used.
+            `batch_size`
+                The number of objects to be sent in one batch. If not provided, the default value is 1000.
+            `consistency_level`
+                The consistency level to be used to send batches. If not provided, the default value is `None`.
+
+        Raises:
+            `WeaviateInvalidInputError`
+                If `workers` or `batch_size` is not positive.
+        """
+        if (workers is not None and workers < 1) or batch_size < 1:
+            raise WeaviateInvalidInputError(
+                f"workers and batch_size have to be positive integers, got {workers} and {batch_size}."
+            )
+        self._consistency_level = consistency_level
+        self._batch_data = _BatchDataWrapper()  # clear old data
+        return _ContextManagerWrapper(
+            _MultiprocessBatchClient(
+                connection=self._connection,
+                consistency_level=self._consistency_level,
+                results=self._batch_data,
+                workers=workers or os.cpu_count() or 1,
+                batch_size=batch_size,
+            )
+        )
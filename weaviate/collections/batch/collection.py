@@ -1,8 +1,10 @@
+import os
 from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Generic, List, Optional, Union
 
 from weaviate.collections.batch.base import (
     _BatchBase,
+    BatchStatsCallback,
     _BatchDataWrapper,
     _BatchMode,
     _DynamicBatching,
@@ -10,11 +12,14 @@ from weaviate.collections.batch.base import (
     _RateLimitedBatching,
 )
 from weaviate.collections.batch.batch_wrapper import _BatchWrapper, _ContextManagerWrapper
+from weaviate.collections.batch.rate_limiter import RateLimiter
+from weaviate.collections.batch.sync_index import SyncIndex
+from weaviate.collections.batch.multiprocess import _MultiprocessBatchCollection
 from weaviate.collections.classes.config import ConsistencyLevel, Vectorizers
 from weaviate.collections.classes.internal import ReferenceInputs, ReferenceInput
 from weaviate.collections.classes.types import Properties
 from weaviate.connect.v4 import ConnectionSync
-from weaviate.exceptions import UnexpectedStatusCodeError
+from weaviate.exceptions import UnexpectedStatusCodeError, WeaviateInvalidInputError
 from weaviate.types import UUID, VECTORS
 
 if TYPE_CHECKING:
@@ -32,6 +37,9 @@ class _BatchCollection(Generic[Properties], _BatchBase):
         name: str,
         tenant: Optional[str],
         vectorizer_batching: bool,
+        stats_callback: Optional[BatchStatsCallback] = None,
+        stats_interval: float = 5,
+        sync_index: Optional[SyncIndex] = None,
     ) -> None:
         super().__init__(
             connection=connection,
@@ -40,6 +48,9 @@ class _BatchCollection(Generic[Properties], _BatchBase):
             batch_mode=batch_mode,
             executor=executor,
             vectorizer_batching=vectorizer_batching,
+            stats_callback=stats_callback,
+            stats_interval=stats_interval,
+            sync_index=sync_index,
         )
         self.__name = name
         self.__tenant = tenant
@@ -165,19 +176,50 @@ class _BatchCollectionWrapper(Generic[Properties], _BatchWrapper):
                 name=self.__name,
                 tenant=self.__tenant,
                 vectorizer_batching=self._vectorizer_batching,
+                stats_callback=self._stats_callback,
+                stats_interval=self._stats_interval,
+                sync_index=self._sync_index,
             )
         )
 
-    def dynamic(self) -> CollectionBatchingContextManager[Properties]:
+    def dynamic(
+        self,
+        stats_callback: Optional[BatchStatsCallback] = None,
+        stats_interval: float = 5,
+        sync_index: Optional[SyncIndex] = None,
+    ) -> CollectionBatchingContextManager[Properties]:
         """Configure dynamic batching.
 
         When you exit the context manager, the final batch will be sent automatically.
+
+        Arguments:
+            `stats_callback`
+                A function that is called with a `BatchStats` snapshot of the batch every `stats_interval` seconds and
+                once more when the batch is finished. If not provided, the default value is `None`.
+            `stats_interval`
+                The number of seconds between two calls of `stats_callback`. If not provided, the default value is 5.
+            `sync_index`
+                A `SyncIndex` of the objects that were imported before. Objects that did not change since then are not
+                sent and not included in the results. If not provided, the default value is `None`.
+
+        Raises:
+            `WeaviateInvalidInputError`
+                If `stats_interval` is not positive.
         """
+        self._validate_stats_interval(stats_interval)
         self._batch_mode: _BatchMode = _DynamicBatching()
+        self._stats_callback = stats_callback
+        self._stats_interval = stats_interval
+        self._sync_index = sync_index
         return self.__create_batch_and_reset()
 
     def fixed_size(
-        self, batch_size: int = 100, concurrent_requests: int = 2
+        self,
+        batch_size: int = 100,
+        concurrent_requests: int = 2,
+        stats_callback: Optional[BatchStatsCallback] = None,
+        stats_interval: float = 5,
+        sync_index: Optional[SyncIndex] = None,
     ) -> CollectionBatchingContextManager[Properties]:
         """Configure fixed size batches. Note that the default is dynamic batching.
 
@@ -189,18 +231,115 @@ class _BatchCollectionWrapper(Generic[Properties], _BatchWrapper):
             `concurrent_requests`
                 The number of concurrent requests when sending batches. This controls the number of concurrent requests
                 made to Weaviate and not the speed of batch creation within Python.
+            `stats_callback`
+                A function that is called with a `BatchStats` snapshot of the batch every `stats_interval` seconds and
+                once more when the batch is finished. If not provided, the default value is `None`.
+            `stats_interval`
+                The number of seconds between two calls of `stats_callback`. If not provided, the default value is 5.
+            `sync_index`
+                A `SyncIndex` of the objects that were imported before. Objects that did not change since then are not
+                sent and not included in the results. If not provided, the default value is `None`.
+
+        Raises:
+            `WeaviateInvalidInputError`
+                If `stats_interval` is not positive.
         """
+        self._validate_stats_interval(stats_interval)
         self._batch_mode = _FixedSizeBatching(batch_size, concurrent_requests)
+        self._stats_callback = stats_callback
+        self._stats_interval = stats_interval
+        self._sync_index = sync_index
         return self.__create_batch_and_reset()
 
-    def rate_limit(self, requests_per_minute: int) -> CollectionBatchingContextManager[Properties]:
+    def rate_limit(
+        self,
+        requests_per_minute: Optional[int] = None,
+        stats_callback: Optional[BatchStatsCallback] = None,
+        stats_interval: float = 5,
+        *,
+        tokens_per_minute: Optional[int] = None,
+        limiter: Optional[RateLimiter] = None,
+        sync_index: Optional[SyncIndex] = None,
+    ) -> CollectionBatchingContextManager[Properties]:
         """Configure batches with a rate limited vectorizer.
 
+        The objects are sent as fast as the budgets of the vectorizer allow, see `RateLimiter` for how they are enforced.
+        Pass the same `limiter` to several batches, or limiters with the same `path` in several processes, to share the
+        budgets of one vectorizer between them.
+
         When you exit the context manager, the final batch will be sent automatically.
 
         Arguments:
             `requests_per_minute`
                 The number of requests that the vectorizer can process per minute.
+            `stats_callback`
+                A function that is called with a `BatchStats` snapshot of the batch every `stats_interval` seconds and
+                once more when the batch is finished. If not provided, the default value is `None`.
+            `stats_interval`
+                The number of seconds between two calls of `stats_callback`. If not provided, the default value is 5.
+            `tokens_per_minute`
+                The number of tokens that the vectorizer can process per minute, estimated from the length of the text
+                properties of the objects.
+            `limiter`
+                A `RateLimiter` that the budgets are taken from instead of `requests_per_minute` and `tokens_per_minute`.
+            `sync_index`
+                A `SyncIndex` of the objects that were imported before. Objects that did not change since then are not
+                sent and not included in the results. If not provided, the default value is `None`.
+
+        Raises:
+            `WeaviateInvalidInputError`
+                If neither or both of a limiter and budgets are given or `stats_interval` is not positive.
         """
-        self._batch_mode = _RateLimitedBatching(requests_per_minute)
+        self._validate_stats_interval(stats_interval)
+        if limiter is None:
+            limiter = RateLimiter(requests_per_minute, tokens_per_minute)
+        elif requests_per_minute is not None or tokens_per_minute is not None:
+            raise WeaviateInvalidInputError(
+                "Either a limiter or requests_per_minute and tokens_per_minute can be given, not both."
+            )
+        self._batch_mode = _RateLimitedBatching(limiter)
+        self._stats_callback = stats_callback
+        self._stats_interval = stats_interval
+        self._sync_index = sync_index
         return self.__create_batch_and_reset()
+
+    def multiprocess(
+        self, workers: Optional[int] = None, batch_size: int = 1000
+    ) -> _ContextManagerWrapper[_MultiprocessBatchCollection[Properties]]:
+        """Configure batching that validates and encodes the objects in worker processes.
+
+        Use this mode if the import is limited by the CPU of the client, i.e. if one core is fully used by the batching.
+        The objects are only validated in the workers, invalid objects are reported in `failed_objects`. References and
+        the retrying of objects that hit the rate limit of a vectorizer are not supported in this mode. The workers are
+        started with the `spawn` method, so the entry point of a script that uses this mode has to be guarded by
+        `if __name__ == "__main__":`.
+
+        When you exit the context manager, the final batch will be sent automatically.
+
+        Arguments:
+            `workers`
+                The number of worker processes, which is also the number of concurrent requests. If not provided, the
+                number of CPUs is used.
+            `batch_size`
+                The number of objects to be sent in one batch. If not provided, the default value is 1000.
+
+        Raises:
+            `WeaviateInvalidInputError`
+                If `workers` or `batch_size` is not positive.
+        """
+        if (workers is not None and workers < 1) or batch_size < 1:
+            raise WeaviateInvalidInputError(
+                f"workers and batch_size have to be positive integers, got {workers} and {batch_size}."
+            )
+        self._batch_data = _BatchDataWrapper()  # clear old data
+        return _ContextManagerWrapper(
+            _MultiprocessBatchCollection[Properties](
+                connection=self._connection,
+                consistency_level=self._consistency_level,
+                results=self._batch_data,
+                workers=workers or os.cpu_count() or 1,
+                batch_size=batch_size,
+                name=self.__name,
+                tenant=self.__tenant,
+            )
+        )
@@ -1,8 +1,10 @@
+import asyncio
 import datetime
 import struct
 import time
 import uuid as uuid_package
-from typing import Any, Dict, List, Mapping, Optional, Sequence, Union, cast
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union, cast
 
 from google.protobuf.struct_pb2 import Struct
 
@@ -15,9 +17,10 @@ from weaviate.collections.classes.batch import (
 from weaviate.collections.classes.config import ConsistencyLevel
 from weaviate.collections.classes.internal import ReferenceToMulti, ReferenceInputs
 from weaviate.collections.classes.types import GeoCoordinate, PhoneNumber
-from weaviate.collections.grpc.shared import _BaseGRPC, _Pack, _is_1d_vector
+from weaviate.collections.grpc.shared import _BaseGRPC, _Pack, _is_1d_vector, _is_2d_vector
 from weaviate.connect import executor
-from weaviate.connect.v4 import Connection
+from weaviate.connect.base import MAX_GRPC_MESSAGE_LENGTH
+from weaviate.connect.v4 import Connection, ConnectionAsync
 from weaviate.exceptions import (
     WeaviateInsertInvalidPropertyError,
     WeaviateInvalidInputError,
@@ -27,6 +30,12 @@ from weaviate.proto.v1 import batch_pb2, base_pb2
 from weaviate.types import VECTORS
 from weaviate.util import _datetime_to_string, _ServerVersion
 
+# room for the non-object fields of the request and the framing of each object in the repeated field
+REQUEST_OVERHEAD_BYTES = 1024
+OBJECT_OVERHEAD_BYTES = 6
+
+_Chunk = Tuple[int, batch_pb2.BatchObjectsRequest]
+
 
 class _BatchGRPC(_BaseGRPC):
     """This class is used to insert multiple objects into Weaviate using the gRPC API.
@@ -83,19 +92,74 @@ class _BatchGRPC(_BaseGRPC):
         objects: List[_BatchObject],
         timeout: Union[int, float],
         max_retries: float,
+        batch_size: Optional[int] = None,
+        concurrent_requests: int = 1,
     ) -> executor.Result[BatchObjectReturn]:
         """Insert multiple objects into Weaviate through the gRPC API.
 
+        The objects are split into several requests if there are more than `batch_size` of them or if their encoded size
+        exceeds the maximum gRPC message size of the server.
+
         Parameters:
             `objects`
                 A list of `WeaviateObject` containing the data of the objects to be inserted. The class name must be
                 provided for each object, and the UUID is optional. If no UUID is provided, one will be generated for each object.
                 The UUIDs of the inserted objects will be returned in the `uuids` attribute of the returned `_BatchReturn` object.
                 The UUIDs of the objects that failed to be inserted will be returned in the `errors` attribute of the returned `_BatchReturn` object.
-            `tenant`
-                The tenant to be used for this batch operation
+            `batch_size`
+                The maximum number of objects sent in one request. If `None`, only the message size limits the requests.
+            `concurrent_requests`
+                The maximum number of requests that are in flight at the same time if the objects are split.
         """
+        max_bytes = (
+            connection._grpc_max_msg_size or MAX_GRPC_MESSAGE_LENGTH
+        ) - REQUEST_OVERHEAD_BYTES
+        # the size is estimated from the first object, encoding them is what should not block the event loop
+        if (
+            isinstance(connection, ConnectionAsync)
+            and len(objects) > 0
+            and connection._offloads(_estimated_size(objects[0]) * len(objects))
+        ):
+
+            async def _offloaded() -> BatchObjectReturn:
+                weaviate_objs, chunks = await asyncio.get_running_loop().run_in_executor(
+                    None, self.__encode, objects, batch_size, max_bytes
+                )
+                return await executor.aresult(
+                    self.__send(
+                        connection,
+                        objects,
+                        weaviate_objs,
+                        chunks,
+                        timeout,
+                        max_retries,
+                        concurrent_requests,
+                    )
+                )
+
+            return _offloaded()
+
+        weaviate_objs, chunks = self.__encode(objects, batch_size, max_bytes)
+        return self.__send(
+            connection, objects, weaviate_objs, chunks, timeout, max_retries, concurrent_requests
+        )
+
+    def __encode(
+        self, objects: List[_BatchObject], batch_size: Optional[int], max_bytes: int
+    ) -> Tuple[List[batch_pb2.BatchObject], List[_Chunk]]:
         weaviate_objs = self.__grpc_objects(objects)
+        return weaviate_objs, self.__split(weaviate_objs, batch_size, max_bytes)
+
+    def __send(
+        self,
+        connection: Connection,
+        objects: List[_BatchObject],
+        weaviate_objs: List[batch_pb2.BatchObject],
+        chunks: List[_Chunk],
+        timeout: Union[int, float],
+        max_retries: float,
+        concurrent_requests: int,
+    ) -> executor.Result[BatchObjectReturn]:
         start = time.time()
 
         def resp(errors: Dict[int, str]) -> BatchObjectReturn:
@@ -134,17 +198,88 @@ class _BatchGRPC(_BaseGRPC):
                 elapsed_seconds=elapsed_time,
             )
 
-        request = batch_pb2.BatchObjectsRequest(
-            objects=weaviate_objs,
+        if len(chunks) == 1:
+            return executor.execute(
+                response_callback=resp,
+                method=connection.grpc_batch_objects,
+                request=chunks[0][1],
+                timeout=timeout,
+                max_retries=max_retries,
+            )
+
+        # a failing request only fails the objects of its chunk, the other chunks might have been imported already
+        if isinstance(connection, ConnectionAsync):
+
+            async def _execute() -> BatchObjectReturn:
+                semaphore = asyncio.Semaphore(concurrent_requests)
+
+                async def send(chunk: _Chunk) -> Union[Dict[int, str], Exception]:
+                    async with semaphore:
+                        try:
+                            return await connection.grpc_batch_objects(
+                                chunk[1], timeout, max_retries
+                            )
+                        except Exception as e:
+                            return e
+
+                results = await asyncio.gather(*[send(chunk) for chunk in chunks])
+                return resp(self.__merge_errors(chunks, results))
+
+            return _execute()
+
+        def send(chunk: _Chunk) -> Union[Dict[int, str], Exception]:
+            try:
+                return connection.grpc_batch_objects(chunk[1], timeout, max_retries)
+            except Exception as e:
+                return e
+
+        if concurrent_requests > 1:
+            with ThreadPoolExecutor(max_workers=min(concurrent_requests, len(chunks))) as pool:
+                results = list(pool.map(send, chunks))
+        else:
+            results = [send(chunk) for chunk in chunks]
+        return resp(self.__merge_errors(chunks, results))
+
+    def _encode(self, objects: List[_BatchObject]) -> batch_pb2.BatchObjectsRequest:
+        """Build the request for the given objects without sending it."""
+        return self.__request(self.__grpc_objects(objects))
+
+    def __request(self, objects: List[batch_pb2.BatchObject]) -> batch_pb2.BatchObjectsRequest:
+        return batch_pb2.BatchObjectsRequest(
+            objects=objects,
             consistency_level=self._consistency_level,
         )
-        return executor.execute(
-            response_callback=resp,
-            method=connection.grpc_batch_objects,
-            request=request,
-            timeout=timeout,
-            max_retries=max_retries,
-        )
+
+    def __split(
+        self, objects: List[batch_pb2.BatchObject], batch_size: Optional[int], max_bytes: int
+    ) -> List[_Chunk]:
+        chunks: List[_Chunk] = []
+        start = 0
+        size = 0
+        for idx, obj in enumerate(objects):
+            obj_size = obj.ByteSize() + OBJECT_OVERHEAD_BYTES
+            if idx > start and (
+                size + obj_size > max_bytes
+                or (batch_size is not None and idx - start >= batch_size)
+            ):
+                chunks.append((start, self.__request(objects[start:idx])))
+                start = idx
+                size = 0
+            size += obj_size
+        chunks.append((start, self.__request(objects[start:])))
+        return chunks
+
+    @staticmethod
+    def __merge_errors(
+        chunks: List[_Chunk], results: List[Union[Dict[int, str], Exception]]
+    ) -> Dict[int, str]:
+        errors: Dict[int, str] = {}
+        for (offset, chunk), result in zip(chunks, results):
+            if isinstance(result, Exception):
+                errors.update({offset + idx: repr(result) for idx in range(len(chunk.objects))})
+            else:
+                errors.update({offset + idx: err for idx, err in result.items()})
+        return errors
 
     def __translate_properties_from_python_to_grpc(
         self, data: Dict[str, Any], refs: ReferenceInputs
@@ -279,3 +414,39 @@ def _serialize_primitive(value: Any) -> Any:
         return [_serialize_primitive(val) for val in value]
 
     return value
+
+
+def _estimated_size(obj: _BatchObject) -> int:
+    """Estimate the size of an object once it is encoded into a `BatchObject` message, without encoding it."""
+    size = 64 + len(obj.collection) + (len(obj.tenant) if obj.tenant is not None else 0)
+    if obj.vector is not None:
+        if isinstance(obj.vector, Mapping):
+            size += sum(len(name) + _estimated_vector_size(vec) for name, vec in obj.vector.items())
+        else:
+            size += _estimated_vector_size(obj.vector)
+    if obj.properties is not None:
+        size += _estimated_value_size(obj.properties)
+    if obj.references is not None:
+        size += _estimated_value_size(obj.references)
+    return size
+
+
+def _estimated_vector_size(vector: Any) -> int:
+    # vectors are packed as 4-byte floats, multi-vectors have an additional header
+    if _is_2d_vector(vector):
+        return 8 + sum(4 * len(vec) for vec in vector)
+    return 4 * len(vector)
+
+
+def _estimated_value_size(value: Any) -> int:
+    if isinstance(value, (str, bytes)):
+        return 2 + len(value)
+    if isinstance(value, Mapping):
+        return sum(4 + len(key) + _estimated_value_size(val) for key, val in value.items())
+    if isinstance(value, (list, tuple)):
+        return 2 + sum(_estimated_value_size(val) for val in value)
+    if isinstance(value, (uuid_package.UUID, datetime.datetime)):
+        return 38
+    if isinstance(value, ReferenceToMulti):
+        return len(value.target_collection) + 38 * len(value.uuids_str)
+    return 10
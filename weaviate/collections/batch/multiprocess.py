@@ -0,0 +1,356 @@
+"""Batching that builds the gRPC requests in worker processes.
+
+Validating the objects and translating them into protobuf messages is CPU-bound Python code that is limited to one core
+by the GIL. In this mode the parent process only collects the raw rows. Worker processes validate and encode chunks of
+them into serialized `BatchObjectsRequest` messages, which the parent then sends over its own connection from a pool of
+threads, as waiting for the network does not hold the GIL.
+
+The workers are started with the `spawn` method, so a script that uses this mode has to guard its entry point with
+`if __name__ == "__main__":`.
+"""
+
+import multiprocessing
+import threading
+import uuid as uuid_package
+from dataclasses import dataclass
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import Dict, Generic, List, NamedTuple, Optional, Set, Tuple, Union
+
+from pydantic import ValidationError
+
+from weaviate.collections.batch.base import (
+    DEFAULT_REQUEST_TIMEOUT,
+    MAX_RETRIES,
+    _BatchDataWrapper,
+)
+from weaviate.collections.batch.grpc_batch_objects import _BatchGRPC, _validate_props
+from weaviate.collections.classes.batch import BatchObject, BatchObjectReturn, ErrorObject, Shard
+from weaviate.collections.classes.config import ConsistencyLevel
+from weaviate.collections.classes.internal import ReferenceInputs
+from weaviate.collections.classes.tenants import Tenant
+from weaviate.collections.classes.types import Properties, WeaviateProperties
+from weaviate.connect.v4 import ConnectionSync
+from weaviate.exceptions import WeaviateBatchValidationError, WeaviateInsertInvalidPropertyError
+from weaviate.logger import logger
+from weaviate.proto.v1 import batch_pb2
+from weaviate.types import UUID, VECTORS
+from weaviate.util import _ServerVersion, get_valid_uuid
+
+
+@dataclass
+class _Row:
+    collection: str
+    properties: Optional[WeaviateProperties]
+    references: Optional[ReferenceInputs]
+    uuid: str
+    vector: Optional[VECTORS]
+    tenant: Optional[str]
+    index: int
+
+
+class _EncodedRows(NamedTuple):
+    request: bytes
+    sent: List[int]
+    """The positions in the chunk of the rows in the request, in the order of the request."""
+    invalid: Dict[int, str]
+    """The positions in the chunk of the rows that failed the validation, with the error."""
+
+
+def _encode_rows(
+    weaviate_version: _ServerVersion,
+    consistency_level: Optional[ConsistencyLevel],
+    rows: List[_Row],
+) -> _EncodedRows:
+    """Validate and encode a chunk of rows, runs in a worker process."""
+    objects = []
+    sent: List[int] = []
+    invalid: Dict[int, str] = {}
+    for pos, row in enumerate(rows):
+        try:
+            if row.properties is not None:
+                _validate_props(dict(row.properties))
+            objects.append(
+                BatchObject(
+                    collection=row.collection,
+                    properties=row.properties,
+                    references=row.references,
+                    uuid=row.uuid,
+                    vector=row.vector,
+                    tenant=row.tenant,
+                    index=row.index,
+                )._to_internal()
+            )
+            sent.append(pos)
+        except (ValidationError, WeaviateInsertInvalidPropertyError) as e:
+            invalid[pos] = repr(e)
+    request = _BatchGRPC(weaviate_version, consistency_level)._encode(objects)
+    return _EncodedRows(request.SerializeToString(), sent, invalid)
+
+
+class _MultiprocessBatchBase:
+    def __init__(
+        self,
+        connection: ConnectionSync,
+        consistency_level: Optional[ConsistencyLevel],
+        results: _BatchDataWrapper,
+        workers: int,
+        batch_size: int,
+    ) -> None:
+        self.__connection = connection
+        self.__consistency_level = consistency_level
+        self.__batch_size = batch_size
+
+        self.__processes = ProcessPoolExecutor(
+            max_workers=workers,
+            # forking a process that has open gRPC channels is not supported by gRPC
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        # one sending thread per worker, each waits for the encoding of its chunk and sends it
+        self.__senders = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="BgBatchSend")
+        # bounds the number of chunks that are encoded or sent, add_object blocks when it is reached
+        self.__pending = threading.BoundedSemaphore(2 * workers)
+        self.__sends: Set["Future[None]"] = set()
+        self.__sends_lock = threading.Lock()
+
+        self.__rows: List[_Row] = []
+        self.__rows_lock = threading.Lock()
+        self.__objs_count = 0
+        self.__objs_logs_count = 0
+
+        # we do not want that users can access the results directly as they are not thread-safe
+        self.__results_for_wrapper_backup = results
+        self.__results_for_wrapper = _BatchDataWrapper()
+        self.__results_lock = threading.Lock()
+        self.__imported_shards: Set[Tuple[str, Optional[str]]] = set()
+
+    @property
+    def number_errors(self) -> int:
+        """Return the number of errors in the batch."""
+        return len(self.__results_for_wrapper.failed_objects)
+
+    def flush(self) -> None:
+        """Send all objects that were added and wait for all requests to be finished."""
+        with self.__rows_lock:
+            rows, self.__rows = self.__rows, []
+        if len(rows) > 0:
+            self.__submit(rows)
+        with self.__sends_lock:
+            sends = list(self.__sends)
+        wait(sends)
+
+    def _shutdown(self) -> None:
+        """Shutdown the current batch and wait for all requests to be finished."""
+        self.flush()
+        self.__senders.shutdown()
+        self.__processes.shutdown()
+
+        # copy the results to the public results
+        self.__results_for_wrapper_backup.results = self.__results_for_wrapper.results
+        self.__results_for_wrapper_backup.failed_objects = self.__results_for_wrapper.failed_objects
+        self.__results_for_wrapper_backup.imported_shards = (
+            self.__results_for_wrapper.imported_shards
+        )
+
+    def _add_object(
+        self,
+        collection: str,
+        properties: Optional[WeaviateProperties] = None,
+        references: Optional[ReferenceInputs] = None,
+        uuid: Optional[UUID] = None,
+        vector: Optional[VECTORS] = None,
+        tenant: Optional[str] = None,
+    ) -> UUID:
+        try:
+            uid = get_valid_uuid(uuid) if uuid is not None else str(uuid_package.uuid4())
+        except (TypeError, ValueError) as e:
+            raise WeaviateBatchValidationError(repr(e))
+        if (collection, tenant) not in self.__imported_shards:
+            with self.__results_lock:
+                self.__imported_shards.add((collection, tenant))
+                self.__results_for_wrapper.imported_shards.add(
+                    Shard(collection=collection, tenant=tenant)
+                )
+
+        rows: Optional[List[_Row]] = None
+        with self.__rows_lock:
+            self.__rows.append(
+                _Row(collection, properties, references, uid, vector, tenant, self.__objs_count)
+            )
+            self.__objs_count += 1
+            if len(self.__rows) >= self.__batch_size:
+                rows, self.__rows = self.__rows, []
+        if rows is not None:
+            self.__submit(rows)
+        return uid
+
+    def __submit(self, rows: List[_Row]) -> None:
+        self.__pending.acquire()
+        try:
+            encoded = self.__processes.submit(
+                _encode_rows, self.__connection._weaviate_version, self.__consistency_level, rows
+            )
+        except Exception:
+            self.__pending.release()
+            raise
+        send = self.__senders.submit(self.__send, rows, encoded)
+        with self.__sends_lock:
+            self.__sends.add(send)
+        send.add_done_callback(self.__discard_send)
+
+    def __discard_send(self, send: "Future[None]") -> None:
+        with self.__sends_lock:
+            self.__sends.discard(send)
+
+    def __send(self, rows: List[_Row], encoded: "Future[_EncodedRows]") -> None:
+        try:
+            try:
+                res = encoded.result()
+                errors = dict(res.invalid)
+                if len(res.sent) > 0:
+                    server_errors = self.__connection.grpc_batch_objects(
+                        batch_pb2.BatchObjectsRequest.FromString(res.request),
+                        timeout=DEFAULT_REQUEST_TIMEOUT,
+                        max_retries=MAX_RETRIES,
+                    )
+                    errors.update({res.sent[idx]: err for idx, err in server_errors.items()})
+            except Exception as e:
+                errors = {pos: repr(e) for pos in range(len(rows))}
+            self.__add_results(rows, errors)
+        finally:
+            self.__pending.release()
+
+    def __add_results(self, rows: List[_Row], errors: Dict[int, str]) -> None:
+        uuids: Dict[int, uuid_package.UUID] = {}
+        failed: Dict[int, ErrorObject] = {}
+        for pos, row in enumerate(rows):
+            if pos in errors:
+                # the row might be invalid, so it is not validated again
+                failed[row.index] = ErrorObject(
+                    errors[pos],
+                    BatchObject.model_construct(**vars(row)),
+                    original_uuid=row.uuid,
+                )
+            else:
+                uuids[row.index] = uuid_package.UUID(row.uuid)
+
+        if len(failed) > 0 and self.__objs_logs_count < 30:
+            logger.error(
+                {
+                    "message": f"Failed to send {len(failed)} objects in a batch of {len(rows)}. Please inspect client.batch.failed_objects or collection.batch.failed_objects for the failed objects.",
+                }
+            )
+            self.__objs_logs_count += 1
+        with self.__results_lock:
+            self.__results_for_wrapper.results.objs += BatchObjectReturn(
+                _all_responses=[uuids.get(row.index) or failed[row.index] for row in rows],
+                uuids=uuids,
+                errors=failed,
+                has_errors=len(failed) > 0,
+            )
+            self.__results_for_wrapper.failed_objects.extend(failed.values())
+
+
+class _MultiprocessBatchCollection(Generic[Properties], _MultiprocessBatchBase):
+    def __init__(
+        self,
+        connection: ConnectionSync,
+        consistency_level: Optional[ConsistencyLevel],
+        results: _BatchDataWrapper,
+        workers: int,
+        batch_size: int,
+        name: str,
+        tenant: Optional[str],
+    ) -> None:
+        super().__init__(
+            connection=connection,
+            consistency_level=consistency_level,
+            results=results,
+            workers=workers,
+            batch_size=batch_size,
+        )
+        self.__name = name
+        self.__tenant = tenant
+
+    def add_object(
+        self,
+        properties: Optional[Properties] = None,
+        references: Optional[ReferenceInputs] = None,
+        uuid: Optional[UUID] = None,
+        vector: Optional[VECTORS] = None,
+    ) -> UUID:
+        """Add one object to this batch.
+
+        The object is validated in a worker process, objects that are not valid are reported in `failed_objects`.
+
+        Arguments:
+            `properties`
+                The data properties of the object to be added as a dictionary.
+            `references`
+                The references of the object to be added as a dictionary.
+            `uuid`:
+                The UUID of the object as an uuid.UUID object or str. If it is None an UUIDv4 will generated, by default None
+            `vector`:
+                The embedding of the object, see `add_object` of the other batching modes.
+
+        Returns:
+            `str`
+                The UUID of the added object. If one was not provided a UUIDv4 will be auto-generated for you and returned here.
+
+        Raises:
+            `WeaviateBatchValidationError`
+                If the UUID is not valid.
+        """
+        return self._add_object(
+            collection=self.__name,
+            properties=properties,
+            references=references,
+            uuid=uuid,
+            vector=vector,
+            tenant=self.__tenant,
+        )
+
+
+class _MultiprocessBatchClient(_MultiprocessBatchBase):
+    def add_object(
+        self,
+        collection: str,
+        properties: Optional[WeaviateProperties] = None,
+        references: Optional[ReferenceInputs] = None,
+        uuid: Optional[UUID] = None,
+        vector: Optional[VECTORS] = None,
+        tenant: Optional[Union[str, Tenant]] = None,
+    ) -> UUID:
+        """Add one object to this batch.
+
+        The object is validated in a worker process, objects that are not valid are reported in `failed_objects`.
+
+        Arguments:
+            `collection`
+                The name of the collection this object belongs to.
+            `properties`
+                The data properties of the object to be added as a dictionary.
+            `references`
+                The references of the object to be added as a dictionary.
+            `uuid`:
+                The UUID of the object as an uuid.UUID object or str. If it is None an UUIDv4 will generated, by default None
+            `vector`:
+                The embedding of the object, see `add_object` of the other batching modes.
+            `tenant`
+                The tenant name or Tenant object to be used for this request.
+
+        Returns:
+            `str`
+                The UUID of the added object. If one was not provided a UUIDv4 will be auto-generated for you and returned here.
+
+        Raises:
+            `WeaviateBatchValidationError`
+                If the UUID is not valid.
+        """
+        return self._add_object(
+            collection=collection,
+            properties=properties,
+            references=references,
+            uuid=uuid,
+            vector=vector,
+            tenant=tenant.name if isinstance(tenant, Tenant) else tenant,
+        )
@@ -0,0 +1,176 @@
+import math
+import os
+import struct
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Mapping, Optional, Tuple
+
+from weaviate.collections.classes.batch import _BatchObject
+from weaviate.exceptions import WeaviateInvalidInputError
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None  # type: ignore
+
+# a common approximation for the tokenizers of the vectorizer providers
+CHARS_PER_TOKEN = 4
+
+# the time of the last refill and the levels of the request and token buckets
+_STATE = struct.Struct("<ddd")
+
+_State = Tuple[float, float, float]
+
+
+class RateLimiter:
+    """Limits the number of objects and the estimated number of tokens that batches send to a vectorizer per minute.
+
+    Each budget is a token bucket that holds up to one minute of the budget and is refilled continuously, so that the
+    batches can use a quota that was not used for a while at once and never exceed it on average. The number of tokens
+    of an object is estimated from the length of its text properties with about four characters per token.
+
+    A limiter can be passed to several batches, which then share its budgets. If a `path` is given, the state of the
+    buckets is kept in that file instead of in memory, all limiters with the same path share their budgets, also across
+    processes. The file is locked with `fcntl.flock`, which is not available on Windows.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        path: Optional[str] = None,
+    ) -> None:
+        """Create a rate limiter.
+
+        Arguments:
+            `requests_per_minute`
+                The number of objects that the vectorizer can process per minute. If not provided, the objects are not limited.
+            `tokens_per_minute`
+                The number of tokens that the vectorizer can process per minute. If not provided, the tokens are not limited.
+            `path`
+                A file that keeps the state of the limiter to share it between processes. If not provided, the state is
+                kept in memory.
+
+        Raises:
+            `WeaviateInvalidInputError`
+                If neither budget is given, if a budget is not positive or if a path is given on Windows.
+        """
+        if requests_per_minute is None and tokens_per_minute is None:
+            raise WeaviateInvalidInputError(
+                "At least one of requests_per_minute and tokens_per_minute has to be given."
+            )
+        for name, budget in (
+            ("requests_per_minute", requests_per_minute),
+            ("tokens_per_minute", tokens_per_minute),
+        ):
+            if budget is not None and (not isinstance(budget, int) or budget <= 0):
+                raise WeaviateInvalidInputError(
+                    f"{name} has to be a positive integer, got {budget}."
+                )
+        if path is not None and fcntl is None:
+            raise WeaviateInvalidInputError(
+                "Sharing a rate limiter through a file is not supported on this platform."
+            )
+
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.path = path
+        self.__lock = threading.Lock()
+        self.__state: Optional[_State] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # the lock cannot be pickled, the in-memory state is copied into the other process
+        state = self.__dict__.copy()
+        del state["_RateLimiter__lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.__lock = threading.Lock()
+
+    def acquire(self, requests: int, tokens: int = 0) -> None:
+        """Block until the budgets allow sending `requests` objects with `tokens` tokens and take them from the budgets.
+
+        An amount that exceeds a budget waits for its bucket to be full and leaves it in debt.
+        """
+        while (wait := self.__try_acquire(requests, tokens)) > 0:
+            time.sleep(wait)
+
+    def _exhaust(self) -> None:
+        """Empty the buckets, e.g. after the vectorizer reported that its rate limit was reached anyway."""
+        with self.__locked() as (_, level_requests, level_tokens):
+            self.__write((time.time(), min(level_requests, 0), min(level_tokens, 0)))
+
+    def __try_acquire(self, requests: int, tokens: int) -> float:
+        with self.__locked() as (last, level_requests, level_tokens):
+            now = time.time()
+            level_requests = self.__refill(level_requests, self.requests_per_minute, now - last)
+            level_tokens = self.__refill(level_tokens, self.tokens_per_minute, now - last)
+
+            wait = max(
+                self.__missing(level_requests, requests, self.requests_per_minute),
+                self.__missing(level_tokens, tokens, self.tokens_per_minute),
+            )
+            if wait <= 0:
+                self.__write((now, level_requests - requests, level_tokens - tokens))
+            return wait
+
+    @staticmethod
+    def __refill(level: float, budget: Optional[int], elapsed: float) -> float:
+        if budget is None:
+            return 0
+        return min(budget, level + elapsed * budget / 60)
+
+    @staticmethod
+    def __missing(level: float, amount: int, budget: Optional[int]) -> float:
+        """Return the seconds until the bucket holds the amount, or 0 if it does already."""
+        if budget is None:
+            return 0
+        return max(0, (min(amount, budget) - level) * 60 / budget)
+
+    @contextmanager
+    def __locked(self) -> Iterator[_State]:
+        """Lock the state of the buckets, also for other processes if it is kept in a file, and yield it."""
+        with self.__lock:
+            if self.path is None:
+                yield self.__state or self.__full()
+                return
+
+            # a path is rejected on construction if fcntl is not available
+            assert fcntl is not None
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                self.__fd = fd
+                data = os.pread(fd, _STATE.size, 0)
+                yield _STATE.unpack(data) if len(data) == _STATE.size else self.__full()
+            finally:
+                # closing the file also releases the lock
+                os.close(fd)
+
+    def __write(self, state: _State) -> None:
+        if self.path is None:
+            self.__state = state
+        else:
+            os.pwrite(self.__fd, _STATE.pack(*state), 0)
+
+    def __full(self) -> _State:
+        return (time.time(), self.requests_per_minute or 0, self.tokens_per_minute or 0)
+
+
+def _text_length(value: Any) -> int:
+    if isinstance(value, str):
+        return len(value)
+    if isinstance(value, Mapping):
+        return sum(_text_length(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(_text_length(v) for v in value)
+    return 0
+
+
+def _estimated_tokens(obj: _BatchObject) -> int:
+    """Estimate the number of tokens that a vectorizer counts for the text properties of an object."""
+    if obj.properties is None:
+        return 0
+    return math.ceil(_text_length(obj.properties) / CHARS_PER_TOKEN)
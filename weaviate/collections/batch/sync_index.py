@@ -0,0 +1,178 @@
+import hashlib
+import json
+import sqlite3
+import threading
+from types import TracebackType
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Type
+
+from weaviate.collections.classes.batch import _BatchObject
+from weaviate.exceptions import WeaviateInvalidInputError
+
+_Key = Tuple[str, Optional[str], str]
+"""The collection, the tenant and the UUID of an object."""
+
+_MAX_VARIABLES = 900  # stay below the default limit of 999 host parameters of older SQLite versions
+
+
+class SyncIndex:
+    """An on-disk index of the content hashes of the objects that were imported, to only send new or changed objects.
+
+    Pass the index as `sync_index` to `insert_many` or to a batch. Objects whose properties, references and vectors hash
+    to the same value as when they were last imported successfully are skipped, all others are sent and their hashes
+    are stored once Weaviate accepted them. The objects are identified by their UUID, so only objects with a
+    deterministic UUID, e.g. from `generate_uuid5`, can be skipped.
+
+    Every time the index is opened, a new run starts. The objects that were imported in an earlier run but not seen in
+    the current one, because they vanished from the source, can be deleted with `collection.data.delete_vanished()`.
+
+    The index is a SQLite database. Its changes are committed every `checkpoint_interval` changes, on `checkpoint()`
+    and when it is closed, an import that was interrupted only resends the objects after the last checkpoint.
+    """
+
+    def __init__(self, path: str, checkpoint_interval: int = 10_000) -> None:
+        """Open or create an index.
+
+        Arguments:
+            `path`
+                The file of the index, it is created if it does not exist.
+            `checkpoint_interval`
+                The number of changes after which they are committed to the file. Default 10000.
+        """
+        if not isinstance(checkpoint_interval, int) or checkpoint_interval < 1:
+            raise WeaviateInvalidInputError(
+                f"checkpoint_interval has to be a positive integer, got {checkpoint_interval}."
+            )
+        self.path = path
+        self.__checkpoint_interval = checkpoint_interval
+        self.__changes = 0
+        self.__lock = threading.Lock()
+        # the batch records the imported objects from its worker threads
+        self.__db = sqlite3.connect(path, check_same_thread=False)
+        self.__db.execute(
+            "CREATE TABLE IF NOT EXISTS objects (collection TEXT NOT NULL, tenant TEXT NOT NULL, uuid TEXT NOT NULL,"
+            " digest BLOB NOT NULL, run INTEGER NOT NULL, PRIMARY KEY (collection, tenant, uuid)) WITHOUT ROWID"
+        )
+        self.__db.execute("CREATE TABLE IF NOT EXISTS runs (id INTEGER PRIMARY KEY)")
+        self.__run = self.__db.execute("INSERT INTO runs DEFAULT VALUES").lastrowid
+        self.__db.commit()
+
+    def __enter__(self) -> "SyncIndex":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def checkpoint(self) -> None:
+        """Commit the changes to the file."""
+        with self.__lock:
+            self.__db.commit()
+            self.__changes = 0
+
+    def close(self) -> None:
+        """Commit the changes and close the file."""
+        self.checkpoint()
+        self.__db.close()
+
+    def __len__(self) -> int:
+        with self.__lock:
+            count: int = self.__db.execute("SELECT COUNT(*) FROM objects").fetchone()[0]
+            return count
+
+    def _unchanged(self, keys: Sequence[_Key], digests: Sequence[bytes]) -> List[bool]:
+        """Return for each object whether it was imported with the same digest already and mark all of them as seen.
+
+        An object that changed is marked as seen as well, so that it is not deleted if sending the new version fails.
+        The digests are looked up with one query per shard and chunk of UUIDs, not per object.
+        """
+        shards: Dict[Tuple[str, str], Set[str]] = {}
+        for collection, tenant, uuid in keys:
+            shards.setdefault((collection, tenant or ""), set()).add(uuid)
+        stored: Dict[Tuple[str, str, str], bytes] = {}
+        with self.__lock:
+            for (collection, tenant), uuids in shards.items():
+                ordered = sorted(uuids)
+                for start in range(0, len(ordered), _MAX_VARIABLES):
+                    chunk = ordered[start : start + _MAX_VARIABLES]
+                    rows = self.__db.execute(
+                        "SELECT uuid, digest FROM objects WHERE collection = ? AND tenant = ?"
+                        f" AND uuid IN ({','.join('?' * len(chunk))})",
+                        (collection, tenant, *chunk),
+                    )
+                    stored.update(((collection, tenant, uuid), digest) for uuid, digest in rows)
+            self.__db.executemany(
+                "UPDATE objects SET run = ? WHERE collection = ? AND tenant = ? AND uuid = ?",
+                [(self.__run, *key) for key in stored],
+            )
+            self.__changed(len(stored))
+        return [
+            stored.get((collection, tenant or "", uuid)) == digest
+            for (collection, tenant, uuid), digest in zip(keys, digests)
+        ]
+
+    def _record(self, entries: Iterable[Tuple[_Key, bytes]]) -> None:
+        """Store the digests of objects that were imported successfully."""
+        rows = [
+            (collection, tenant or "", uuid, digest, self.__run)
+            for (collection, tenant, uuid), digest in entries
+        ]
+        with self.__lock:
+            self.__db.executemany("INSERT OR REPLACE INTO objects VALUES (?, ?, ?, ?, ?)", rows)
+            self.__changed(len(rows))
+
+    def _vanished(self, collection: str, tenant: Optional[str]) -> List[str]:
+        """Return the UUIDs of the objects of a shard that were not seen in the current run."""
+        with self.__lock:
+            return [
+                row[0]
+                for row in self.__db.execute(
+                    "SELECT uuid FROM objects WHERE collection = ? AND tenant = ? AND run != ?",
+                    (collection, tenant or "", self.__run),
+                )
+            ]
+
+    def _forget(self, collection: str, tenant: Optional[str], uuids: Sequence[str]) -> None:
+        """Remove objects that were deleted from the index."""
+        with self.__lock:
+            self.__db.executemany(
+                "DELETE FROM objects WHERE collection = ? AND tenant = ? AND uuid = ?",
+                [(collection, tenant or "", uuid) for uuid in uuids],
+            )
+            self.__changed(len(uuids))
+
+    def __changed(self, count: int) -> None:
+        self.__changes += count
+        if self.__changes >= self.__checkpoint_interval:
+            self.__db.commit()
+            self.__changes = 0
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    # numpy arrays, pandas and polars series - their repr is shortened for large arrays
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    if hasattr(value, "to_list"):
+        return value.to_list()
+    return repr(value)
+
+
+def _object_key(obj: _BatchObject) -> _Key:
+    assert obj.uuid is not None
+    return obj.collection, obj.tenant, obj.uuid
+
+
+def _object_digest(obj: _BatchObject) -> bytes:
+    """Hash the content of an object, the properties, references and vectors."""
+    content = json.dumps(
+        [obj.properties, obj.references, obj.vector],
+        sort_keys=True,
+        default=_json_default,
+        separators=(",", ":"),
+    )
+    return hashlib.blake2b(content.encode(), digest_size=16).digest()
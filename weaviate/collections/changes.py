@@ -0,0 +1,292 @@
+import asyncio
+import base64
+import datetime
+import json
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Deque,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from weaviate.collections.classes.filters import Filter, _Filters
+from weaviate.collections.classes.grpc import METADATA, MetadataQuery, Sort
+from weaviate.collections.classes.internal import (
+    Object,
+    ReturnProperties,
+    ReturnReferences,
+    TProperties,
+    TReferences,
+)
+from weaviate.collections.queries.fetch_objects import _FetchObjectsQuery, _FetchObjectsQueryAsync
+from weaviate.exceptions import WeaviateInvalidInputError
+
+CHANGES_PAGE_SIZE = 100
+
+
+@dataclass(frozen=True)
+class _Watermark:
+    """The position of a changes iterator: the update time in milliseconds of the last object, the number of objects
+    with exactly this update time that were returned already and the UUID of the last of them, in the order of their
+    UUIDs."""
+
+    timestamp: int
+    count: int = 0
+    last: Optional[str] = None
+
+    def advance(self, obj: Object[Any, Any]) -> "_Watermark":
+        timestamp = _update_time(obj)
+        if timestamp == self.timestamp:
+            return _Watermark(timestamp, self.count + 1, str(obj.uuid))
+        return _Watermark(timestamp, 1, str(obj.uuid))
+
+    def returned(self, obj: Object[Any, Any]) -> bool:
+        """Whether the object was returned before this position, given the same update time as then."""
+        return (
+            self.last is not None
+            and _update_time(obj) == self.timestamp
+            and str(obj.uuid) <= self.last
+        )
+
+    def token(self) -> str:
+        data = json.dumps(
+            {"t": self.timestamp, "n": self.count, "u": self.last}, separators=(",", ":")
+        )
+        return base64.urlsafe_b64encode(data.encode()).decode()
+
+    @classmethod
+    def parse(cls, since: Optional[Union[datetime.datetime, str]]) -> "_Watermark":
+        if since is None:
+            return cls(0)
+        if isinstance(since, datetime.datetime):
+            if since.tzinfo is None:
+                since = since.replace(tzinfo=datetime.timezone.utc)
+            return cls(round(since.timestamp() * 1000))
+        try:
+            data = json.loads(base64.urlsafe_b64decode(since.encode()))
+            count, last = int(data["n"]), data["u"]
+            if count < 0 or (last is None) != (count == 0):
+                raise ValueError(f"invalid position {count} {last!r}")
+            return cls(int(data["t"]), count, None if last is None else str(last))
+        except (ValueError, TypeError, KeyError) as e:
+            raise WeaviateInvalidInputError(
+                f"since has to be a datetime or a watermark of a changes iterator, got {since!r}."
+            ) from e
+
+
+def _update_time(obj: Object[Any, Any]) -> int:
+    assert obj.metadata.last_update_time is not None
+    return round(obj.metadata.last_update_time.timestamp() * 1000)
+
+
+def _with_update_time(return_metadata: Optional[METADATA]) -> METADATA:
+    """Add the update time, which the iterator needs for its watermark, to the requested metadata."""
+    if return_metadata is None:
+        return MetadataQuery(last_update_time=True)
+    if isinstance(return_metadata, MetadataQuery):
+        return return_metadata.model_copy(update={"last_update_time": True})
+    return [*return_metadata, "last_update_time"]
+
+
+@dataclass
+class _ChangesInputs(Generic[TProperties, TReferences]):
+    include_vector: bool
+    return_metadata: Optional[METADATA]
+    return_properties: Optional[ReturnProperties[TProperties]]
+    return_references: Optional[ReturnReferences[TReferences]]
+    since: Optional[Union[datetime.datetime, str]]
+    page_size: Optional[int]
+    follow: bool
+    poll_interval: float
+
+
+class _ChangesBase(Generic[TProperties, TReferences]):
+    def __init__(self, inputs: _ChangesInputs[TProperties, TReferences]) -> None:
+        if inputs.page_size is not None and inputs.page_size < 1:
+            raise WeaviateInvalidInputError(
+                f"page_size has to be a positive integer, got {inputs.page_size}."
+            )
+        if inputs.poll_interval < 0:
+            raise WeaviateInvalidInputError(
+                f"poll_interval cannot be negative, got {inputs.poll_interval}."
+            )
+        self._inputs = inputs
+        self._return_metadata = _with_update_time(inputs.return_metadata)
+        self._page_size = inputs.page_size or CHANGES_PAGE_SIZE
+
+        self._watermark = _Watermark.parse(inputs.since)
+        # the position of the last fetched page, ahead of the watermark while a page is consumed
+        self._cursor = self._watermark
+        self._page: Deque[Object[TProperties, TReferences]] = deque()
+
+    @property
+    def watermark(self) -> str:
+        """A token for the position after the last returned object, pass it as `since` to resume from there."""
+        return self._watermark.token()
+
+    def _request(self, cursor: _Watermark) -> Tuple[_Filters, int, int]:
+        # the objects with the same update time are sorted by their UUIDs and skipped with an offset, the last one that
+        # was returned is requested again to check that none of the skipped ones was updated in the meantime
+        since = datetime.datetime.fromtimestamp(cursor.timestamp / 1000, tz=datetime.timezone.utc)
+        if cursor.count == 0:
+            return Filter.by_update_time().greater_or_equal(since), 0, self._page_size
+        return (
+            Filter.by_update_time().greater_or_equal(since),
+            cursor.count - 1,
+            self._page_size + 1,
+        )
+
+    def _new(
+        self,
+        cursor: _Watermark,
+        objects: List[Object[TProperties, TReferences]],
+        offset: int,
+        limit: int,
+    ) -> Tuple[List[Object[TProperties, TReferences]], bool, _Watermark]:
+        """Return the objects of a page that were not returned yet, whether the page was full and the position of the
+        cursor before these objects."""
+        if cursor.count > 0 and (len(objects) == 0 or not cursor.returned(objects[0])):
+            # some of the skipped objects were updated since, count the returned ones again from the first one on
+            return [], True, _Watermark(cursor.timestamp, 0, cursor.last)
+        new = [obj for obj in objects if not cursor.returned(obj)]
+        skipped = len(objects) - len(new)
+        if cursor.last is not None:
+            cursor = _Watermark(cursor.timestamp, offset + skipped, cursor.last)
+        return new, len(objects) == limit, cursor
+
+    def _fetched(self, page: List[Object[TProperties, TReferences]], cursor: _Watermark) -> None:
+        self._cursor = cursor
+        for obj in page:
+            self._cursor = self._cursor.advance(obj)
+        self._page.extend(page)
+
+    def _pop(self) -> Object[TProperties, TReferences]:
+        obj = self._page.popleft()
+        self._watermark = self._watermark.advance(obj)
+        return obj
+
+
+class _ChangesIterator(
+    _ChangesBase[TProperties, TReferences],
+    Iterable[Object[TProperties, TReferences]],
+):
+    """Iterates over the objects of a collection in the order of their last update."""
+
+    def __init__(
+        self,
+        query: _FetchObjectsQuery[Any, Any],
+        inputs: _ChangesInputs[TProperties, TReferences],
+    ) -> None:
+        super().__init__(inputs)
+        self.__query = query
+        self.__pool: Optional[ThreadPoolExecutor] = None
+        self.__prefetched: Optional[
+            "Future[Tuple[List[Object[TProperties, TReferences]], bool, _Watermark]]"
+        ] = None
+
+    def __iter__(self) -> Iterator[Object[TProperties, TReferences]]:
+        return self
+
+    def __next__(self) -> Object[TProperties, TReferences]:
+        while len(self._page) == 0:
+            if self.__prefetched is not None:
+                page, full, cursor = self.__prefetched.result()
+                self.__prefetched = None
+            else:
+                page, full, cursor = self.__fetch(self._cursor)
+            self._fetched(page, cursor)
+            if len(page) == 0 and not full:
+                if not self._inputs.follow:
+                    raise StopIteration
+                time.sleep(self._inputs.poll_interval)
+                continue
+            if full and len(page) > 0:
+                # more changes are waiting, fetch them while this page is consumed
+                if self.__pool is None:
+                    self.__pool = ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix="WeaviateChanges"
+                    )
+                self.__prefetched = self.__pool.submit(self.__fetch, self._cursor)
+        return self._pop()
+
+    def __fetch(
+        self, cursor: _Watermark
+    ) -> Tuple[List[Object[TProperties, TReferences]], bool, _Watermark]:
+        filters, offset, limit = self._request(cursor)
+        res = self.__query.fetch_objects(
+            limit=limit,
+            offset=offset,
+            filters=filters,
+            sort=Sort.by_update_time().by_id(),
+            include_vector=self._inputs.include_vector,
+            return_metadata=self._return_metadata,
+            return_properties=self._inputs.return_properties,
+            return_references=self._inputs.return_references,
+        )
+        return self._new(cursor, res.objects, offset, limit)  # type: ignore
+
+
+class _ChangesAIterator(
+    _ChangesBase[TProperties, TReferences],
+    AsyncIterable[Object[TProperties, TReferences]],
+):
+    """Iterates over the objects of a collection in the order of their last update."""
+
+    def __init__(
+        self,
+        query: _FetchObjectsQueryAsync[Any, Any],
+        inputs: _ChangesInputs[TProperties, TReferences],
+    ) -> None:
+        super().__init__(inputs)
+        self.__query = query
+        self.__prefetched: Optional[
+            "asyncio.Task[Tuple[List[Object[TProperties, TReferences]], bool, _Watermark]]"
+        ] = None
+
+    def __aiter__(self) -> AsyncIterator[Object[TProperties, TReferences]]:
+        return self
+
+    async def __anext__(self) -> Object[TProperties, TReferences]:
+        while len(self._page) == 0:
+            if self.__prefetched is not None:
+                page, full, cursor = await self.__prefetched
+                self.__prefetched = None
+            else:
+                page, full, cursor = await self.__fetch(self._cursor)
+            self._fetched(page, cursor)
+            if len(page) == 0 and not full:
+                if not self._inputs.follow:
+                    raise StopAsyncIteration
+                await asyncio.sleep(self._inputs.poll_interval)
+                continue
+            if full and len(page) > 0:
+                # more changes are waiting, fetch them while this page is consumed
+                self.__prefetched = asyncio.create_task(self.__fetch(self._cursor))
+        return self._pop()
+
+    async def __fetch(
+        self, cursor: _Watermark
+    ) -> Tuple[List[Object[TProperties, TReferences]], bool, _Watermark]:
+        filters, offset, limit = self._request(cursor)
+        res = await self.__query.fetch_objects(
+            limit=limit,
+            offset=offset,
+            filters=filters,
+            sort=Sort.by_update_time().by_id(),
+            include_vector=self._inputs.include_vector,
+            return_metadata=self._return_metadata,
+            return_properties=self._inputs.return_properties,
+            return_references=self._inputs.return_references,
+        )
+        return self._new(cursor, res.objects, offset, limit)  # type: ignore
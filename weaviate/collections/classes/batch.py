@@ -294,6 +294,124 @@ class BatchResult:
         self.refs: BatchReferenceReturn = BatchReferenceReturn()
 
 
+@dataclass
+class BatchStats:
+    """This class contains a point-in-time snapshot of a running batch, as returned by `batch.stats()`.
+
+    Attributes:
+        `objects_per_second`
+            The number of successfully imported objects per second, averaged over the last `window_seconds`.
+        `window_seconds`
+            The length of the moving window used to compute `objects_per_second`.
+        `objects_sent`
+            The number of objects that were sent to Weaviate and not re-added for a retry.
+        `objects_failed`
+            The number of objects that failed to be imported.
+        `references_sent`
+            The number of references that were sent to Weaviate.
+        `references_failed`
+            The number of references that failed to be imported.
+        `retries`
+            The number of times an object was re-added to the queue after a temporary (rate limit) error.
+        `recommended_batch_size`
+            The number of objects that are currently sent in one request.
+        `concurrent_requests`
+            The number of requests that may currently be in flight at the same time.
+        `in_flight_requests`
+            The number of requests that are currently in flight.
+        `queued_objects`
+            The number of objects waiting in the client-side queue.
+        `queued_references`
+            The number of references waiting in the client-side queue.
+        `queued_bytes`
+            The estimated encoded size of the objects waiting in the client-side queue.
+        `server_queue_length`
+            The length of the batch queue of Weaviate as last reported by the server, `None` if it was not queried.
+        `server_rate_per_second`
+            The number of objects per second that Weaviate last reported to be processing, `None` if it was not queried.
+        `request_latency`
+            A histogram of the durations of the object requests. The keys are the upper bounds of the buckets in seconds,
+            the values the number of requests that took at most that long, but longer than the previous bucket.
+        `elapsed_seconds`
+            The time since the batch was started.
+    """
+
+    objects_per_second: float
+    window_seconds: float
+    objects_sent: int
+    objects_failed: int
+    references_sent: int
+    references_failed: int
+    retries: int
+    recommended_batch_size: int
+    concurrent_requests: int
+    in_flight_requests: int
+    queued_objects: int
+    queued_references: int
+    queued_bytes: int
+    server_queue_length: Optional[int]
+    server_rate_per_second: Optional[float]
+    request_latency: Dict[float, int]
+    elapsed_seconds: float
+
+
+@dataclass
+class ImportFileProgress:
+    """This class contains a point-in-time snapshot of a running `import_file`, as passed to its `progress_callback`.
+
+    Attributes:
+        `rows`
+            The number of rows of the file that were processed, including the rows that were skipped because they were
+            imported before the last checkpoint.
+        `objects_imported`
+            The number of objects that were imported successfully by this call.
+        `objects_failed`
+            The number of objects that failed to be imported by this call.
+        `objects_per_second`
+            The number of successfully imported objects per second since the import started.
+        `elapsed_seconds`
+            The time since the import started.
+    """
+
+    rows: int
+    objects_imported: int
+    objects_failed: int
+    objects_per_second: float
+    elapsed_seconds: float
+
+
+@dataclass
+class ImportFileReturn:
+    """This class contains the results of an `import_file` operation.
+
+    Attributes:
+        `rows`
+            The number of rows of the file, including the rows that were skipped because they were imported before the
+            last checkpoint.
+        `skipped_rows`
+            The number of rows that were skipped because they were imported before the last checkpoint.
+        `objects_imported`
+            The number of objects that were imported successfully.
+        `objects_failed`
+            The number of objects that failed to be imported.
+        `errors`
+            A dictionary of the objects that failed to be imported. The keys are the numbers of their rows in the file,
+            starting at 0, and the values the `ErrorObject` objects.
+        `has_errors`
+            A boolean indicating whether any of the objects failed to be imported.
+        `elapsed_seconds`
+            The time taken by the import.
+    """
+
+    rows: int = 0
+    skipped_rows: int = 0
+    objects_imported: int = 0
+    objects_failed: int = 0
+    errors: Dict[int, ErrorObject] = field(default_factory=dict)
+    has_errors: bool = False
+    elapsed_seconds: float = 0.0
+
+
 @dataclass
 class DeleteManyObject:
     """This class contains the objects of a `delete_many` operation."""
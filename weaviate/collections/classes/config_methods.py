@@ -1,4 +1,5 @@
-from typing import Any, Dict, List, Optional, Union, cast
+from dataclasses import fields
+from typing import Any, Callable, Dict, List, Optional, Union, cast
 
 from weaviate.collections.classes.config import (
     _BQConfig,
@@ -88,7 +89,8 @@ def __get_generative_config(schema: Dict[str, Any]) -> Optional[_GenerativeConfi
 
 def __get_vectorizer_config(schema: Dict[str, Any]) -> Optional[_VectorizerConfig]:
     if __is_vectorizer_present(schema) is not None and schema.get("vectorizer", "none") != "none":
-        vec_config: Dict[str, Any] = schema["moduleConfig"].pop(schema["vectorizer"])
+        # copied, as the schema may be cached and parsed more than once
+        vec_config: Dict[str, Any] = dict(schema["moduleConfig"][schema["vectorizer"]])
         try:
             vectorizer = Vectorizers(schema["vectorizer"])
         except ValueError:
@@ -226,7 +228,7 @@ def __get_vector_config(
             assert len(vectorizer) == 1
 
             vectorizer_str: str = str(list(vectorizer)[0])
-            vec_config: Dict[str, Any] = named_vector["vectorizer"][vectorizer_str]
+            vec_config: Dict[str, Any] = dict(named_vector["vectorizer"][vectorizer_str])
             props = vec_config.pop("properties", None)
 
             vector_index_config = __get_vector_index_config(named_vector)
@@ -274,78 +276,140 @@ def _collection_config_simple_from_json(schema: Dict[str, Any]) -> _CollectionCo
     )
 
 
-def _collection_config_from_json(schema: Dict[str, Any]) -> _CollectionConfig:
-    return _CollectionConfig(
-        name=schema["class"],
-        description=schema.get("description"),
-        generative_config=__get_generative_config(schema),
-        inverted_index_config=_InvertedIndexConfig(
-            bm25=_BM25Config(
-                b=schema["invertedIndexConfig"]["bm25"]["b"],
-                k1=schema["invertedIndexConfig"]["bm25"]["k1"],
-            ),
-            cleanup_interval_seconds=schema["invertedIndexConfig"]["cleanupIntervalSeconds"],
-            index_null_state=cast(dict, schema["invertedIndexConfig"]).get("indexNullState")
-            is True,
-            index_property_length=cast(dict, schema["invertedIndexConfig"]).get(
-                "indexPropertyLength"
-            )
-            is True,
-            index_timestamps=cast(dict, schema["invertedIndexConfig"]).get("indexTimestamps")
-            is True,
-            stopwords=_StopwordsConfig(
-                preset=StopwordsPreset(schema["invertedIndexConfig"]["stopwords"]["preset"]),
-                additions=schema["invertedIndexConfig"]["stopwords"]["additions"],
-                removals=schema["invertedIndexConfig"]["stopwords"]["removals"],
-            ),
+def __get_inverted_index_config(schema: Dict[str, Any]) -> _InvertedIndexConfig:
+    return _InvertedIndexConfig(
+        bm25=_BM25Config(
+            b=schema["invertedIndexConfig"]["bm25"]["b"],
+            k1=schema["invertedIndexConfig"]["bm25"]["k1"],
         ),
-        multi_tenancy_config=_MultiTenancyConfig(
-            enabled=schema.get("multiTenancyConfig", {}).get("enabled", False),
-            auto_tenant_creation=schema.get("multiTenancyConfig", {}).get(
-                "autoTenantCreation", False
-            ),
-            auto_tenant_activation=schema.get("multiTenancyConfig", {}).get(
-                "autoTenantActivation", False
-            ),
+        cleanup_interval_seconds=schema["invertedIndexConfig"]["cleanupIntervalSeconds"],
+        index_null_state=cast(dict, schema["invertedIndexConfig"]).get("indexNullState") is True,
+        index_property_length=cast(dict, schema["invertedIndexConfig"]).get("indexPropertyLength")
+        is True,
+        index_timestamps=cast(dict, schema["invertedIndexConfig"]).get("indexTimestamps") is True,
+        stopwords=_StopwordsConfig(
+            preset=StopwordsPreset(schema["invertedIndexConfig"]["stopwords"]["preset"]),
+            additions=schema["invertedIndexConfig"]["stopwords"]["additions"],
+            removals=schema["invertedIndexConfig"]["stopwords"]["removals"],
         ),
-        properties=_properties_from_config(schema) if schema.get("properties") is not None else [],
-        references=_references_from_config(schema) if schema.get("properties") is not None else [],
-        replication_config=_ReplicationConfig(
-            factor=schema["replicationConfig"]["factor"],
-            async_enabled=schema["replicationConfig"].get("asyncEnabled", False),
-            deletion_strategy=(
-                ReplicationDeletionStrategy(schema["replicationConfig"]["deletionStrategy"])
-                if "deletionStrategy" in schema["replicationConfig"]
-                else ReplicationDeletionStrategy.NO_AUTOMATED_RESOLUTION
-            ),
+    )
+
+
+def __get_multi_tenancy_config(schema: Dict[str, Any]) -> _MultiTenancyConfig:
+    return _MultiTenancyConfig(
+        enabled=schema.get("multiTenancyConfig", {}).get("enabled", False),
+        auto_tenant_creation=schema.get("multiTenancyConfig", {}).get("autoTenantCreation", False),
+        auto_tenant_activation=schema.get("multiTenancyConfig", {}).get(
+            "autoTenantActivation", False
         ),
-        reranker_config=__get_rerank_config(schema),
-        sharding_config=(
-            None
-            if schema.get("multiTenancyConfig", {}).get("enabled", False)
-            else _ShardingConfig(
-                virtual_per_physical=schema["shardingConfig"]["virtualPerPhysical"],
-                desired_count=schema["shardingConfig"]["desiredCount"],
-                actual_count=schema["shardingConfig"]["actualCount"],
-                desired_virtual_count=schema["shardingConfig"]["desiredVirtualCount"],
-                actual_virtual_count=schema["shardingConfig"]["actualVirtualCount"],
-                key=schema["shardingConfig"]["key"],
-                strategy=schema["shardingConfig"]["strategy"],
-                function=schema["shardingConfig"]["function"],
-            )
+    )
+
+
+def __get_replication_config(schema: Dict[str, Any]) -> _ReplicationConfig:
+    return _ReplicationConfig(
+        factor=schema["replicationConfig"]["factor"],
+        async_enabled=schema["replicationConfig"].get("asyncEnabled", False),
+        deletion_strategy=(
+            ReplicationDeletionStrategy(schema["replicationConfig"]["deletionStrategy"])
+            if "deletionStrategy" in schema["replicationConfig"]
+            else ReplicationDeletionStrategy.NO_AUTOMATED_RESOLUTION
         ),
-        vector_index_config=__get_vector_index_config(schema),
-        vector_index_type=__get_vector_index_type(schema),
-        vectorizer_config=__get_vectorizer_config(schema),
-        vectorizer=__get_vectorizer(schema),
-        vector_config=__get_vector_config(schema, simple=False),
     )
 
 
+def __get_sharding_config(schema: Dict[str, Any]) -> Optional[_ShardingConfig]:
+    if schema.get("multiTenancyConfig", {}).get("enabled", False):
+        return None
+    return _ShardingConfig(
+        virtual_per_physical=schema["shardingConfig"]["virtualPerPhysical"],
+        desired_count=schema["shardingConfig"]["desiredCount"],
+        actual_count=schema["shardingConfig"]["actualCount"],
+        desired_virtual_count=schema["shardingConfig"]["desiredVirtualCount"],
+        actual_virtual_count=schema["shardingConfig"]["actualVirtualCount"],
+        key=schema["shardingConfig"]["key"],
+        strategy=schema["shardingConfig"]["strategy"],
+        function=schema["shardingConfig"]["function"],
+    )
+
+
+# parsers of all the fields of `_CollectionConfig` but its name, in field order
+_COLLECTION_CONFIG_FIELDS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "description": lambda schema: schema.get("description"),
+    "generative_config": __get_generative_config,
+    "inverted_index_config": __get_inverted_index_config,
+    "multi_tenancy_config": __get_multi_tenancy_config,
+    "properties": lambda schema: (
+        _properties_from_config(schema) if schema.get("properties") is not None else []
+    ),
+    "references": lambda schema: (
+        _references_from_config(schema) if schema.get("properties") is not None else []
+    ),
+    "replication_config": __get_replication_config,
+    "reranker_config": __get_rerank_config,
+    "sharding_config": __get_sharding_config,
+    "vector_index_config": __get_vector_index_config,
+    "vector_index_type": __get_vector_index_type,
+    "vectorizer_config": __get_vectorizer_config,
+    "vectorizer": __get_vectorizer,
+    "vector_config": lambda schema: __get_vector_config(schema, simple=False),
+}
+
+
+def _collection_config_from_json(schema: Dict[str, Any]) -> _CollectionConfig:
+    return _CollectionConfig(
+        name=schema["class"],
+        **{field: parse(schema) for field, parse in _COLLECTION_CONFIG_FIELDS.items()},
+    )
+
+
+class _LazyCollectionConfig(_CollectionConfig):
+    """A `CollectionConfig` whose sub-configs are parsed from the schema only when they are first accessed.
+
+    Each parsed value is stored on the instance, so that it is parsed at most once.
+    """
+
+    def __init__(self, schema: Dict[str, Any]) -> None:
+        self._schema = schema
+        self.name = schema["class"]
+
+    def __getattr__(self, name: str) -> Any:
+        # only called for the fields that have not been parsed yet
+        parse = _COLLECTION_CONFIG_FIELDS.get(name)
+        if parse is None or "_schema" not in self.__dict__:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        value = parse(self._schema)
+        setattr(self, name, value)
+        return value
+
+    def __materialize(self) -> _CollectionConfig:
+        return _CollectionConfig(
+            **{f.name: getattr(self, f.name) for f in fields(_CollectionConfig)}
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, _LazyCollectionConfig):
+            other = other.__materialize()
+        return self.__materialize() == other
+
+    def __repr__(self) -> str:
+        return repr(self.__materialize())
+
+    def to_dict(self) -> dict:
+        return self.__materialize().to_dict()
+
+
+def _collection_config_lazy_from_json(schema: Dict[str, Any]) -> _CollectionConfig:
+    return _LazyCollectionConfig(schema)
+
+
 def _collection_configs_from_json(schema: Dict[str, Any]) -> Dict[str, _CollectionConfig]:
     return {schema["class"]: _collection_config_from_json(schema) for schema in schema["classes"]}
 
 
+def _collection_configs_lazy_from_json(schema: Dict[str, Any]) -> Dict[str, _CollectionConfig]:
+    return {schema["class"]: _LazyCollectionConfig(schema) for schema in schema["classes"]}
+
+
 def _collection_configs_simple_from_json(
     schema: Dict[str, Any]
 ) -> Dict[str, _CollectionConfigSimple]:
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Any, Generic, List, Optional, Union
+from typing import Any, Dict, Generic, List, Optional, Union
 from typing_extensions import TypeVar, TypeAlias
 from weaviate.types import BEACON, UUID, VECTORS
 
@@ -38,6 +38,25 @@ class DataObject(Generic[P, R]):
     # throws error: Incompatible types in assignment (expression has type "None", variable has type "R")  [assignment]
 
 
+@dataclass
+class FileMapping:
+    """This class defines how the columns of a file are mapped to the objects created by `import_file`.
+
+    Attributes:
+        `properties`
+            The columns to import as properties, mapped to the names of the properties. If `None`, all columns except the
+            `uuid` and `vector` columns are imported as properties of the same name.
+        `uuid`
+            The column holding the UUIDs of the objects. If `None`, random UUIDs are generated.
+        `vector`
+            The column holding the vectors of the objects. In CSV files the vectors are JSON arrays.
+    """
+
+    properties: Optional[Dict[str, str]] = None
+    uuid: Optional[str] = None
+    vector: Optional[str] = None
+
+
 @dataclass
 class _DataReference:
     from_property: str
@@ -1,15 +1,16 @@
+from abc import ABC, abstractmethod
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional, Sequence, Union
+from typing import Hashable, List, Optional, Sequence, Union
 from typing_extensions import TypeAlias
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 from weaviate.collections.classes.types import GeoCoordinate
 
 
 from weaviate.collections.classes.types import _WeaviateInput
 from weaviate.types import UUID
 from weaviate.proto.v1 import base_pb2
-from weaviate.util import get_valid_uuid
+from weaviate.util import _get_valid_uuids, get_valid_uuid
 
 from weaviate.exceptions import WeaviateInvalidInputError
 
@@ -59,13 +60,20 @@ class _Operator(str, Enum):
             return base_pb2.Filters.OPERATOR_OR
 
 
-class _Filters:
+class _Filters(ABC):
     def __and__(self, other: "_Filters") -> "_Filters":
         return _FilterAnd([self, other])
 
     def __or__(self, other: "_Filters") -> "_Filters":
         return _FilterOr([self, other])
 
+    @abstractmethod
+    def _key(self) -> Hashable:
+        """A hashable representation of the structure and values of this filter.
+
+        Filters with equal keys are converted to the same request, which allows caching the converted filters.
+        """
+
 
 class _FilterAnd(_Filters):
     def __init__(self, filters: List[_Filters]):
@@ -77,6 +85,9 @@ class _FilterAnd(_Filters):
     def operator(self) -> _Operator:
         return _Operator.AND
 
+    def _key(self) -> Hashable:
+        return (_Operator.AND, tuple(filter_._key() for filter_ in self.filters))
+
 
 class _FilterOr(_Filters):
     def __init__(self, filters: List[_Filters]):
@@ -88,6 +99,9 @@ class _FilterOr(_Filters):
     def operator(self) -> _Operator:
         return _Operator.OR
 
+    def _key(self) -> Hashable:
+        return (_Operator.OR, tuple(filter_._key() for filter_ in self.filters))
+
 
 class _GeoCoordinateFilter(GeoCoordinate):
     distance: float
@@ -125,11 +139,76 @@ _TargetRefs = Union[_SingleTargetRef, _MultiTargetRef]
 _FilterTargets = Union[_SingleTargetRef, _MultiTargetRef, _CountRef, str]
 
 
+def _target_key(target: Optional[_FilterTargets]) -> Hashable:
+    if target is None or isinstance(target, str):
+        return target
+    if isinstance(target, _CountRef):
+        return ("count", target.link_on)
+    if isinstance(target, _SingleTargetRef):
+        return ("single", target.link_on, _target_key(target.target))
+    return ("multi", target.link_on, target.target_collection, _target_key(target.target))
+
+
+def _scalar_key(value: FilterValues) -> Hashable:
+    # the type is part of the key as e.g. 1, 1.0 and True are equal but are sent in different fields, and equal
+    # datetimes in different timezones are sent as different strings
+    if isinstance(value, datetime):
+        return (datetime, value, value.utcoffset())
+    if isinstance(value, _GeoCoordinateFilter):
+        return (_GeoCoordinateFilter, value.latitude, value.longitude, value.distance)
+    return (type(value), value)
+
+
+def _value_key(value: FilterValues) -> Hashable:
+    if isinstance(value, list):
+        # lists are sent in the field matching the type of their first element
+        if isinstance(value[0], datetime):
+            return (list, tuple(_scalar_key(val) for val in value))
+        return (list, type(value[0]), tuple(value))
+    return _scalar_key(value)
+
+
 class _FilterValue(_Filters, _WeaviateInput):
     value: FilterValues
     operator: _Operator
     target: _FilterTargets
 
+    # filters with many values, e.g. long contains_any lists, are often reused as they are, so the key is only
+    # computed once per filter
+    _structural_key: Optional[Hashable] = PrivateAttr(default=None)
+
+    def _key(self) -> Hashable:
+        if self._structural_key is None:
+            self._structural_key = (
+                self.operator,
+                _target_key(self.target),
+                _value_key(self.value),
+            )
+        return self._structural_key
+
+
+def _split_id_filter(filters: _Filters, chunk_size: int) -> List[_Filters]:
+    """Split a filter on a list of UUIDs into filters on at most `chunk_size` UUIDs, other filters are not split."""
+    if chunk_size < 1:
+        raise WeaviateInvalidInputError(f"chunk_size has to be positive, got {chunk_size}.")
+    if (
+        not isinstance(filters, _FilterValue)
+        or filters.operator != _Operator.CONTAINS_ANY
+        or filters.target != "_id"
+        or not isinstance(filters.value, list)
+        or len(filters.value) <= chunk_size
+    ):
+        return [filters]
+    # the UUIDs were validated when the filter was created
+    return [
+        _FilterValue.model_construct(
+            value=filters.value[i : i + chunk_size],
+            operator=_Operator.CONTAINS_ANY,
+            target="_id",
+        )
+        for i in range(0, len(filters.value), chunk_size)
+    ]
+
 
 class _FilterBase:
     _target: Optional[_TargetRefs] = None
@@ -373,7 +452,7 @@ class _FilterById(_FilterBase):
             raise WeaviateInvalidInputError("Filter contains_any must have at least one value")
         return _FilterValue(
             target=self._target_path(),
-            value=[get_valid_uuid(val) for val in uuids],
+            value=_get_valid_uuids(uuids),
             operator=_Operator.CONTAINS_ANY,
         )
 
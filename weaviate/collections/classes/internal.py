@@ -12,10 +12,11 @@ from typing import (
     Sequence,
     Tuple,
     Type,
+    TypeVar,
     Union,
     cast,
 )
-from typing_extensions import deprecated
+from typing_extensions import dataclass_transform, deprecated
 
 from typing_extensions import TypeAlias
 
@@ -60,8 +61,22 @@ from weaviate.types import INCLUDE_VECTOR, UUID, UUIDS
 
 from weaviate.proto.v1 import search_get_pb2, generative_pb2
 
+_T = TypeVar("_T")
 
-@dataclass
+
+@dataclass_transform()
+def _slotted_dataclass(cls: Type[_T]) -> Type[_T]:
+    """A dataclass which stores its fields in `__slots__` instead of a per-instance `__dict__`.
+
+    Query results can consist of many thousands of these objects, so this saves both memory and attribute access time.
+    Slotted dataclasses require Python 3.10, older versions get a regular dataclass.
+    """
+    if sys.version_info >= (3, 10):
+        return dataclass(slots=True)(cls)
+    return dataclass(cls)
+
+
+@_slotted_dataclass
 class MetadataReturn:
     """Metadata of an object returned by a query."""
 
@@ -89,14 +104,14 @@ class MetadataReturn:
         )
 
 
-@dataclass
+@_slotted_dataclass
 class GroupByMetadataReturn:
     """Metadata of an object returned by a group by query."""
 
     distance: Optional[float] = None
 
 
-@dataclass
+@_slotted_dataclass
 class _Object(Generic[P, R, M]):
     uuid: uuid_package.UUID
     metadata: M
@@ -106,12 +121,12 @@ class _Object(Generic[P, R, M]):
     collection: str
 
 
-@dataclass
+@_slotted_dataclass
 class Object(Generic[P, R], _Object[P, R, MetadataReturn]):
     """A single Weaviate object returned by a query within the `.query` namespace of a collection."""
 
 
-@dataclass
+@_slotted_dataclass
 class MetadataSingleObjectReturn:
     """Metadata of an object returned by the `fetch_object_by_id` query."""
 
@@ -120,12 +135,12 @@ class MetadataSingleObjectReturn:
     is_consistent: Optional[bool]
 
 
-@dataclass
+@_slotted_dataclass
 class ObjectSingleReturn(Generic[P, R], _Object[P, R, MetadataSingleObjectReturn]):
     """A single Weaviate object returned by the `fetch_object_by_id` query."""
 
 
-@dataclass
+@_slotted_dataclass
 class GroupByObject(Generic[P, R], _Object[P, R, GroupByMetadataReturn]):
     """A single Weaviate object returned by a query with the `group_by` argument specified."""
 
@@ -168,6 +183,8 @@ class GenerativeGrouped:
 class GenerativeObject(Generic[P, R], Object[P, R]):
     """A single Weaviate object returned by a query within the `generate` namespace of a collection."""
 
+    __slots__ = ("__generated", "generative")
+
     __generated: Optional[str]
     generative: Optional[GenerativeSingle]
 
@@ -266,13 +283,27 @@ class GroupByReturn(Generic[P, R]):
     groups: Dict[str, Group[P, R]]
 
 
-@dataclass
+@_slotted_dataclass
 class QueryReturn(Generic[P, R]):
     """The return type of a query within the `.query` namespace of a collection."""
 
     objects: List[Object[P, R]]
 
 
+@_slotted_dataclass
+class TenantObject(Generic[P, R], Object[P, R]):
+    """A single Weaviate object returned by a query spanning multiple tenants of a collection."""
+
+    tenant: str
+
+
+@dataclass
+class MultiTenantQueryReturn(Generic[P, R]):
+    """The return type of a query within the `.query.multi_tenant()` namespace of a collection."""
+
+    objects: List[TenantObject[P, R]]
+
+
 _GQLEntryReturnType: TypeAlias = Dict[str, List[Dict[str, Any]]]
 
 
@@ -484,6 +515,8 @@ class ReferenceToMulti(_WeaviateInput):
 
 
 class _CrossReference(Generic[Properties, IReferences]):
+    __slots__ = ("__objects",)
+
     def __init__(
         self,
         objects: Optional[List[Object[Properties, IReferences]]],
@@ -759,6 +792,15 @@ GroupByReturnType = Union[
     GroupByReturn[TProperties, CrossReferences],
 ]
 
+MultiTenantQueryReturnType = Union[
+    MultiTenantQueryReturn[Properties, References],
+    MultiTenantQueryReturn[TProperties, TReferences],
+    MultiTenantQueryReturn[Properties, CrossReferences],
+    MultiTenantQueryReturn[Properties, TReferences],
+    MultiTenantQueryReturn[TProperties, References],
+    MultiTenantQueryReturn[TProperties, CrossReferences],
+]
+
 QuerySearchReturnType = Union[
     QueryReturnType[Properties, References, TProperties, TReferences],
     GroupByReturnType[Properties, References, TProperties, TReferences],
@@ -1,5 +1,6 @@
+from dataclasses import dataclass
 from enum import Enum
-from typing import Any
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -233,3 +234,47 @@ class TenantUpdate(BaseModel):
         self.activityStatus = _TenantActivistatusServerValues.from_string(
             self.activityStatusInternal.value
         )
+
+
+@dataclass
+class TenantsChunkProgress:
+    """The outcome of a single chunk of a `create_many`, `update_many` or `remove_many` operation.
+
+    Attributes:
+        `succeeded`
+            The names of the tenants of this chunk that were processed successfully.
+        `failed`
+            The names of the tenants of this chunk that could not be processed, even after retrying.
+        `error`
+            The error that made the chunk fail, if any.
+        `processed`
+            The number of tenants processed so far, including this chunk.
+        `total`
+            The total number of tenants of the operation.
+    """
+
+    succeeded: List[str]
+    failed: List[str]
+    error: Optional[Exception]
+    processed: int
+    total: int
+
+
+@dataclass
+class TenantsManyReturn:
+    """This class contains the results of a `create_many`, `update_many` or `remove_many` operation.
+
+    Attributes:
+        `succeeded`
+            The names of the tenants that were processed successfully.
+        `failed`
+            The names of the tenants that could not be processed mapped to the error of their chunk.
+    """
+
+    succeeded: List[str]
+    failed: Dict[str, Exception]
+
+    @property
+    def has_errors(self) -> bool:
+        """Whether any of the tenants could not be processed."""
+        return len(self.failed) > 0
@@ -1,3 +1,4 @@
+import datetime
 import json
 from dataclasses import asdict
 from typing import Generic, List, Literal, Optional, Type, Union, overload
@@ -7,6 +8,7 @@ from weaviate.collections.aggregate import _AggregateCollectionAsync
 from weaviate.collections.backups import _CollectionBackupAsync
 from weaviate.collections.cluster import _ClusterAsync
 from weaviate.collections.classes.config import ConsistencyLevel
+from weaviate.collections.changes import _ChangesInputs, _ChangesAIterator
 from weaviate.collections.classes.grpc import METADATA, PROPERTIES, REFERENCES
 from weaviate.collections.classes.internal import (
     CrossReferences,
@@ -20,7 +22,8 @@ from weaviate.collections.classes.types import Properties, TProperties
 from weaviate.collections.config import _ConfigCollectionAsync
 from weaviate.collections.data import _DataCollectionAsync
 from weaviate.collections.generate import _GenerateCollectionAsync
-from weaviate.collections.iterator import _IteratorInputs, _ObjectAIterator
+from weaviate.collections.iterator import _IteratorInputs, _ObjectAIterator, _TableAIterator
+from weaviate.collections.queries.tables import ReturnFormat, _validate_return_format
 from weaviate.collections.query import _QueryCollectionAsync
 from weaviate.collections.tenants import _TenantsAsync
 from weaviate.connect.v4 import ConnectionAsync
@@ -280,6 +283,18 @@ class CollectionAsync(Generic[Properties, References], _CollectionBase[Connectio
         cache_size: Optional[int] = None,
     ) -> _ObjectAIterator[TProperties, TReferences]: ...
 
+    @overload
+    def iterator(
+        self,
+        include_vector: bool = False,
+        return_metadata: Optional[METADATA] = None,
+        *,
+        return_properties: Optional[ReturnProperties[TProperties]] = None,
+        return_format: ReturnFormat,
+        after: Optional[UUID] = None,
+        cache_size: Optional[int] = None,
+    ) -> _TableAIterator: ...
+
     def iterator(
         self,
         include_vector: bool = False,
@@ -287,6 +302,7 @@ class CollectionAsync(Generic[Properties, References], _CollectionBase[Connectio
         *,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None,
+        return_format: Optional[ReturnFormat] = None,
         after: Optional[UUID] = None,
         cache_size: Optional[int] = None,
     ) -> Union[
@@ -296,6 +312,7 @@ class CollectionAsync(Generic[Properties, References], _CollectionBase[Connectio
         _ObjectAIterator[TProperties, References],
         _ObjectAIterator[TProperties, CrossReferences],
         _ObjectAIterator[TProperties, TReferences],
+        _TableAIterator,
     ]:
         """Use this method to return an iterator over the objects in the collection.
 
@@ -316,6 +333,9 @@ class CollectionAsync(Generic[Properties, References], _CollectionBase[Connectio
                 The properties to return with each object.
             `return_references`
                 The references to return with each object.
+            `return_format`
+                Iterate over tables of this format instead of objects, one of `"arrow"`, `"pandas"` or `"polars"`. Each table
+                holds the next `cache_size` objects of the collection and `return_references` cannot be used.
             `after`
                 The cursor to use to mark the initial starting point of the iterator in the collection.
             `cache_size`
@@ -325,6 +345,20 @@ class CollectionAsync(Generic[Properties, References], _CollectionBase[Connectio
             `weaviate.exceptions.WeaviateGRPCQueryError`:
                 If the request to the Weaviate server fails.
         """
+        if return_format is not None:
+            _validate_return_format(return_format, references=return_references)
+            return _TableAIterator(
+                self.query,
+                _IteratorInputs(
+                    include_vector=include_vector,
+                    return_metadata=return_metadata,
+                    return_properties=return_properties,
+                    return_references=None,
+                    after=after,
+                ),
+                return_format,
+                cache_size=cache_size,
+            )
         return _ObjectAIterator(
             self.query,
             _IteratorInputs(
@@ -336,3 +370,67 @@ class CollectionAsync(Generic[Properties, References], _CollectionBase[Connectio
             ),
             cache_size=cache_size,
         )
+
+    def changes(
+        self,
+        since: Optional[Union[datetime.datetime, str]] = None,
+        *,
+        include_vector: bool = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Optional[REFERENCES] = None,
+        page_size: Optional[int] = None,
+        follow: bool = False,
+        poll_interval: float = 1.0,
+    ) -> _ChangesAIterator[Properties, References]:
+        """Use this method to return an iterator over the objects in the collection that were created or updated since a point in time.
+
+        The objects are returned in the order of their last update, fetched in pages of `page_size` objects that are
+        filtered and sorted by their update time and UUID. Objects with the same update time are skipped with an offset,
+        so Weaviate has to allow more results than there are of them (`QUERY_MAXIMUM_RESULTS`). While a page is
+        consumed, the next one is fetched in the background.
+        An object that is updated again during the iteration is returned again. Deleted objects are not returned.
+
+        The iterator keeps a `watermark`, a token for the position after the last returned object. Store it and pass it
+        as `since` to resume the iteration there, e.g. to mirror the collection into another system incrementally.
+
+        This requires the `index_timestamps` option of the inverted index of the collection to be enabled.
+
+        Arguments:
+            `since`
+                Return the objects that were updated at or after this time, or after the position of this `watermark` of
+                an earlier iterator. If not provided, all objects are returned.
+            `include_vector`
+                Whether to include the vector in the metadata of the returned objects.
+            `return_metadata`
+                The metadata to return with each object, the last update time is always returned.
+            `return_properties`
+                The properties to return with each object.
+            `return_references`
+                The references to return with each object.
+            `page_size`
+                How many objects should be fetched in each request to Weaviate during the iteration. The default is 100.
+            `follow`
+                Instead of stopping once all changes were returned, keep polling Weaviate for new changes.
+            `poll_interval`
+                The number of seconds to wait between two polls when following the changes. The default is 1.
+
+        Raises:
+            `weaviate.exceptions.WeaviateGRPCQueryError`:
+                If the request to Weaviate fails.
+            `weaviate.exceptions.WeaviateInvalidInputError`:
+                If `since` is not a datetime or a watermark.
+        """
+        return _ChangesAIterator(
+            self.query,
+            _ChangesInputs(
+                include_vector=include_vector,
+                return_metadata=return_metadata,
+                return_properties=return_properties,
+                return_references=return_references,
+                since=since,
+                page_size=page_size,
+                follow=follow,
+                poll_interval=poll_interval,
+            ),
+        )
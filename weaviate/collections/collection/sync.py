@@ -1,3 +1,4 @@
+import datetime
 import json
 from dataclasses import asdict
 from typing import Generic, List, Literal, Optional, Type, Union, overload
@@ -5,6 +6,7 @@ from typing import Generic, List, Literal, Optional, Type, Union, overload
 from weaviate.collections.aggregate import _AggregateCollection
 from weaviate.collections.backups import _CollectionBackup
 from weaviate.collections.batch.collection import _BatchCollectionWrapper
+from weaviate.collections.changes import _ChangesInputs, _ChangesIterator
 from weaviate.collections.classes.cluster import Shard
 from weaviate.collections.classes.config import ConsistencyLevel
 from weaviate.collections.classes.grpc import METADATA, PROPERTIES, REFERENCES
@@ -21,7 +23,8 @@ from weaviate.collections.cluster import _Cluster
 from weaviate.collections.config import _ConfigCollection
 from weaviate.collections.data import _DataCollection
 from weaviate.collections.generate import _GenerateCollection
-from weaviate.collections.iterator import _IteratorInputs, _ObjectIterator
+from weaviate.collections.iterator import _IteratorInputs, _ObjectIterator, _TableIterator
+from weaviate.collections.queries.tables import ReturnFormat, _validate_return_format
 from weaviate.collections.query import _QueryCollection
 from weaviate.collections.tenants import _Tenants
 from weaviate.connect.v4 import ConnectionSync
@@ -297,6 +300,18 @@ class Collection(Generic[Properties, References], _CollectionBase[ConnectionSync
         cache_size: Optional[int] = None,
     ) -> _ObjectIterator[TProperties, TReferences]: ...
 
+    @overload
+    def iterator(
+        self,
+        include_vector: bool = False,
+        return_metadata: Optional[METADATA] = None,
+        *,
+        return_properties: Optional[ReturnProperties[TProperties]] = None,
+        return_format: ReturnFormat,
+        after: Optional[UUID] = None,
+        cache_size: Optional[int] = None,
+    ) -> _TableIterator: ...
+
     def iterator(
         self,
         include_vector: bool = False,
@@ -304,6 +319,7 @@ class Collection(Generic[Properties, References], _CollectionBase[ConnectionSync
         *,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None,
+        return_format: Optional[ReturnFormat] = None,
         after: Optional[UUID] = None,
         cache_size: Optional[int] = None,
     ) -> Union[
@@ -313,6 +329,7 @@ class Collection(Generic[Properties, References], _CollectionBase[ConnectionSync
         _ObjectIterator[TProperties, References],
         _ObjectIterator[TProperties, CrossReferences],
         _ObjectIterator[TProperties, TReferences],
+        _TableIterator,
     ]:
         """Use this method to return an iterator over the objects in the collection.
 
@@ -333,6 +350,9 @@ class Collection(Generic[Properties, References], _CollectionBase[ConnectionSync
                 The properties to return with each object.
             `return_references`
                 The references to return with each object.
+            `return_format`
+                Iterate over tables of this format instead of objects, one of `"arrow"`, `"pandas"` or `"polars"`. Each table
+                holds the next `cache_size` objects of the collection and `return_references` cannot be used.
             `after`
                 The cursor to use to mark the initial starting point of the iterator in the collection.
             `cache_size`
@@ -342,6 +362,20 @@ class Collection(Generic[Properties, References], _CollectionBase[ConnectionSync
             `weaviate.exceptions.WeaviateGRPCQueryError`:
                 If the request to the Weaviate server fails.
         """
+        if return_format is not None:
+            _validate_return_format(return_format, references=return_references)
+            return _TableIterator(
+                self.query,
+                _IteratorInputs(
+                    include_vector=include_vector,
+                    return_metadata=return_metadata,
+                    return_properties=return_properties,
+                    return_references=None,
+                    after=after,
+                ),
+                return_format,
+                cache_size=cache_size,
+            )
         return _ObjectIterator(
             self.query,
             _IteratorInputs(
@@ -353,3 +387,67 @@ class Collection(Generic[Properties, References], _CollectionBase[ConnectionSync
             ),
             cache_size=cache_size,
         )
+
+    def changes(
+        self,
+        since: Optional[Union[datetime.datetime, str]] = None,
+        *,
+        include_vector: bool = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Optional[REFERENCES] = None,
+        page_size: Optional[int] = None,
+        follow: bool = False,
+        poll_interval: float = 1.0,
+    ) -> _ChangesIterator[Properties, References]:
+        """Use this method to return an iterator over the objects in the collection that were created or updated since a point in time.
+
+        The objects are returned in the order of their last update, fetched in pages of `page_size` objects that are
+        filtered and sorted by their update time and UUID. Objects with the same update time are skipped with an offset,
+        so Weaviate has to allow more results than there are of them (`QUERY_MAXIMUM_RESULTS`). While a page is
+        consumed, the next one is fetched in the background.
+        An object that is updated again during the iteration is returned again. Deleted objects are not returned.
+
+        The iterator keeps a `watermark`, a token for the position after the last returned object. Store it and pass it
+        as `since` to resume the iteration there, e.g. to mirror the collection into another system incrementally.
+
+        This requires the `index_timestamps` option of the inverted index of the collection to be enabled.
+
+        Arguments:
+            `since`
+                Return the objects that were updated at or after this time, or after the position of this `watermark` of
+                an earlier iterator. If not provided, all objects are returned.
+            `include_vector`
+                Whether to include the vector in the metadata of the returned objects.
+            `return_metadata`
+                The metadata to return with each object, the last update time is always returned.
+            `return_properties`
+                The properties to return with each object.
+            `return_references`
+                The references to return with each object.
+            `page_size`
+                How many objects should be fetched in each request to Weaviate during the iteration. The default is 100.
+            `follow`
+                Instead of stopping once all changes were returned, keep polling Weaviate for new changes.
+            `poll_interval`
+                The number of seconds to wait between two polls when following the changes. The default is 1.
+
+        Raises:
+            `weaviate.exceptions.WeaviateGRPCQueryError`:
+                If the request to Weaviate fails.
+            `weaviate.exceptions.WeaviateInvalidInputError`:
+                If `since` is not a datetime or a watermark.
+        """
+        return _ChangesIterator(
+            self.query,
+            _ChangesInputs(
+                include_vector=include_vector,
+                return_metadata=return_metadata,
+                return_properties=return_properties,
+                return_references=return_references,
+                since=since,
+                page_size=page_size,
+                follow=follow,
+                poll_interval=poll_interval,
+            ),
+        )
@@ -1,5 +1,6 @@
 import asyncio
 from typing import (
+    Any,
     Awaitable,
     Dict,
     Generic,
@@ -31,8 +32,8 @@ from weaviate.collections.classes.config import (
     _VectorizerConfigCreate,
 )
 from weaviate.collections.classes.config_methods import (
-    _collection_config_from_json,
-    _collection_configs_from_json,
+    _collection_config_lazy_from_json,
+    _collection_configs_lazy_from_json,
     _collection_configs_simple_from_json,
 )
 from weaviate.collections.classes.internal import References
@@ -59,6 +60,41 @@ class _CollectionsExecutor(Generic[ConnectionType]):
     def __init__(self, connection: ConnectionType):
         self._connection = connection
 
+    def __invalidate_schema(self, name: Optional[str] = None) -> None:
+        if self._connection._schema_cache is not None:
+            self._connection._schema_cache.invalidate(name)
+
+    def __get_schema(self, name: Optional[str]) -> executor.Result[Dict[str, Any]]:
+        cache = self._connection._schema_cache
+        cached = None
+        if cache is not None:
+            cached = cache.get_all() if name is None else cache.get(name)
+        if cached is not None:
+            return executor.return_(
+                cached, "async" if isinstance(self._connection, ConnectionAsync) else "sync"
+            )
+
+        def resp(res: Response) -> Dict[str, Any]:
+            data = _decode_json_response_dict(
+                res, "Get schema all" if name is None else "Get schema export"
+            )
+            assert data is not None
+            if cache is not None:
+                if name is None:
+                    cache.put_all(data)
+                else:
+                    cache.put(name, data)
+            return data
+
+        return executor.execute(
+            response_callback=resp,
+            method=self._connection.get,
+            path="/schema" if name is None else f"/schema/{name}",
+            error_msg=(
+                "Get all collections" if name is None else "Could not export collection config"
+            ),
+        )
+
     def _use(
         self,
         *,
@@ -110,6 +146,7 @@ class _CollectionsExecutor(Generic[ConnectionType]):
             async def execute_():
                 res = await result
                 collection_name = res.json()["class"]
+                self.__invalidate_schema(collection_name)
                 collection = self._use(
                     name=collection_name,
                     data_model_properties=data_model_properties,
@@ -123,6 +160,7 @@ class _CollectionsExecutor(Generic[ConnectionType]):
 
         assert isinstance(result, Response)
         collection_name = result.json()["class"]
+        self.__invalidate_schema(collection_name)
         collection = self._use(
             name=collection_name,
             data_model_properties=data_model_properties,
@@ -134,7 +172,7 @@ class _CollectionsExecutor(Generic[ConnectionType]):
 
     def __delete(self, *, name: str) -> executor.Result[None]:
         return executor.execute(
-            response_callback=lambda res: None,
+            response_callback=lambda res: self.__invalidate_schema(name),
             method=self._connection.delete,
             path=f"/schema/{name}",
             error_msg="Collection may not have been deleted properly.",
@@ -308,6 +346,8 @@ class _CollectionsExecutor(Generic[ConnectionType]):
             `weaviate.UnexpectedStatusCodeError`
                 If Weaviate reports a non-OK status.
         """
+        # collections created by other clients must not be missed because of a cached schema
+        self.__invalidate_schema()
         if isinstance(self._connection, ConnectionAsync):
 
             async def _execute() -> None:
@@ -371,18 +411,14 @@ class _CollectionsExecutor(Generic[ConnectionType]):
             `weaviate.UnexpectedStatusCodeError`
                 If Weaviate reports a non-OK status.
         """
-        path = f"/schema/{_capitalize_first_letter(name)}"
 
-        def resp(res: Response) -> CollectionConfig:
-            data = _decode_json_response_dict(res, "Get schema export")
-            assert data is not None
-            return _collection_config_from_json(data)
+        def resp(data: Dict[str, Any]) -> CollectionConfig:
+            return _collection_config_lazy_from_json(data)
 
         return executor.execute(
             response_callback=resp,
-            method=self._connection.get,
-            path=path,
-            error_msg="Could not export collection config",
+            method=self.__get_schema,
+            name=_capitalize_first_letter(name),
         )
 
     def list_all(
@@ -410,19 +446,16 @@ class _CollectionsExecutor(Generic[ConnectionType]):
         _validate_input([_ValidateArgument(expected=[bool], name="simple", value=simple)])
 
         def resp(
-            res: Response,
+            data: Dict[str, Any],
         ) -> Union[Dict[str, CollectionConfig], Dict[str, CollectionConfigSimple]]:
-            data = _decode_json_response_dict(res, "Get schema all")
-            assert data is not None
             if simple:
                 return _collection_configs_simple_from_json(data)
-            return _collection_configs_from_json(data)
+            return _collection_configs_lazy_from_json(data)
 
         return executor.execute(
             response_callback=resp,
-            method=self._connection.get,
-            path="/schema",
-            error_msg="Get all collections",
+            method=self.__get_schema,
+            name=None,
         )
 
     def _create_from_dict(
@@ -25,7 +25,7 @@ from weaviate.collections.classes.config import (
     _RerankerProvider,
 )
 from weaviate.collections.classes.config_methods import (
-    _collection_config_from_json,
+    _collection_config_lazy_from_json,
     _collection_config_simple_from_json,
 )
 from weaviate.collections.classes.config_vector_index import _VectorIndexConfigDynamicUpdate
@@ -50,9 +50,24 @@ class _ConfigExecutor(Generic[ConnectionType]):
         self._name = name
         self._tenant = tenant
 
-    def __get(self) -> executor.Result[Dict[str, Any]]:
+    def __invalidate_schema(self) -> None:
+        if self._connection._schema_cache is not None:
+            self._connection._schema_cache.invalidate(self._name)
+
+    def __get(self, cached: bool = False) -> executor.Result[Dict[str, Any]]:
+        # only read-only callers may use the cache, the others modify the returned schema in place
+        cache = self._connection._schema_cache if cached else None
+        schema = cache.get(self._name) if cache is not None else None
+        if schema is not None:
+            return executor.return_(
+                schema, "async" if isinstance(self._connection, ConnectionAsync) else "sync"
+            )
+
         def resp(res: Response) -> Dict[str, Any]:
-            return cast(Dict[str, Any], res.json())
+            schema = cast(Dict[str, Any], res.json())
+            if cache is not None:
+                cache.put(self._name, schema)
+            return schema
 
         return executor.execute(
             response_callback=resp,
@@ -82,11 +97,12 @@ class _ConfigExecutor(Generic[ConnectionType]):
         def resp(res: Dict[str, Any]) -> Union[CollectionConfig, CollectionConfigSimple]:
             if simple:
                 return _collection_config_simple_from_json(res)
-            return _collection_config_from_json(res)
+            return _collection_config_lazy_from_json(res)
 
         return executor.execute(
             response_callback=resp,
             method=self.__get,
+            cached=True,
         )
 
     def update(
@@ -172,7 +188,7 @@ class _ConfigExecutor(Generic[ConnectionType]):
             schema = config.merge_with_existing(schema)
 
             def inner_resp(res: Response) -> None:
-                return None
+                self.__invalidate_schema()
 
             return executor.execute(
                 response_callback=inner_resp,
@@ -215,7 +231,7 @@ class _ConfigExecutor(Generic[ConnectionType]):
                     obj["moduleConfig"] = {configured_module: modconf}
 
             def inner_resp(res: Response) -> None:
-                return None
+                self.__invalidate_schema()
 
             return executor.execute(
                 response_callback=inner_resp,
@@ -1,9 +1,13 @@
 import asyncio
 import datetime
+import threading
+import time
 import uuid as uuid_package
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import (
     Any,
+    Callable,
     Dict,
     Generic,
     Optional,
@@ -25,10 +29,12 @@ from weaviate.collections.classes.batch import (
     BatchObjectReturn,
     BatchReferenceReturn,
     DeleteManyReturn,
+    ImportFileProgress,
+    ImportFileReturn,
 )
 from weaviate.collections.classes.config import ConsistencyLevel
-from weaviate.collections.classes.data import DataObject, DataReferences
-from weaviate.collections.classes.filters import _Filters
+from weaviate.collections.classes.data import DataObject, DataReferences, FileMapping
+from weaviate.collections.classes.filters import Filter, _Filters, _split_id_filter
 from weaviate.collections.classes.internal import (
     _Reference,
     ReferenceToMulti,
@@ -52,7 +58,16 @@ from weaviate.validator import _validate_input, _ValidateArgument
 
 from weaviate.collections.batch.grpc_batch_objects import _BatchGRPC
 from weaviate.collections.batch.grpc_batch_delete import _BatchDeleteGRPC
+from weaviate.collections.batch.sync_index import SyncIndex, _object_digest, _object_key
 from weaviate.collections.batch.rest import _BatchREST
+from weaviate.collections.data.files import (
+    FileFormat,
+    _Chunk,
+    _chunks,
+    _file_format,
+    _load_checkpoint,
+    _save_checkpoint,
+)
 from weaviate.exceptions import WeaviateInvalidInputError
 from weaviate.util import _ServerVersion
 
@@ -161,16 +176,33 @@ class _DataExecutor(Generic[ConnectionType]):
     def insert_many(
         self,
         objects: Sequence[Union[Properties, DataObject[Properties, Optional[ReferenceInputs]]]],
+        *,
+        batch_size: Optional[int] = 1000,
+        concurrent_requests: int = 2,
+        sync_index: Optional[SyncIndex] = None,
     ) -> executor.Result[BatchObjectReturn]:
         """Insert multiple objects into the collection.
 
+        Large inputs are split into several requests, by number of objects and by their encoded size so that no request
+        exceeds the maximum gRPC message size of Weaviate. The indexes in the returned object always refer to the position
+        of the object in `objects`.
+
         Arguments:
             `objects`
                 The objects to insert. This can be either a list of `Properties` or `DataObject[Properties, ReferenceInputs]`
                     If you didn't set `data_model` then `Properties` will be `Data[str, Any]` in which case you can insert simple dictionaries here.
                         If you want to insert references, vectors, or UUIDs alongside your properties, you will have to use `DataObject` instead.
+            `batch_size`
+                The maximum number of objects sent in one request. If `None`, the objects are only split by size. Default 1000.
+            `concurrent_requests`
+                The maximum number of requests that are sent at the same time. Default 2.
+            `sync_index`
+                A `SyncIndex` of the objects that were imported before. Objects that did not change since then are not
+                sent, they are reported as successful in the returned object nevertheless.
 
         Raises:
+            `weaviate.exceptions.WeaviateInvalidInputError`:
+                If `batch_size` or `concurrent_requests` is not a positive integer.
             `weaviate.exceptions.WeaviateGRPCBatchError`:
                 If any unexpected error occurs during the batch operation.
             `weaviate.exceptions.WeaviateInsertInvalidPropertyError`:
@@ -178,6 +210,19 @@ class _DataExecutor(Generic[ConnectionType]):
             `weaviate.exceptions.WeaviateInsertManyAllFailedError`:
                 If every object in the batch fails to be inserted. The exception message contains details about the failure.
         """
+        if self._validate_arguments:
+            _validate_input(
+                [
+                    _ValidateArgument(expected=[int, None], name="batch_size", value=batch_size),
+                    _ValidateArgument(
+                        expected=[int], name="concurrent_requests", value=concurrent_requests
+                    ),
+                ]
+            )
+        if (batch_size is not None and batch_size < 1) or concurrent_requests < 1:
+            raise WeaviateInvalidInputError(
+                f"batch_size and concurrent_requests have to be positive integers, got {batch_size} and {concurrent_requests}."
+            )
         objs = [
             (
                 _BatchObject(
@@ -203,6 +248,16 @@ class _DataExecutor(Generic[ConnectionType]):
             for idx, obj in enumerate(objects)
         ]
 
+        skipped: List[_BatchObject] = []
+        digests: Dict[int, bytes] = {}
+        if sync_index is not None:
+            digests = {obj.index: _object_digest(obj) for obj in objs}
+            unchanged = sync_index._unchanged(
+                [_object_key(obj) for obj in objs], [digests[obj.index] for obj in objs]
+            )
+            skipped = [obj for obj, skip in zip(objs, unchanged) if skip]
+            objs = [obj for obj, skip in zip(objs, unchanged) if not skip]
+
         def resp(res: BatchObjectReturn) -> BatchObjectReturn:
             if (n_obj_errs := len(res.errors)) > 0:
                 logger.error(
@@ -211,8 +266,24 @@ class _DataExecutor(Generic[ConnectionType]):
                         "errors": res.errors,
                     }
                 )
+            if sync_index is None:
+                return res
+
+            sync_index._record(
+                (_object_key(obj), digests[obj.index]) for obj in objs if obj.index in res.uuids
+            )
+            res.uuids.update({obj.index: uuid_package.UUID(obj.uuid) for obj in skipped})
+            res._all_responses = [
+                res.uuids[idx] if idx in res.uuids else res.errors[idx]
+                for idx in range(len(objects))
+            ]
             return res
 
+        if len(objs) == 0:
+            return executor.return_(
+                resp(BatchObjectReturn()),
+                "async" if isinstance(self._connection, ConnectionAsync) else "sync",
+            )
         return executor.execute(
             response_callback=resp,
             method=self.__batch_grpc.objects,
@@ -220,6 +291,8 @@ class _DataExecutor(Generic[ConnectionType]):
             objects=objs,
             timeout=self._connection.timeout_config.insert,
             max_retries=2,
+            batch_size=batch_size,
+            concurrent_requests=concurrent_requests,
         )
 
     def exists(self, uuid: UUID) -> executor.Result[bool]:
@@ -643,10 +716,24 @@ class _DataExecutor(Generic[ConnectionType]):
         )
 
     def delete_many(
-        self, where: _Filters, *, verbose: bool = False, dry_run: bool = False
+        self,
+        where: _Filters,
+        *,
+        verbose: bool = False,
+        dry_run: bool = False,
+        until_empty: bool = False,
+        chunk_size: int = 1000,
+        concurrent_requests: int = 2,
+        progress_callback: Optional[Callable[[DeleteManyReturn[None]], None]] = None,
     ) -> executor.Result[Union[DeleteManyReturn[List[DeleteManyObject]], DeleteManyReturn[None]]]:
         """Delete multiple objects from the collection based on a filter.
 
+        Weaviate deletes at most `QUERY_MAXIMUM_RESULTS` objects, 10000 by default, in one request. With `until_empty`,
+        the request is repeated until it does not delete any more objects.
+
+        A filter on a list of UUIDs, `Filter.by_id().contains_any(uuids)`, is split into chunks of `chunk_size` UUIDs,
+        which are deleted with up to `concurrent_requests` requests at the same time.
+
         Arguments:
             `where`
                 The filter to apply. This filter is the same that is used when performing queries and has the same syntax, REQUIRED.
@@ -654,14 +741,105 @@ class _DataExecutor(Generic[ConnectionType]):
                 Whether to return the deleted objects in the response.
             `dry_run`
                 Whether to perform a dry run. If set to `True`, the objects will not be deleted, but the response will contain the objects that would have been deleted.
+            `until_empty`
+                Whether to repeat the deletion until no more objects are deleted, to delete more objects than Weaviate
+                deletes in one request. Ignored for dry runs.
+            `chunk_size`
+                The maximum number of UUIDs in one request when deleting a list of UUIDs. Default 1000.
+            `concurrent_requests`
+                The maximum number of requests that are sent at the same time when deleting a list of UUIDs. Default 2.
+            `progress_callback`
+                A function that is called after every request with a `DeleteManyReturn` of the totals so far.
 
         Raises:
             `weaviate.WeaviateConnectionError`:
                 If the network connection to Weaviate fails.
+            `weaviate.exceptions.WeaviateInvalidInputError`:
+                If `chunk_size` or `concurrent_requests` is not a positive integer.
             `weaviate.UnexpectedStatusCodeError`:
                 If Weaviate reports a non-OK status.
         """
         _ValidateArgument(expected=[_Filters], name="where", value=where)
+        if self._validate_arguments:
+            _validate_input(
+                [
+                    _ValidateArgument(expected=[int], name="chunk_size", value=chunk_size),
+                    _ValidateArgument(
+                        expected=[int], name="concurrent_requests", value=concurrent_requests
+                    ),
+                ]
+            )
+        if chunk_size < 1 or concurrent_requests < 1:
+            raise WeaviateInvalidInputError(
+                f"chunk_size and concurrent_requests have to be positive integers, got {chunk_size} and {concurrent_requests}."
+            )
+        filters = _split_id_filter(where, chunk_size)
+        if len(filters) == 1 and not until_empty and progress_callback is None:
+            return self.__delete(where, verbose=verbose, dry_run=dry_run)
+
+        total: DeleteManyReturn[Any] = DeleteManyReturn(
+            failed=0, matches=0, objects=[] if verbose else None, successful=0
+        )
+
+        def add(res: DeleteManyReturn[Any]) -> bool:
+            """Add the result of a request to the totals and return whether the request has to be repeated."""
+            total.failed += res.failed
+            total.matches += res.matches
+            total.successful += res.successful
+            if total.objects is not None:
+                total.objects.extend(res.objects)
+            if progress_callback is not None:
+                progress_callback(
+                    DeleteManyReturn(
+                        failed=total.failed,
+                        matches=total.matches,
+                        objects=None,
+                        successful=total.successful,
+                    )
+                )
+            # objects that fail to be deleted match again, so only a request that deleted objects is repeated
+            return until_empty and not dry_run and res.successful > 0
+
+        if isinstance(self._connection, ConnectionAsync):
+
+            async def _execute() -> DeleteManyReturn[Any]:
+                semaphore = asyncio.Semaphore(concurrent_requests)
+
+                async def delete(filters: _Filters) -> None:
+                    async with semaphore:
+                        while add(
+                            await executor.aresult(
+                                self.__delete(filters, verbose=verbose, dry_run=dry_run)
+                            )
+                        ):
+                            pass
+
+                await asyncio.gather(*(delete(chunk) for chunk in filters))
+                return total
+
+            return _execute()
+
+        lock = threading.Lock()
+
+        def delete(filters: _Filters) -> None:
+            while True:
+                res = executor.result(self.__delete(filters, verbose=verbose, dry_run=dry_run))
+                with lock:
+                    if not add(res):
+                        return
+
+        if len(filters) == 1:
+            delete(filters[0])
+        else:
+            with ThreadPoolExecutor(
+                max_workers=concurrent_requests, thread_name_prefix="WeaviateDeleteMany"
+            ) as pool:
+                list(pool.map(delete, filters))
+        return total
+
+    def __delete(
+        self, where: _Filters, *, verbose: bool, dry_run: bool
+    ) -> executor.Result[DeleteManyReturn[Any]]:
         return self.__batch_delete.batch_delete(
             self._connection,
             name=self.name,
@@ -671,6 +849,188 @@ class _DataExecutor(Generic[ConnectionType]):
             tenant=self._tenant,
         )
 
+    def delete_vanished(
+        self, sync_index: SyncIndex, *, chunk_size: int = 1000
+    ) -> executor.Result[DeleteManyReturn[None]]:
+        """Delete the objects that were imported with a `SyncIndex` earlier but not in its current run.
+
+        The objects are deleted with `delete_many` in chunks of `chunk_size` UUIDs. Every chunk that is deleted without
+        failures is removed from the index right away, so that an interrupted call can simply be repeated.
+
+        Arguments:
+            `sync_index`
+                The index that the objects of this collection, and tenant if any, were imported with.
+            `chunk_size`
+                The maximum number of UUIDs in one `delete_many` filter. Default 1000.
+
+        Raises:
+            `weaviate.WeaviateConnectionError`:
+                If the network connection to Weaviate fails.
+            `weaviate.exceptions.WeaviateInvalidInputError`:
+                If `chunk_size` is not a positive integer.
+            `weaviate.UnexpectedStatusCodeError`:
+                If Weaviate reports a non-OK status.
+        """
+        if self._validate_arguments:
+            _validate_input(
+                [
+                    _ValidateArgument(expected=[SyncIndex], name="sync_index", value=sync_index),
+                    _ValidateArgument(expected=[int], name="chunk_size", value=chunk_size),
+                ]
+            )
+        if chunk_size < 1:
+            raise WeaviateInvalidInputError(f"chunk_size has to be positive, got {chunk_size}.")
+        uuids = sync_index._vanished(self.name, self._tenant)
+        chunks = [uuids[i : i + chunk_size] for i in range(0, len(uuids), chunk_size)]
+        total = DeleteManyReturn(failed=0, matches=0, objects=None, successful=0)
+
+        def add(chunk: List[str], res: DeleteManyReturn) -> None:
+            total.failed += res.failed
+            total.matches += res.matches
+            total.successful += res.successful
+            if res.failed == 0:
+                sync_index._forget(self.name, self._tenant, chunk)
+
+        if isinstance(self._connection, ConnectionAsync):
+
+            async def _execute() -> DeleteManyReturn[None]:
+                for chunk in chunks:
+                    add(
+                        chunk,
+                        await executor.aresult(
+                            self.delete_many(where=Filter.by_id().contains_any(chunk))
+                        ),
+                    )
+                return total
+
+            return _execute()
+        for chunk in chunks:
+            add(chunk, executor.result(self.delete_many(where=Filter.by_id().contains_any(chunk))))
+        return total
+
+    def import_file(
+        self,
+        path: str,
+        *,
+        format: Optional[FileFormat] = None,  # noqa: A002
+        mapping: Optional[FileMapping] = None,
+        chunk_size: int = 10_000,
+        batch_size: Optional[int] = 1000,
+        concurrent_requests: int = 2,
+        checkpoint: Optional[str] = None,
+        sync_index: Optional[SyncIndex] = None,
+        progress_callback: Optional[Callable[[ImportFileProgress], None]] = None,
+    ) -> executor.Result[ImportFileReturn]:
+        """Import the rows of a JSONL, CSV or Parquet file as objects into the collection.
+
+        The file is streamed in chunks of `chunk_size` rows, each chunk is inserted with `insert_many` while the next one
+        is read and decoded in the background. CSV and Parquet files are decoded with pyarrow, which is required for
+        Parquet files. Without pyarrow, all values of a CSV file are imported as strings.
+
+        If a `checkpoint` file is given, the number of imported rows is stored in it after every chunk. Calling the method
+        again with the same checkpoint resumes the import after the last finished chunk, which is also the case once
+        the whole file was imported. Objects that failed to be imported are reported in the returned object and not
+        imported again on resume.
+
+        Arguments:
+            `path`
+                The file to import.
+            `format`
+                The format of the file, one of `"jsonl"`, `"csv"` or `"parquet"`. If not provided, it is derived from the
+                extension of the file.
+            `mapping`
+                A `FileMapping` of the columns of the file to the properties, UUIDs and vectors of the objects. If not
+                provided, every column is imported as a property of the same name.
+            `chunk_size`
+                The number of rows that are read and inserted at once. Default 10000.
+            `batch_size`
+                The maximum number of objects sent in one request, see `insert_many`. Default 1000.
+            `concurrent_requests`
+                The maximum number of requests that are sent at the same time, see `insert_many`. Default 2.
+            `checkpoint`
+                A file to store the progress of the import in, to resume it if it is interrupted.
+            `sync_index`
+                A `SyncIndex` to skip the objects that did not change since they were imported before, see `insert_many`.
+            `progress_callback`
+                A function that is called with an `ImportFileProgress` after every chunk.
+
+        Raises:
+            `weaviate.exceptions.WeaviateInvalidInputError`:
+                If the format is not supported, `chunk_size` is not positive or the checkpoint belongs to another file or
+                to an older version of it.
+            `weaviate.exceptions.WeaviateOptionalDependencyNotInstalledError`:
+                If a Parquet file is imported and pyarrow is not installed.
+            `weaviate.exceptions.WeaviateInsertManyAllFailedError`:
+                If every object of a chunk fails to be inserted. The checkpoint still points to the end of the last
+                finished chunk.
+        """
+        if self._validate_arguments:
+            _validate_input(
+                [
+                    _ValidateArgument(expected=[str], name="path", value=path),
+                    _ValidateArgument(expected=[FileMapping, None], name="mapping", value=mapping),
+                    _ValidateArgument(expected=[int], name="chunk_size", value=chunk_size),
+                    _ValidateArgument(expected=[str, None], name="checkpoint", value=checkpoint),
+                ]
+            )
+        if chunk_size < 1:
+            raise WeaviateInvalidInputError(f"chunk_size has to be positive, got {chunk_size}.")
+        file_format = _file_format(path, format)
+        skipped = _load_checkpoint(checkpoint, path) if checkpoint is not None else 0
+        chunks = _chunks(path, file_format, mapping or FileMapping(), chunk_size, skipped)
+        total = ImportFileReturn(rows=skipped, skipped_rows=skipped)
+        start = time.time()
+
+        def insert(chunk: _Chunk) -> executor.Result[BatchObjectReturn]:
+            return self.insert_many(
+                chunk.objects,  # type: ignore
+                batch_size=batch_size,
+                concurrent_requests=concurrent_requests,
+                sync_index=sync_index,
+            )
+
+        def add(chunk: _Chunk, res: BatchObjectReturn) -> None:
+            total.rows = chunk.start + len(chunk.objects)
+            total.objects_imported += len(res.uuids)
+            total.objects_failed += len(res.errors)
+            total.errors.update({chunk.start + idx: err for idx, err in res.errors.items()})
+            total.has_errors = total.has_errors or res.has_errors
+            total.elapsed_seconds = time.time() - start
+            if checkpoint is not None:
+                _save_checkpoint(checkpoint, path, total.rows)
+            if progress_callback is not None:
+                progress_callback(
+                    ImportFileProgress(
+                        rows=total.rows,
+                        objects_imported=total.objects_imported,
+                        objects_failed=total.objects_failed,
+                        objects_per_second=(
+                            total.objects_imported / total.elapsed_seconds
+                            if total.elapsed_seconds > 0
+                            else 0.0
+                        ),
+                        elapsed_seconds=total.elapsed_seconds,
+                    )
+                )
+
+        if isinstance(self._connection, ConnectionAsync):
+
+            async def _execute() -> ImportFileReturn:
+                loop = asyncio.get_running_loop()
+                pending = loop.run_in_executor(None, next, chunks, None)
+                while (chunk := await pending) is not None:
+                    pending = loop.run_in_executor(None, next, chunks, None)
+                    add(chunk, await executor.aresult(insert(chunk)))
+                return total
+
+            return _execute()
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="WeaviateImportFile") as pool:
+            pending = pool.submit(next, chunks, None)
+            while (chunk := pending.result()) is not None:
+                pending = pool.submit(next, chunks, None)
+                add(chunk, executor.result(insert(chunk)))
+        return total
+
     def __apply_context(self, params: Dict[str, Any]) -> Dict[str, Any]:
 
         if self._tenant is not None:
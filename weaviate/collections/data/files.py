@@ -0,0 +1,246 @@
+"""Streaming readers of the files that `import_file` imports.
+
+JSONL files are read line by line with the standard library. CSV files are decoded with `pyarrow.csv` in background
+threads if pyarrow is installed and with the `csv` module otherwise, which reads all values as strings. Parquet files
+require pyarrow, their row groups are decoded in parallel and the row groups before a checkpoint are not read at all.
+
+The record batches that pyarrow decodes stay columnar until the objects of a chunk are created: every column of a chunk
+is converted to Python values at once and fixed size float vectors are taken from the values buffer of their column.
+"""
+
+import csv
+import importlib
+import itertools
+import json
+import os
+import uuid as uuid_package
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Literal, Optional
+
+from weaviate.collections.classes.data import DataObject, FileMapping
+from weaviate.collections.queries.tables import _import
+from weaviate.exceptions import WeaviateInvalidInputError
+
+FileFormat = Literal["jsonl", "csv", "parquet"]
+
+_EXTENSIONS: Dict[str, FileFormat] = {
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+    ".csv": "csv",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+}
+
+_Row = Dict[str, Any]
+
+
+@dataclass
+class _Chunk:
+    start: int
+    """The number of the first row of the chunk in the file."""
+    objects: List[DataObject[Dict[str, Any], None]]
+
+
+def _file_format(path: str, format: Optional[FileFormat]) -> FileFormat:  # noqa: A002
+    if format is not None:
+        if format not in ("jsonl", "csv", "parquet"):
+            raise WeaviateInvalidInputError(
+                f"format has to be one of 'jsonl', 'csv' or 'parquet', got {format!r}."
+            )
+        return format
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in _EXTENSIONS:
+        raise WeaviateInvalidInputError(
+            f"The format of {path} cannot be derived from its extension, please pass it as format."
+        )
+    return _EXTENSIONS[extension]
+
+
+def _jsonl_rows(path: str, skip: int) -> Iterator[_Row]:
+    with open(path, "rb") as f:
+        lines = (line for line in f if not line.isspace())
+        # the skipped lines are not decoded
+        for line in itertools.islice(lines, skip, None):
+            yield json.loads(line)
+
+
+def _csv_rows(path: str, skip: int) -> Iterator[_Row]:
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in itertools.islice(csv.DictReader(f), skip, None):
+            yield {name: value for name, value in row.items() if value != ""}
+
+
+def _skip_batches(batches: Iterable[Any], skip: int) -> Iterator[Any]:
+    """Drop the first `skip` rows of a stream of Arrow record batches."""
+    for batch in batches:
+        if skip >= batch.num_rows:
+            skip -= batch.num_rows
+            continue
+        yield batch.slice(skip) if skip > 0 else batch
+        skip = 0
+
+
+def _parquet_batches(path: str, chunk_size: int, skip: int) -> Iterator[Any]:
+    pq = _import("pyarrow.parquet", "import_file of Parquet files")
+    file = pq.ParquetFile(path)
+    row_groups: List[int] = []
+    for idx in range(file.num_row_groups):
+        num_rows = file.metadata.row_group(idx).num_rows
+        if len(row_groups) == 0 and num_rows <= skip:
+            skip -= num_rows
+        else:
+            row_groups.append(idx)
+    if len(row_groups) == 0:
+        return
+    yield from _skip_batches(file.iter_batches(batch_size=chunk_size, row_groups=row_groups), skip)
+
+
+def _to_object(row: _Row, mapping: FileMapping) -> DataObject[Dict[str, Any], None]:
+    if mapping.properties is None:
+        properties = {
+            name: value
+            for name, value in row.items()
+            if value is not None and name != mapping.uuid and name != mapping.vector
+        }
+    else:
+        properties = {
+            prop: row[column]
+            for column, prop in mapping.properties.items()
+            if row.get(column) is not None
+        }
+    uuid = row.get(mapping.uuid) if mapping.uuid is not None else None
+    if isinstance(uuid, bytes):
+        uuid = uuid_package.UUID(bytes=uuid)
+    vector = row.get(mapping.vector) if mapping.vector is not None else None
+    if isinstance(vector, str):
+        vector = json.loads(vector)
+    return DataObject(properties=properties, uuid=uuid, vector=vector)
+
+
+def _arrow_uuids(column: Any) -> List[Any]:
+    return [
+        uuid_package.UUID(bytes=uuid) if isinstance(uuid, bytes) else uuid
+        for uuid in column.to_pylist()
+    ]
+
+
+def _arrow_vectors(pa: Any, column: Any) -> List[Any]:
+    column = column.combine_chunks()
+    if (
+        pa.types.is_fixed_size_list(column.type)
+        and pa.types.is_floating(column.type.value_type)
+        and column.null_count == 0
+    ):
+        # one row of the matrix per object, without creating a Python float per value
+        return list(
+            column.flatten()
+            .to_numpy(zero_copy_only=False)
+            .reshape(len(column), column.type.list_size)
+        )
+    return [
+        json.loads(vector) if isinstance(vector, str) else vector for vector in column.to_pylist()
+    ]
+
+
+def _arrow_objects(
+    pa: Any, table: Any, mapping: FileMapping
+) -> List[DataObject[Dict[str, Any], None]]:
+    names = table.column_names
+    if mapping.properties is None:
+        columns = {name: name for name in names if name != mapping.uuid and name != mapping.vector}
+    else:
+        columns = {column: prop for column, prop in mapping.properties.items() if column in names}
+    values = [(prop, table.column(column).to_pylist()) for column, prop in columns.items()]
+    rows = table.num_rows
+    uuids = (
+        _arrow_uuids(table.column(mapping.uuid))
+        if mapping.uuid is not None and mapping.uuid in names
+        else itertools.repeat(None, rows)
+    )
+    vectors = (
+        _arrow_vectors(pa, table.column(mapping.vector))
+        if mapping.vector is not None and mapping.vector in names
+        else itertools.repeat(None, rows)
+    )
+    return [
+        DataObject(
+            properties={prop: column[row] for prop, column in values if column[row] is not None},
+            uuid=uuid,
+            vector=vector,
+        )
+        for row, uuid, vector in zip(range(rows), uuids, vectors)
+    ]
+
+
+def _arrow_chunks(
+    batches: Iterator[Any], mapping: FileMapping, chunk_size: int, start: int
+) -> Iterator[_Chunk]:
+    """Regroup Arrow record batches into chunks of `chunk_size` rows and create their objects column by column."""
+    pa = _import("pyarrow", "import_file")
+    pending: List[Any] = []
+    pending_rows = 0
+    for batch in batches:
+        pending.append(batch)
+        pending_rows += batch.num_rows
+        while pending_rows >= chunk_size:
+            table = pa.Table.from_batches(pending)
+            yield _Chunk(start, _arrow_objects(pa, table.slice(0, chunk_size), mapping))
+            start += chunk_size
+            rest = table.slice(chunk_size)
+            pending = rest.to_batches()
+            pending_rows = rest.num_rows
+    if pending_rows > 0:
+        yield _Chunk(start, _arrow_objects(pa, pa.Table.from_batches(pending), mapping))
+
+
+def _row_chunks(
+    rows: Iterator[_Row], mapping: FileMapping, chunk_size: int, start: int
+) -> Iterator[_Chunk]:
+    while len(batch := list(itertools.islice(rows, chunk_size))) > 0:
+        yield _Chunk(start, [_to_object(row, mapping) for row in batch])
+        start += len(batch)
+
+
+def _chunks(
+    path: str, format: FileFormat, mapping: FileMapping, chunk_size: int, skip: int  # noqa: A002
+) -> Iterator[_Chunk]:
+    """Read the rows of a file after the first `skip` rows and map them to objects, `chunk_size` rows at a time."""
+    if format == "jsonl":
+        yield from _row_chunks(_jsonl_rows(path, skip), mapping, chunk_size, skip)
+    elif format == "parquet":
+        yield from _arrow_chunks(
+            _parquet_batches(path, chunk_size, skip), mapping, chunk_size, skip
+        )
+    else:
+        try:
+            pa_csv = importlib.import_module("pyarrow.csv")
+        except ImportError:
+            yield from _row_chunks(_csv_rows(path, skip), mapping, chunk_size, skip)
+            return
+        # the file is only opened once the first chunk is requested, which happens in a background thread
+        batches = _skip_batches(pa_csv.open_csv(path), skip)
+        yield from _arrow_chunks(batches, mapping, chunk_size, skip)
+
+
+def _load_checkpoint(checkpoint: str, path: str) -> int:
+    """Return the number of rows of the file that were imported before, 0 if there is no checkpoint yet."""
+    try:
+        with open(checkpoint) as f:
+            state = json.load(f)
+    except FileNotFoundError:
+        return 0
+    if state.get("file") != os.path.abspath(path) or state.get("size") != os.path.getsize(path):
+        raise WeaviateInvalidInputError(
+            f"The checkpoint {checkpoint} belongs to another file or {path} changed since, delete the checkpoint to "
+            "import the file from the start."
+        )
+    rows: int = state["rows"]
+    return rows
+
+
+def _save_checkpoint(checkpoint: str, path: str, rows: int) -> None:
+    state = {"file": os.path.abspath(path), "size": os.path.getsize(path), "rows": rows}
+    # the checkpoint is replaced atomically, so that it is never lost if the import is interrupted
+    with open(checkpoint + ".tmp", "w") as f:
+        json.dump(state, f)
+    os.replace(checkpoint + ".tmp", checkpoint)
@@ -1,5 +1,6 @@
 import uuid as uuid_package
 from typing import (
+    Callable,
     Optional,
     List,
     Literal,
@@ -10,14 +11,18 @@ from typing import (
     overload,
 )
 
+from weaviate.collections.batch.sync_index import SyncIndex
 from weaviate.collections.classes.batch import (
     DeleteManyObject,
     BatchObjectReturn,
     BatchReferenceReturn,
     DeleteManyReturn,
+    ImportFileProgress,
+    ImportFileReturn,
 )
-from weaviate.collections.classes.data import DataObject, DataReferences
+from weaviate.collections.classes.data import DataObject, DataReferences, FileMapping
 from weaviate.collections.classes.filters import _Filters
+from weaviate.collections.data.files import FileFormat
 from weaviate.collections.classes.internal import (
     SingleReferenceInput,
     ReferenceInput,
@@ -43,6 +48,10 @@ class _DataCollection(Generic[Properties], _DataExecutor[ConnectionSync]):
     def insert_many(
         self,
         objects: Sequence[Union[Properties, DataObject[Properties, Optional[ReferenceInputs]]]],
+        *,
+        batch_size: Optional[int] = 1000,
+        concurrent_requests: int = 2,
+        sync_index: Optional[SyncIndex] = None,
     ) -> BatchObjectReturn: ...
     def replace(
         self,
@@ -72,13 +81,53 @@ class _DataCollection(Generic[Properties], _DataExecutor[ConnectionSync]):
     def delete_by_id(self, uuid: UUID) -> bool: ...
     @overload
     def delete_many(
-        self, where: _Filters, *, verbose: Literal[False] = False, dry_run: bool = False
+        self,
+        where: _Filters,
+        *,
+        verbose: Literal[False] = False,
+        dry_run: bool = False,
+        until_empty: bool = False,
+        chunk_size: int = 1000,
+        concurrent_requests: int = 2,
+        progress_callback: Optional[Callable[[DeleteManyReturn[None]], None]] = None,
     ) -> DeleteManyReturn[None]: ...
     @overload
     def delete_many(
-        self, where: _Filters, *, verbose: Literal[True], dry_run: bool = False
+        self,
+        where: _Filters,
+        *,
+        verbose: Literal[True],
+        dry_run: bool = False,
+        until_empty: bool = False,
+        chunk_size: int = 1000,
+        concurrent_requests: int = 2,
+        progress_callback: Optional[Callable[[DeleteManyReturn[None]], None]] = None,
     ) -> DeleteManyReturn[List[DeleteManyObject]]: ...
     @overload
     def delete_many(
-        self, where: _Filters, *, verbose: bool = False, dry_run: bool = False
+        self,
+        where: _Filters,
+        *,
+        verbose: bool = False,
+        dry_run: bool = False,
+        until_empty: bool = False,
+        chunk_size: int = 1000,
+        concurrent_requests: int = 2,
+        progress_callback: Optional[Callable[[DeleteManyReturn[None]], None]] = None,
     ) -> Union[DeleteManyReturn[List[DeleteManyObject]], DeleteManyReturn[None]]: ...
+    def delete_vanished(
+        self, sync_index: SyncIndex, *, chunk_size: int = 1000
+    ) -> DeleteManyReturn[None]: ...
+    def import_file(
+        self,
+        path: str,
+        *,
+        format: Optional[FileFormat] = None,
+        mapping: Optional[FileMapping] = None,
+        chunk_size: int = 10_000,
+        batch_size: Optional[int] = 1000,
+        concurrent_requests: int = 2,
+        checkpoint: Optional[str] = None,
+        sync_index: Optional[SyncIndex] = None,
+        progress_callback: Optional[Callable[[ImportFileProgress], None]] = None,
+    ) -> ImportFileReturn: ...
@@ -1,5 +1,7 @@
+import threading
 import uuid as uuid_lib
-from typing import Any, Dict, List, Literal, Optional, cast, overload
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Literal, Optional, cast, overload
 
 from weaviate.collections.classes.filters import (
     _CountRef,
@@ -18,8 +20,15 @@ from weaviate.proto.v1 import base_pb2
 from weaviate.types import TIME
 from weaviate.util import _datetime_to_string
 
+_FILTER_CACHE_SIZE = 256
+
 
 class _FilterToGRPC:
+    # the most recently converted filters by their structural key, so that filters used in many requests, e.g.
+    # tenant-scoped ACL filters or long contains_any lists, are only converted once
+    __cache: "OrderedDict[Hashable, base_pb2.Filters]" = OrderedDict()
+    __lock = threading.Lock()
+
     @overload
     @staticmethod
     def convert(weav_filter: Literal[None]) -> None: ...
@@ -30,9 +39,33 @@ class _FilterToGRPC:
 
     @staticmethod
     def convert(weav_filter: Optional[_Filters]) -> Optional[base_pb2.Filters]:
+        """Convert a filter to its gRPC message.
+
+        The returned message is shared between all conversions of structurally equal filters and must not be modified.
+        """
         if weav_filter is None:
             return None
-        elif isinstance(weav_filter, _FilterValue):
+
+        key = weav_filter._key()
+        try:
+            with _FilterToGRPC.__lock:
+                compiled = _FilterToGRPC.__cache.get(key)
+                if compiled is not None:
+                    _FilterToGRPC.__cache.move_to_end(key)
+                    return compiled
+        except TypeError:  # a value that cannot be hashed, e.g. a list inside a list
+            return _FilterToGRPC.__convert(weav_filter)
+
+        compiled = _FilterToGRPC.__convert(weav_filter)
+        with _FilterToGRPC.__lock:
+            _FilterToGRPC.__cache[key] = compiled
+            if len(_FilterToGRPC.__cache) > _FILTER_CACHE_SIZE:
+                _FilterToGRPC.__cache.popitem(last=False)
+        return compiled
+
+    @staticmethod
+    def __convert(weav_filter: _Filters) -> base_pb2.Filters:
+        if isinstance(weav_filter, _FilterValue):
             return _FilterToGRPC.__value_filter(weav_filter)
         else:
             return _FilterToGRPC.__and_or_filter(weav_filter)
@@ -142,14 +175,12 @@ class _FilterToGRPC:
         return base_pb2.IntArray(values=cast(List[int], value))
 
     @staticmethod
-    def __and_or_filter(weav_filter: _Filters) -> Optional[base_pb2.Filters]:
+    def __and_or_filter(weav_filter: _Filters) -> base_pb2.Filters:
         assert isinstance(weav_filter, _FilterAnd) or isinstance(weav_filter, _FilterOr)
         return base_pb2.Filters(
             operator=weav_filter.operator._to_grpc(),
             filters=[
-                filter_
-                for single_filter in weav_filter.filters
-                if (filter_ := _FilterToGRPC.convert(single_filter)) is not None
+                _FilterToGRPC.__convert(single_filter) for single_filter in weav_filter.filters
             ],
         )
 
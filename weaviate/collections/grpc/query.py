@@ -1,4 +1,5 @@
 import uuid as uuid_lib
+from collections import abc
 from dataclasses import dataclass
 from typing import (
     Dict,
@@ -39,11 +40,11 @@ from weaviate.collections.classes.internal import (
     _GroupBy,
 )
 from weaviate.collections.filters import _FilterToGRPC
-from weaviate.collections.grpc.shared import _BaseGRPC
+from weaviate.collections.grpc.shared import _BaseGRPC, _validate_near_options
 from weaviate.proto.v1 import base_search_pb2, search_get_pb2
 from weaviate.types import NUMBER, UUID
 from weaviate.util import _ServerVersion
-from weaviate.validator import _ValidateArgument, _validate_input
+from weaviate.validator import _ArgumentValidator, _ValidateArgument, _validate_input
 
 # Can be found in the google.protobuf.internal.well_known_types.pyi stub file but is defined explicitly here for clarity.
 _PyValue: TypeAlias = Union[
@@ -70,6 +71,24 @@ class _Move:
 
 A = TypeVar("A")
 
+_validate_request_arguments = _ArgumentValidator(
+    [
+        ([int, None], "limit"),
+        ([int, None], "offset"),
+        ([uuid_lib.UUID, str, None], "after"),
+        ([_Filters, None], "filters"),
+        ([_MetadataQuery, None], "metadata"),
+        ([_Generative, None], "generative"),
+        ([Rerank, None], "rerank"),
+        ([int, None], "autocut"),
+        ([_GroupBy, None], "group_by"),
+        ([str, bool, QueryNested, Sequence, None], "return_properties"),
+        ([_QueryReference, Sequence, None], "return_references"),
+    ]
+)
+_validate_return_property = _ArgumentValidator([([str, QueryNested], "return_properties")])
+_validate_return_reference = _ArgumentValidator([([_QueryReference], "return_references")])
+
 
 class _QueryGRPC(_BaseGRPC):
     def __init__(
@@ -95,12 +114,7 @@ class _QueryGRPC(_BaseGRPC):
         distance: Optional[NUMBER] = None,
     ) -> Tuple[Optional[float], Optional[float]]:
         if self._validate_arguments:
-            _validate_input(
-                [
-                    _ValidateArgument([float, int, None], "certainty", certainty),
-                    _ValidateArgument([float, int, None], "distance", distance),
-                ]
-            )
+            _validate_near_options(certainty, distance)
         return (
             float(certainty) if certainty is not None else None,
             float(distance) if distance is not None else None,
@@ -377,6 +391,28 @@ class _QueryGRPC(_BaseGRPC):
             ),
         )
 
+    def prepare(
+        self,
+        *,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        autocut: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        return_metadata: Optional[_MetadataQuery] = None,
+        return_properties: Union[PROPERTIES, bool, None] = None,
+        return_references: Optional[REFERENCES] = None,
+    ) -> search_get_pb2.SearchRequest:
+        """Build a request without a search operator, to which the search of a prepared query is added per call."""
+        return self.__create_request(
+            limit=limit,
+            offset=offset,
+            autocut=autocut,
+            filters=filters,
+            metadata=return_metadata,
+            return_properties=return_properties,
+            return_references=return_references,
+        )
+
     def __create_request(
         self,
         limit: Optional[int] = None,
@@ -404,42 +440,26 @@ class _QueryGRPC(_BaseGRPC):
         near_video: Optional[base_search_pb2.NearVideoSearch] = None,
     ) -> search_get_pb2.SearchRequest:
         if self._validate_arguments:
-            _validate_input(
-                [
-                    _ValidateArgument([int, None], "limit", limit),
-                    _ValidateArgument([int, None], "offset", offset),
-                    _ValidateArgument([uuid_lib.UUID, str, None], "after", after),
-                    _ValidateArgument([_Filters, None], "filters", filters),
-                    _ValidateArgument([_MetadataQuery, None], "metadata", metadata),
-                    _ValidateArgument([_Generative, None], "generative", generative),
-                    _ValidateArgument([Rerank, None], "rerank", rerank),
-                    _ValidateArgument([int, None], "autocut", autocut),
-                    _ValidateArgument([_GroupBy, None], "group_by", group_by),
-                    _ValidateArgument(
-                        [str, bool, QueryNested, Sequence, None],
-                        "return_properties",
-                        return_properties,
-                    ),
-                    _ValidateArgument(
-                        [_QueryReference, Sequence, None], "return_references", return_references
-                    ),
-                ]
+            _validate_request_arguments(
+                limit,
+                offset,
+                after,
+                filters,
+                metadata,
+                generative,
+                rerank,
+                autocut,
+                group_by,
+                return_properties,
+                return_references,
             )
-            if isinstance(return_properties, Sequence):
+            if isinstance(return_properties, abc.Sequence):
                 for prop in return_properties:
-                    _validate_input(
-                        _ValidateArgument(
-                            expected=[str, QueryNested], name="return_properties", value=prop
-                        )
-                    )
+                    _validate_return_property(prop)
 
-            if isinstance(return_references, Sequence):
+            if isinstance(return_references, abc.Sequence):
                 for ref in return_references:
-                    _validate_input(
-                        _ValidateArgument(
-                            expected=[_QueryReference], name="return_references", value=ref
-                        )
-                    )
+                    _validate_return_reference(ref)
 
         if return_references is not None:
             return_references_parsed: Optional[Set[REFERENCE]] = self.__convert_to_set(
@@ -36,11 +36,37 @@ from weaviate.exceptions import (
 from weaviate.proto.v1 import base_search_pb2, base_pb2
 from weaviate.types import NUMBER, UUID
 from weaviate.util import _get_vector_v4, _ServerVersion
-from weaviate.validator import _is_valid, _ValidateArgument, _validate_input, _ExtraTypes
+from weaviate.validator import (
+    _ArgumentValidator,
+    _compile_expected,
+    _ValidateArgument,
+    _validate_input,
+    _ExtraTypes,
+)
 
 UINT32_LEN = 4
 UINT64_LEN = 8
 
+_validate_near_options = _ArgumentValidator(
+    [([float, int, None], "certainty"), ([float, int, None], "distance")]
+)
+_validate_near_vector_arguments = _ArgumentValidator(
+    [
+        (
+            [
+                List,
+                Dict,
+                _ExtraTypes.PANDAS,
+                _ExtraTypes.POLARS,
+                _ExtraTypes.NUMPY,
+                _ExtraTypes.TF,
+            ],
+            "near_vector",
+        ),
+        ([str, None, List, _MultiTargetVectorJoin], "target_vector"),
+    ]
+)
+
 
 class _BaseGRPC:
     def __init__(
@@ -292,12 +318,7 @@ class _BaseGRPC:
         distance: Optional[NUMBER] = None,
     ) -> Tuple[Optional[float], Optional[float]]:
         if self._validate_arguments:
-            _validate_input(
-                [
-                    _ValidateArgument([float, int, None], "certainty", certainty),
-                    _ValidateArgument([float, int, None], "distance", distance),
-                ]
-            )
+            _validate_near_options(certainty, distance)
         return (
             float(certainty) if certainty is not None else None,
             float(distance) if distance is not None else None,
@@ -311,25 +332,7 @@ class _BaseGRPC:
         target_vector: Optional[TargetVectorJoinType],
     ) -> base_search_pb2.NearVector:
         if self._validate_arguments:
-            _validate_input(
-                [
-                    _ValidateArgument(
-                        [
-                            List,
-                            Dict,
-                            _ExtraTypes.PANDAS,
-                            _ExtraTypes.POLARS,
-                            _ExtraTypes.NUMPY,
-                            _ExtraTypes.TF,
-                        ],
-                        "near_vector",
-                        near_vector,
-                    ),
-                    _ValidateArgument(
-                        [str, None, List, _MultiTargetVectorJoin], "target_vector", target_vector
-                    ),
-                ]
-            )
+            _validate_near_vector_arguments(near_vector, target_vector)
 
         certainty, distance = self._parse_near_options(certainty, distance)
 
@@ -788,13 +791,9 @@ def __is_list_type(inputs: Any) -> bool:
     except TypeError:
         return False
 
-    return any(
-        _is_valid(types, inputs)
-        for types in [
-            List,
-            _ExtraTypes.TF,
-            _ExtraTypes.PANDAS,
-            _ExtraTypes.NUMPY,
-            _ExtraTypes.POLARS,
-        ]
-    )
+    return __is_list_or_array(inputs)
+
+
+__is_list_or_array = _compile_expected(
+    [List, _ExtraTypes.TF, _ExtraTypes.PANDAS, _ExtraTypes.NUMPY, _ExtraTypes.POLARS]
+)
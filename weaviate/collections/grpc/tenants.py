@@ -21,7 +21,8 @@ class _TenantsGRPC(_BaseGRPC):
             names=tenants_pb2.TenantNames(values=names) if names is not None else None,
         )
 
-    def map_activity_status(self, status: tenants_pb2.TenantActivityStatus) -> TenantActivityStatus:
+    @staticmethod
+    def map_activity_status(status: tenants_pb2.TenantActivityStatus) -> TenantActivityStatus:
         if (
             status == tenants_pb2.TENANT_ACTIVITY_STATUS_COLD
             or status == tenants_pb2.TENANT_ACTIVITY_STATUS_INACTIVE
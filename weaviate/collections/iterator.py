@@ -11,6 +11,7 @@ from weaviate.collections.classes.internal import (
     Object,
 )
 from weaviate.collections.queries.fetch_objects import _FetchObjectsQuery, _FetchObjectsQueryAsync
+from weaviate.collections.queries.tables import QueryTable, ReturnFormat, _last_uuid
 from weaviate.types import UUID as UUIDorStr
 
 
@@ -122,3 +123,79 @@ class _ObjectAIterator(
             self.__iter_object_last_uuid is not None
         )  # if this is None the iterator will never stop
         return ret_object  # pyright: ignore
+
+
+class _TableIterator(Iterable[QueryTable]):
+    """Iterates over the objects in a collection one page of `cache_size` objects at a time, each page being a table of
+    the requested `return_format`."""
+
+    def __init__(
+        self,
+        query: _FetchObjectsQuery[Any, Any],
+        inputs: _IteratorInputs[Any, Any],
+        return_format: ReturnFormat,
+        cache_size: Optional[int] = None,
+    ) -> None:
+        self.__query = query
+        self.__inputs = inputs
+        self.__return_format: ReturnFormat = return_format
+
+        self.__iter_last_uuid: Optional[UUID] = _parse_after(self.__inputs.after)
+        self.__iter_cache_size = cache_size or ITERATOR_CACHE_SIZE
+
+    def __iter__(self) -> Iterator[QueryTable]:
+        self.__iter_last_uuid = _parse_after(self.__inputs.after)
+        return self
+
+    def __next__(self) -> QueryTable:
+        table = self.__query.fetch_objects(
+            limit=self.__iter_cache_size,
+            after=self.__iter_last_uuid,
+            include_vector=self.__inputs.include_vector,
+            return_metadata=self.__inputs.return_metadata,
+            return_properties=self.__inputs.return_properties,
+            return_format=self.__return_format,
+        )
+        last_uuid = _last_uuid(table, self.__return_format)
+        if last_uuid is None:
+            raise StopIteration
+        self.__iter_last_uuid = UUID(bytes=last_uuid)
+        return table
+
+
+class _TableAIterator(AsyncIterable[QueryTable]):
+    """Iterates over the objects in a collection one page of `cache_size` objects at a time, each page being a table of
+    the requested `return_format`."""
+
+    def __init__(
+        self,
+        query: _FetchObjectsQueryAsync[Any, Any],
+        inputs: _IteratorInputs[Any, Any],
+        return_format: ReturnFormat,
+        cache_size: Optional[int] = None,
+    ) -> None:
+        self.__query = query
+        self.__inputs = inputs
+        self.__return_format: ReturnFormat = return_format
+
+        self.__iter_last_uuid: Optional[UUID] = _parse_after(self.__inputs.after)
+        self.__iter_cache_size = cache_size or ITERATOR_CACHE_SIZE
+
+    def __aiter__(self) -> AsyncIterator[QueryTable]:
+        self.__iter_last_uuid = _parse_after(self.__inputs.after)
+        return self
+
+    async def __anext__(self) -> QueryTable:
+        table = await self.__query.fetch_objects(
+            limit=self.__iter_cache_size,
+            after=self.__iter_last_uuid,
+            include_vector=self.__inputs.include_vector,
+            return_metadata=self.__inputs.return_metadata,
+            return_properties=self.__inputs.return_properties,
+            return_format=self.__return_format,
+        )
+        last_uuid = _last_uuid(table, self.__return_format)
+        if last_uuid is None:
+            raise StopAsyncIteration
+        self.__iter_last_uuid = UUID(bytes=last_uuid)
+        return table
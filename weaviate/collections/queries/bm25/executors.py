@@ -16,6 +16,7 @@ from weaviate.collections.classes.internal import (
 )
 from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
 from weaviate.collections.queries.executor import _BaseExecutor
+from weaviate.collections.queries.tables import ReturnFormat, _validate_return_format
 from weaviate.connect import executor
 from weaviate.connect.v4 import ConnectionType
 from weaviate.exceptions import WeaviateUnsupportedFeatureError
@@ -145,7 +146,9 @@ class _BM25GenerateExecutor(
             ),
         )
         return executor.execute(
-            response_callback=resp, method=self._connection.grpc_search, request=request
+            response_callback=self._offloaded(resp),
+            method=self._connection.grpc_search,
+            request=request,
         )
 
 
@@ -167,6 +170,7 @@ class _BM25QueryExecutor(
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None,
+        return_format: Optional[ReturnFormat] = None,
     ) -> executor.Result[QuerySearchReturnType[Properties, References, TProperties, TReferences]]:
         """Search for objects in this collection using the keyword-based BM25 algorithm.
 
@@ -195,6 +199,10 @@ class _BM25QueryExecutor(
                 The metadata to return for each object, defaults to `None`.
             `return_properties`
                 The properties to return for each object.
+            `return_format`
+                The format to return the results in instead of objects, one of `"arrow"`, `"pandas"` or `"polars"`. The results are
+                decoded straight into the columns of a `pyarrow.Table`, `pandas.DataFrame` or `polars.DataFrame`, which requires the
+                corresponding library to be installed.
 
         NOTE:
             If `return_properties` is not provided then all non-reference properties are returned including nested properties.
@@ -219,21 +227,24 @@ class _BM25QueryExecutor(
         def resp(
             res: SearchReply,
         ) -> QuerySearchReturnType[Properties, References, TProperties, TReferences]:
-            return cast(
-                Any,
-                self._result_to_query_or_groupby_return(
-                    res,
-                    _QueryOptions.from_input(
-                        return_metadata,
-                        return_properties,
-                        include_vector,
-                        self._references,
-                        return_references,
-                        rerank,
-                        group_by,
-                    ),
-                ),
+            options = _QueryOptions.from_input(
+                return_metadata,
+                return_properties,
+                include_vector,
+                self._references,
+                return_references,
+                rerank,
+                group_by,
             )
+            if return_format is not None:
+                return cast(Any, self._result_to_table(res, options, return_format))
+            return cast(Any, self._result_to_query_or_groupby_return(res, options))
+
+        _validate_return_format(
+            return_format,
+            group_by=group_by,
+            references=return_references if return_references is not None else self._references,
+        )
 
         request = self._query.bm25(
             query=query,
@@ -249,7 +260,7 @@ class _BM25QueryExecutor(
             return_references=self._parse_return_references(cast(Any, return_references)),
         )
         return executor.execute(
-            response_callback=resp,
+            response_callback=self._offloaded(resp),
             method=self._connection.grpc_search,
             request=request,
         )
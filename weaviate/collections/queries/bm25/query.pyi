@@ -14,6 +14,7 @@ from weaviate.collections.classes.internal import (
 )
 from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
 from weaviate.collections.queries.bm25.executors import _BM25QueryExecutor
+from weaviate.collections.queries.tables import QueryTable, ReturnFormat
 from weaviate.connect.v4 import ConnectionAsync, ConnectionSync
 from weaviate.types import INCLUDE_VECTOR
 
@@ -228,6 +229,22 @@ class _BM25QueryAsync(
         return_references: Type[TReferences],
     ) -> GroupByReturn[TProperties, TReferences]: ...
     @overload
+    async def bm25(
+        self,
+        query: Optional[str],
+        *,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        rerank: Optional[Rerank] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[ReturnProperties[TProperties]] = None,
+        return_format: ReturnFormat,
+    ) -> QueryTable: ...
+    @overload
     async def bm25(
         self,
         query: Optional[str],
@@ -243,6 +260,7 @@ class _BM25QueryAsync(
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None,
+        return_format: Optional[ReturnFormat] = None,
     ) -> QuerySearchReturnType[Properties, References, TProperties, TReferences]: ...
 
 class _BM25Query(
@@ -462,6 +480,22 @@ class _BM25Query(
         return_references: Type[TReferences],
     ) -> GroupByReturn[TProperties, TReferences]: ...
     @overload
+    def bm25(
+        self,
+        query: Optional[str],
+        *,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        rerank: Optional[Rerank] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[ReturnProperties[TProperties]] = None,
+        return_format: ReturnFormat,
+    ) -> QueryTable: ...
+    @overload
     def bm25(
         self,
         query: Optional[str],
@@ -477,4 +511,5 @@ class _BM25Query(
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None,
+        return_format: Optional[ReturnFormat] = None,
     ) -> QuerySearchReturnType[Properties, References, TProperties, TReferences]: ...
@@ -0,0 +1,125 @@
+import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from weaviate.collections.classes.types import GeoCoordinate, _PhoneNumber
+from weaviate.collections.grpc.shared import _ByteOps
+from weaviate.proto.v1 import properties_pb2
+from weaviate.util import _datetime_from_weaviate_str, _WeaviateUUIDInt
+from weaviate.warnings import _Warnings
+
+_ValueDecoder = Callable[[properties_pb2.Value], Any]
+_ListValueDecoder = Callable[[properties_pb2.ListValue], Optional[List[Any]]]
+
+
+def _decode_uuid(uuid: str) -> _WeaviateUUIDInt:
+    # the server always sends canonical UUIDs so the validation done by uuid.UUID(...) can be skipped
+    return _WeaviateUUIDInt(int(uuid.replace("-", ""), 16))
+
+
+def _decode_timestamp(timestamp: int) -> datetime.datetime:
+    # Handle the case in which last_update_time_unix is in nanoseconds or milliseconds, issue #958
+    if len(str(timestamp)) <= 13:
+        return datetime.datetime.fromtimestamp(timestamp / 1000, tz=datetime.timezone.utc)
+    else:
+        return datetime.datetime.fromtimestamp(timestamp / 1e9, tz=datetime.timezone.utc)
+
+
+def _decode_date(date: str) -> Optional[datetime.datetime]:
+    try:
+        return _datetime_from_weaviate_str(date)
+    except ValueError as e:
+        # note that the year 9999 is valid and does not need to be handled. for 5 digit years only the first
+        # 4 digits are considered and it wrapps around
+        if "year 0 is out of range" in str(e):
+            _Warnings.datetime_year_zero(date)
+            return datetime.datetime.min
+        _Warnings.unknown_type_encountered("date_value")
+        return None
+
+
+def _decode_phone(value: properties_pb2.Value) -> _PhoneNumber:
+    phone = value.phone_value
+    return _PhoneNumber(
+        country_code=phone.country_code,
+        default_country=phone.default_country,
+        international_formatted=phone.international_formatted,
+        national=phone.national,
+        national_formatted=phone.national_formatted,
+        number=phone.input,
+        valid=phone.valid,
+    )
+
+
+class _PropertyDecoder:
+    """Decodes the non-reference properties of search results.
+
+    Each value is decoded by looking up the field set in its `kind` oneof in a table of decoders, instead of probing
+    every field in turn. The decoding of list values depends on the server version and is chosen once when the decoder
+    is created, use `_PropertyDecoder.for_version` to share the decoders of a version between executors.
+    """
+
+    def __init__(self, uses_125_api: bool) -> None:
+        self._list_value_decoders: Dict[str, _ListValueDecoder] = {
+            "bool_values": lambda value: list(value.bool_values.values),
+            "date_values": lambda value: [
+                _datetime_from_weaviate_str(val) for val in value.date_values.values
+            ],
+            "int_values": lambda value: _ByteOps.decode_int64s(value.int_values.values),
+            "number_values": lambda value: _ByteOps.decode_float64s(value.number_values.values),
+            "text_values": lambda value: list(value.text_values.values),
+            "uuid_values": lambda value: [_decode_uuid(val) for val in value.uuid_values.values],
+            "object_values": lambda value: [
+                self.decode_properties(val) for val in value.object_values.values
+            ],
+        }
+        self._value_decoders: Dict[str, _ValueDecoder] = {
+            "uuid_value": lambda value: _decode_uuid(value.uuid_value),
+            "date_value": lambda value: _decode_date(value.date_value),
+            "string_value": lambda value: value.string_value,
+            "text_value": lambda value: value.text_value,
+            "int_value": lambda value: value.int_value,
+            "number_value": lambda value: value.number_value,
+            "bool_value": lambda value: value.bool_value,
+            "list_value": (
+                (lambda value: self.__decode_list_value_125(value.list_value))
+                if uses_125_api
+                else (lambda value: self.__decode_list_value_123(value.list_value))
+            ),
+            "object_value": lambda value: self.decode_properties(value.object_value),
+            "geo_value": lambda value: GeoCoordinate(
+                latitude=value.geo_value.latitude, longitude=value.geo_value.longitude
+            ),
+            "blob_value": lambda value: value.blob_value,
+            "phone_value": _decode_phone,
+            "null_value": lambda value: None,
+        }
+
+    @staticmethod
+    def for_version(uses_125_api: bool) -> "_PropertyDecoder":
+        return _DECODERS[uses_125_api]
+
+    def __decode_list_value_125(self, value: properties_pb2.ListValue) -> Optional[List[Any]]:
+        kind = value.WhichOneof("kind")
+        decoder = self._list_value_decoders.get(kind) if kind is not None else None
+        if decoder is None:
+            _Warnings.unknown_type_encountered(str(kind))
+            return None
+        return decoder(value)
+
+    def __decode_list_value_123(self, value: properties_pb2.ListValue) -> List[Any]:
+        return [self.decode_value(val) for val in value.values]
+
+    def decode_value(self, value: properties_pb2.Value) -> Any:
+        kind = value.WhichOneof("kind")
+        decoder = self._value_decoders.get(kind) if kind is not None else None
+        if decoder is None:
+            _Warnings.unknown_type_encountered(str(kind))
+            return None
+        return decoder(value)
+
+    def decode_properties(self, properties: properties_pb2.Properties) -> dict:
+        decode_value = self.decode_value
+        return {name: decode_value(value) for name, value in properties.fields.items()}
+
+
+_DECODERS = {uses_125_api: _PropertyDecoder(uses_125_api) for uses_125_api in (True, False)}
@@ -1,6 +1,20 @@
-import datetime
+import asyncio
 import uuid as uuid_lib
-from typing import Any, Dict, Generic, List, Mapping, Optional, Sequence, Type, Union, cast
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
 from typing_extensions import is_typeddict
 
@@ -38,19 +52,32 @@ from weaviate.collections.classes.internal import (
     WeaviateProperties,
     _CrossReference,
 )
-from weaviate.collections.classes.types import GeoCoordinate, _PhoneNumber, TReferences
+from weaviate.collections.classes.types import TReferences
 from weaviate.collections.grpc.query import _QueryGRPC
 from weaviate.collections.grpc.shared import _ByteOps, _Unpack
-from weaviate.connect.v4 import ConnectionType
+from weaviate.collections.queries.decoders import _PropertyDecoder, _decode_timestamp
+from weaviate.collections.queries.tables import QueryTable, ReturnFormat, _decode_table
+from weaviate.connect.v4 import ConnectionAsync, ConnectionType
 from weaviate.exceptions import WeaviateInvalidInputError
 from weaviate.proto.v1 import base_pb2, generative_pb2, properties_pb2, search_get_pb2
 from weaviate.types import INCLUDE_VECTOR
-from weaviate.util import (
-    _datetime_from_weaviate_str,
-    _WeaviateUUIDInt,
+from weaviate.util import _WeaviateUUIDInt
+from weaviate.validator import _ArgumentValidator
+
+_ReferenceMap = Dict[Tuple[str, str, bytes], Object[Any, Any]]
+"""The referenced objects decoded so far in a response, keyed by reference path, target collection and UUID."""
+
+_REFERENCE_OPTIONS = _QueryOptions(True, True, True, True, False)
+
+_validate_return_metadata = _ArgumentValidator(
+    [
+        ([Sequence[str], MetadataQuery, None], "return_metadata"),
+        ([bool, str, Sequence], "include_vector"),
+    ]
 )
-from weaviate.validator import _validate_input, _ValidateArgument
-from weaviate.warnings import _Warnings
+
+
+T = TypeVar("T")
 
 
 class _BaseExecutor(Generic[ConnectionType]):
@@ -67,32 +94,42 @@ class _BaseExecutor(Generic[ConnectionType]):
         self._connection = connection
         self._name = name
         self.__tenant = tenant
-        self.__consistency_level = consistency_level
+        self._consistency_level = consistency_level
         self._properties = properties
         self._references = references
         self._validate_arguments = validate_arguments
 
         self.__uses_125_api = connection._weaviate_version.is_at_least(1, 25, 0)
         self.__uses_127_api = connection._weaviate_version.is_at_least(1, 27, 0)
+        self.__decoder = _PropertyDecoder.for_version(self.__uses_125_api)
         self._query = _QueryGRPC(
             connection._weaviate_version,
             self._name,
             self.__tenant,
-            self.__consistency_level,
+            self._consistency_level,
             validate_arguments=self._validate_arguments,
             uses_125_api=self.__uses_125_api,
             uses_127_api=self.__uses_127_api,
         )
 
-    def __retrieve_timestamp(
-        self,
-        timestamp: int,
-    ) -> datetime.datetime:
-        # Handle the case in which last_update_time_unix is in nanoseconds or milliseconds, issue #958
-        if len(str(timestamp)) <= 13:
-            return datetime.datetime.fromtimestamp(timestamp / 1000, tz=datetime.timezone.utc)
-        else:
-            return datetime.datetime.fromtimestamp(timestamp / 1e9, tz=datetime.timezone.utc)
+    def _offloaded(
+        self, resp: Callable[[search_get_pb2.SearchReply], T]
+    ) -> Callable[[search_get_pb2.SearchReply], T]:
+        """Wrap a response callback so that large replies are decoded in the executor of the event loop.
+
+        Only async connections with an `offload_threshold` offload, the callback then returns an awaitable for the
+        replies that reach the threshold, which `executor.execute` awaits.
+        """
+        connection = self._connection
+        if not isinstance(connection, ConnectionAsync) or connection._offload_threshold is None:
+            return resp
+
+        def offloaded(res: search_get_pb2.SearchReply) -> Any:
+            if not connection._offloads(res.ByteSize()):
+                return resp(res)
+            return asyncio.get_running_loop().run_in_executor(None, resp, res)
+
+        return offloaded
 
     def __extract_metadata_for_object(
         self,
@@ -102,12 +139,12 @@ class _BaseExecutor(Generic[ConnectionType]):
             distance=add_props.distance if add_props.distance_present else None,
             certainty=add_props.certainty if add_props.certainty_present else None,
             creation_time=(
-                self.__retrieve_timestamp(add_props.creation_time_unix)
+                _decode_timestamp(add_props.creation_time_unix)
                 if add_props.creation_time_unix_present
                 else None
             ),
             last_update_time=(
-                self.__retrieve_timestamp(add_props.last_update_time_unix)
+                _decode_timestamp(add_props.last_update_time_unix)
                 if add_props.last_update_time_unix_present
                 else None
             ),
@@ -229,96 +266,17 @@ class _BaseExecutor(Generic[ConnectionType]):
             )
         return None
 
-    def __deserialize_list_value_prop_125(
-        self, value: properties_pb2.ListValue
-    ) -> Optional[List[Any]]:
-        if value.HasField("bool_values"):
-            return list(value.bool_values.values)
-        if value.HasField("date_values"):
-            return [_datetime_from_weaviate_str(val) for val in value.date_values.values]
-        if value.HasField("int_values"):
-            return _ByteOps.decode_int64s(value.int_values.values)
-        if value.HasField("number_values"):
-            return _ByteOps.decode_float64s(value.number_values.values)
-        if value.HasField("text_values"):
-            return list(value.text_values.values)
-        if value.HasField("uuid_values"):
-            return [uuid_lib.UUID(val) for val in value.uuid_values.values]
-        if value.HasField("object_values"):
-            return [
-                self.__parse_nonref_properties_result(val) for val in value.object_values.values
-            ]
-        _Warnings.unknown_type_encountered(value.WhichOneof("value"))
-        return None
-
-    def __deserialize_list_value_prop_123(self, value: properties_pb2.ListValue) -> List[Any]:
-        return [self.__deserialize_non_ref_prop(val) for val in value.values]
-
-    def __deserialize_non_ref_prop(self, value: properties_pb2.Value) -> Any:
-        if value.HasField("uuid_value"):
-            return uuid_lib.UUID(value.uuid_value)
-        if value.HasField("date_value"):
-            try:
-                return _datetime_from_weaviate_str(value.date_value)
-            except ValueError as e:
-                # note that the year 9999 is valid and does not need to be handled. for 5 digit years only the first
-                # 4 digits are considered and it wrapps around
-                if "year 0 is out of range" in str(e):
-                    _Warnings.datetime_year_zero(value.date_value)
-                    return datetime.datetime.min
-
-        if value.HasField("string_value"):
-            return str(value.string_value)
-        if value.HasField("text_value"):
-            return str(value.text_value)
-        if value.HasField("int_value"):
-            return int(value.int_value)
-        if value.HasField("number_value"):
-            return float(value.number_value)
-        if value.HasField("bool_value"):
-            return bool(value.bool_value)
-        if value.HasField("list_value"):
-            return (
-                self.__deserialize_list_value_prop_125(value.list_value)
-                if self._connection._weaviate_version.is_at_least(1, 25, 0)
-                else self.__deserialize_list_value_prop_123(value.list_value)
-            )
-        if value.HasField("object_value"):
-            return self.__parse_nonref_properties_result(value.object_value)
-        if value.HasField("geo_value"):
-            return GeoCoordinate(
-                latitude=value.geo_value.latitude, longitude=value.geo_value.longitude
-            )
-        if value.HasField("blob_value"):
-            return value.blob_value
-        if value.HasField("phone_value"):
-            return _PhoneNumber(
-                country_code=value.phone_value.country_code,
-                default_country=value.phone_value.default_country,
-                international_formatted=value.phone_value.international_formatted,
-                national=value.phone_value.national,
-                national_formatted=value.phone_value.national_formatted,
-                number=value.phone_value.input,
-                valid=value.phone_value.valid,
-            )
-        if value.HasField("null_value"):
-            return None
-
-        _Warnings.unknown_type_encountered(value.WhichOneof("value"))
-        return None
-
     def __parse_nonref_properties_result(
         self,
         properties: properties_pb2.Properties,
     ) -> dict:
-        return {
-            name: self.__deserialize_non_ref_prop(value)
-            for name, value in properties.fields.items()
-        }
+        return self.__decoder.decode_properties(properties)
 
     def __parse_ref_properties_result(
         self,
         properties: search_get_pb2.PropertiesResult,
+        refs: _ReferenceMap,
+        path: str = "",
     ) -> Optional[dict]:
         if len(properties.ref_props) == 0:
             return {} if properties.ref_props_requested else None
@@ -326,20 +284,36 @@ class _BaseExecutor(Generic[ConnectionType]):
         return {
             ref_prop.prop_name: _CrossReference._from(
                 [
-                    self.__result_to_query_object(
-                        prop, prop.metadata, _QueryOptions(True, True, True, True, False)
-                    )
+                    self.__result_to_reference_object(prop, refs, path + ref_prop.prop_name)
                     for prop in ref_prop.properties
                 ]
             )
             for ref_prop in properties.ref_props
         }
 
+    def __result_to_reference_object(
+        self,
+        props: search_get_pb2.PropertiesResult,
+        refs: _ReferenceMap,
+        path: str,
+    ) -> Object[Any, Any]:
+        # every occurrence of the same object under the same reference path carries the same data, so it is decoded
+        # only once per response and the resulting object is shared between all cross-references pointing to it
+        key = (path, props.target_collection, props.metadata.id_as_bytes)
+        obj = refs.get(key)
+        if obj is None:
+            obj = refs[key] = self.__result_to_query_object(
+                props, props.metadata, _REFERENCE_OPTIONS, refs, path + "."
+            )
+        return obj
+
     def __result_to_query_object(
         self,
         props: search_get_pb2.PropertiesResult,
         meta: search_get_pb2.MetadataResult,
         options: _QueryOptions,
+        refs: _ReferenceMap,
+        path: str = "",
     ) -> Object[Any, Any]:
         return Object(
             collection=props.target_collection,
@@ -354,7 +328,9 @@ class _BaseExecutor(Generic[ConnectionType]):
                 else MetadataReturn()
             ),
             references=(
-                self.__parse_ref_properties_result(props) if options.include_references else None
+                self.__parse_ref_properties_result(props, refs, path)
+                if options.include_references
+                else None
             ),
             uuid=self.__extract_id_for_object(meta),
             vector=self.__extract_vector_for_object(meta) if options.include_vector else {},
@@ -366,6 +342,7 @@ class _BaseExecutor(Generic[ConnectionType]):
         meta: search_get_pb2.MetadataResult,
         gen: generative_pb2.GenerativeResult,
         options: _QueryOptions,
+        refs: _ReferenceMap,
     ) -> GenerativeObject[Any, Any]:
         return GenerativeObject(
             collection=props.target_collection,
@@ -380,7 +357,9 @@ class _BaseExecutor(Generic[ConnectionType]):
                 else MetadataReturn()
             ),
             references=(
-                self.__parse_ref_properties_result(props) if options.include_references else None
+                self.__parse_ref_properties_result(props, refs)
+                if options.include_references
+                else None
             ),
             uuid=self.__extract_id_for_object(meta),
             vector=self.__extract_vector_for_object(meta) if options.include_vector else {},
@@ -396,10 +375,13 @@ class _BaseExecutor(Generic[ConnectionType]):
         self,
         res: search_get_pb2.GroupByResult,
         options: _QueryOptions,
+        refs: _ReferenceMap,
     ) -> Group[Any, Any]:
         return Group(
             objects=[
-                self.__result_to_group_by_object(obj.properties, obj.metadata, options, res.name)
+                self.__result_to_group_by_object(
+                    obj.properties, obj.metadata, options, res.name, refs
+                )
                 for obj in res.objects
             ],
             name=res.name,
@@ -413,10 +395,13 @@ class _BaseExecutor(Generic[ConnectionType]):
         self,
         res: search_get_pb2.GroupByResult,
         options: _QueryOptions,
+        refs: _ReferenceMap,
     ) -> GenerativeGroup[Any, Any]:
         return GenerativeGroup(
             objects=[
-                self.__result_to_group_by_object(obj.properties, obj.metadata, options, res.name)
+                self.__result_to_group_by_object(
+                    obj.properties, obj.metadata, options, res.name, refs
+                )
                 for obj in res.objects
             ],
             name=res.name,
@@ -433,6 +418,7 @@ class _BaseExecutor(Generic[ConnectionType]):
         meta: search_get_pb2.MetadataResult,
         options: _QueryOptions,
         group_name: str,
+        refs: _ReferenceMap,
     ) -> GroupByObject[Any, Any]:
         return GroupByObject(
             collection=props.target_collection,
@@ -447,21 +433,31 @@ class _BaseExecutor(Generic[ConnectionType]):
                 else GroupByMetadataReturn()
             ),
             references=(
-                self.__parse_ref_properties_result(props) if options.include_references else None
+                self.__parse_ref_properties_result(props, refs)
+                if options.include_references
+                else None
             ),
             uuid=self.__extract_id_for_object(meta),
             vector=self.__extract_vector_for_object(meta) if options.include_vector else {},
             belongs_to_group=group_name,
         )
 
+    def _result_to_query_object(
+        self,
+        res: search_get_pb2.SearchResult,
+        options: _QueryOptions,
+    ) -> Object[Any, Any]:
+        return self.__result_to_query_object(res.properties, res.metadata, options, {})
+
     def _result_to_query_return(
         self,
         res: search_get_pb2.SearchReply,
         options: _QueryOptions,
     ) -> QueryReturn[WeaviateProperties, CrossReferences]:
+        refs: _ReferenceMap = {}
         return QueryReturn(
             objects=[
-                self.__result_to_query_object(obj.properties, obj.metadata, options)
+                self.__result_to_query_object(obj.properties, obj.metadata, options, refs)
                 for obj in res.results
             ]
         )
@@ -471,11 +467,12 @@ class _BaseExecutor(Generic[ConnectionType]):
         res: search_get_pb2.SearchReply,
         options: _QueryOptions,
     ) -> GenerativeReturn[WeaviateProperties, CrossReferences]:
+        refs: _ReferenceMap = {}
         return GenerativeReturn(
             generated=self.__extract_generated_from_reply(res),
             objects=[
                 self.__result_to_generative_object(
-                    obj.properties, obj.metadata, obj.generative, options
+                    obj.properties, obj.metadata, obj.generative, options, refs
                 )
                 for obj in res.results
             ],
@@ -503,8 +500,10 @@ class _BaseExecutor(Generic[ConnectionType]):
         res: search_get_pb2.SearchReply,
         options: _QueryOptions,
     ) -> GroupByReturn[WeaviateProperties, CrossReferences]:
+        refs: _ReferenceMap = {}
         groups = {
-            group.name: self.__result_to_group(group, options) for group in res.group_by_results
+            group.name: self.__result_to_group(group, options, refs)
+            for group in res.group_by_results
         }
         objects_group_by: List[GroupByObject] = [
             obj for group in groups.values() for obj in group.objects
@@ -516,8 +515,9 @@ class _BaseExecutor(Generic[ConnectionType]):
         res: search_get_pb2.SearchReply,
         options: _QueryOptions,
     ) -> GenerativeGroupByReturn[WeaviateProperties, CrossReferences]:
+        refs: _ReferenceMap = {}
         groups = {
-            group.name: self.__result_to_generative_group(group, options)
+            group.name: self.__result_to_generative_group(group, options, refs)
             for group in res.group_by_results
         }
         objects_group_by: List[GroupByObject] = [
@@ -555,6 +555,14 @@ class _BaseExecutor(Generic[ConnectionType]):
             else self._result_to_groupby_return(res, options)
         )
 
+    def _result_to_table(
+        self,
+        res: search_get_pb2.SearchReply,
+        options: _QueryOptions,
+        return_format: ReturnFormat,
+    ) -> QueryTable:
+        return _decode_table(res, options, return_format, self.__uses_125_api)
+
     def _parse_return_properties(
         self,
         return_properties: Optional[ReturnProperties[WeaviateProperties]],
@@ -600,14 +608,7 @@ class _BaseExecutor(Generic[ConnectionType]):
         self, return_metadata: Optional[METADATA], include_vector: INCLUDE_VECTOR
     ) -> Optional[_MetadataQuery]:
         if self._validate_arguments:
-            _validate_input(
-                [
-                    _ValidateArgument(
-                        [Sequence[str], MetadataQuery, None], "return_metadata", return_metadata
-                    ),
-                    _ValidateArgument([bool, str, Sequence], "include_vector", include_vector),
-                ]
-            )
+            _validate_return_metadata(return_metadata, include_vector)
         if return_metadata is None:
             ret_md = None
         elif hasattr(return_metadata, "creation_time"):
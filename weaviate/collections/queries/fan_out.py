@@ -0,0 +1,125 @@
+import asyncio
+import heapq
+import itertools
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from weaviate.proto.v1 import search_get_pb2
+
+A = TypeVar("A")
+R = TypeVar("R")
+T = TypeVar("T")
+
+DEFAULT_MAX_CONCURRENCY = 16
+
+
+def _fan_out(
+    call: Callable[[A], R],
+    items: Iterable[A],
+    max_concurrency: int,
+    on_result: Callable[[A, R], bool],
+) -> None:
+    """Call `call` for every item using at most `max_concurrency` threads.
+
+    Items are consumed lazily so that only the in-flight requests are held in memory. `on_result` is invoked
+    in the calling thread as results arrive and can return `True` to stop dispatching the remaining items.
+    """
+    it = iter(items)
+    in_flight: Dict["Future[R]", A] = {}
+    pool = ThreadPoolExecutor(max_workers=max_concurrency)
+    try:
+        for item in itertools.islice(it, max_concurrency):
+            in_flight[pool.submit(call, item)] = item
+        while len(in_flight) > 0:
+            done, _ = wait(in_flight.keys(), return_when=FIRST_COMPLETED)
+            for fut in done:
+                if on_result(in_flight.pop(fut), fut.result()):
+                    return
+            for item in itertools.islice(it, len(done)):
+                in_flight[pool.submit(call, item)] = item
+    finally:
+        # do not block on requests that are still running once the caller is no longer interested in them
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def _afan_out(
+    call: Callable[[A], Awaitable[R]],
+    items: Iterable[A],
+    max_concurrency: int,
+    on_result: Callable[[A, R], bool],
+) -> None:
+    """The asyncio equivalent of `_fan_out`, bounding the number of concurrently awaited requests."""
+    it = iter(items)
+    in_flight: Dict["asyncio.Future[R]", A] = {}
+    try:
+        for item in itertools.islice(it, max_concurrency):
+            in_flight[asyncio.ensure_future(call(item))] = item
+        while len(in_flight) > 0:
+            done, _ = await asyncio.wait(in_flight.keys(), return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if on_result(in_flight.pop(task), task.result()):
+                    return
+            for item in itertools.islice(it, len(done)):
+                in_flight[asyncio.ensure_future(call(item))] = item
+    finally:
+        for task in in_flight:
+            task.cancel()
+
+
+def _result_sort_key(result: search_get_pb2.SearchResult) -> float:
+    """The key by which results from independent searches are ranked against each other, lower is better."""
+    if result.metadata.distance_present:
+        return result.metadata.distance
+    if result.metadata.score_present:
+        return -result.metadata.score
+    return 0.0
+
+
+class _TopK(Generic[T]):
+    """Keeps the best `k` items pushed into it, ordered by ascending key.
+
+    A bounded max-heap is used so that pushing `n` items costs `O(n log k)`. If `k` is `None` all items are kept.
+    """
+
+    def __init__(self, k: Optional[int], stop_at: Optional[float] = None) -> None:
+        self.__k = k
+        self.__stop_at = stop_at
+        self.__heap: List[Tuple[float, int, T]] = []
+        self.__counter = itertools.count()
+
+    def push(self, key: float, item: T) -> None:
+        # keys are negated to use heapq as a max-heap, the counter keeps insertion order stable on ties
+        entry = (-key, -next(self.__counter), item)
+        if self.__k is None or len(self.__heap) < self.__k:
+            heapq.heappush(self.__heap, entry)
+        elif entry > self.__heap[0]:
+            heapq.heapreplace(self.__heap, entry)
+
+    def is_full(self) -> bool:
+        return self.__k is not None and len(self.__heap) >= self.__k
+
+    def worst_key(self) -> Optional[float]:
+        return -self.__heap[0][0] if len(self.__heap) > 0 else None
+
+    def is_satisfied(self) -> bool:
+        """Whether the heap is full and every item in it is at or below the `stop_at` threshold."""
+        worst = self.worst_key()
+        return (
+            self.__stop_at is not None
+            and self.is_full()
+            and worst is not None
+            and worst <= self.__stop_at
+        )
+
+    def items(self) -> List[T]:
+        return [item for _, _, item in sorted(self.__heap, reverse=True)]
@@ -107,5 +107,7 @@ class _FetchObjectsByIdQueryExecutor(
             return_references=self._parse_return_references(return_references),
         )
         return executor.execute(
-            response_callback=resp, method=self._connection.grpc_search, request=request
+            response_callback=self._offloaded(resp),
+            method=self._connection.grpc_search,
+            request=request,
         )
@@ -15,6 +15,7 @@ from weaviate.collections.classes.internal import (
 )
 from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
 from weaviate.collections.queries.executor import _BaseExecutor
+from weaviate.collections.queries.tables import ReturnFormat, _validate_return_format
 from weaviate.connect.v4 import ConnectionType
 from weaviate.connect import executor
 from weaviate.proto.v1.search_get_pb2 import SearchReply
@@ -39,7 +40,7 @@ class _FetchObjectsGenerateExecutor(
         include_vector: INCLUDE_VECTOR = False,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
-        return_references: Optional[ReturnReferences[TReferences]] = None
+        return_references: Optional[ReturnReferences[TReferences]] = None,
     ) -> executor.Result[GenerativeReturnType[Properties, References, TProperties, TReferences]]:
         """Perform retrieval-augmented generation (RAG) on the results of a simple get query of objects in this collection.
 
@@ -118,7 +119,7 @@ class _FetchObjectsGenerateExecutor(
             ),
         )
         return executor.execute(
-            response_callback=resp,
+            response_callback=self._offloaded(resp),
             method=self._connection.grpc_search,
             request=request,
         )
@@ -138,7 +139,8 @@ class _FetchObjectsQueryExecutor(
         include_vector: INCLUDE_VECTOR = False,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
-        return_references: Optional[ReturnReferences[TReferences]] = None
+        return_references: Optional[ReturnReferences[TReferences]] = None,
+        return_format: Optional[ReturnFormat] = None,
     ) -> executor.Result[QueryReturnType[Properties, References, TProperties, TReferences]]:
         """Retrieve the objects in this collection without any search.
 
@@ -161,6 +163,10 @@ class _FetchObjectsQueryExecutor(
                 The properties to return for each object.
             `return_references`
                 The references to return for each object.
+            `return_format`
+                The format to return the results in instead of objects, one of `"arrow"`, `"pandas"` or `"polars"`. The results are
+                decoded straight into the columns of a `pyarrow.Table`, `pandas.DataFrame` or `polars.DataFrame`, which requires the
+                corresponding library to be installed.
 
         NOTE:
             - If `return_properties` is not provided then all properties are returned except for blob properties.
@@ -178,19 +184,21 @@ class _FetchObjectsQueryExecutor(
         def resp(
             res: SearchReply,
         ) -> QueryReturnType[Properties, References, TProperties, TReferences]:
-            return cast(
-                Any,
-                self._result_to_query_return(
-                    res,
-                    _QueryOptions.from_input(
-                        return_metadata,
-                        return_properties,
-                        include_vector,
-                        self._references,
-                        return_references,
-                    ),
-                ),
+            options = _QueryOptions.from_input(
+                return_metadata,
+                return_properties,
+                include_vector,
+                self._references,
+                return_references,
             )
+            if return_format is not None:
+                return cast(Any, self._result_to_table(res, options, return_format))
+            return cast(Any, self._result_to_query_return(res, options))
+
+        _validate_return_format(
+            return_format,
+            references=return_references if return_references is not None else self._references,
+        )
 
         request = self._query.get(
             limit=limit,
@@ -203,7 +211,7 @@ class _FetchObjectsQueryExecutor(
             return_references=self._parse_return_references(cast(Any, return_references)),
         )
         return executor.execute(
-            response_callback=resp,
+            response_callback=self._offloaded(resp),
             method=self._connection.grpc_search,
             request=request,
         )
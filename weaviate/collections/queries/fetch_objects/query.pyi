@@ -10,6 +10,7 @@ from weaviate.collections.classes.internal import (
     QueryReturnType,
 )
 from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
+from weaviate.collections.queries.tables import QueryTable, ReturnFormat
 from weaviate.connect.v4 import ConnectionAsync, ConnectionSync
 from weaviate.collections.queries.fetch_objects.executors import _FetchObjectsQueryExecutor
 from weaviate.types import UUID, INCLUDE_VECTOR
@@ -114,7 +115,22 @@ class _FetchObjectsQueryAsync(
         include_vector: INCLUDE_VECTOR = False,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
-        return_references: Optional[ReturnReferences[TReferences]] = None
+        return_format: ReturnFormat
+    ) -> QueryTable: ...
+    @overload
+    async def fetch_objects(
+        self,
+        *,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[UUID] = None,
+        filters: Optional[_Filters] = None,
+        sort: Optional[Sorting] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[ReturnProperties[TProperties]] = None,
+        return_references: Optional[ReturnReferences[TReferences]] = None,
+        return_format: Optional[ReturnFormat] = None
     ) -> QueryReturnType[Properties, References, TProperties, TReferences]: ...
 
 class _FetchObjectsQuery(
@@ -217,5 +233,20 @@ class _FetchObjectsQuery(
         include_vector: INCLUDE_VECTOR = False,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
-        return_references: Optional[ReturnReferences[TReferences]] = None
+        return_format: ReturnFormat
+    ) -> QueryTable: ...
+    @overload
+    def fetch_objects(
+        self,
+        *,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[UUID] = None,
+        filters: Optional[_Filters] = None,
+        sort: Optional[Sorting] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[ReturnProperties[TProperties]] = None,
+        return_references: Optional[ReturnReferences[TReferences]] = None,
+        return_format: Optional[ReturnFormat] = None
     ) -> QueryReturnType[Properties, References, TProperties, TReferences]: ...
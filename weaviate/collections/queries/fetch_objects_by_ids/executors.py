@@ -15,6 +15,7 @@ from weaviate.collections.classes.internal import (
 )
 from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
 from weaviate.collections.queries.executor import _BaseExecutor
+from weaviate.collections.queries.tables import ReturnFormat, _validate_return_format
 from weaviate.connect import executor
 from weaviate.connect.v4 import ConnectionAsync, ConnectionType
 
@@ -40,7 +41,7 @@ class _FetchObjectsByIdsGenerateExecutor(
         include_vector: INCLUDE_VECTOR = False,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
-        return_references: Optional[ReturnReferences[TReferences]] = None
+        return_references: Optional[ReturnReferences[TReferences]] = None,
     ) -> executor.Result[GenerativeReturnType[Properties, References, TProperties, TReferences]]:
         """Perform retrieval-augmented generation (RAG) on the results of a simple get query of objects matching the provided IDs in this collection.
 
@@ -92,7 +93,7 @@ class _FetchObjectsByIdsGenerateExecutor(
             ),
         )
         return executor.execute(
-            response_callback=resp,
+            response_callback=self._offloaded(resp),
             method=self._connection.grpc_search,
             request=request,
         )
@@ -112,7 +113,8 @@ class _FetchObjectsByIdsQueryExecutor(
         include_vector: INCLUDE_VECTOR = False,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
-        return_references: Optional[ReturnReferences[TReferences]] = None
+        return_references: Optional[ReturnReferences[TReferences]] = None,
+        return_format: Optional[ReturnFormat] = None,
     ) -> executor.Result[QueryReturnType[Properties, References, TProperties, TReferences]]:
         """Perform a special case of fetch_objects based on filters on uuid.
 
@@ -122,19 +124,21 @@ class _FetchObjectsByIdsQueryExecutor(
         def resp(
             res: SearchReply,
         ) -> QueryReturnType[Properties, References, TProperties, TReferences]:
-            return cast(
-                Any,
-                self._result_to_query_return(
-                    res,
-                    _QueryOptions.from_input(
-                        return_metadata,
-                        return_properties,
-                        include_vector,
-                        self._references,
-                        return_references,
-                    ),
-                ),
+            options = _QueryOptions.from_input(
+                return_metadata,
+                return_properties,
+                include_vector,
+                self._references,
+                return_references,
             )
+            if return_format is not None:
+                return cast(Any, self._result_to_table(res, options, return_format))
+            return cast(Any, self._result_to_query_return(res, options))
+
+        _validate_return_format(
+            return_format,
+            references=return_references if return_references is not None else self._references,
+        )
 
         if not ids:
             if isinstance(self._connection, ConnectionAsync):
@@ -158,7 +162,7 @@ class _FetchObjectsByIdsQueryExecutor(
             return_references=self._parse_return_references(cast(Any, return_references)),
         )
         return executor.execute(
-            response_callback=resp,
+            response_callback=self._offloaded(resp),
             method=self._connection.grpc_search,
             request=request,
         )
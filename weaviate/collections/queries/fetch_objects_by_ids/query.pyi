@@ -12,6 +12,7 @@ from weaviate.collections.classes.types import Properties, TProperties, Referenc
 from weaviate.collections.queries.fetch_objects_by_ids.executors import (
     _FetchObjectsByIdsQueryExecutor,
 )
+from weaviate.collections.queries.tables import QueryTable, ReturnFormat
 from weaviate.connect.v4 import ConnectionAsync, ConnectionSync
 from weaviate.types import UUID, INCLUDE_VECTOR
 
@@ -115,7 +116,22 @@ class _FetchObjectsByIDsQueryAsync(
         include_vector: INCLUDE_VECTOR = False,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
-        return_references: Optional[ReturnReferences[TReferences]] = None
+        return_format: ReturnFormat
+    ) -> QueryTable: ...
+    @overload
+    async def fetch_objects_by_ids(
+        self,
+        ids: Iterable[UUID],
+        *,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[UUID] = None,
+        sort: Optional[Sorting] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[ReturnProperties[TProperties]] = None,
+        return_references: Optional[ReturnReferences[TReferences]] = None,
+        return_format: Optional[ReturnFormat] = None
     ) -> QueryReturnType[Properties, References, TProperties, TReferences]: ...
 
 class _FetchObjectsByIDsQuery(
@@ -218,5 +234,20 @@ class _FetchObjectsByIDsQuery(
         include_vector: INCLUDE_VECTOR = False,
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
-        return_references: Optional[ReturnReferences[TReferences]] = None
+        return_format: ReturnFormat
+    ) -> QueryTable: ...
+    @overload
+    def fetch_objects_by_ids(
+        self,
+        ids: Iterable[UUID],
+        *,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[UUID] = None,
+        sort: Optional[Sorting] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[ReturnProperties[TProperties]] = None,
+        return_references: Optional[ReturnReferences[TReferences]] = None,
+        return_format: Optional[ReturnFormat] = None
     ) -> QueryReturnType[Properties, References, TProperties, TReferences]: ...
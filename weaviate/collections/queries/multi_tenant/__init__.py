@@ -0,0 +1,6 @@
+from .query import _MultiTenantQueryAsync, _MultiTenantQuery
+
+__all__ = [
+    "_MultiTenantQuery",
+    "_MultiTenantQueryAsync",
+]
@@ -0,0 +1,233 @@
+from typing import (
+    Any,
+    Generic,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
+
+from weaviate.collections.classes.config import ConsistencyLevel
+from weaviate.collections.classes.filters import _Filters
+from weaviate.collections.classes.grpc import (
+    METADATA,
+    NearVectorInputType,
+    TargetVectorJoinType,
+)
+from weaviate.collections.classes.internal import (
+    MultiTenantQueryReturn,
+    MultiTenantQueryReturnType,
+    ReturnProperties,
+    ReturnReferences,
+    TenantObject,
+    WeaviateProperties,
+    _QueryOptions,
+)
+from weaviate.collections.classes.tenants import Tenant
+from weaviate.collections.classes.types import Properties, References, TProperties, TReferences
+from weaviate.collections.queries.executor import _BaseExecutor
+from weaviate.collections.queries.fan_out import _TopK, _afan_out, _fan_out, _result_sort_key
+from weaviate.connect import executor
+from weaviate.connect.v4 import ConnectionAsync, ConnectionType
+from weaviate.exceptions import WeaviateInvalidInputError
+from weaviate.proto.v1 import search_get_pb2
+from weaviate.types import INCLUDE_VECTOR, NUMBER
+from weaviate.validator import _validate_input, _ValidateArgument
+
+_TenantResult = Tuple[str, search_get_pb2.SearchResult]
+
+
+class _MultiTenantQueryExecutor(
+    Generic[ConnectionType, Properties, References], _BaseExecutor[ConnectionType]
+):
+    def __init__(
+        self,
+        connection: ConnectionType,
+        name: str,
+        consistency_level: Optional[ConsistencyLevel],
+        tenants: Sequence[Union[str, Tenant]],
+        properties: Optional[Type[WeaviateProperties]],
+        references: Optional[Type[Optional[Mapping[str, Any]]]],
+        validate_arguments: bool,
+        max_concurrency: int,
+    ) -> None:
+        super().__init__(
+            connection,
+            name,
+            consistency_level,
+            None,
+            properties,
+            references,
+            validate_arguments,
+        )
+        if validate_arguments:
+            _validate_input(
+                [
+                    _ValidateArgument([Sequence[Union[str, Tenant]]], "tenants", tenants),
+                    _ValidateArgument([int], "max_concurrency", max_concurrency),
+                ]
+            )
+        if max_concurrency < 1:
+            raise WeaviateInvalidInputError(
+                f"max_concurrency must be at least 1, but is {max_concurrency}"
+            )
+        self._tenants = [
+            tenant.name if isinstance(tenant, Tenant) else tenant for tenant in tenants
+        ]
+        self._max_concurrency = max_concurrency
+
+    def __requests_per_tenant(
+        self, request: search_get_pb2.SearchRequest
+    ) -> Iterator[Tuple[str, search_get_pb2.SearchRequest]]:
+        # copies are created lazily so that only the in-flight requests are kept in memory
+        for tenant in self._tenants:
+            tenant_request = search_get_pb2.SearchRequest()
+            tenant_request.CopyFrom(request)
+            tenant_request.tenant = tenant
+            yield tenant, tenant_request
+
+    def near_vector(
+        self,
+        near_vector: NearVectorInputType,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[ReturnProperties[TProperties]] = None,
+        return_references: Optional[ReturnReferences[TReferences]] = None,
+        early_stop_distance: Optional[NUMBER] = None,
+    ) -> executor.Result[
+        MultiTenantQueryReturnType[Properties, References, TProperties, TReferences]
+    ]:
+        """Search for objects by vector across all the tenants of this query using vector-based similarity search.
+
+        One search is sent per tenant over the gRPC channel, with at most `max_concurrency` of them in flight at once.
+        The results of all tenants are merged by distance into a single global top-`limit` list.
+
+        Arguments:
+            `near_vector`
+                The vector to search on, REQUIRED.
+            `certainty`
+                The minimum similarity score to return. If not specified, the default certainty specified by the server is used.
+            `distance`
+                The maximum distance to search. If not specified, the default distance specified by the server is used.
+            `limit`
+                The maximum number of results to return, both per tenant and overall. If not specified, the default limit specified by the server is used for each tenant and all results are returned.
+            `filters`
+                The filters to apply to the search.
+            `target_vector`
+                The name of the vector space to search in for named vector configurations. Required if multiple spaces are configured.
+            `include_vector`
+                Whether to include the vector in the results. If not specified, this is set to False.
+            `return_metadata`
+                The metadata to return for each object, defaults to `None`.
+            `return_properties`
+                The properties to return for each object.
+            `return_references`
+                The references to return for each object.
+            `early_stop_distance`
+                Stop querying further tenants once `limit` results at or below this distance have been collected. Requires `limit` to be set.
+
+        NOTE:
+            - Only the final top-`limit` results are deserialized into objects.
+            - If `early_stop_distance` is reached, tenants that have not been searched yet are skipped so better matches may exist in them.
+
+        Returns:
+            A `MultiTenantQueryReturn` object that includes the searched objects, each tagged with the tenant it was found in.
+
+        Raises:
+            `weaviate.exceptions.WeaviateGRPCQueryError`:
+                If the request to the Weaviate server fails for any of the tenants.
+            `weaviate.exceptions.WeaviateInvalidInputError`:
+                If `early_stop_distance` is provided without `limit`.
+        """
+        if self._validate_arguments:
+            _validate_input(
+                _ValidateArgument([int, float, None], "early_stop_distance", early_stop_distance)
+            )
+        if early_stop_distance is not None and limit is None:
+            raise WeaviateInvalidInputError("early_stop_distance requires limit to be set")
+
+        metadata = self._parse_return_metadata(return_metadata, include_vector)
+        assert metadata is not None
+        metadata.distance = True  # always required to merge the results of the tenants
+        request = self._query.near_vector(
+            near_vector=near_vector,
+            certainty=certainty,
+            distance=distance,
+            filters=filters,
+            limit=limit,
+            target_vector=target_vector,
+            return_metadata=metadata,
+            return_properties=self._parse_return_properties(return_properties),
+            return_references=self._parse_return_references(return_references),
+        )
+        top_k: _TopK[_TenantResult] = _TopK(
+            limit, float(early_stop_distance) if early_stop_distance is not None else None
+        )
+
+        def on_reply(
+            tenant_request: Tuple[str, search_get_pb2.SearchRequest],
+            reply: search_get_pb2.SearchReply,
+        ) -> bool:
+            for result in reply.results:
+                top_k.push(_result_sort_key(result), (tenant_request[0], result))
+            return top_k.is_satisfied()
+
+        def resp() -> MultiTenantQueryReturnType[Properties, References, TProperties, TReferences]:
+            options = _QueryOptions.from_input(
+                return_metadata,
+                return_properties,
+                include_vector,
+                self._references,
+                return_references,
+            )
+            objects: List[TenantObject[Any, Any]] = []
+            for tenant, result in top_k.items():
+                obj = self._result_to_query_object(result, options)
+                objects.append(
+                    TenantObject(
+                        uuid=obj.uuid,
+                        metadata=obj.metadata,
+                        properties=obj.properties,
+                        references=obj.references,
+                        vector=obj.vector,
+                        collection=obj.collection,
+                        tenant=tenant,
+                    )
+                )
+            return cast(Any, MultiTenantQueryReturn(objects=objects))
+
+        if isinstance(self._connection, ConnectionAsync):
+            connection = self._connection
+
+            async def _execute() -> (
+                MultiTenantQueryReturnType[Properties, References, TProperties, TReferences]
+            ):
+                await _afan_out(
+                    lambda tenant_request: connection.grpc_search(tenant_request[1]),
+                    self.__requests_per_tenant(request),
+                    self._max_concurrency,
+                    on_reply,
+                )
+                return resp()
+
+            return _execute()
+
+        connection = self._connection
+        _fan_out(
+            lambda tenant_request: connection.grpc_search(tenant_request[1]),
+            self.__requests_per_tenant(request),
+            self._max_concurrency,
+            on_reply,
+        )
+        return resp()
@@ -0,0 +1,22 @@
+from typing import Generic
+
+from weaviate.connect import executor
+from weaviate.collections.classes.types import Properties, References
+from weaviate.collections.queries.multi_tenant.executors import _MultiTenantQueryExecutor
+from weaviate.connect.v4 import ConnectionAsync, ConnectionSync
+
+
+@executor.wrap("async")
+class _MultiTenantQueryAsync(
+    Generic[Properties, References],
+    _MultiTenantQueryExecutor[ConnectionAsync, Properties, References],
+):
+    pass
+
+
+@executor.wrap("sync")
+class _MultiTenantQuery(
+    Generic[Properties, References],
+    _MultiTenantQueryExecutor[ConnectionSync, Properties, References],
+):
+    pass
@@ -0,0 +1,261 @@
+from typing import Generic, Literal, Optional, Type, Union, overload
+
+from weaviate.collections.classes.filters import (
+    _Filters,
+)
+from weaviate.collections.classes.grpc import (
+    METADATA,
+    PROPERTIES,
+    REFERENCES,
+    TargetVectorJoinType,
+    NearVectorInputType,
+)
+from weaviate.collections.classes.internal import (
+    MultiTenantQueryReturn,
+    MultiTenantQueryReturnType,
+    CrossReferences,
+    ReturnProperties,
+    ReturnReferences,
+)
+from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
+from weaviate.collections.queries.multi_tenant.executors import _MultiTenantQueryExecutor
+from weaviate.connect.v4 import ConnectionAsync, ConnectionSync
+from weaviate.types import NUMBER, INCLUDE_VECTOR
+
+class _MultiTenantQueryAsync(
+    Generic[Properties, References],
+    _MultiTenantQueryExecutor[ConnectionAsync, Properties, References],
+):
+    @overload
+    async def near_vector(
+        self,
+        near_vector: NearVectorInputType,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Union[PROPERTIES, bool, None] = None,
+        return_references: Literal[None] = None,
+        early_stop_distance: Optional[NUMBER] = None,
+    ) -> MultiTenantQueryReturn[Properties, References]: ...
+    @overload
+    async def near_vector(
+        self,
+        near_vector: NearVectorInputType,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Union[PROPERTIES, bool, None] = None,
+        return_references: REFERENCES,
+        early_stop_distance: Optional[NUMBER] = None,
+    ) -> MultiTenantQueryReturn[Properties, CrossReferences]: ...
+    @overload
+    async def near_vector(
+        self,
+        near_vector: NearVectorInputType,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Union[PROPERTIES, bool, None] = None,
+        return_references: Type[TReferences],
+        early_stop_distance: Optional[NUMBER] = None,
+    ) -> MultiTenantQueryReturn[Properties, TReferences]: ...
+    @overload
+    async def near_vector(
+        self,
+        near_vector: NearVectorInputType,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: Literal[None] = None,
+        early_stop_distance: Optional[NUMBER] = None,
+    ) -> MultiTenantQueryReturn[TProperties, References]: ...
+    @overload
+    async def near_vector(
+        self,
+        near_vector: NearVectorInputType,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: REFERENCES,
+        early_stop_distance: Optional[NUMBER] = None,
+    ) -> MultiTenantQueryReturn[TProperties, CrossReferences]: ...
+    @overload
+    async def near_vector(
+        self,
+        near_vector: NearVectorInputType,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: Type[TReferences],
+        early_stop_distance: Optional[NUMBER] = None,
+    ) -> MultiTenantQueryReturn[TProperties, TReferences]: ...
+
+    ### DEFAULT ###
+    @overload
+    async def near_vector(
+        self,
+        near_vector: NearVectorInputType,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[ReturnProperties[TProperties]] = None,
+        return_references: Optional[ReturnReferences[TReferences]] = None,
+        early_stop_distance: Optional[NUMBER] = None,
+    ) -> MultiTenantQueryReturnType[Properties, References, TProperties, TReferences]: ...
+
+class _MultiTenantQuery(
+    Generic[Properties, References],
+    _MultiTenantQueryExecutor[ConnectionSync, Properties, References],
+):
+    @overload
+    def near_vector(
+        self,
+        near_vector: NearVectorInputType,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Union[PROPERTIES, bool, None] = None,
+        return_references: Literal[None] = None,
+        early_stop_distance: Optional[NUMBER] = None,
+    ) -> MultiTenantQueryReturn[Properties, References]: ...
+    @overload
+    def near_vector(
+        self,
+        near_vector: NearVectorInputType,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Union[PROPERTIES, bool, None] = None,
+        return_references: REFERENCES,
+        early_stop_distance: Optional[NUMBER] = None,
+    ) -> MultiTenantQueryReturn[Properties, CrossReferences]: ...
+    @overload
+    def near_vector(
+        self,
+        near_vector: NearVectorInputType,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Union[PROPERTIES, bool, None] = None,
+        return_references: Type[TReferences],
+        early_stop_distance: Optional[NUMBER] = None,
+    ) -> MultiTenantQueryReturn[Properties, TReferences]: ...
+    @overload
+    def near_vector(
+        self,
+        near_vector: NearVectorInputType,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: Literal[None] = None,
+        early_stop_distance: Optional[NUMBER] = None,
+    ) -> MultiTenantQueryReturn[TProperties, References]: ...
+    @overload
+    def near_vector(
+        self,
+        near_vector: NearVectorInputType,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: REFERENCES,
+        early_stop_distance: Optional[NUMBER] = None,
+    ) -> MultiTenantQueryReturn[TProperties, CrossReferences]: ...
+    @overload
+    def near_vector(
+        self,
+        near_vector: NearVectorInputType,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: Type[TReferences],
+        early_stop_distance: Optional[NUMBER] = None,
+    ) -> MultiTenantQueryReturn[TProperties, TReferences]: ...
+
+    ### DEFAULT ###
+    @overload
+    def near_vector(
+        self,
+        near_vector: NearVectorInputType,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[ReturnProperties[TProperties]] = None,
+        return_references: Optional[ReturnReferences[TReferences]] = None,
+        early_stop_distance: Optional[NUMBER] = None,
+    ) -> MultiTenantQueryReturnType[Properties, References, TProperties, TReferences]: ...
@@ -21,6 +21,7 @@ from weaviate.collections.classes.internal import (
 )
 from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
 from weaviate.collections.queries.near_image.executors import _NearImageQueryExecutor
+from weaviate.collections.queries.tables import QueryTable, ReturnFormat
 from weaviate.connect.v4 import ConnectionAsync, ConnectionSync
 from weaviate.types import BLOB_INPUT, NUMBER, INCLUDE_VECTOR
 
@@ -259,6 +260,27 @@ class _NearImageQueryAsync(
         return_properties: Type[TProperties],
         return_references: Type[TReferences],
     ) -> GroupByReturn[TProperties, TReferences]: ...
+
+    ### Table ###
+    @overload
+    async def near_image(
+        self,
+        near_image: BLOB_INPUT,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[ReturnProperties[TProperties]] = None,
+        return_format: ReturnFormat,
+    ) -> QueryTable: ...
+
     ### DEFAULT ###
     @overload
     async def near_image(
@@ -278,6 +300,7 @@ class _NearImageQueryAsync(
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None,
+        return_format: Optional[ReturnFormat] = None,
     ) -> QuerySearchReturnType[Properties, References, TProperties, TReferences]: ...
 
 class _NearImageQuery(
@@ -514,6 +537,27 @@ class _NearImageQuery(
         return_properties: Type[TProperties],
         return_references: Type[TReferences],
     ) -> GroupByReturn[TProperties, TReferences]: ...
+
+    ### Table ###
+    @overload
+    def near_image(
+        self,
+        near_image: BLOB_INPUT,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[ReturnProperties[TProperties]] = None,
+        return_format: ReturnFormat,
+    ) -> QueryTable: ...
+
     ### DEFAULT ###
     @overload
     def near_image(
@@ -533,4 +577,5 @@ class _NearImageQuery(
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None,
+        return_format: Optional[ReturnFormat] = None,
     ) -> QuerySearchReturnType[Properties, References, TProperties, TReferences]: ...
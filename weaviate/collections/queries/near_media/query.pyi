@@ -24,6 +24,7 @@ from weaviate.collections.classes.internal import (
 )
 from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
 from weaviate.collections.queries.near_media.executors import _NearMediaQueryExecutor
+from weaviate.collections.queries.tables import QueryTable, ReturnFormat
 from weaviate.connect.v4 import ConnectionAsync, ConnectionSync
 from weaviate.types import BLOB_INPUT, NUMBER, INCLUDE_VECTOR
 
@@ -275,6 +276,27 @@ class _NearMediaQueryAsync(
         return_references: Type[TReferences],
     ) -> GroupByReturn[TProperties, TReferences]: ...
 
+    ### Table ###
+    @overload
+    async def near_media(
+        self,
+        media: BLOB_INPUT,
+        media_type: NearMediaType,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[ReturnProperties[TProperties]] = None,
+        return_format: ReturnFormat,
+    ) -> QueryTable: ...
+
     ### DEFAULT ###
     @overload
     async def near_media(
@@ -295,6 +317,7 @@ class _NearMediaQueryAsync(
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None,
+        return_format: Optional[ReturnFormat] = None,
     ) -> QuerySearchReturnType[Properties, References, TProperties, TReferences]: ...
 
 class _NearMediaQuery(
@@ -544,6 +567,27 @@ class _NearMediaQuery(
         return_references: Type[TReferences],
     ) -> GroupByReturn[TProperties, TReferences]: ...
 
+    ### Table ###
+    @overload
+    def near_media(
+        self,
+        media: BLOB_INPUT,
+        media_type: NearMediaType,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[ReturnProperties[TProperties]] = None,
+        return_format: ReturnFormat,
+    ) -> QueryTable: ...
+
     ### DEFAULT ###
     @overload
     def near_media(
@@ -564,4 +608,5 @@ class _NearMediaQuery(
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None,
+        return_format: Optional[ReturnFormat] = None,
     ) -> QuerySearchReturnType[Properties, References, TProperties, TReferences]: ...
@@ -18,6 +18,7 @@ from weaviate.collections.classes.internal import (
 )
 from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
 from weaviate.collections.queries.executor import _BaseExecutor
+from weaviate.collections.queries.tables import ReturnFormat, _validate_return_format
 from weaviate.connect import executor
 from weaviate.connect.v4 import ConnectionType
 from weaviate.proto.v1.search_get_pb2 import SearchReply
@@ -148,7 +149,9 @@ class _NearObjectGenerateExecutor(
             return_references=self._parse_return_references(return_references),
         )
         return executor.execute(
-            response_callback=resp, method=self._connection.grpc_search, request=request
+            response_callback=self._offloaded(resp),
+            method=self._connection.grpc_search,
+            request=request,
         )
 
 
@@ -172,6 +175,7 @@ class _NearObjectQueryExecutor(
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None,
+        return_format: Optional[ReturnFormat] = None,
     ) -> executor.Result[
         QueryNearMediaReturnType[Properties, References, TProperties, TReferences]
     ]:
@@ -208,6 +212,10 @@ class _NearObjectQueryExecutor(
                 The properties to return for each object.
             `return_references`
                 The references to return for each object.
+            `return_format`
+                The format to return the results in instead of objects, one of `"arrow"`, `"pandas"` or `"polars"`. The results are
+                decoded straight into the columns of a `pyarrow.Table`, `pandas.DataFrame` or `polars.DataFrame`, which requires the
+                corresponding library to be installed.
 
         NOTE:
             - If `return_properties` is not provided then all properties are returned except for blob properties.
@@ -226,21 +234,24 @@ class _NearObjectQueryExecutor(
         def resp(
             res: SearchReply,
         ) -> QueryNearMediaReturnType[Properties, References, TProperties, TReferences]:
-            return cast(
-                Any,
-                self._result_to_query_or_groupby_return(
-                    res,
-                    _QueryOptions.from_input(
-                        return_metadata,
-                        return_properties,
-                        include_vector,
-                        self._references,
-                        return_references,
-                        rerank,
-                        group_by,
-                    ),
-                ),
+            options = _QueryOptions.from_input(
+                return_metadata,
+                return_properties,
+                include_vector,
+                self._references,
+                return_references,
+                rerank,
+                group_by,
             )
+            if return_format is not None:
+                return cast(Any, self._result_to_table(res, options, return_format))
+            return cast(Any, self._result_to_query_or_groupby_return(res, options))
+
+        _validate_return_format(
+            return_format,
+            group_by=group_by,
+            references=return_references if return_references is not None else self._references,
+        )
 
         request = self._query.near_object(
             near_object=near_object,
@@ -258,5 +269,7 @@ class _NearObjectQueryExecutor(
             return_references=self._parse_return_references(return_references),
         )
         return executor.execute(
-            response_callback=resp, method=self._connection.grpc_search, request=request
+            response_callback=self._offloaded(resp),
+            method=self._connection.grpc_search,
+            request=request,
         )
@@ -21,6 +21,7 @@ from weaviate.collections.classes.internal import (
 )
 from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
 from weaviate.collections.queries.near_object.executors import _NearObjectQueryExecutor
+from weaviate.collections.queries.tables import QueryTable, ReturnFormat
 from weaviate.connect.v4 import ConnectionAsync, ConnectionSync
 from weaviate.types import NUMBER, INCLUDE_VECTOR, UUID
 
@@ -260,6 +261,26 @@ class _NearObjectQueryAsync(
         return_references: Type[TReferences],
     ) -> GroupByReturn[TProperties, TReferences]: ...
 
+    ### Table ###
+    @overload
+    async def near_object(
+        self,
+        near_object: UUID,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[ReturnProperties[TProperties]] = None,
+        return_format: ReturnFormat,
+    ) -> QueryTable: ...
+
     ### DEFAULT ###
     @overload
     async def near_object(
@@ -279,6 +300,7 @@ class _NearObjectQueryAsync(
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None,
+        return_format: Optional[ReturnFormat] = None,
     ) -> QuerySearchReturnType[Properties, References, TProperties, TReferences]: ...
 
 class _NearObjectQuery(
@@ -518,6 +540,26 @@ class _NearObjectQuery(
     ) -> GroupByReturn[TProperties, TReferences]: ...
 
     ### DEFAULT ###
+
+    ### Table ###
+    @overload
+    def near_object(
+        self,
+        near_object: UUID,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        rerank: Optional[Rerank] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[ReturnProperties[TProperties]] = None,
+        return_format: ReturnFormat,
+    ) -> QueryTable: ...
     @overload
     def near_object(
         self,
@@ -536,4 +578,5 @@ class _NearObjectQuery(
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None,
+        return_format: Optional[ReturnFormat] = None,
     ) -> QuerySearchReturnType[Properties, References, TProperties, TReferences]: ...
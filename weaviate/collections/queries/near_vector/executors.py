@@ -6,6 +6,7 @@ from weaviate.collections.classes.filters import (
 from weaviate.collections.classes.grpc import (
     METADATA,
     GroupBy,
+    MetadataQuery,
     Rerank,
     TargetVectorJoinType,
     NearVectorInputType,
@@ -24,6 +25,12 @@ from weaviate.collections.classes.internal import (
 )
 from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
 from weaviate.collections.queries.executor import _BaseExecutor
+from weaviate.collections.queries.tables import (
+    IdsAndDistances,
+    ReturnFormat,
+    _decode_ids_and_distances,
+    _validate_return_format,
+)
 from weaviate.connect import executor
 from weaviate.connect.v4 import ConnectionType
 from weaviate.proto.v1.search_get_pb2 import SearchReply
@@ -154,7 +161,7 @@ class _NearVectorGenerateExecutor(
             return_references=self._parse_return_references(return_references),
         )
         return executor.execute(
-            response_callback=resp,
+            response_callback=self._offloaded(resp),
             method=self._connection.grpc_search,
             request=request,
         )
@@ -180,6 +187,7 @@ class _NearVectorQueryExecutor(
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None,
+        return_format: Optional[ReturnFormat] = None,
     ) -> executor.Result[QuerySearchReturnType[Properties, References, TProperties, TReferences]]:
         """Search for objects by vector in this collection using and vector-based similarity search.
 
@@ -214,6 +222,10 @@ class _NearVectorQueryExecutor(
                 The properties to return for each object.
             `return_references`
                 The references to return for each object.
+            `return_format`
+                The format to return the results in instead of objects, one of `"arrow"`, `"pandas"` or `"polars"`. The results are
+                decoded straight into the columns of a `pyarrow.Table`, `pandas.DataFrame` or `polars.DataFrame`, which requires the
+                corresponding library to be installed.
 
         NOTE:
             - If `return_properties` is not provided then all properties are returned except for blob properties.
@@ -232,21 +244,24 @@ class _NearVectorQueryExecutor(
         def resp(
             res: SearchReply,
         ) -> QuerySearchReturnType[Properties, References, TProperties, TReferences]:
-            return cast(
-                Any,
-                self._result_to_generative_return(
-                    res,
-                    _QueryOptions.from_input(
-                        return_metadata,
-                        return_properties,
-                        include_vector,
-                        self._references,
-                        return_references,
-                        rerank,
-                        group_by,
-                    ),
-                ),
+            options = _QueryOptions.from_input(
+                return_metadata,
+                return_properties,
+                include_vector,
+                self._references,
+                return_references,
+                rerank,
+                group_by,
             )
+            if return_format is not None:
+                return cast(Any, self._result_to_table(res, options, return_format))
+            return cast(Any, self._result_to_generative_return(res, options))
+
+        _validate_return_format(
+            return_format,
+            group_by=group_by,
+            references=return_references if return_references is not None else self._references,
+        )
 
         request = self._query.near_vector(
             near_vector=near_vector,
@@ -264,7 +279,70 @@ class _NearVectorQueryExecutor(
             return_references=self._parse_return_references(return_references),
         )
         return executor.execute(
-            response_callback=resp,
+            response_callback=self._offloaded(resp),
+            method=self._connection.grpc_search,
+            request=request,
+        )
+
+    def near_vector_ids(
+        self,
+        near_vector: NearVectorInputType,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+    ) -> executor.Result[IdsAndDistances]:
+        """Search for objects by vector in this collection and return only their UUIDs and distances.
+
+        Only the id and distance of each object are requested from Weaviate and they are decoded straight into NumPy
+        arrays, which makes this considerably cheaper than `near_vector` when nothing else about the objects is needed.
+
+        Arguments:
+            `near_vector`
+                The vector to search on, REQUIRED.
+            `certainty`
+                The minimum similarity score to return. If not specified, the default certainty specified by the server is used.
+            `distance`
+                The maximum distance to search. If not specified, the default distance specified by the server is used.
+            `limit`
+                The maximum number of results to return. If not specified, the default limit specified by the server is returned.
+            `offset`
+                The offset to start from. If not specified, the retrieval begins from the first object in the server.
+            `auto_limit`
+                The maximum number of [autocut](https://weaviate.io/developers/weaviate/api/graphql/additional-operators#autocut) results to return. If not specified, no limit is applied.
+            `filters`
+                The filters to apply to the search.
+            `target_vector`
+                The name of the vector space to search in for named vector configurations. Required if multiple spaces are configured.
+
+        Returns:
+            A tuple of two NumPy arrays of the same length, ordered by distance: the UUIDs of the objects as 16-byte
+            `numpy.void` scalars (use `uuid.UUID(bytes=uuids[i].tobytes())` to convert one) and their distances as `float32`.
+
+        Raises:
+            `weaviate.exceptions.WeaviateGRPCQueryError`:
+                If the request to the Weaviate server fails.
+            `weaviate.exceptions.WeaviateOptionalDependencyNotInstalledError`:
+                If NumPy is not installed.
+        """
+        request = self._query.near_vector(
+            near_vector=near_vector,
+            certainty=certainty,
+            distance=distance,
+            filters=filters,
+            limit=limit,
+            offset=offset,
+            autocut=auto_limit,
+            target_vector=target_vector,
+            return_metadata=self._parse_return_metadata(MetadataQuery(distance=True), False),
+            return_properties=[],
+        )
+        return executor.execute(
+            response_callback=self._offloaded(_decode_ids_and_distances),
             method=self._connection.grpc_search,
             request=request,
         )
@@ -0,0 +1,6 @@
+from .query import _PreparedQueryAsync, _PreparedQuery
+
+__all__ = [
+    "_PreparedQuery",
+    "_PreparedQueryAsync",
+]
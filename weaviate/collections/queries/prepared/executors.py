@@ -0,0 +1,187 @@
+from typing import Any, Generic, List, Mapping, Optional, Type, Union, cast
+
+from weaviate.collections.classes.config import ConsistencyLevel
+from weaviate.collections.classes.filters import _Filters
+from weaviate.collections.classes.grpc import (
+    METADATA,
+    PROPERTIES,
+    REFERENCES,
+    NearVectorInputType,
+    TargetVectorJoinType,
+)
+from weaviate.collections.classes.internal import (
+    QueryReturn,
+    WeaviateProperties,
+    _QueryOptions,
+)
+from weaviate.collections.classes.types import Properties, References
+from weaviate.collections.queries.executor import _BaseExecutor
+from weaviate.connect import executor
+from weaviate.connect.v4 import ConnectionType
+from weaviate.proto.v1 import base_search_pb2, search_get_pb2
+from weaviate.types import INCLUDE_VECTOR, NUMBER
+from weaviate.validator import _validate_input, _ValidateArgument
+
+
+class _PreparedQueryExecutor(
+    Generic[ConnectionType, Properties, References], _BaseExecutor[ConnectionType]
+):
+    def __init__(
+        self,
+        connection: ConnectionType,
+        name: str,
+        consistency_level: Optional[ConsistencyLevel],
+        tenant: Optional[str],
+        properties: Optional[Type[WeaviateProperties]],
+        references: Optional[Type[Optional[Mapping[str, Any]]]],
+        validate_arguments: bool,
+        *,
+        limit: Optional[int],
+        offset: Optional[int],
+        auto_limit: Optional[int],
+        filters: Optional[_Filters],
+        certainty: Optional[NUMBER],
+        distance: Optional[NUMBER],
+        target_vector: Optional[TargetVectorJoinType],
+        query_properties: Optional[List[str]],
+        include_vector: INCLUDE_VECTOR,
+        return_metadata: Optional[METADATA],
+        return_properties: Union[PROPERTIES, bool, None],
+        return_references: Optional[REFERENCES],
+    ) -> None:
+        super().__init__(
+            connection,
+            name,
+            consistency_level,
+            tenant,
+            properties,
+            references,
+            validate_arguments,
+        )
+        if validate_arguments:
+            _validate_input(_ValidateArgument([List, None], "query_properties", query_properties))
+        # everything that does not change between executions is validated and converted once, so that an execution
+        # only has to copy the request and add the search to it
+        self.__request = self._query.prepare(
+            limit=limit,
+            offset=offset,
+            autocut=auto_limit,
+            filters=filters,
+            return_metadata=self._parse_return_metadata(return_metadata, include_vector),
+            return_properties=self._parse_return_properties(return_properties),
+            return_references=self._parse_return_references(return_references),
+        )
+        self.__options = _QueryOptions.from_input(
+            return_metadata,
+            return_properties,
+            include_vector,
+            self._references,
+            return_references,
+        )
+        self.__certainty, self.__distance = self._query._parse_near_options(certainty, distance)
+        self.__target_vector = target_vector
+        self.__query_properties = query_properties if query_properties is not None else []
+
+    def __execute(
+        self, request: search_get_pb2.SearchRequest
+    ) -> executor.Result[QueryReturn[Properties, References]]:
+        def resp(
+            res: search_get_pb2.SearchReply,
+        ) -> QueryReturn[Properties, References]:
+            return cast(
+                QueryReturn[Properties, References],
+                self._result_to_query_return(res, self.__options),
+            )
+
+        return executor.execute(
+            response_callback=self._offloaded(resp),
+            method=self._connection.grpc_search,
+            request=request,
+        )
+
+    def __request_with_limit(self, limit: Optional[int]) -> search_get_pb2.SearchRequest:
+        if self._validate_arguments:
+            _validate_input(_ValidateArgument([int, None], "limit", limit))
+        request = search_get_pb2.SearchRequest()
+        request.CopyFrom(self.__request)
+        if limit is not None:
+            request.limit = limit
+        return request
+
+    def near_vector(
+        self, near_vector: NearVectorInputType, *, limit: Optional[int] = None
+    ) -> executor.Result[QueryReturn[Properties, References]]:
+        """Execute this prepared query as a search by vector.
+
+        Arguments:
+            `near_vector`
+                The vector to search on, REQUIRED.
+            `limit`
+                The maximum number of results to return. If not specified, the limit of the prepared query is used.
+
+        Returns:
+            A `QueryReturn` object that includes the searched objects.
+
+        Raises:
+            `weaviate.exceptions.WeaviateGRPCQueryError`:
+                If the request to the Weaviate server fails.
+        """
+        request = self.__request_with_limit(limit)
+        request.near_vector.CopyFrom(
+            self._query._parse_near_vector(
+                near_vector, self.__certainty, self.__distance, self.__target_vector
+            )
+        )
+        return self.__execute(request)
+
+    def near_text(
+        self, query: Union[List[str], str], *, limit: Optional[int] = None
+    ) -> executor.Result[QueryReturn[Properties, References]]:
+        """Execute this prepared query as a search by text, which requires a text2vec module.
+
+        Arguments:
+            `query`
+                The text or texts to search on, REQUIRED.
+            `limit`
+                The maximum number of results to return. If not specified, the limit of the prepared query is used.
+
+        Returns:
+            A `QueryReturn` object that includes the searched objects.
+
+        Raises:
+            `weaviate.exceptions.WeaviateGRPCQueryError`:
+                If the request to the Weaviate server fails.
+        """
+        request = self.__request_with_limit(limit)
+        request.near_text.CopyFrom(
+            self._query._parse_near_text(
+                query, self.__certainty, self.__distance, None, None, self.__target_vector
+            )
+        )
+        return self.__execute(request)
+
+    def bm25(
+        self, query: str, *, limit: Optional[int] = None
+    ) -> executor.Result[QueryReturn[Properties, References]]:
+        """Execute this prepared query as a keyword (BM25) search on the `query_properties` of the prepared query.
+
+        Arguments:
+            `query`
+                The keyword-based query to search for, REQUIRED.
+            `limit`
+                The maximum number of results to return. If not specified, the limit of the prepared query is used.
+
+        Returns:
+            A `QueryReturn` object that includes the searched objects.
+
+        Raises:
+            `weaviate.exceptions.WeaviateGRPCQueryError`:
+                If the request to the Weaviate server fails.
+        """
+        if self._validate_arguments:
+            _validate_input(_ValidateArgument([str], "query", query))
+        request = self.__request_with_limit(limit)
+        request.bm25_search.CopyFrom(
+            base_search_pb2.BM25(query=query, properties=self.__query_properties)
+        )
+        return self.__execute(request)
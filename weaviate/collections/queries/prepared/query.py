@@ -0,0 +1,22 @@
+from typing import Generic
+
+from weaviate.connect import executor
+from weaviate.collections.classes.types import Properties, References
+from weaviate.collections.queries.prepared.executors import _PreparedQueryExecutor
+from weaviate.connect.v4 import ConnectionAsync, ConnectionSync
+
+
+@executor.wrap("async")
+class _PreparedQueryAsync(
+    Generic[Properties, References],
+    _PreparedQueryExecutor[ConnectionAsync, Properties, References],
+):
+    pass
+
+
+@executor.wrap("sync")
+class _PreparedQuery(
+    Generic[Properties, References],
+    _PreparedQueryExecutor[ConnectionSync, Properties, References],
+):
+    pass
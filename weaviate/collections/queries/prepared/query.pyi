@@ -0,0 +1,35 @@
+from typing import Generic, List, Optional, Union
+
+from weaviate.collections.classes.grpc import NearVectorInputType
+from weaviate.collections.classes.internal import QueryReturn
+from weaviate.collections.classes.types import Properties, References
+from weaviate.collections.queries.prepared.executors import _PreparedQueryExecutor
+from weaviate.connect.v4 import ConnectionAsync, ConnectionSync
+
+class _PreparedQueryAsync(
+    Generic[Properties, References],
+    _PreparedQueryExecutor[ConnectionAsync, Properties, References],
+):
+    async def near_vector(
+        self, near_vector: NearVectorInputType, *, limit: Optional[int] = None
+    ) -> QueryReturn[Properties, References]: ...
+    async def near_text(
+        self, query: Union[List[str], str], *, limit: Optional[int] = None
+    ) -> QueryReturn[Properties, References]: ...
+    async def bm25(
+        self, query: str, *, limit: Optional[int] = None
+    ) -> QueryReturn[Properties, References]: ...
+
+class _PreparedQuery(
+    Generic[Properties, References],
+    _PreparedQueryExecutor[ConnectionSync, Properties, References],
+):
+    def near_vector(
+        self, near_vector: NearVectorInputType, *, limit: Optional[int] = None
+    ) -> QueryReturn[Properties, References]: ...
+    def near_text(
+        self, query: Union[List[str], str], *, limit: Optional[int] = None
+    ) -> QueryReturn[Properties, References]: ...
+    def bm25(
+        self, query: str, *, limit: Optional[int] = None
+    ) -> QueryReturn[Properties, References]: ...
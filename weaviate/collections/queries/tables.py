@@ -0,0 +1,298 @@
+import importlib
+from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple, Union
+
+from weaviate.collections.classes.internal import _QueryOptions
+from weaviate.collections.grpc.shared import _ByteOps, _Unpack
+from weaviate.collections.queries.decoders import _decode_timestamp, _PropertyDecoder
+from weaviate.exceptions import (
+    WeaviateInvalidInputError,
+    WeaviateOptionalDependencyNotInstalledError,
+)
+from weaviate.proto.v1 import base_pb2, properties_pb2, search_get_pb2
+
+ReturnFormat = Literal["arrow", "pandas", "polars"]
+RETURN_FORMATS = ("arrow", "pandas", "polars")
+
+QueryTable = Any
+"""A `pyarrow.Table`, `pandas.DataFrame` or `polars.DataFrame` depending on the requested `return_format`.
+
+It is typed as `Any` as these libraries are optional dependencies of the client."""
+
+IdsAndDistances = Tuple[Any, Any]
+"""The UUIDs of the found objects as a NumPy array of 16-byte `numpy.void` scalars and their distances as a `float32` array."""
+
+UUID_COLUMN = "uuid"
+VECTOR_COLUMN = "vector"
+
+_METADATA_COLUMNS = (
+    "distance",
+    "certainty",
+    "score",
+    "explain_score",
+    "is_consistent",
+    "rerank_score",
+)
+_TIMESTAMP_COLUMNS = {
+    "creation_time": "creation_time_unix",
+    "last_update_time": "last_update_time_unix",
+}
+
+_Column = Union[List[Any], "_VectorColumn"]
+
+
+class _VectorColumn:
+    """The raw float32 bytes of one vector per row, so that vectors of equal length can be handed to the table libraries
+    as a single buffer."""
+
+    def __init__(self, rows: int, multi: bool) -> None:
+        self.blobs: List[bytes] = [b""] * rows
+        self.multi = multi
+
+    def dimensions(self) -> Optional[int]:
+        """The number of dimensions if every row holds a single vector of the same length, `None` otherwise."""
+        if self.multi or len(self.blobs) == 0:
+            return None
+        length = len(self.blobs[0])
+        if length == 0 or any(len(blob) != length for blob in self.blobs):
+            return None
+        return length // 4
+
+    def to_lists(self) -> List[Any]:
+        unpack = _Unpack.multi if self.multi else _ByteOps.decode_float32s
+        return [unpack(blob) if len(blob) > 0 else None for blob in self.blobs]
+
+
+class _ColumnPropertyDecoder(_PropertyDecoder):
+    """Decodes property values into types that Arrow, pandas and polars can all hold in a column.
+
+    UUIDs are returned as strings and geo coordinates and phone numbers as dicts instead of the model classes used for
+    `Object` properties.
+    """
+
+    def __init__(self, uses_125_api: bool) -> None:
+        super().__init__(uses_125_api)
+        self._value_decoders["uuid_value"] = lambda value: value.uuid_value
+        self._value_decoders["geo_value"] = lambda value: {
+            "latitude": value.geo_value.latitude,
+            "longitude": value.geo_value.longitude,
+        }
+        self._value_decoders["phone_value"] = _decode_phone_to_dict
+        self._list_value_decoders["uuid_values"] = lambda value: list(value.uuid_values.values)
+
+    @staticmethod
+    def for_version(uses_125_api: bool) -> "_PropertyDecoder":
+        return _COLUMN_DECODERS[uses_125_api]
+
+
+def _decode_phone_to_dict(value: properties_pb2.Value) -> Dict[str, Any]:
+    phone = value.phone_value
+    return {
+        "country_code": phone.country_code,
+        "default_country": phone.default_country,
+        "international_formatted": phone.international_formatted,
+        "national": phone.national,
+        "national_formatted": phone.national_formatted,
+        "number": phone.input,
+        "valid": phone.valid,
+    }
+
+
+_COLUMN_DECODERS = {
+    uses_125_api: _ColumnPropertyDecoder(uses_125_api) for uses_125_api in (True, False)
+}
+
+
+def _vector_column_name(name: str) -> str:
+    return VECTOR_COLUMN if name in ("", "default") else f"{VECTOR_COLUMN}.{name}"
+
+
+def _build_columns(
+    results: Sequence[search_get_pb2.SearchResult],
+    options: _QueryOptions,
+    decoder: _PropertyDecoder,
+) -> Dict[str, _Column]:
+    """Decode the results of a search column by column without creating an object per result."""
+    rows = len(results)
+    metadata = [result.metadata for result in results]
+    columns: Dict[str, _Column] = {UUID_COLUMN: [meta.id_as_bytes for meta in metadata]}
+
+    if options.include_metadata:
+        for name in _METADATA_COLUMNS:
+            present = f"{name}_present"
+            if any(getattr(meta, present) for meta in metadata):
+                columns[name] = [
+                    getattr(meta, name) if getattr(meta, present) else None for meta in metadata
+                ]
+        for name, field in _TIMESTAMP_COLUMNS.items():
+            present = f"{field}_present"
+            if any(getattr(meta, present) for meta in metadata):
+                columns[name] = [
+                    _decode_timestamp(getattr(meta, field)) if getattr(meta, present) else None
+                    for meta in metadata
+                ]
+
+    if options.include_properties:
+        decode_value = decoder.decode_value
+        properties: Dict[str, List[Any]] = {}
+        for row, result in enumerate(results):
+            for name, value in result.properties.non_ref_props.fields.items():
+                column = properties.get(name)
+                if column is None:
+                    column = properties[name] = [None] * rows
+                column[row] = decode_value(value)
+        for name, column in properties.items():
+            if name in columns:
+                raise WeaviateInvalidInputError(
+                    f"The property '{name}' has the same name as the '{name}' metadata column of the table, exclude one of them from the query"
+                )
+            columns[name] = column
+
+    if options.include_vector:
+        vectors: Dict[str, _VectorColumn] = {}
+        for row, meta in enumerate(metadata):
+            if len(meta.vector_bytes) > 0:
+                if VECTOR_COLUMN not in vectors:
+                    vectors[VECTOR_COLUMN] = _VectorColumn(rows, multi=False)
+                vectors[VECTOR_COLUMN].blobs[row] = meta.vector_bytes
+            for vec in meta.vectors:
+                name = _vector_column_name(vec.name)
+                if name not in vectors:
+                    vectors[name] = _VectorColumn(
+                        rows, multi=vec.type == base_pb2.Vectors.VECTOR_TYPE_MULTI_FP32
+                    )
+                vectors[name].blobs[row] = vec.vector_bytes
+        for name, vector_column in vectors.items():
+            if name in columns:
+                raise WeaviateInvalidInputError(
+                    f"The property '{name}' has the same name as the '{name}' vector column of the table, exclude one of them from the query"
+                )
+            columns[name] = vector_column
+
+    return columns
+
+
+def _import(package: str, feature: str) -> Any:
+    try:
+        return importlib.import_module(package)
+    except ImportError as e:
+        raise WeaviateOptionalDependencyNotInstalledError(feature, package) from e
+
+
+def _float32_matrix(return_format: ReturnFormat, column: _VectorColumn, dimensions: int) -> Any:
+    np = _import("numpy", f'return_format="{return_format}"')
+    return np.frombuffer(b"".join(column.blobs), dtype="<f4").reshape(-1, dimensions)
+
+
+def _to_arrow(columns: Dict[str, _Column]) -> QueryTable:
+    pa = _import("pyarrow", 'return_format="arrow"')
+    arrays: Dict[str, Any] = {}
+    for name, column in columns.items():
+        if name == UUID_COLUMN:
+            arrays[name] = pa.array(column, type=pa.binary(16))
+        elif isinstance(column, _VectorColumn):
+            dimensions = column.dimensions()
+            if dimensions is not None:
+                values = pa.Array.from_buffers(
+                    pa.float32(),
+                    len(column.blobs) * dimensions,
+                    [None, pa.py_buffer(b"".join(column.blobs))],
+                )
+                arrays[name] = pa.FixedSizeListArray.from_arrays(values, dimensions)
+            else:
+                value_type = pa.list_(pa.float32())
+                arrays[name] = pa.array(
+                    column.to_lists(), type=pa.list_(value_type) if column.multi else value_type
+                )
+        else:
+            arrays[name] = pa.array(column)
+    return pa.table(arrays)
+
+
+def _to_pandas(columns: Dict[str, _Column]) -> QueryTable:
+    pd = _import("pandas", 'return_format="pandas"')
+    data: Dict[str, Any] = {}
+    for name, column in columns.items():
+        if isinstance(column, _VectorColumn):
+            dimensions = column.dimensions()
+            data[name] = pd.Series(
+                (
+                    list(_float32_matrix("pandas", column, dimensions))
+                    if dimensions is not None
+                    else column.to_lists()
+                ),
+                dtype=object,
+            )
+        else:
+            data[name] = column
+    return pd.DataFrame(data)
+
+
+def _to_polars(columns: Dict[str, _Column]) -> QueryTable:
+    pl = _import("polars", 'return_format="polars"')
+    series: List[Any] = []
+    for name, column in columns.items():
+        if name == UUID_COLUMN:
+            series.append(pl.Series(name, column, dtype=pl.Binary))
+        elif isinstance(column, _VectorColumn):
+            dimensions = column.dimensions()
+            if dimensions is not None:
+                series.append(pl.Series(name, _float32_matrix("polars", column, dimensions)))
+            else:
+                series.append(pl.Series(name, column.to_lists()))
+        else:
+            series.append(pl.Series(name, column))
+    return pl.DataFrame(series)
+
+
+_CONVERTERS = {"arrow": _to_arrow, "pandas": _to_pandas, "polars": _to_polars}
+
+
+def _validate_return_format(
+    return_format: Optional[ReturnFormat], *, group_by: Any = None, references: Any = None
+) -> None:
+    if return_format is None:
+        return
+    if return_format not in RETURN_FORMATS:
+        raise WeaviateInvalidInputError(
+            f"return_format must be one of {RETURN_FORMATS}, but is {return_format}"
+        )
+    if group_by is not None:
+        raise WeaviateInvalidInputError("return_format cannot be used together with group_by")
+    if references is not None:
+        raise WeaviateInvalidInputError(
+            "return_format cannot be used together with return_references"
+        )
+
+
+def _decode_table(
+    res: search_get_pb2.SearchReply,
+    options: _QueryOptions,
+    return_format: ReturnFormat,
+    uses_125_api: bool,
+) -> QueryTable:
+    columns = _build_columns(res.results, options, _ColumnPropertyDecoder.for_version(uses_125_api))
+    return _CONVERTERS[return_format](columns)
+
+
+def _last_uuid(table: QueryTable, return_format: ReturnFormat) -> Optional[bytes]:
+    """The raw bytes of the UUID in the last row of a table returned by `_decode_table`."""
+    if len(table) == 0:
+        return None
+    column = table[UUID_COLUMN]
+    if return_format == "arrow":
+        return bytes(column[-1].as_py())
+    if return_format == "pandas":
+        return bytes(column.iloc[-1])
+    return bytes(column[-1])
+
+
+def _decode_ids_and_distances(res: search_get_pb2.SearchReply) -> IdsAndDistances:
+    """Decode only the UUIDs and distances of the results, in a single pass and without creating any objects."""
+    np = _import("numpy", "near_vector_ids")
+    ids: List[bytes] = []
+    distances: List[float] = []
+    for result in res.results:
+        meta = result.metadata
+        ids.append(meta.id_as_bytes)
+        distances.append(meta.distance)
+    return np.frombuffer(b"".join(ids), dtype="V16"), np.array(distances, dtype=np.float32)
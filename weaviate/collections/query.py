@@ -1,5 +1,14 @@
-from typing import Generic
+from typing import Generic, List, Literal, Optional, Sequence, Union, overload
 
+from weaviate.collections.classes.filters import _Filters
+from weaviate.collections.classes.grpc import (
+    METADATA,
+    PROPERTIES,
+    REFERENCES,
+    TargetVectorJoinType,
+)
+from weaviate.collections.classes.internal import CrossReferences
+from weaviate.collections.classes.tenants import Tenant
 from weaviate.collections.classes.types import TProperties, References
 
 from weaviate.collections.queries.bm25 import _BM25QueryAsync, _BM25Query
@@ -12,12 +21,19 @@ from weaviate.collections.queries.fetch_objects_by_ids import (
     _FetchObjectsByIDsQuery,
 )
 from weaviate.collections.queries.fetch_objects import _FetchObjectsQueryAsync, _FetchObjectsQuery
+from weaviate.collections.queries.fan_out import DEFAULT_MAX_CONCURRENCY
 from weaviate.collections.queries.hybrid import _HybridQueryAsync, _HybridQuery
+from weaviate.collections.queries.multi_tenant import (
+    _MultiTenantQueryAsync,
+    _MultiTenantQuery,
+)
 from weaviate.collections.queries.near_image import _NearImageQueryAsync, _NearImageQuery
 from weaviate.collections.queries.near_media import _NearMediaQueryAsync, _NearMediaQuery
 from weaviate.collections.queries.near_object import _NearObjectQueryAsync, _NearObjectQuery
 from weaviate.collections.queries.near_text import _NearTextQueryAsync, _NearTextQuery
 from weaviate.collections.queries.near_vector import _NearVectorQueryAsync, _NearVectorQuery
+from weaviate.collections.queries.prepared import _PreparedQueryAsync, _PreparedQuery
+from weaviate.types import INCLUDE_VECTOR, NUMBER
 
 
 class _QueryCollectionAsync(
@@ -33,7 +49,144 @@ class _QueryCollectionAsync(
     _NearTextQueryAsync[TProperties, References],
     _NearVectorQueryAsync[TProperties, References],
 ):
-    pass
+    def multi_tenant(
+        self,
+        tenants: Sequence[Union[str, Tenant]],
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> _MultiTenantQueryAsync[TProperties, References]:
+        """Use this method to search across many tenants of this multi-tenancy-enabled collection at once.
+
+        This method does not send a request to Weaviate. It returns a query namespace whose searches are fanned out
+        over all the given tenants concurrently and whose results are merged into a single ranked list.
+
+        Arguments:
+            `tenants`
+                The tenants to search in. Can be `str` or `wvc.tenants.Tenant`.
+            `max_concurrency`
+                The maximum number of per-tenant searches in flight at any one time. Defaults to 16.
+        """
+        return _MultiTenantQueryAsync(
+            self._connection,
+            self._name,
+            self._consistency_level,
+            tenants,
+            self._properties,
+            self._references,
+            self._validate_arguments,
+            max_concurrency,
+        )
+
+    @overload
+    def prepare(
+        self,
+        *,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        query_properties: Optional[List[str]] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Union[PROPERTIES, bool, None] = None,
+        return_references: Literal[None] = None,
+    ) -> _PreparedQueryAsync[TProperties, References]: ...
+
+    @overload
+    def prepare(
+        self,
+        *,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        query_properties: Optional[List[str]] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Union[PROPERTIES, bool, None] = None,
+        return_references: REFERENCES,
+    ) -> _PreparedQueryAsync[TProperties, CrossReferences]: ...
+
+    def prepare(
+        self,
+        *,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        query_properties: Optional[List[str]] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Union[PROPERTIES, bool, None] = None,
+        return_references: Optional[REFERENCES] = None,
+    ) -> Union[
+        _PreparedQueryAsync[TProperties, References],
+        _PreparedQueryAsync[TProperties, CrossReferences],
+    ]:
+        """Use this method to prepare a query that is executed many times with only its vector, text or limit changing.
+
+        This method does not send a request to Weaviate. All arguments are validated and converted into a request once,
+        so that each execution of the returned prepared query only has to add its search to a copy of that request.
+
+        Arguments:
+            `limit`
+                The maximum number of results to return. Can be overridden per execution. If not specified, the default limit specified by the server is returned.
+            `offset`
+                The offset to start from. If not specified, the retrieval begins from the first object in the server.
+            `auto_limit`
+                The maximum number of [autocut](https://weaviate.io/developers/weaviate/api/graphql/additional-operators#autocut) results to return. If not specified, no limit is applied.
+            `filters`
+                The filters to apply to the search.
+            `certainty`
+                The minimum similarity score to return for `near_vector` and `near_text` executions. If not specified, the default certainty specified by the server is used.
+            `distance`
+                The maximum distance to search for `near_vector` and `near_text` executions. If not specified, the default distance specified by the server is used.
+            `target_vector`
+                The name of the vector space to search in for named vector configurations. Required if multiple spaces are configured.
+            `query_properties`
+                The properties to search in for `bm25` executions. If not specified, all properties are searched.
+            `include_vector`
+                Whether to include the vector in the results. If not specified, this is set to False.
+            `return_metadata`
+                The metadata to return for each object, defaults to `None`.
+            `return_properties`
+                The properties to return for each object.
+            `return_references`
+                The references to return for each object.
+
+        Returns:
+            A prepared query whose `near_vector`, `near_text` and `bm25` methods execute it.
+        """
+        return _PreparedQueryAsync[TProperties, References](
+            self._connection,
+            self._name,
+            self._consistency_level,
+            self._query._tenant,
+            self._properties,
+            self._references,
+            self._validate_arguments,
+            limit=limit,
+            offset=offset,
+            auto_limit=auto_limit,
+            filters=filters,
+            certainty=certainty,
+            distance=distance,
+            target_vector=target_vector,
+            query_properties=query_properties,
+            include_vector=include_vector,
+            return_metadata=return_metadata,
+            return_properties=return_properties,
+            return_references=return_references,
+        )
 
 
 class _QueryCollection(
@@ -49,4 +202,140 @@ class _QueryCollection(
     _NearTextQuery[TProperties, References],
     _NearVectorQuery[TProperties, References],
 ):
-    pass
+    def multi_tenant(
+        self,
+        tenants: Sequence[Union[str, Tenant]],
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> _MultiTenantQuery[TProperties, References]:
+        """Use this method to search across many tenants of this multi-tenancy-enabled collection at once.
+
+        This method does not send a request to Weaviate. It returns a query namespace whose searches are fanned out
+        over all the given tenants concurrently and whose results are merged into a single ranked list.
+
+        Arguments:
+            `tenants`
+                The tenants to search in. Can be `str` or `wvc.tenants.Tenant`.
+            `max_concurrency`
+                The maximum number of per-tenant searches in flight at any one time. Defaults to 16.
+        """
+        return _MultiTenantQuery(
+            self._connection,
+            self._name,
+            self._consistency_level,
+            tenants,
+            self._properties,
+            self._references,
+            self._validate_arguments,
+            max_concurrency,
+        )
+
+    @overload
+    def prepare(
+        self,
+        *,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        query_properties: Optional[List[str]] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Union[PROPERTIES, bool, None] = None,
+        return_references: Literal[None] = None,
+    ) -> _PreparedQuery[TProperties, References]: ...
+
+    @overload
+    def prepare(
+        self,
+        *,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        query_properties: Optional[List[str]] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Union[PROPERTIES, bool, None] = None,
+        return_references: REFERENCES,
+    ) -> _PreparedQuery[TProperties, CrossReferences]: ...
+
+    def prepare(
+        self,
+        *,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        query_properties: Optional[List[str]] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Union[PROPERTIES, bool, None] = None,
+        return_references: Optional[REFERENCES] = None,
+    ) -> Union[
+        _PreparedQuery[TProperties, References], _PreparedQuery[TProperties, CrossReferences]
+    ]:
+        """Use this method to prepare a query that is executed many times with only its vector, text or limit changing.
+
+        This method does not send a request to Weaviate. All arguments are validated and converted into a request once,
+        so that each execution of the returned prepared query only has to add its search to a copy of that request.
+
+        Arguments:
+            `limit`
+                The maximum number of results to return. Can be overridden per execution. If not specified, the default limit specified by the server is returned.
+            `offset`
+                The offset to start from. If not specified, the retrieval begins from the first object in the server.
+            `auto_limit`
+                The maximum number of [autocut](https://weaviate.io/developers/weaviate/api/graphql/additional-operators#autocut) results to return. If not specified, no limit is applied.
+            `filters`
+                The filters to apply to the search.
+            `certainty`
+                The minimum similarity score to return for `near_vector` and `near_text` executions. If not specified, the default certainty specified by the server is used.
+            `distance`
+                The maximum distance to search for `near_vector` and `near_text` executions. If not specified, the default distance specified by the server is used.
+            `target_vector`
+                The name of the vector space to search in for named vector configurations. Required if multiple spaces are configured.
+            `query_properties`
+                The properties to search in for `bm25` executions. If not specified, all properties are searched.
+            `include_vector`
+                Whether to include the vector in the results. If not specified, this is set to False.
+            `return_metadata`
+                The metadata to return for each object, defaults to `None`.
+            `return_properties`
+                The properties to return for each object.
+            `return_references`
+                The references to return for each object.
+
+        Returns:
+            A prepared query whose `near_vector`, `near_text` and `bm25` methods execute it.
+        """
+        return _PreparedQuery[TProperties, References](
+            self._connection,
+            self._name,
+            self._consistency_level,
+            self._query._tenant,
+            self._properties,
+            self._references,
+            self._validate_arguments,
+            limit=limit,
+            offset=offset,
+            auto_limit=auto_limit,
+            filters=filters,
+            certainty=certainty,
+            distance=distance,
+            target_vector=target_vector,
+            query_properties=query_properties,
+            include_vector=include_vector,
+            return_metadata=return_metadata,
+            return_properties=return_properties,
+            return_references=return_references,
+        )
@@ -1,10 +1,14 @@
 from typing import Dict, List, Optional, Sequence, Union
-from weaviate.collections.classes.tenants import Tenant
+from weaviate.collections.classes.tenants import Tenant, TenantsManyReturn
 from weaviate.collections.tenants.executor import _TenantsExecutor
 from weaviate.collections.tenants.executor import (
     TenantCreateInputType,
     TenantOutputType,
+    TenantsProgressCallback,
     TenantUpdateInputType,
+    TENANTS_MANY_CONCURRENCY,
+    TENANTS_MANY_RETRIES,
+    UPDATE_TENANT_BATCH_SIZE,
 )
 from weaviate.connect.v4 import ConnectionAsync
 
@@ -22,3 +26,31 @@ class _TenantsAsync(_TenantsExecutor[ConnectionAsync]):
         self, tenants: Union[TenantUpdateInputType, Sequence[TenantUpdateInputType]]
     ) -> None: ...
     async def exists(self, tenant: Union[str, Tenant]) -> bool: ...
+    async def refresh_registry(self) -> None: ...
+    async def create_many(
+        self,
+        tenants: Sequence[TenantCreateInputType],
+        *,
+        chunk_size: int = UPDATE_TENANT_BATCH_SIZE,
+        concurrency: int = TENANTS_MANY_CONCURRENCY,
+        retries: int = TENANTS_MANY_RETRIES,
+        on_progress: Optional[TenantsProgressCallback] = None,
+    ) -> TenantsManyReturn: ...
+    async def update_many(
+        self,
+        tenants: Sequence[TenantUpdateInputType],
+        *,
+        chunk_size: int = UPDATE_TENANT_BATCH_SIZE,
+        concurrency: int = TENANTS_MANY_CONCURRENCY,
+        retries: int = TENANTS_MANY_RETRIES,
+        on_progress: Optional[TenantsProgressCallback] = None,
+    ) -> TenantsManyReturn: ...
+    async def remove_many(
+        self,
+        tenants: Sequence[Union[str, Tenant]],
+        *,
+        chunk_size: int = UPDATE_TENANT_BATCH_SIZE,
+        concurrency: int = TENANTS_MANY_CONCURRENCY,
+        retries: int = TENANTS_MANY_RETRIES,
+        on_progress: Optional[TenantsProgressCallback] = None,
+    ) -> TenantsManyReturn: ...
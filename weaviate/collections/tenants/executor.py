@@ -1,6 +1,19 @@
 import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from math import ceil
-from typing import Any, Dict, Generic, List, Optional, Sequence, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 from httpx import Response
 
@@ -12,11 +25,19 @@ from weaviate.collections.classes.tenants import (
     TenantCreateActivityStatus,
     TenantUpdateActivityStatus,
     TenantOutput,
+    TenantsChunkProgress,
+    TenantsManyReturn,
 )
 from weaviate.collections.grpc.tenants import _TenantsGRPC
+from weaviate.collections.tenants.registry import _TenantRegistry
 from weaviate.connect import executor
 from weaviate.connect.v4 import _ExpectedStatusCodes, ConnectionAsync, ConnectionType
-from weaviate.exceptions import WeaviateInvalidInputError
+from weaviate.exceptions import (
+    UnexpectedStatusCodeError,
+    WeaviateConnectionError,
+    WeaviateInvalidInputError,
+    WeaviateTimeoutError,
+)
 from weaviate.proto.v1 import tenants_pb2
 from weaviate.validator import _validate_input, _ValidateArgument
 
@@ -25,6 +46,22 @@ TenantUpdateInputType = Union[Tenant, TenantUpdate]
 TenantOutputType = Tenant
 
 UPDATE_TENANT_BATCH_SIZE = 100
+TENANTS_MANY_CONCURRENCY = 4
+TENANTS_MANY_RETRIES = 2
+TENANTS_MANY_RETRY_BACKOFF = 0.5
+
+T = TypeVar("T")
+C = TypeVar("C")
+
+TenantsProgressCallback = Callable[[TenantsChunkProgress], None]
+
+
+def _is_retryable(error: Exception) -> bool:
+    if isinstance(error, (WeaviateConnectionError, WeaviateTimeoutError)):
+        return True
+    return isinstance(error, UnexpectedStatusCodeError) and (
+        error.status_code >= 500 or error.status_code == 429
+    )
 
 
 class _TenantsExecutor(Generic[ConnectionType]):
@@ -41,6 +78,70 @@ class _TenantsExecutor(Generic[ConnectionType]):
             name=name,
         )
         self._validate_arguments = validate_arguments
+        self._registry: Optional[_TenantRegistry] = None
+
+    @executor.no_wrapping
+    def enable_registry(self, ttl: Optional[float] = None) -> None:
+        """Keep an in-memory registry of the tenants of this collection to answer `exists` and `get_by_name(s)` locally.
+
+        The registry is loaded with a single `TenantsGet` gRPC call on the first lookup and holds only the name and activity
+        status of each tenant, so lookups are O(1) and do not go to the server. Tenants created, updated and removed through
+        this object are applied to the registry directly. Changes made by other clients are only picked up when the registry
+        is reloaded, either once `ttl` has expired or by calling `refresh_registry`.
+
+        Arguments:
+            `ttl`
+                The number of seconds after which the registry is reloaded on the next lookup. If not specified, the registry
+                is only reloaded by calling `refresh_registry`.
+
+        NOTE:
+            - Requires Weaviate 1.25.0 or higher.
+            - With RBAC enabled, the registry only contains the tenants the user is allowed to read.
+        """
+        self._connection._weaviate_version.check_is_at_least_1_25_0("The tenant registry")
+        if self._validate_arguments:
+            _validate_input(_ValidateArgument(expected=[int, float, None], name="ttl", value=ttl))
+        self._registry = _TenantRegistry(ttl)
+
+    @executor.no_wrapping
+    def disable_registry(self) -> None:
+        """Drop the in-memory tenant registry so that all lookups go to the server again."""
+        self._registry = None
+
+    def refresh_registry(self) -> executor.Result[None]:
+        """Reload the in-memory tenant registry from the server.
+
+        Raises:
+            `weaviate.WeaviateConnectionError`
+                If the network connection to Weaviate fails.
+            `weaviate.exceptions.WeaviateInvalidInputError`
+                If the registry has not been enabled with `enable_registry`.
+        """
+        if self._registry is None:
+            raise WeaviateInvalidInputError(
+                f"The tenant registry of collection {self._name} is not enabled, call `enable_registry` first"
+            )
+        self._registry.invalidate()
+        return self.__from_registry(self._registry, lambda registry: None)
+
+    def __from_registry(
+        self, registry: _TenantRegistry, lookup: Callable[[_TenantRegistry], T]
+    ) -> executor.Result[T]:
+        if not registry.is_stale():
+            return executor.return_(
+                lookup(registry),
+                "async" if isinstance(self._connection, ConnectionAsync) else "sync",
+            )
+
+        def resp(res: tenants_pb2.TenantsGetReply) -> T:
+            registry.load(res.tenants)
+            return lookup(registry)
+
+        return executor.execute(
+            response_callback=resp,
+            method=self._connection.grpc_tenants_get,
+            request=self._grpc.get(names=None),
+        )
 
     def create(
         self,
@@ -80,15 +181,21 @@ class _TenantsExecutor(Generic[ConnectionType]):
                 ]
             )
         path = "/schema/" + self._name + "/tenants"
+        mapped_tenants = self.__map_create_tenants(tenants)
 
         def resp(res: Response) -> None:
+            if self._registry is not None:
+                for tenant in mapped_tenants:
+                    self._registry.set_status(
+                        tenant.name, TenantActivityStatus(tenant.activity_status.value)
+                    )
             return None
 
         return executor.execute(
             response_callback=resp,
             method=self._connection.post,
             path=path,
-            weaviate_object=self.__map_create_tenants(tenants),
+            weaviate_object=[tenant.model_dump() for tenant in mapped_tenants],
             error_msg=f"Collection tenants may not have been added properly for {self._name}",
             status_codes=_ExpectedStatusCodes(
                 ok_in=200, error=f"Add collection tenants for {self._name}"
@@ -141,6 +248,9 @@ class _TenantsExecutor(Generic[ConnectionType]):
         path = "/schema/" + self._name + "/tenants"
 
         def resp(res: Response) -> None:
+            if self._registry is not None:
+                for tenant_name in tenant_names:
+                    self._registry.remove(tenant_name)
             return None
 
         return executor.execute(
@@ -235,26 +345,26 @@ class _TenantsExecutor(Generic[ConnectionType]):
 
     def __map_create_tenants(
         self, tenants: Union[str, Tenant, TenantCreate, Sequence[Union[str, Tenant, TenantCreate]]]
-    ) -> List[dict]:
+    ) -> List[TenantCreate]:
         if (
             isinstance(tenants, str)
             or isinstance(tenants, Tenant)
             or isinstance(tenants, TenantCreate)
         ):
-            return [self.__map_create_tenant(tenants).model_dump()]
+            return [self.__map_create_tenant(tenants)]
         else:
-            return [self.__map_create_tenant(tenant).model_dump() for tenant in tenants]
+            return [self.__map_create_tenant(tenant) for tenant in tenants]
 
     def __map_update_tenants(
         self, tenants: Union[TenantUpdateInputType, Sequence[TenantUpdateInputType]]
-    ) -> List[List[dict]]:
+    ) -> List[List[TenantUpdate]]:
         if isinstance(tenants, Tenant) or isinstance(tenants, TenantUpdate):
-            return [[self.__map_update_tenant(tenants).model_dump()]]
+            return [[self.__map_update_tenant(tenants)]]
         else:
             batches = ceil(len(tenants) / UPDATE_TENANT_BATCH_SIZE)
             return [
                 [
-                    self.__map_update_tenant(tenants[i + b * UPDATE_TENANT_BATCH_SIZE]).model_dump()
+                    self.__map_update_tenant(tenants[i + b * UPDATE_TENANT_BATCH_SIZE])
                     for i in range(
                         min(len(tenants) - b * UPDATE_TENANT_BATCH_SIZE, UPDATE_TENANT_BATCH_SIZE)
                     )
@@ -294,6 +404,7 @@ class _TenantsExecutor(Generic[ConnectionType]):
         If the tenant does not exist, it will not be included in the response.
         If no names are provided, all tenants will be returned.
         The collection must have been created with multi-tenancy enabled.
+        If the tenant registry is enabled with `enable_registry`, the lookup is answered from it instead of the server.
 
         Arguments:
             `tenants`
@@ -314,6 +425,18 @@ class _TenantsExecutor(Generic[ConnectionType]):
                     value=tenants,
                 )
             )
+        if self._registry is not None:
+            names = [tenant.name if isinstance(tenant, Tenant) else tenant for tenant in tenants]
+
+            def lookup(registry: _TenantRegistry) -> Dict[str, TenantOutputType]:
+                statuses = {name: registry.status(name) for name in names}
+                return {
+                    name: TenantOutput(name=name, activity_status=status)
+                    for name, status in statuses.items()
+                    if status is not None
+                }
+
+            return self.__from_registry(self._registry, lookup)
         return self.__get_with_grpc(tenants=tenants)
 
     def get_by_name(
@@ -324,6 +447,7 @@ class _TenantsExecutor(Generic[ConnectionType]):
         If the tenant does not exist, `None` will be returned.
 
         The collection must have been created with multi-tenancy enabled.
+        If the tenant registry is enabled with `enable_registry`, the lookup is answered from it instead of the server.
 
         Arguments:
             `tenant`
@@ -341,6 +465,15 @@ class _TenantsExecutor(Generic[ConnectionType]):
                 _ValidateArgument(expected=[Union[str, Tenant]], name="tenant", value=tenant)
             )
         tenant_name = tenant.name if isinstance(tenant, Tenant) else tenant
+        if self._registry is not None:
+
+            def lookup(registry: _TenantRegistry) -> Optional[TenantOutputType]:
+                status = registry.status(tenant_name)
+                if status is None:
+                    return None
+                return TenantOutput(name=tenant_name, activity_status=status)
+
+            return self.__from_registry(self._registry, lookup)
         if self._connection._weaviate_version.is_lower_than(1, 28, 0):
             # For Weaviate versions < 1.28.0, we need to use the gRPC API
             # such versions don't have RBAC so the filtering issue doesn't exist therein
@@ -371,40 +504,56 @@ class _TenantsExecutor(Generic[ConnectionType]):
             ),
         )
 
+    def __registry_update(self, tenants: List[TenantUpdate]) -> None:
+        if self._registry is None:
+            return
+        for tenant in tenants:
+            status = TenantActivityStatus(tenant.activity_status.value)
+            previous = self._registry.status(tenant.name)
+            # moving a tenant to or from cloud storage is asynchronous on the server
+            if status == TenantActivityStatus.OFFLOADED and previous != status:
+                status = TenantActivityStatus.OFFLOADING
+            elif previous == TenantActivityStatus.OFFLOADED and status != previous:
+                status = TenantActivityStatus.ONLOADING
+            self._registry.set_status(tenant.name, status)
+
     def __update(
         self,
         tenants: Union[TenantUpdateInputType, Sequence[TenantUpdateInputType]],
     ) -> executor.Result[None]:
         path = "/schema/" + self._name + "/tenants"
         if isinstance(self._connection, ConnectionAsync):
+            connection = self._connection
+
+            async def _put(mapped_tenants: List[TenantUpdate]) -> None:
+                await executor.aresult(
+                    connection.put(
+                        path=path,
+                        weaviate_object=[tenant.model_dump() for tenant in mapped_tenants],
+                        error_msg=f"Collection tenants may not have been updated properly for {self._name}",
+                        status_codes=_ExpectedStatusCodes(
+                            ok_in=200, error=f"Update collection tenants for {self._name}"
+                        ),
+                    )
+                )
+                self.__registry_update(mapped_tenants)
 
             async def _execute() -> None:
                 await asyncio.gather(
-                    *[
-                        executor.aresult(
-                            self._connection.put(
-                                path=path,
-                                weaviate_object=mapped_tenants,
-                                error_msg=f"Collection tenants may not have been updated properly for {self._name}",
-                                status_codes=_ExpectedStatusCodes(
-                                    ok_in=200, error=f"Update collection tenants for {self._name}"
-                                ),
-                            )
-                        )
-                        for mapped_tenants in self.__map_update_tenants(tenants)
-                    ]
+                    *[_put(mapped_tenants) for mapped_tenants in self.__map_update_tenants(tenants)]
                 )
 
             return _execute()
         for mapped_tenants in self.__map_update_tenants(tenants):
             self._connection.put(
                 path=path,
-                weaviate_object=mapped_tenants,
+                weaviate_object=[tenant.model_dump() for tenant in mapped_tenants],
                 error_msg=f"Collection tenants may not have been updated properly for {self._name}",
                 status_codes=_ExpectedStatusCodes(
                     ok_in=200, error=f"Update collection tenants for {self._name}"
                 ),
             )
+            self.__registry_update(mapped_tenants)
 
     def update(
         self,
@@ -441,6 +590,7 @@ class _TenantsExecutor(Generic[ConnectionType]):
         """Check if a tenant exists for a collection in Weaviate.
 
         The collection must have been created with multi-tenancy enabled.
+        If the tenant registry is enabled with `enable_registry`, the lookup is answered from it instead of the server.
 
         Arguments:
             `tenant`
@@ -466,10 +616,15 @@ class _TenantsExecutor(Generic[ConnectionType]):
                 )
             )
 
+        tenant_name = tenant.name if isinstance(tenant, Tenant) else tenant
+        if self._registry is not None:
+            return self.__from_registry(
+                self._registry, lambda registry: registry.status(tenant_name) is not None
+            )
+
         def resp(res: Response) -> bool:
             return res.status_code == 200
 
-        tenant_name = tenant.name if isinstance(tenant, Tenant) else tenant
         path = "/schema/" + self._name + "/tenants/" + tenant_name
         return executor.execute(
             response_callback=resp,
@@ -480,3 +635,300 @@ class _TenantsExecutor(Generic[ConnectionType]):
                 ok_in=[200, 404], error=f"Check if tenant exists for {self._name}"
             ),  # allow 404 to perform bool check on response code
         )
+
+    def __validate_many(self, chunk_size: int, concurrency: int, retries: int) -> None:
+        if self._validate_arguments:
+            _validate_input(
+                [
+                    _ValidateArgument(expected=[int], name="chunk_size", value=chunk_size),
+                    _ValidateArgument(expected=[int], name="concurrency", value=concurrency),
+                    _ValidateArgument(expected=[int], name="retries", value=retries),
+                ]
+            )
+        if chunk_size < 1 or concurrency < 1 or retries < 0:
+            raise WeaviateInvalidInputError(
+                f"chunk_size and concurrency must be at least 1 and retries at least 0, but got {chunk_size}, {concurrency} and {retries}"
+            )
+
+    def __many(
+        self,
+        items: List[C],
+        name_of: Callable[[C], str],
+        send: Callable[[List[C]], executor.Result[Any]],
+        on_success: Callable[[List[C]], None],
+        chunk_size: int,
+        concurrency: int,
+        retries: int,
+        on_progress: Optional[TenantsProgressCallback],
+    ) -> executor.Result[TenantsManyReturn]:
+        chunks = [items[i : i + chunk_size] for i in range(0, len(items), chunk_size)]
+        ret = TenantsManyReturn(succeeded=[], failed={})
+        processed = 0
+
+        # progress is always reported from the calling thread or task, in order of chunk completion
+        def report(chunk: List[C], error: Optional[Exception]) -> None:
+            nonlocal processed
+            names = [name_of(item) for item in chunk]
+            processed += len(names)
+            if error is None:
+                ret.succeeded.extend(names)
+            else:
+                ret.failed.update((name, error) for name in names)
+            if on_progress is not None:
+                on_progress(
+                    TenantsChunkProgress(
+                        succeeded=names if error is None else [],
+                        failed=[] if error is None else names,
+                        error=error,
+                        processed=processed,
+                        total=len(items),
+                    )
+                )
+
+        if isinstance(self._connection, ConnectionAsync):
+
+            async def _send(chunk: List[C]) -> Tuple[List[C], Optional[Exception]]:
+                async with semaphore:
+                    for attempt in range(retries + 1):
+                        try:
+                            await executor.aresult(send(chunk))
+                            on_success(chunk)
+                            return chunk, None
+                        except Exception as e:
+                            if attempt == retries or not _is_retryable(e):
+                                return chunk, e
+                            await asyncio.sleep(TENANTS_MANY_RETRY_BACKOFF * 2**attempt)
+                    raise AssertionError("unreachable")
+
+            async def _execute() -> TenantsManyReturn:
+                for next_done in asyncio.as_completed([_send(chunk) for chunk in chunks]):
+                    report(*await next_done)
+                return ret
+
+            semaphore = asyncio.Semaphore(concurrency)
+            return _execute()
+
+        def _send_sync(chunk: List[C]) -> Optional[Exception]:
+            for attempt in range(retries + 1):
+                try:
+                    send(chunk)
+                    on_success(chunk)
+                    return None
+                except Exception as e:
+                    if attempt == retries or not _is_retryable(e):
+                        return e
+                    time.sleep(TENANTS_MANY_RETRY_BACKOFF * 2**attempt)
+            raise AssertionError("unreachable")
+
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            futures = {pool.submit(_send_sync, chunk): chunk for chunk in chunks}
+            for future in as_completed(futures):
+                report(futures[future], future.result())
+        return ret
+
+    def create_many(
+        self,
+        tenants: Sequence[TenantCreateInputType],
+        *,
+        chunk_size: int = UPDATE_TENANT_BATCH_SIZE,
+        concurrency: int = TENANTS_MANY_CONCURRENCY,
+        retries: int = TENANTS_MANY_RETRIES,
+        on_progress: Optional[TenantsProgressCallback] = None,
+    ) -> executor.Result[TenantsManyReturn]:
+        """Create many tenants for a collection in Weaviate using concurrent requests of `chunk_size` tenants each.
+
+        Unlike `create`, a failing chunk does not fail the whole operation. Chunks failing because of a connection error,
+        a timeout or a 5xx/429 status code are retried with exponential backoff, all other failures are reported as is.
+
+        Arguments:
+            `tenants`
+                A list of tenant names, `wvc.config.tenants.Tenant` and/or `wvc.config.tenants.TenantCreate` objects to add to the given collection.
+            `chunk_size`
+                The number of tenants sent per request, defaults to 100.
+            `concurrency`
+                The maximum number of requests in flight at any one time, defaults to 4.
+            `retries`
+                The number of times a failing chunk is retried, defaults to 2.
+            `on_progress`
+                A callback called with a `TenantsChunkProgress` object whenever a chunk has succeeded or finally failed.
+
+        Returns:
+            A `TenantsManyReturn` object containing the names of the created tenants and the errors of the failed ones.
+
+        Raises:
+            `weaviate.WeaviateInvalidInputError`
+                If the input arguments are invalid.
+        """
+        if self._validate_arguments:
+            _validate_input(
+                _ValidateArgument(
+                    expected=[Sequence[Union[str, Tenant, TenantCreate]]],
+                    name="tenants",
+                    value=tenants,
+                )
+            )
+        self.__validate_many(chunk_size, concurrency, retries)
+        path = "/schema/" + self._name + "/tenants"
+
+        def send(chunk: List[TenantCreate]) -> executor.Result[Response]:
+            return self._connection.post(
+                path=path,
+                weaviate_object=[tenant.model_dump() for tenant in chunk],
+                error_msg=f"Collection tenants may not have been added properly for {self._name}",
+                status_codes=_ExpectedStatusCodes(
+                    ok_in=200, error=f"Add collection tenants for {self._name}"
+                ),
+            )
+
+        def on_success(chunk: List[TenantCreate]) -> None:
+            if self._registry is not None:
+                for tenant in chunk:
+                    self._registry.set_status(
+                        tenant.name, TenantActivityStatus(tenant.activity_status.value)
+                    )
+
+        return self.__many(
+            self.__map_create_tenants(tenants),
+            lambda tenant: tenant.name,
+            send,
+            on_success,
+            chunk_size,
+            concurrency,
+            retries,
+            on_progress,
+        )
+
+    def update_many(
+        self,
+        tenants: Sequence[TenantUpdateInputType],
+        *,
+        chunk_size: int = UPDATE_TENANT_BATCH_SIZE,
+        concurrency: int = TENANTS_MANY_CONCURRENCY,
+        retries: int = TENANTS_MANY_RETRIES,
+        on_progress: Optional[TenantsProgressCallback] = None,
+    ) -> executor.Result[TenantsManyReturn]:
+        """Update many tenants for a collection in Weaviate using concurrent requests of `chunk_size` tenants each.
+
+        Unlike `update`, a failing chunk does not fail the whole operation. Chunks failing because of a connection error,
+        a timeout or a 5xx/429 status code are retried with exponential backoff, all other failures are reported as is.
+
+        Arguments:
+            `tenants`
+                A list of `wvc.config.tenants.Tenant` and/or `wvc.config.tenants.TenantUpdate` objects to update for the given collection.
+            `chunk_size`
+                The number of tenants sent per request, defaults to 100.
+            `concurrency`
+                The maximum number of requests in flight at any one time, defaults to 4.
+            `retries`
+                The number of times a failing chunk is retried, defaults to 2.
+            `on_progress`
+                A callback called with a `TenantsChunkProgress` object whenever a chunk has succeeded or finally failed.
+
+        Returns:
+            A `TenantsManyReturn` object containing the names of the updated tenants and the errors of the failed ones.
+
+        Raises:
+            `weaviate.WeaviateInvalidInputError`
+                If the input arguments are invalid.
+        """
+        if self._validate_arguments:
+            _validate_input(
+                _ValidateArgument(
+                    expected=[Sequence[Union[Tenant, TenantUpdate]]],
+                    name="tenants",
+                    value=tenants,
+                )
+            )
+        self.__validate_many(chunk_size, concurrency, retries)
+        path = "/schema/" + self._name + "/tenants"
+
+        def send(chunk: List[TenantUpdate]) -> executor.Result[Response]:
+            return self._connection.put(
+                path=path,
+                weaviate_object=[tenant.model_dump() for tenant in chunk],
+                error_msg=f"Collection tenants may not have been updated properly for {self._name}",
+                status_codes=_ExpectedStatusCodes(
+                    ok_in=200, error=f"Update collection tenants for {self._name}"
+                ),
+            )
+
+        return self.__many(
+            [self.__map_update_tenant(tenant) for tenant in tenants],
+            lambda tenant: tenant.name,
+            send,
+            self.__registry_update,
+            chunk_size,
+            concurrency,
+            retries,
+            on_progress,
+        )
+
+    def remove_many(
+        self,
+        tenants: Sequence[Union[str, Tenant]],
+        *,
+        chunk_size: int = UPDATE_TENANT_BATCH_SIZE,
+        concurrency: int = TENANTS_MANY_CONCURRENCY,
+        retries: int = TENANTS_MANY_RETRIES,
+        on_progress: Optional[TenantsProgressCallback] = None,
+    ) -> executor.Result[TenantsManyReturn]:
+        """Remove many tenants from a collection in Weaviate using concurrent requests of `chunk_size` tenants each.
+
+        Unlike `remove`, a failing chunk does not fail the whole operation. Chunks failing because of a connection error,
+        a timeout or a 5xx/429 status code are retried with exponential backoff, all other failures are reported as is.
+
+        Arguments:
+            `tenants`
+                A list of tenant names and/or `wvc.config.tenants.Tenant` objects to remove from the given collection.
+            `chunk_size`
+                The number of tenants sent per request, defaults to 100.
+            `concurrency`
+                The maximum number of requests in flight at any one time, defaults to 4.
+            `retries`
+                The number of times a failing chunk is retried, defaults to 2.
+            `on_progress`
+                A callback called with a `TenantsChunkProgress` object whenever a chunk has succeeded or finally failed.
+
+        Returns:
+            A `TenantsManyReturn` object containing the names of the removed tenants and the errors of the failed ones.
+
+        Raises:
+            `weaviate.WeaviateInvalidInputError`
+                If the input arguments are invalid.
+        """
+        if self._validate_arguments:
+            _validate_input(
+                _ValidateArgument(
+                    expected=[Sequence[Union[str, Tenant]]],
+                    name="tenants",
+                    value=tenants,
+                )
+            )
+        self.__validate_many(chunk_size, concurrency, retries)
+        path = "/schema/" + self._name + "/tenants"
+
+        def send(chunk: List[str]) -> executor.Result[Response]:
+            return self._connection.delete(
+                path=path,
+                weaviate_object=chunk,
+                error_msg=f"Collection tenants may not have been deleted for {self._name}",
+                status_codes=_ExpectedStatusCodes(
+                    ok_in=200, error=f"Delete collection tenants for {self._name}"
+                ),
+            )
+
+        def on_success(chunk: List[str]) -> None:
+            if self._registry is not None:
+                for tenant_name in chunk:
+                    self._registry.remove(tenant_name)
+
+        return self.__many(
+            [tenant.name if isinstance(tenant, Tenant) else tenant for tenant in tenants],
+            lambda tenant_name: tenant_name,
+            send,
+            on_success,
+            chunk_size,
+            concurrency,
+            retries,
+            on_progress,
+        )
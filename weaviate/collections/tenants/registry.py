@@ -0,0 +1,51 @@
+import time
+from typing import Dict, Iterable, Optional, cast
+
+from weaviate.collections.classes.tenants import TenantActivityStatus
+from weaviate.collections.grpc.tenants import _TenantsGRPC
+from weaviate.proto.v1 import tenants_pb2
+
+_STATUSES: Dict[int, TenantActivityStatus] = {
+    value: _TenantsGRPC.map_activity_status(cast(tenants_pb2.TenantActivityStatus, value))
+    for value in tenants_pb2.TenantActivityStatus.values()
+    if value != tenants_pb2.TENANT_ACTIVITY_STATUS_UNSPECIFIED
+}
+
+
+class _TenantRegistry:
+    """An in-memory view of the tenants of a single collection.
+
+    The registry holds only the name and activity status of each tenant, so that lookups are a single dict access and
+    no `Tenant` objects are created when loading it. It is loaded from a `TenantsGetReply` and kept up to date with the
+    tenants created, updated and removed by this client in between loads.
+    """
+
+    def __init__(self, ttl: Optional[float]) -> None:
+        self.__ttl = ttl
+        self.__statuses: Dict[str, TenantActivityStatus] = {}
+        self.__loaded_at: Optional[float] = None
+
+    def is_stale(self) -> bool:
+        if self.__loaded_at is None:
+            return True
+        return self.__ttl is not None and time.monotonic() - self.__loaded_at > self.__ttl
+
+    def invalidate(self) -> None:
+        self.__loaded_at = None
+
+    def load(self, tenants: Iterable[tenants_pb2.Tenant]) -> None:
+        # the whole dict is swapped at once so that concurrent readers never see a partially loaded registry
+        self.__statuses = {tenant.name: _STATUSES[tenant.activity_status] for tenant in tenants}
+        self.__loaded_at = time.monotonic()
+
+    def status(self, name: str) -> Optional[TenantActivityStatus]:
+        return self.__statuses.get(name)
+
+    def set_status(self, name: str, status: TenantActivityStatus) -> None:
+        self.__statuses[name] = status
+
+    def remove(self, name: str) -> None:
+        self.__statuses.pop(name, None)
+
+    def __len__(self) -> int:
+        return len(self.__statuses)
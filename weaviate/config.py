@@ -75,12 +75,22 @@ class AdditionalConfig(BaseModel):
 
     When specifying the proxies, be aware that supplying a URL (`str`) will populate all of the `http`, `https`, and grpc proxies.
     In order for this to be possible, you must have a proxy that is capable of handling simultaneous HTTP/1.1 and HTTP/2 traffic.
+
+    When specifying `schema_cache_ttl`, the client caches the collection configurations it fetches for that many seconds and
+    serves `collection.config.get()`, `collections.export_config()` and `collections.list_all()` from the cache. The cache is
+    invalidated by the collection changes made through this client, but not by changes made through other clients.
+
+    When specifying `offload_threshold`, the async client encodes inserted objects and decodes query results in the default
+    executor of the event loop instead of on the event loop itself, if their size reaches that many bytes. This keeps the
+    event loop responsive while large payloads are converted, the executor can be replaced with `loop.set_default_executor()`.
     """
 
     connection: ConnectionConfig = Field(default_factory=ConnectionConfig)
     proxies: Union[str, Proxies, None] = Field(default=None)
     timeout_: Union[Tuple[int, int], Timeout] = Field(default_factory=Timeout, alias="timeout")
     trust_env: bool = Field(default=False)
+    schema_cache_ttl: Optional[Union[int, float]] = Field(default=None, ge=0)
+    offload_threshold: Optional[int] = Field(default=None, ge=0)
 
     @property
     def timeout(self) -> Timeout:
@@ -0,0 +1,45 @@
+import time
+from typing import Any, Dict, Optional, Tuple
+
+_Entry = Tuple[float, Dict[str, Any]]
+
+
+class _SchemaCache:
+    """A per-connection cache of the raw schema responses of Weaviate.
+
+    Entries expire `ttl` seconds after they were stored. The client drops the affected entries whenever it changes a
+    collection itself, but changes made by other clients are only seen once the entries have expired.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self.__ttl = ttl
+        self.__collections: Dict[str, _Entry] = {}
+        self.__all: Optional[_Entry] = None
+
+    def __fresh(self, entry: Optional[_Entry]) -> Optional[Dict[str, Any]]:
+        if entry is None or time.monotonic() - entry[0] > self.__ttl:
+            return None
+        return entry[1]
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        return self.__fresh(self.__collections.get(name))
+
+    def get_all(self) -> Optional[Dict[str, Any]]:
+        return self.__fresh(self.__all)
+
+    def put(self, name: str, schema: Dict[str, Any]) -> None:
+        self.__collections[name] = (time.monotonic(), schema)
+
+    def put_all(self, schema: Dict[str, Any]) -> None:
+        now = time.monotonic()
+        self.__all = (now, schema)
+        for collection in schema.get("classes") or []:
+            self.__collections[collection["class"]] = (now, collection)
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """Drop the cached schema of the given collection, or of all collections if no name is given."""
+        self.__all = None
+        if name is None:
+            self.__collections = {}
+        else:
+            self.__collections.pop(name, None)
@@ -58,6 +58,7 @@ from weaviate.connect.base import (
 from weaviate.connect import executor
 from weaviate.connect.event_loop import _EventLoopSingleton
 from weaviate.connect.integrations import _IntegrationConfig
+from weaviate.connect.schema_cache import _SchemaCache
 from weaviate.embedded import EmbeddedV4
 from weaviate.exceptions import (
     AuthenticationFailedError,
@@ -126,6 +127,8 @@ class _ConnectionBase:
         connection_config: ConnectionConfig,
         embedded_db: Optional[EmbeddedV4] = None,
         skip_init_checks: bool = False,
+        schema_cache_ttl: Optional[float] = None,
+        offload_threshold: Optional[int] = None,
     ):
         self.url = connection_params._http_url
         self.embedded_db = embedded_db
@@ -143,6 +146,10 @@ class _ConnectionBase:
         self._grpc_max_msg_size: Optional[int] = None
         self._connected = False
         self._skip_init_checks = skip_init_checks
+        self._schema_cache = (
+            _SchemaCache(schema_cache_ttl) if schema_cache_ttl is not None else None
+        )
+        self._offload_threshold = offload_threshold
 
         self._headers = {"content-type": "application/json"}
         self.__add_weaviate_embedding_service_header(connection_params.http.host)
@@ -245,6 +252,10 @@ class _ConnectionBase:
     def is_connected(self) -> bool:
         return self._connected
 
+    def _offloads(self, size: int) -> bool:
+        """Whether a payload of `size` bytes is encoded or decoded in the executor of the event loop."""
+        return self._offload_threshold is not None and size >= self._offload_threshold
+
     def get_current_bearer_token(self) -> str:
         if not self.is_connected():
             raise WeaviateClosedClientError()
@@ -388,3 +388,12 @@ class WeaviateAgentsNotInstalledError(WeaviateBaseError):
         super().__init__(
             'Weaviate Agents (Alpha) functionality requires additional dependencies. Please install them using: "pip install weaviate-client[agents]"'
         )
+
+
+class WeaviateOptionalDependencyNotInstalledError(WeaviateBaseError):
+    """Error raised when using functionality that requires an optional dependency which is not installed."""
+
+    def __init__(self, feature: str, package: str) -> None:
+        super().__init__(
+            f'{feature} requires {package}. Please install it using: "pip install {package}"'
+        )
@@ -2,6 +2,7 @@ from weaviate.collections.classes.batch import (
     BatchObjectReturn,
     BatchReferenceReturn,
     BatchResult,
+    BatchStats,
     ErrorObject,
     ErrorReference,
 )
@@ -10,6 +11,7 @@ __all__ = [
     "BatchObjectReturn",
     "BatchReferenceReturn",
     "BatchResult",
+    "BatchStats",
     "ErrorObject",
     "ErrorReference",
 ]
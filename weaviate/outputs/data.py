@@ -2,6 +2,8 @@ from weaviate.collections.classes.data import Error, RefError
 from weaviate.collections.classes.batch import (
     DeleteManyObject,
     DeleteManyReturn,
+    ImportFileProgress,
+    ImportFileReturn,
 )
 
 
@@ -9,5 +11,7 @@ __all__ = [
     "DeleteManyObject",
     "DeleteManyReturn",
     "Error",
+    "ImportFileProgress",
+    "ImportFileReturn",
     "RefError",
 ]
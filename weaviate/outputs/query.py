@@ -21,6 +21,7 @@ from weaviate.collections.classes.internal import (
     GenerativeSearchReturnType,
     MetadataReturn,
     MetadataSingleObjectReturn,
+    MultiTenantQueryReturn,
     Object,
     ObjectSingleReturn,
     GroupByObject,
@@ -37,6 +38,7 @@ from weaviate.collections.classes.internal import (
     QuerySingleReturn,
     ReferenceInput,
     ReferenceInputs,
+    TenantObject,
 )
 from weaviate.collections.classes.types import (
     GeoCoordinate,
@@ -60,6 +62,7 @@ __all__ = [
     "ListOfVectorsQuery",
     "MetadataReturn",
     "MetadataSingleObjectReturn",
+    "MultiTenantQueryReturn",
     "NearVectorInputType",
     "Object",
     "ObjectSingleReturn",
@@ -80,6 +83,7 @@ __all__ = [
     "ReferenceInputs",
     "Sorting",
     "TargetVectorJoinType",
+    "TenantObject",
     "WeaviateField",
     "WeaviateProperties",
 ]
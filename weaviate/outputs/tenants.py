@@ -1,4 +1,15 @@
-from weaviate.collections.classes.tenants import Tenant, TenantActivityStatus
+from weaviate.collections.classes.tenants import (
+    Tenant,
+    TenantActivityStatus,
+    TenantsChunkProgress,
+    TenantsManyReturn,
+)
 from weaviate.collections.tenants import TenantOutputType
 
-__all__ = ["Tenant", "TenantActivityStatus", "TenantOutputType"]
+__all__ = [
+    "Tenant",
+    "TenantActivityStatus",
+    "TenantOutputType",
+    "TenantsChunkProgress",
+    "TenantsManyReturn",
+]
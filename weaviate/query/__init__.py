@@ -0,0 +1,7 @@
+from .async_ import _QueryAsync
+from .sync import _Query
+
+__all__ = [
+    "_Query",
+    "_QueryAsync",
+]
@@ -0,0 +1,8 @@
+from weaviate.connect import executor
+from weaviate.connect.v4 import ConnectionAsync
+from weaviate.query.executor import _QueryExecutor
+
+
+@executor.wrap("async")
+class _QueryAsync(_QueryExecutor[ConnectionAsync]):
+    pass
@@ -0,0 +1,36 @@
+from typing import List, Optional, Sequence
+
+from weaviate.collections.classes.filters import _Filters
+from weaviate.collections.classes.grpc import (
+    METADATA,
+    PROPERTIES,
+    REFERENCES,
+    NearVectorInputType,
+    TargetVectorJoinType,
+)
+from weaviate.collections.classes.internal import CrossReferences, QueryReturn, WeaviateProperties
+from weaviate.connect.v4 import ConnectionAsync
+from weaviate.query.executor import _QueryExecutor
+from weaviate.types import INCLUDE_VECTOR, NUMBER
+
+class _QueryAsync(_QueryExecutor[ConnectionAsync]):
+    async def search_many(
+        self,
+        collections: Sequence[str],
+        *,
+        near_vector: Optional[NearVectorInputType] = None,
+        query: Optional[str] = None,
+        alpha: NUMBER = 0.7,
+        query_properties: Optional[List[str]] = None,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: int = 10,
+        filters: Optional[_Filters] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Optional[REFERENCES] = None,
+        max_concurrency: int = 16,
+        rrf_k: int = 60,
+    ) -> QueryReturn[WeaviateProperties, CrossReferences]: ...
@@ -0,0 +1,218 @@
+from typing import Any, Dict, Generic, Iterator, List, Optional, Sequence, Tuple
+
+from weaviate.collections.classes.filters import _Filters
+from weaviate.collections.classes.grpc import (
+    METADATA,
+    PROPERTIES,
+    REFERENCES,
+    NearVectorInputType,
+    TargetVectorJoinType,
+)
+from weaviate.collections.classes.internal import (
+    CrossReferences,
+    QueryReturn,
+    WeaviateProperties,
+    _QueryOptions,
+)
+from weaviate.collections.queries.executor import _BaseExecutor
+from weaviate.collections.queries.fan_out import (
+    DEFAULT_MAX_CONCURRENCY,
+    _TopK,
+    _afan_out,
+    _fan_out,
+    _result_sort_key,
+)
+from weaviate.connect import executor
+from weaviate.connect.v4 import ConnectionAsync, ConnectionType
+from weaviate.exceptions import WeaviateInvalidInputError
+from weaviate.proto.v1 import search_get_pb2
+from weaviate.types import INCLUDE_VECTOR, NUMBER
+from weaviate.util import _capitalize_first_letter
+from weaviate.validator import _validate_input, _ValidateArgument
+
+RRF_K = 60
+
+_CollectionRequest = Tuple[str, search_get_pb2.SearchRequest]
+
+
+class _QueryExecutor(Generic[ConnectionType]):
+    def __init__(self, connection: ConnectionType):
+        self._connection = connection
+
+    def search_many(
+        self,
+        collections: Sequence[str],
+        *,
+        near_vector: Optional[NearVectorInputType] = None,
+        query: Optional[str] = None,
+        alpha: NUMBER = 0.7,
+        query_properties: Optional[List[str]] = None,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: int = 10,
+        filters: Optional[_Filters] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Optional[REFERENCES] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        rrf_k: int = RRF_K,
+    ) -> executor.Result[QueryReturn[WeaviateProperties, CrossReferences]]:
+        """Search several collections at once and merge their results into a single ranked list.
+
+        One search is sent per collection over the gRPC channel, with at most `max_concurrency` of them in flight at once.
+        If only `near_vector` is given, a vector search is performed in each collection and the results are merged by distance.
+        If `query` is given, a hybrid search is performed in each collection (using `near_vector` as its vector if provided) and,
+        as hybrid scores are not comparable across collections, the results are merged using reciprocal rank fusion (RRF).
+
+        Arguments:
+            `collections`
+                The names of the collections to search in, REQUIRED.
+            `near_vector`
+                The vector to search on. Required if `query` is not provided.
+            `query`
+                The keyword query of a hybrid search. If provided, the collections are searched with hybrid search.
+            `alpha`
+                The weight of the vector search in the hybrid search, defaults to 0.7.
+            `query_properties`
+                The properties to search in for the keyword part of the hybrid search.
+            `certainty`
+                The minimum similarity score to return. Only applies to vector searches.
+            `distance`
+                The maximum distance to search.
+            `limit`
+                The maximum number of results to return, both per collection and overall. Defaults to 10.
+            `filters`
+                The filters to apply to the search in every collection.
+            `target_vector`
+                The name of the vector space to search in for named vector configurations.
+            `include_vector`
+                Whether to include the vector in the results. If not specified, this is set to False.
+            `return_metadata`
+                The metadata to return for each object, defaults to `None`.
+            `return_properties`
+                The properties to return for each object.
+            `return_references`
+                The references to return for each object.
+            `max_concurrency`
+                The maximum number of per-collection searches in flight at any one time. Defaults to 16.
+            `rrf_k`
+                The rank constant of the reciprocal rank fusion used to merge hybrid results, defaults to 60.
+
+        NOTE:
+            - Only the final top-`limit` results are deserialized into objects.
+            - The `collection` attribute of each returned object is the collection it was found in.
+
+        Returns:
+            A `QueryReturn` object that includes the searched objects of all collections ranked together.
+
+        Raises:
+            `weaviate.exceptions.WeaviateGRPCQueryError`:
+                If the request to the Weaviate server fails for any of the collections.
+            `weaviate.exceptions.WeaviateInvalidInputError`:
+                If neither `near_vector` nor `query` is provided.
+        """
+        _validate_input(
+            [
+                _ValidateArgument([Sequence[str]], "collections", collections),
+                _ValidateArgument([int], "limit", limit),
+                _ValidateArgument([int], "max_concurrency", max_concurrency),
+                _ValidateArgument([int], "rrf_k", rrf_k),
+            ]
+        )
+        if near_vector is None and query is None:
+            raise WeaviateInvalidInputError("Either near_vector or query must be provided")
+        if max_concurrency < 1:
+            raise WeaviateInvalidInputError(
+                f"max_concurrency must be at least 1, but is {max_concurrency}"
+            )
+
+        use_rrf = query is not None
+        executors = {
+            name: _BaseExecutor(self._connection, name, None, None, None, None, True)
+            for name in (_capitalize_first_letter(collection) for collection in collections)
+        }
+
+        def requests() -> Iterator[_CollectionRequest]:
+            for name, base in executors.items():
+                metadata = base._parse_return_metadata(return_metadata, include_vector)
+                assert metadata is not None
+                if use_rrf:
+                    request = base._query.hybrid(
+                        query=query,
+                        alpha=float(alpha),
+                        vector=near_vector,
+                        properties=query_properties,
+                        distance=distance,
+                        limit=limit,
+                        filters=filters,
+                        target_vector=target_vector,
+                        return_metadata=metadata,
+                        return_properties=base._parse_return_properties(return_properties),
+                        return_references=base._parse_return_references(return_references),
+                    )
+                else:
+                    assert near_vector is not None
+                    metadata.distance = True  # always required to merge the results by distance
+                    request = base._query.near_vector(
+                        near_vector=near_vector,
+                        certainty=certainty,
+                        distance=distance,
+                        limit=limit,
+                        filters=filters,
+                        target_vector=target_vector,
+                        return_metadata=metadata,
+                        return_properties=base._parse_return_properties(return_properties),
+                        return_references=base._parse_return_references(return_references),
+                    )
+                yield name, request
+
+        replies: Dict[str, search_get_pb2.SearchReply] = {}
+
+        def on_reply(
+            collection_request: _CollectionRequest, reply: search_get_pb2.SearchReply
+        ) -> bool:
+            replies[collection_request[0]] = reply
+            return False
+
+        def resp() -> QueryReturn[WeaviateProperties, CrossReferences]:
+            # merging in the order of the input keeps ties deterministic regardless of reply arrival order
+            top_k: _TopK[Tuple[str, search_get_pb2.SearchResult]] = _TopK(limit)
+            for name in executors:
+                for rank, result in enumerate(replies[name].results):
+                    key = -1.0 / (rrf_k + rank + 1) if use_rrf else _result_sort_key(result)
+                    top_k.push(key, (name, result))
+
+            options = _QueryOptions.from_input(
+                return_metadata, return_properties, include_vector, None, return_references
+            )
+            objects: List[Any] = []
+            for name, result in top_k.items():
+                obj = executors[name]._result_to_query_object(result, options)
+                obj.collection = name
+                objects.append(obj)
+            return QueryReturn(objects=objects)
+
+        if isinstance(self._connection, ConnectionAsync):
+            connection = self._connection
+
+            async def _execute() -> QueryReturn[WeaviateProperties, CrossReferences]:
+                await _afan_out(
+                    lambda collection_request: connection.grpc_search(collection_request[1]),
+                    requests(),
+                    max_concurrency,
+                    on_reply,
+                )
+                return resp()
+
+            return _execute()
+
+        connection = self._connection
+        _fan_out(
+            lambda collection_request: connection.grpc_search(collection_request[1]),
+            requests(),
+            max_concurrency,
+            on_reply,
+        )
+        return resp()
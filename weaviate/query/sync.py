@@ -0,0 +1,8 @@
+from weaviate.connect import executor
+from weaviate.connect.v4 import ConnectionSync
+from weaviate.query.executor import _QueryExecutor
+
+
+@executor.wrap("sync")
+class _Query(_QueryExecutor[ConnectionSync]):
+    pass
@@ -317,6 +317,22 @@ def get_valid_uuid(uuid: Union[str, uuid_lib.UUID]) -> str:
     return _uuid
 
 
+_CANONICAL_UUID = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}")
+
+
+def _get_valid_uuids(uuids: Sequence[Union[str, uuid_lib.UUID]]) -> List[str]:
+    """Validate and extract many UUIDs at once, see `get_valid_uuid`.
+
+    Strings that already are canonical lower-case UUIDs, by far the most common input, are only matched against a
+    regex instead of being parsed and formatted again.
+    """
+    match = _CANONICAL_UUID.fullmatch
+    return [
+        uuid if isinstance(uuid, str) and match(uuid) is not None else get_valid_uuid(uuid)
+        for uuid in uuids
+    ]
+
+
 def get_vector(vector: Sequence) -> Sequence[float]:
     """
     Get weaviate compatible format of the embedding vector.
@@ -869,6 +885,13 @@ def _datetime_to_string(value: TIME) -> str:
 
 
 def _datetime_from_weaviate_str(string: str) -> datetime.datetime:
+    # fast path for RFC3339 strings, fromisoformat only understands a trailing Z from Python 3.11 on
+    try:
+        return datetime.datetime.fromisoformat(
+            string[:-1] + "+00:00" if string[-1] == "Z" else string
+        )
+    except ValueError:  # e.g. fractional seconds with other than 3 or 6 digits before Python 3.11
+        pass
     try:
         return datetime.datetime.strptime(
             "".join(string.rsplit(":", 1) if string[-1] != "Z" else string),
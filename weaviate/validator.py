@@ -1,5 +1,16 @@
 from dataclasses import dataclass
-from typing import Any, List, Sequence, Union, get_args, get_origin
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+    get_args,
+    get_origin,
+)
 
 from weaviate.exceptions import WeaviateInvalidInputError
 from weaviate.str_enum import BaseEnum
@@ -19,6 +30,18 @@ class _ExtraTypes(str, BaseEnum):
     TF = "tensorflow"
 
 
+_Check = Callable[[Any], bool]
+
+# sequences longer than this are validated on an evenly spaced sample of their elements instead of on every element
+_SAMPLE_THRESHOLD = 1000
+_SAMPLE_SIZE = 100
+
+# compiled checks by the id of their expected type, the expected type is kept alive in the entry so that its id cannot
+# be reused by another object while the entry exists
+_CHECKS: Dict[int, Tuple[Any, _Check]] = {}
+_MAX_CHECKS = 1024
+
+
 def _validate_input(inputs: Union[List[_ValidateArgument], _ValidateArgument]) -> None:
     """Validate the values of the input arguments in comparison to the expected types defined in _ValidateArgument.
 
@@ -28,35 +51,133 @@ def _validate_input(inputs: Union[List[_ValidateArgument], _ValidateArgument]) -
     if isinstance(inputs, _ValidateArgument):
         inputs = [inputs]
     for validate in inputs:
-        if not any(_is_valid(exp, validate.value) for exp in validate.expected):
+        value = validate.value
+        for expected in validate.expected:
+            # None and plain classes make up most of the expected types and are checked inline
+            if expected is None:
+                if value is None:
+                    break
+            elif isinstance(expected, type):
+                if isinstance(value, expected):
+                    break
+            elif _check_for(expected)(value):
+                break
+        else:
             raise WeaviateInvalidInputError(
                 f"Argument '{validate.name}' must be one of: {validate.expected}, but got {type(validate.value)}"
             )
 
 
 def _is_valid(expected: Any, value: Any) -> bool:
+    return _check_for(expected)(value)
+
+
+def _compile_expected(expected: Sequence[Any]) -> _Check:
+    """Compile a check for whether a value is valid for any of the expected types, to be stored at the call site."""
+    classes, checks = _split_expected(expected)
+    if len(checks) == 0:
+        return lambda value: isinstance(value, classes)
+    return lambda value: isinstance(value, classes) or any(check(value) for check in checks)
+
+
+def _split_expected(expected: Sequence[Any]) -> Tuple[Tuple[type, ...], List[_Check]]:
+    """Split expected types into the classes that a single isinstance() can check and compiled checks for the rest."""
+    classes: List[type] = []
+    checks: List[_Check] = []
+    for exp in expected:
+        if exp is None:
+            classes.append(type(None))
+        elif isinstance(exp, type):
+            classes.append(exp)
+        elif (
+            not isinstance(exp, _ExtraTypes)
+            and get_origin(exp) is not None
+            and isinstance(get_origin(exp), type)
+            and len(get_args(exp)) == 0
+        ):
+            # unsubscripted generics like List or Sequence
+            classes.append(cast(type, get_origin(exp)))
+        else:
+            checks.append(_compile(exp))
+    # None is the most common value of optional arguments, isinstance stops at the first matching class and the
+    # instance checks of pydantic models and ABCs are comparatively slow
+    classes.sort(key=lambda cls: cls is not type(None))
+    return tuple(classes), checks
+
+
+class _ArgumentValidator:
+    """Validates the arguments of a call site against expected types that are compiled once.
+
+    Create it once, e.g. at module level, with the expected types and names of the arguments and call it with their
+    values in the same order. It raises the same errors as `_validate_input` without creating any `_ValidateArgument`.
+    """
+
+    def __init__(self, arguments: Sequence[Tuple[List[Any], str]]) -> None:
+        self.__arguments = [
+            (*_split_expected(expected), expected, name) for expected, name in arguments
+        ]
+        self.__classes = [classes for classes, _, _, _ in self.__arguments]
+
+    def __call__(self, *values: Any) -> None:
+        # valid values nearly always pass the isinstance checks, which map() runs without a loop in Python
+        if all(map(isinstance, values, self.__classes)):
+            return
+        for (classes, checks, expected, name), value in zip(self.__arguments, values):
+            if isinstance(value, classes) or any(check(value) for check in checks):
+                continue
+            raise WeaviateInvalidInputError(
+                f"Argument '{name}' must be one of: {expected}, but got {type(value)}"
+            )
+
+
+def _check_for(expected: Any) -> _Check:
+    entry = _CHECKS.get(id(expected))
+    if entry is not None:
+        return entry[1]
+    if len(_CHECKS) >= _MAX_CHECKS:
+        _CHECKS.clear()
+    check = _compile(expected)
+    _CHECKS[id(expected)] = (expected, check)
+    return check
+
+
+def _sample(value: Sequence) -> Sequence:
+    if len(value) <= _SAMPLE_THRESHOLD:
+        return value
+    step = len(value) // _SAMPLE_SIZE
+    return [value[i] for i in range(0, len(value), step)] + [value[-1]]
+
+
+def _compile(expected: Any) -> _Check:
     if expected is None:
-        return value is None
+        return lambda value: value is None
 
     # check for types that are not installed
     # https://stackoverflow.com/questions/12569452/how-to-identify-numpy-types-in-python
     if isinstance(expected, _ExtraTypes):
-        return expected.value in type(value).__module__
+        module = expected.value
+        return lambda value: module in type(value).__module__
 
     expected_origin = get_origin(expected)
     if expected_origin is Union:
         args = get_args(expected)
-        return any(isinstance(value, arg) for arg in args)
+        return lambda value: isinstance(value, args)
     if expected_origin is not None and (
         issubclass(expected_origin, Sequence) or expected_origin is list
     ):
-        if not isinstance(value, Sequence) and not isinstance(value, list):
-            return False
         args = get_args(expected)
         if len(args) == 1:
             if get_origin(args[0]) is Union:
                 union_args = get_args(args[0])
-                return any(isinstance(val, union_arg) for val in value for union_arg in union_args)
+                return lambda value: isinstance(value, (Sequence, list)) and any(
+                    isinstance(val, union_args) for val in _sample(value)
+                )
             else:
-                return all(isinstance(val, args[0]) for val in value)
-    return isinstance(value, expected)
+                arg = args[0]
+                return lambda value: isinstance(value, (Sequence, list)) and all(
+                    isinstance(val, arg) for val in _sample(value)
+                )
+    if expected_origin is not None and len(get_args(expected)) == 0:
+        # unsubscripted generics like List or Dict, isinstance is much faster on their origin
+        return lambda value: isinstance(value, expected_origin)
+    return lambda value: isinstance(value, expected)